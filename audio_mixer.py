@@ -0,0 +1,604 @@
+#!/usr/bin/env python3
+"""
+Software Audio Mixer
+
+One output stream for everything a station plays. Sounds are decoded once
+into a memory-resident PCM bank; playing voices are mixed block-by-block in
+NumPy onto named buses (music, world, ambient, ui, voice), each with its own
+gain. Every gain change is a linear per-sample ramp, so ducking, fades and
+crossfades are sample-accurate and click-free.
+
+Sinks:
+- SoundDeviceSink: sounddevice callback stream (the normal case)
+- NullSink: renders and discards audio (headless stations, benchmarks)
+- FileSink: writes a 16-bit WAV (tests, debugging)
+
+Mixer.render() can also be called directly to drive the mixer offline.
+"""
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+import time
+import wave
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+
+import numpy as np
+
+try:
+    import sounddevice as sd  # type: ignore
+except Exception:
+    sd = None
+
+try:
+    import soundfile as sf  # type: ignore
+except Exception:
+    sf = None
+
+
+DEFAULT_SAMPLE_RATE = 44100
+DEFAULT_CHANNELS = 2
+DEFAULT_BLOCK_SIZE = 512
+DEFAULT_BUSES = ("music", "world", "ambient", "ui", "voice")
+_DECLICK_FRAMES = 64  # fade applied when a stop_if predicate trips
+
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+
+# =======================
+# PCM bank
+# =======================
+
+class PCMBank:
+    """
+    Decode-once store of clips as int16 (frames, channels) arrays at the
+    mixer's sample rate. int16 halves the resident size of long loops.
+    """
+
+    def __init__(self, sample_rate: int = DEFAULT_SAMPLE_RATE, channels: int = DEFAULT_CHANNELS):
+        self.sample_rate = int(sample_rate)
+        self.channels = int(channels)
+        self._clips: Dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: Union[str, os.PathLike]) -> np.ndarray:
+        """Clip for path, decoding it on first use."""
+        key = os.path.abspath(str(path))
+        with self._lock:
+            clip = self._clips.get(key)
+        if clip is not None:
+            return clip
+        clip = self._decode(key)
+        with self._lock:
+            return self._clips.setdefault(key, clip)
+
+    def preload(self, paths: Iterable[Union[str, os.PathLike]]) -> int:
+        """Decode every path that isn't resident yet. Returns clips loaded."""
+        loaded = 0
+        for p in paths:
+            try:
+                self.get(p)
+                loaded += 1
+            except Exception:
+                pass
+        return loaded
+
+    def add(self, key: str, samples: np.ndarray, sample_rate: int) -> np.ndarray:
+        """Store already-decoded audio (e.g. synthesized speech) under key."""
+        clip = self.convert(samples, sample_rate)
+        with self._lock:
+            self._clips[key] = clip
+        return clip
+
+    def evict(self, key: Union[str, os.PathLike]) -> None:
+        with self._lock:
+            self._clips.pop(os.path.abspath(str(key)), None)
+            self._clips.pop(str(key), None)
+
+    def memory_bytes(self) -> int:
+        with self._lock:
+            return sum(c.nbytes for c in self._clips.values())
+
+    def __len__(self) -> int:
+        return len(self._clips)
+
+    def _decode(self, path: str) -> np.ndarray:
+        if sf is None:
+            raise RuntimeError("soundfile not installed; cannot decode audio files")
+        data, sr = sf.read(path, dtype="float32", always_2d=True)
+        return self.convert(data, sr)
+
+    def convert(self, samples: np.ndarray, sample_rate: int) -> np.ndarray:
+        """Any PCM array -> int16 (frames, channels) at the bank's rate."""
+        data = np.asarray(samples)
+        if data.dtype == np.int16:
+            data = data.astype(np.float32) * _INT16_SCALE
+        else:
+            data = data.astype(np.float32, copy=False)
+        if data.ndim == 1:
+            data = data[:, None]
+
+        if data.shape[1] != self.channels:
+            if data.shape[1] == 1:
+                data = np.repeat(data, self.channels, axis=1)
+            elif self.channels == 1:
+                data = data.mean(axis=1, keepdims=True)
+            else:
+                data = data[:, :self.channels]
+
+        if int(sample_rate) != self.sample_rate and len(data) > 1:
+            n_out = max(1, int(round(len(data) * self.sample_rate / float(sample_rate))))
+            x_out = np.linspace(0.0, len(data) - 1, n_out)
+            x_in = np.arange(len(data))
+            data = np.stack([np.interp(x_out, x_in, data[:, c]) for c in range(data.shape[1])], axis=1)
+
+        return (np.clip(data, -1.0, 1.0) * 32767.0).astype(np.int16)
+
+
+# =======================
+# Gain ramps, voices, buses
+# =======================
+
+class _Ramp:
+    """Linear per-sample gain ramp."""
+    __slots__ = ("value", "target", "step", "left")
+
+    def __init__(self, value: float = 1.0):
+        self.value = float(value)
+        self.target = float(value)
+        self.step = 0.0
+        self.left = 0
+
+    def set(self, target: float, frames: int) -> None:
+        target = float(target)
+        if frames <= 0:
+            self.value = self.target = target
+            self.left = 0
+        else:
+            self.target = target
+            self.left = int(frames)
+            self.step = (target - self.value) / frames
+
+    def block(self, n: int) -> Union[float, np.ndarray]:
+        """Gain for the next n samples: a scalar when steady, else an array."""
+        if self.left <= 0:
+            return self.value
+        m = min(n, self.left)
+        ramp = (self.value + self.step * np.arange(1, m + 1, dtype=np.float32)).astype(np.float32)
+        self.left -= m
+        self.value = self.target if self.left == 0 else float(ramp[-1])
+        if m < n:
+            ramp = np.concatenate([ramp, np.full(n - m, self.value, dtype=np.float32)])
+        return ramp
+
+
+class _Voice:
+    __slots__ = ("pcm", "bus", "pos", "loop", "loop_start", "gain", "stop_after_ramp", "done",
+                 "stop_if", "played")
+
+    def __init__(self, pcm: np.ndarray, bus: str, gain: float, loop: bool, loop_start: int, start: int):
+        self.pcm = pcm
+        self.bus = bus
+        self.pos = min(max(0, start), len(pcm))
+        self.loop = loop
+        self.loop_start = loop_start if 0 <= loop_start < len(pcm) else 0
+        self.gain = _Ramp(gain)
+        self.stop_after_ramp = False
+        self.done = False
+        self.stop_if: Optional[Callable[[], bool]] = None
+        self.played = 0
+
+
+class Mixer:
+    """
+    Block mixer: voices -> buses -> master.
+
+    All control methods are thread-safe and take effect at the start of the
+    next rendered block, so changes made together (e.g. both halves of a
+    crossfade) begin on the same sample.
+    """
+
+    def __init__(self, sample_rate: int = DEFAULT_SAMPLE_RATE, channels: int = DEFAULT_CHANNELS,
+                 block_size: int = DEFAULT_BLOCK_SIZE, buses: Iterable[str] = DEFAULT_BUSES):
+        self.sample_rate = int(sample_rate)
+        self.channels = int(channels)
+        self.block_size = int(block_size)
+        self.bank = PCMBank(self.sample_rate, self.channels)
+        self.master = _Ramp(1.0)
+        self._buses: Dict[str, _Ramp] = {b: _Ramp(1.0) for b in buses}
+        self._voices: Dict[int, _Voice] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+        self._sink = None
+        self.frames_rendered = 0
+        self.render_seconds = 0.0
+
+    # ---------- helpers ----------
+
+    def _frames(self, seconds: float) -> int:
+        return max(0, int(round(float(seconds) * self.sample_rate)))
+
+    def _clip(self, sound: Union[str, os.PathLike, np.ndarray]) -> np.ndarray:
+        if isinstance(sound, np.ndarray):
+            if sound.dtype == np.int16 and sound.ndim == 2 and sound.shape[1] == self.channels:
+                return sound
+            return self.bank.convert(sound, self.sample_rate)
+        return self.bank.get(sound)
+
+    def _bus(self, name: str) -> _Ramp:
+        bus = self._buses.get(name)
+        if bus is None:
+            bus = self._buses[name] = _Ramp(1.0)
+        return bus
+
+    # ---------- voices ----------
+
+    def play(self, sound: Union[str, os.PathLike, np.ndarray], bus: str = "world", gain: float = 1.0,
+             loop: bool = False, loop_start: float = 0.0, fade_in: float = 0.0, start: float = 0.0,
+             stop_if: Optional[Callable[[], bool]] = None) -> int:
+        """
+        Start a voice. sound is a file path (decoded once into the bank) or a
+        PCM array at the mixer rate. Returns a voice id (0 if it can't play).
+
+        loop_start: seconds into the clip that later loop passes restart from.
+        stop_if: cheap predicate polled once per block by the render loop;
+                 when it returns True the voice fades out over a few ms.
+        """
+        try:
+            pcm = self._clip(sound)
+        except Exception:
+            return 0
+        if len(pcm) == 0:
+            return 0
+        with self._lock:
+            vid = next(self._ids)
+            v = _Voice(pcm, bus, 0.0 if fade_in > 0 else gain, loop,
+                       self._frames(loop_start), self._frames(start))
+            if fade_in > 0:
+                v.gain.set(gain, self._frames(fade_in))
+            v.stop_if = stop_if
+            self._bus(bus)
+            self._voices[vid] = v
+            return vid
+
+    def stop(self, vid: int, fade_out: float = 0.0) -> None:
+        with self._lock:
+            v = self._voices.get(vid)
+            if v is None:
+                return
+            if fade_out > 0:
+                v.gain.set(0.0, self._frames(fade_out))
+                v.stop_after_ramp = True
+            else:
+                del self._voices[vid]
+
+    def set_gain(self, vid: int, gain: float, ramp: float = 0.0) -> None:
+        with self._lock:
+            v = self._voices.get(vid)
+            if v is not None:
+                v.gain.set(gain, self._frames(ramp))
+                v.stop_after_ramp = False
+
+    def get_gain(self, vid: int) -> float:
+        with self._lock:
+            v = self._voices.get(vid)
+            return v.gain.target if v is not None else 0.0
+
+    def is_playing(self, vid: int) -> bool:
+        with self._lock:
+            return vid in self._voices
+
+    def position(self, vid: int) -> int:
+        """Frames of vid rendered so far, or -1 once it has finished."""
+        with self._lock:
+            v = self._voices.get(vid)
+            return v.played if v is not None else -1
+
+    def crossfade(self, from_vid: int, sound: Union[str, os.PathLike, np.ndarray], duration: float,
+                  bus: Optional[str] = None, gain: float = 1.0, loop: bool = True) -> int:
+        """Fade from_vid out and sound in over the same sample span. Returns the new voice id."""
+        try:
+            pcm = self._clip(sound)
+        except Exception:
+            return 0
+        with self._lock:
+            old = self._voices.get(from_vid)
+            frames = self._frames(duration)
+            vid = next(self._ids)
+            v = _Voice(pcm, bus or (old.bus if old else "music"), 0.0, loop, 0, 0)
+            v.gain.set(gain, frames)
+            self._bus(v.bus)
+            self._voices[vid] = v
+            if old is not None:
+                old.gain.set(0.0, frames)
+                old.stop_after_ramp = True
+            return vid
+
+    # ---------- buses ----------
+
+    def set_bus_gain(self, bus: str, gain: float, ramp: float = 0.0) -> None:
+        with self._lock:
+            self._bus(bus).set(gain, self._frames(ramp))
+
+    def bus_gain(self, bus: str) -> float:
+        with self._lock:
+            return self._bus(bus).target
+
+    def stop_bus(self, bus: str, fade_out: float = 0.0) -> None:
+        with self._lock:
+            for vid in [vid for vid, v in self._voices.items() if v.bus == bus]:
+                self.stop(vid, fade_out)
+
+    def set_master_gain(self, gain: float, ramp: float = 0.0) -> None:
+        with self._lock:
+            self.master.set(gain, self._frames(ramp))
+
+    # ---------- rendering ----------
+
+    def render(self, frames: int) -> np.ndarray:
+        """Mix the next `frames` samples. Returns float32 (frames, channels)."""
+        t0 = time.perf_counter()
+        n = int(frames)
+        ch = self.channels
+        bus_bufs: Dict[str, np.ndarray] = {}
+
+        with self._lock:
+            finished = []
+            for vid, v in self._voices.items():
+                if v.stop_if is not None:
+                    try:
+                        tripped = v.stop_if()
+                    except Exception:
+                        tripped = False
+                    if tripped:
+                        v.stop_if = None
+                        v.gain.set(0.0, _DECLICK_FRAMES)
+                        v.stop_after_ramp = True
+
+                g = v.gain.block(n)
+                pcm = v.pcm
+                total = len(pcm)
+                silent = not isinstance(g, np.ndarray) and g == 0.0
+
+                written = 0
+                while written < n:
+                    avail = total - v.pos
+                    if avail <= 0:
+                        if v.loop:
+                            v.pos = v.loop_start
+                            continue
+                        v.done = True
+                        break
+                    take = min(n - written, avail)
+                    if not silent:
+                        buf = bus_bufs.get(v.bus)
+                        if buf is None:
+                            buf = bus_bufs[v.bus] = np.zeros((n, ch), dtype=np.float32)
+                        seg = pcm[v.pos:v.pos + take].astype(np.float32)
+                        if isinstance(g, np.ndarray):
+                            seg *= (g[written:written + take] * _INT16_SCALE)[:, None]
+                        else:
+                            seg *= np.float32(g) * _INT16_SCALE
+                        buf[written:written + take] += seg
+                    v.pos += take
+                    written += take
+                v.played += written
+
+                if v.done or (v.stop_after_ramp and v.gain.left == 0):
+                    finished.append(vid)
+            for vid in finished:
+                self._voices.pop(vid, None)
+
+            out = np.zeros((n, ch), dtype=np.float32)
+            for name, bus in self._buses.items():
+                bg = bus.block(n)
+                buf = bus_bufs.get(name)
+                if buf is None:
+                    continue
+                if isinstance(bg, np.ndarray):
+                    out += buf * bg[:, None]
+                elif bg != 0.0:
+                    out += buf * np.float32(bg)
+
+            mg = self.master.block(n)
+            if isinstance(mg, np.ndarray):
+                out *= mg[:, None]
+            elif mg != 1.0:
+                out *= np.float32(mg)
+
+        np.clip(out, -1.0, 1.0, out=out)
+        self.frames_rendered += n
+        self.render_seconds += time.perf_counter() - t0
+        return out
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            voices = len(self._voices)
+            per_bus: Dict[str, int] = {}
+            for v in self._voices.values():
+                per_bus[v.bus] = per_bus.get(v.bus, 0) + 1
+        audio_seconds = self.frames_rendered / float(self.sample_rate)
+        return {
+            "voices": voices,
+            "voices_per_bus": per_bus,
+            "bank_clips": len(self.bank),
+            "bank_bytes": self.bank.memory_bytes(),
+            "audio_seconds": round(audio_seconds, 3),
+            "render_seconds": round(self.render_seconds, 4),
+            # Fraction of one core spent mixing per second of audio
+            "cpu_load": round(self.render_seconds / audio_seconds, 5) if audio_seconds else 0.0,
+        }
+
+    def benchmark(self, seconds: float = 10.0) -> Dict[str, float]:
+        """Render `seconds` of audio as fast as possible (advances playback)."""
+        blocks = max(1, int(seconds * self.sample_rate / self.block_size))
+        t0 = time.perf_counter()
+        for _ in range(blocks):
+            self.render(self.block_size)
+        wall = time.perf_counter() - t0
+        audio = blocks * self.block_size / float(self.sample_rate)
+        return {"audio_seconds": audio, "wall_seconds": wall,
+                "realtime_factor": audio / wall if wall > 0 else float("inf")}
+
+    # ---------- output ----------
+
+    def start(self, sink=None) -> None:
+        """Attach and start a sink (default: NullSink)."""
+        self.stop_output()
+        self._sink = sink or NullSink()
+        self._sink.start(self)
+
+    def stop_output(self) -> None:
+        if self._sink is not None:
+            try:
+                self._sink.stop()
+            finally:
+                self._sink = None
+
+    @property
+    def sink(self):
+        return self._sink
+
+
+# =======================
+# Sinks
+# =======================
+
+class SoundDeviceSink:
+    """Single long-lived sounddevice output stream pulling from the mixer."""
+
+    def __init__(self, device: Any = None, latency: Any = "low"):
+        self.device = device
+        self.latency = latency
+        self._stream = None
+
+    def start(self, mixer: Mixer) -> None:
+        if sd is None:
+            raise RuntimeError("sounddevice not installed")
+
+        def _callback(outdata, frames, time_info, status):
+            outdata[:] = mixer.render(frames)
+
+        self._stream = sd.OutputStream(
+            samplerate=mixer.sample_rate,
+            channels=mixer.channels,
+            blocksize=mixer.block_size,
+            dtype="float32",
+            device=self.device,
+            latency=self.latency,
+            callback=_callback,
+        )
+        self._stream.start()
+
+    def stop(self) -> None:
+        if self._stream is not None:
+            try:
+                self._stream.stop()
+                self._stream.close()
+            finally:
+                self._stream = None
+
+
+class NullSink:
+    """
+    Renders and discards audio on a background thread.
+    realtime=True paces blocks at the sample rate; False runs flat out.
+    """
+
+    def __init__(self, realtime: bool = True):
+        self.realtime = realtime
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, mixer: Mixer) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(mixer,), daemon=True, name="MixerSink")
+        self._thread.start()
+
+    def _run(self, mixer: Mixer) -> None:
+        block_dur = mixer.block_size / float(mixer.sample_rate)
+        next_t = time.monotonic()
+        while not self._stop.is_set():
+            self._consume(mixer.render(mixer.block_size))
+            if self.realtime:
+                next_t += block_dur
+                delay = next_t - time.monotonic()
+                if delay > 0:
+                    self._stop.wait(delay)
+                elif delay < -1.0:
+                    next_t = time.monotonic()  # fell far behind; don't try to catch up
+
+    def _consume(self, block: np.ndarray) -> None:
+        pass
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        self._close()
+
+    def _close(self) -> None:
+        pass
+
+
+class FileSink(NullSink):
+    """Writes the mix to a 16-bit WAV file."""
+
+    def __init__(self, path: str, realtime: bool = True):
+        super().__init__(realtime=realtime)
+        self.path = path
+        self._wav = None
+
+    def start(self, mixer: Mixer) -> None:
+        self._wav = wave.open(self.path, "wb")
+        self._wav.setnchannels(mixer.channels)
+        self._wav.setsampwidth(2)
+        self._wav.setframerate(mixer.sample_rate)
+        super().start(mixer)
+
+    def _consume(self, block: np.ndarray) -> None:
+        self._wav.writeframes((block * 32767.0).astype("<i2").tobytes())
+
+    def _close(self) -> None:
+        if self._wav is not None:
+            self._wav.close()
+            self._wav = None
+
+
+def make_sink(spec: Optional[str] = "device"):
+    """Sink from a config value: "device", "null", or a path ending in .wav."""
+    spec = (spec or "device").strip()
+    if spec == "null":
+        return NullSink()
+    if spec.lower().endswith(".wav"):
+        return FileSink(spec)
+    return SoundDeviceSink()
+
+
+# =======================
+# Shared instance
+# =======================
+
+_mixer: Optional[Mixer] = None
+_mixer_lock = threading.Lock()
+
+
+def get_mixer(sink: Optional[str] = "device", log=print) -> Mixer:
+    """
+    Process-wide mixer (one output stream for the whole station).
+    The first caller chooses the sink; a device sink that can't open falls
+    back to a NullSink so playback logic still runs headless.
+    """
+    global _mixer
+    with _mixer_lock:
+        if _mixer is None:
+            mixer = Mixer()
+            try:
+                mixer.start(make_sink(sink))
+            except Exception as e:
+                log(f"[audio_mixer] Output '{sink}' unavailable ({e}); using null sink")
+                mixer.start(NullSink())
+            _mixer = mixer
+        return _mixer
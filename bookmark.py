@@ -35,6 +35,11 @@ def resolve_voice_path(p: str) -> str:
     # Fallback to plain relative
     return p
 
+# Opt-in startup trace (RADIO_OS_STARTUP_TRACE=1); imported first so it can time every import
+import startup_trace
+_STARTUP = startup_trace.get_trace()
+_STARTUP.step("imports")
+
 import os, time, json, re, tempfile, subprocess, queue, sqlite3, random, hashlib
 from typing import Any, Dict, List, Optional, Tuple
 import importlib.util
@@ -65,27 +70,36 @@ import threading
 import asyncio
 import yaml
 
-# Pygame for multi-channel file audio (music/sfx)
-try:
-    import pygame
-    import pygame.mixer
-    HAS_PYGAME = True
-except ImportError:
-    HAS_PYGAME = False
-    print("[bookmark] WARNING: pygame not installed. File audio disabled.", file=sys.stderr)
+# Shared software mixer for file audio (music/sfx/world/ui)
+import audio_mixer
 
-# Pygame for multi-channel file audio (music/sfx)
-try:
-    import pygame
-    import pygame.mixer
-    HAS_PYGAME = True
-except ImportError:
-    HAS_PYGAME = False
-    print("[bookmark] WARNING: pygame not installed. File audio disabled.", file=sys.stderr)
+# Static plugin index (lets startup import only the plugins a station uses)
+import plugin_index
+
+# MinHash/LSH near-duplicate detection for producer candidates
+import near_dup
+
+# Lazy-decay tag heat (log-space scores + heap top-k)
+import tag_heat
+
+# In-memory segment queue counters (reconciled against SQLite)
+import queue_stats
+
+# Local socket push channel for status (shell subscribes instead of polling)
+import status_channel
+
+# Shared LLM/TTS host for multi-station boxes (opt-in via RADIO_OS_INFERENCE_ADDR)
+import inference_host
+
+# Bounded event queue, dedupe ring and lag metrics for the event router
+import event_router
 
 # Character Context Engine
 try:
-    from context_engine import query_context_engine, format_context_for_prompt
+    from context_engine import (
+        query_context_engine, format_context_for_prompt,
+        context_latency_stats, record_context_timeout,
+    )
     HAS_CONTEXT_ENGINE = True
 except ImportError:
     HAS_CONTEXT_ENGINE = False
@@ -111,6 +125,8 @@ status_lock = threading.Lock()
 # Safe Host Defaults
 # =======================
 
+_STARTUP.step("module_setup")
+
 STATION_DIR = os.environ.get("STATION_DIR", ".")
 DB_PATH = os.environ.get("STATION_DB_PATH", "station.sqlite")
 MEMORY_PATH = os.environ.get("STATION_MEMORY_PATH", "station_memory.json")
@@ -569,11 +585,40 @@ class WidgetRegistry:
             "default_panel": (default_panel or "right").strip().lower(),
         }
 
+    def register_lazy(self, key: str, loader, *, title: Optional[str] = None, default_panel: str = "right"):
+        """
+        Placeholder for a widget whose plugin hasn't been imported yet.
+        loader() must import the plugin and run its register_widgets(), which
+        replaces this spec with the real one.
+        """
+        key = (key or "").strip().lower()
+        if not key or key in self._specs:
+            return
+        self._specs[key] = {
+            "key": key,
+            "title": title or key,
+            "factory": None,
+            "loader": loader,
+            "default_panel": (default_panel or "right").strip().lower(),
+        }
+
     def keys(self) -> List[str]:
         return sorted(self._specs.keys())
 
     def get(self, key: str) -> Optional[Dict[str, Any]]:
-        return self._specs.get((key or "").strip().lower())
+        key = (key or "").strip().lower()
+        spec = self._specs.get(key)
+        if spec and spec.get("loader"):
+            loader = spec.pop("loader")
+            try:
+                loader()
+            except Exception as e:
+                print(f"Lazy widget load failed {key}: {e}")
+            spec = self._specs.get(key)
+            if spec and spec.get("factory") is None:
+                self._specs.pop(key, None)
+                return None
+        return spec
 
 
 # =======================
@@ -930,11 +975,80 @@ def load_meta_plugins(plugin_dir: str) -> None:
             print(f"Meta plugin load failed {name}: {e}")
 
 
+def _startup_plugin_names(cfg: Dict[str, Any], index: Dict[str, Dict[str, Any]]) -> set:
+    """
+    Plugins the station needs at startup: enabled feeds in the manifest plus
+    owners of widgets placed in the saved UI layout.
+    """
+    wanted = set()
+
+    feeds_cfg = cfg.get("feeds", {})
+    if isinstance(feeds_cfg, dict):
+        for feed_name, feed_cfg in feeds_cfg.items():
+            if not isinstance(feed_cfg, dict) or not feed_cfg.get("enabled", False):
+                continue
+            name = plugin_index.resolve(index, feed_cfg.get("plugin") or feed_name)
+            if name:
+                wanted.add(name)
+
+    def _walk(node):
+        if isinstance(node, dict):
+            key = node.get("widget_key")
+            if isinstance(key, str):
+                owner = plugin_index.widget_owner(index, key)
+                if owner:
+                    wanted.add(owner)
+            for v in node.values():
+                _walk(v)
+        elif isinstance(node, list):
+            for v in node:
+                _walk(v)
+
+    _walk(cfg.get("ui_layout"))
+    return wanted
+
+
+def _load_plugin_module(name: str, path: str, plugins: Dict[str, Any], runtime_stub: Dict[str, Any]) -> None:
+    """Import one plugin, register its feed_worker into plugins and its widgets into WIDGETS."""
+    try:
+        with _STARTUP.phase(name, kind="plugin"):
+            mod = plugin_index.import_plugin(name, path)
+
+        # Feed worker (only if marked as feed)
+
+        is_feed = bool(getattr(mod, "IS_FEED", True))  # default = feed
+
+        if hasattr(mod, "feed_worker") and is_feed:
+            fn = mod.feed_worker
+
+            plugins[name] = fn
+
+            declared = getattr(mod, "PLUGIN_NAME", None)
+            if isinstance(declared, str) and declared.strip():
+                plugins[declared.strip().lower()] = fn
+
+            print(f"Loaded FEED plugin: {name}")
+
+
+        # Widget registration (optional)
+        if hasattr(mod, "register_widgets") and callable(getattr(mod, "register_widgets")):
+            try:
+                mod.register_widgets(WIDGETS, runtime_stub)
+                print(f"Registered widgets: {name}")
+            except Exception as e:
+                print(f"Widget registration failed {name}: {e}")
+
+    except Exception as e:
+        print(f"Plugin load failed {name}: {e}")
+
+
 def load_feed_plugins(cfg_override: Optional[Dict[str, Any]] = None, runtime_stub: Optional[Dict[str, Any]] = None):
     """
-    Loads plugins/*.py once.
+    Loads the plugins this station uses, once.
+    - Enabled feeds and widgets in the saved layout are imported now
     - If plugin has feed_worker -> registers as feed
     - If plugin has register_widgets(registry, runtime_stub) -> registers widgets
+    - Other plugins' widgets are registered lazily from the static plugin index
     """
     plugins = {}
     
@@ -961,46 +1075,34 @@ def load_feed_plugins(cfg_override: Optional[Dict[str, Any]] = None, runtime_stu
             "SHOW_INTERRUPT": SHOW_INTERRUPT,  # ✅ for graceful voice interruption
             "PBP_ACTIVE": PBP_ACTIVE,  # ✅ blocks narrator in TTS/host pipeline during races
             "audio_queue": audio_queue,  # ✅ for draining pre-rendered audio on race start
-            "db_connect": db_connect,  # ✅ for flushing queued DB segments
+            "db_connect": db_connect_tracked,  # ✅ for flushing queued DB segments
             "db_enqueue_segment": db_enqueue_segment,  # ✅ for PBP broadcast commentary
         }
 
-    for path in glob.glob(os.path.join(plugin_dir, "*.py")):
-        name = os.path.splitext(os.path.basename(path))[0]
+    t0 = time.perf_counter()
+    index = plugin_index.build_index(plugin_dir)
+    wanted = _startup_plugin_names(current_cfg, index)
+    imported = 0
 
-        try:
-            spec = importlib.util.spec_from_file_location(name, path)
-            mod = importlib.util.module_from_spec(spec)
-            sys.modules[name] = mod  # Register in sys.modules so other plugins can find it
-            spec.loader.exec_module(mod)
-
-            # Feed worker
-            # Feed worker (only if marked as feed)
-
-            is_feed = bool(getattr(mod, "IS_FEED", True))  # default = feed
-
-            if hasattr(mod, "feed_worker") and is_feed:
-                fn = mod.feed_worker
-
-                plugins[name] = fn
-
-                declared = getattr(mod, "PLUGIN_NAME", None)
-                if isinstance(declared, str) and declared.strip():
-                    plugins[declared.strip().lower()] = fn
-
-                print(f"Loaded FEED plugin: {name}")
+    for name, info in index.items():
+        path = info["path"]
 
+        if name in wanted or (info["has_register_widgets"] and info["widgets"] is None):
+            # Used by this station (or registers widgets we can't see statically)
+            _load_plugin_module(name, path, plugins, runtime_stub)
+            imported += 1
+            continue
 
-            # Widget registration (optional)
-            if hasattr(mod, "register_widgets") and callable(getattr(mod, "register_widgets")):
-                try:
-                    mod.register_widgets(WIDGETS, runtime_stub)
-                    print(f"Registered widgets: {name}")
-                except Exception as e:
-                    print(f"Widget registration failed {name}: {e}")
+        # Not used at startup: widgets get placeholders, the module loads on first open
+        for w in info.get("widgets") or []:
+            WIDGETS.register_lazy(
+                w["key"],
+                lambda name=name, path=path: _load_plugin_module(name, path, {}, runtime_stub),
+                title=w.get("title"),
+                default_panel=w.get("default_panel", "right"),
+            )
 
-        except Exception as e:
-            print(f"Plugin load failed {name}: {e}")
+    log("feed", f"plugins: imported {imported}/{len(index)} in {(time.perf_counter() - t0) * 1000:.0f} ms (others deferred)")
 
     return plugins
 
@@ -1140,7 +1242,9 @@ dj_q: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
 
 ui_q: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
 
-event_q = queue.Queue()
+# Bounded; per-source overflow policy from router.* (applied when the router starts)
+event_q = event_router.EventQueue()
+ROUTER_METRICS = event_router.RouterMetrics()
 ui_cmd_q: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
 ftb_cmd_q: "queue.Queue[Dict[str, Any]]" = queue.Queue()
 music_cmd_q: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
@@ -1516,15 +1620,28 @@ def event_to_segment(evt: StationEvent, mem: Dict[str, Any]) -> Dict[str, Any]:
 # =======================
 # Database Helpers
 # =======================
+
+# Queue depth counters; reads reconcile with SQLite every reconcile_sec
+QUEUE_STATS = queue_stats.QueueStats(
+    reconcile_sec=float(cfg_get("producer.queue_stats_reconcile_sec", 10.0) or 10.0),
+    log=log,
+)
+
+
+def _segment_state(conn: sqlite3.Connection, seg_id: str) -> Optional[Tuple[str, str]]:
+    row = conn.execute("SELECT status, source FROM segments WHERE id=?;", (seg_id,)).fetchone()
+    return (row[0], row[1]) if row else None
+
+
 def db_depth_claimed(conn) -> int:
-    cur = conn.execute("SELECT COUNT(*) FROM segments WHERE status='claimed';")
-    return int(cur.fetchone()[0])
+    return QUEUE_STATS.total(conn, ("claimed",))
 
 def db_flush_queue():
     conn = db_connect()
     conn.execute("DELETE FROM segments;")
     conn.commit()
     conn.close()
+    QUEUE_STATS.invalidate()
 
 
 def db_reset_claimed(conn: sqlite3.Connection) -> None:
@@ -1535,6 +1652,7 @@ def db_reset_claimed(conn: sqlite3.Connection) -> None:
         "UPDATE segments SET status='queued', claimed_ts=NULL WHERE status='claimed';"
     )
     conn.commit()
+    QUEUE_STATS.invalidate()
 
 # =======================
 # DB Queue Safety
@@ -1552,14 +1670,21 @@ def db_reclaim_stuck_claims(conn: sqlite3.Connection, *, older_than_sec: int = C
         (cutoff,)
     )
     conn.commit()
-    return int(getattr(cur, "rowcount", 0) or 0)
+    n = int(getattr(cur, "rowcount", 0) or 0)
+    if n:
+        QUEUE_STATS.invalidate()
+    return n
 
 def db_return_to_queue(conn: sqlite3.Connection, seg_id: str) -> None:
-    conn.execute(
-        "UPDATE segments SET status='queued', claimed_ts=NULL WHERE id=?;",
-        (seg_id,)
-    )
-    conn.commit()
+    prev = _segment_state(conn, seg_id)
+    with QUEUE_STATS.writing():
+        cur = conn.execute(
+            "UPDATE segments SET status='queued', claimed_ts=NULL WHERE id=?;",
+            (seg_id,)
+        )
+        conn.commit()
+        if prev and int(getattr(cur, "rowcount", 0) or 0):
+            QUEUE_STATS.moved(prev[1], prev[0], "queued")
 
 
 # =======================
@@ -1572,8 +1697,8 @@ def event_router_worker(
     *,
     poll_timeout: float = 0.25,
     loop_sleep: float = 0.03,
-    batch_max: int = 12,
-    batch_time_budget: float = 0.20,
+    batch_min: int = 12,
+    batch_max: int = 256,
     dedupe_window_sec: int = 90,
 ) -> None:
     """
@@ -1581,46 +1706,63 @@ def event_router_worker(
 
     Guarantees:
       - Own DB connection
-      - Batch processing
-      - Soft dedupe
+      - Batch processing: batch size follows event_q depth, one commit per batch
+      - Soft dedupe over a time-bucketed ring
       - Never crashes station loop
     """
 
     conn = db_connect()
     migrate_segments_table(conn)
 
-    dedupe: Dict[str, int] = {}
+    policies = cfg_get("router.policies", {}) or {}
+    event_q.configure(
+        maxsize=int(cfg_get("router.max_pending", 2000) or 2000),
+        per_source_max=int(cfg_get("router.per_source_max", 200) or 200),
+        policies=policies if isinstance(policies, dict) else {},
+    )
+    batch_max = max(int(cfg_get("router.batch_max", batch_max) or batch_max), batch_min)
+    dedupe = event_router.DedupeRing(
+        window_sec=float(cfg_get("router.dedupe_window_sec", dedupe_window_sec) or dedupe_window_sec),
+    )
 
     def dedupe_key(evt: StationEvent) -> str:
         t = str(evt.payload.get("title", ""))[:200]
         b = str(evt.payload.get("body", ""))[:200]
         return sha1(f"{evt.source}|{evt.type}|{t}|{b}")
 
-    def dedupe_ok(evt: StationEvent) -> bool:
-        now = now_ts()
-        k = dedupe_key(evt)
-        last = int(dedupe.get(k, 0))
-
-        if now - last < dedupe_window_sec:
-            return False
-
-        dedupe[k] = now
-
-        # prune map periodically
-        if len(dedupe) > 600:
-            cutoff = now - (dedupe_window_sec * 4)
-            for kk, ts in list(dedupe.items()):
-                if ts < cutoff:
-                    dedupe.pop(kk, None)
-
-        return True
-
-    def enqueue_from_event(evt: StationEvent) -> None:
-        seg = event_to_segment(evt, mem)
-        if not seg:
-            return
-
-        db_enqueue_segment(conn, seg)
+    def route_batch(events: List[Tuple[str, StationEvent]], now: int) -> int:
+        segs = []
+        handled = []
+        with QUEUE_STATS.writing():
+            for key, evt in events:
+                try:
+                    seg = event_to_segment(evt, mem)
+                    if seg and db_enqueue_segment(conn, seg, commit=False):
+                        segs.append(seg)
+                    handled.append((key, evt))
+                except Exception as e:
+                    log("router", f"drop event src={evt.source} type={evt.type}: {type(e).__name__}: {e}")
+            try:
+                conn.commit()
+            except Exception as e:
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+                QUEUE_STATS.invalidate()
+                # The batch already left event_q; put it back so it is routed again
+                requeued = sum(1 for _, evt in handled if event_q.put(evt))
+                log("router", f"batch commit failed, re-queued {requeued}/{len(handled)} events: "
+                              f"{type(e).__name__}: {e}")
+                stop_event.wait(poll_timeout)
+                return 0
+            for seg in segs:
+                QUEUE_STATS.inserted(seg.get("source", "feed"))
+        # Only committed events count as seen, so re-queued ones aren't deduped
+        for key, _ in handled:
+            dedupe.add(key, now)
+        if not segs:
+            return 0
 
         try:
             producer_kick.set()
@@ -1633,14 +1775,16 @@ def event_router_worker(
             pass
 
         try:
-            ui_q.put(("set_segment_display", seg))
-            ui_q.put(("widget_update", {
-                "widget_key": "timeline_replay",
-                "data": {"push": seg}
-            }))
+            ui_q.put(("set_segment_display", segs[-1]))
+            for seg in segs:
+                ui_q.put(("widget_update", {
+                    "widget_key": "timeline_replay",
+                    "data": {"push": seg}
+                }))
 
         except Exception as e:
             log("ERR", f"{type(e).__name__}: {e}")
+        return len(segs)
 
     while not stop_event.is_set():
         # -------------------
@@ -1661,45 +1805,47 @@ def event_router_worker(
             except Exception as e:
                 log("host", f"boot open error: {type(e).__name__}: {e}")
 
-        t_start = time.time()
         routed = 0
 
         try:
-            # Primary blocking pull
-            try:
-                evt = event_q.get(timeout=poll_timeout)
-                if isinstance(evt, StationEvent) and dedupe_ok(evt):
-                    enqueue_from_event(evt)
-                    routed += 1
-            except queue.Empty:
-                pass
-
-            # Opportunistic batch drain
-            while routed < batch_max and (time.time() - t_start) <= batch_time_budget:
-                try:
-                    evt = event_q.get_nowait()
-                except queue.Empty:
-                    break
-
-                if isinstance(evt, StationEvent) and dedupe_ok(evt):
-                    enqueue_from_event(evt)
-                    routed += 1
+            # Deeper backlog -> bigger batches (still one transaction each)
+            want = max(batch_min, min(batch_max, event_q.qsize() // 2 + 1))
+            batch = event_q.get_batch(want, timeout=poll_timeout)
+
+            now_m = time.monotonic()
+            now = now_ts()
+            candidates = [evt for evt, _ in batch if isinstance(evt, StationEvent)]
+            events = []
+            batch_keys = set()
+            for evt in candidates:
+                key = dedupe_key(evt)
+                if key not in batch_keys and not dedupe.seen(key, now):
+                    batch_keys.add(key)
+                    events.append((key, evt))
+            if events:
+                routed = route_batch(events, now)
+            if batch:
+                ROUTER_METRICS.record_batch([now_m - ts for _, ts in batch], routed, len(candidates) - len(events))
 
         except Exception as e:
             log("router", f"Router error: {type(e).__name__}: {e}")
 
         try:
+            rm = ROUTER_METRICS.snapshot()
             log_every(
                 mem,
                 "router_heartbeat",
                 8,
                 "router",
-                f"heartbeat routed={routed} queued={db_depth_queued(conn)}"
+                f"heartbeat routed={routed} queued={db_depth_queued(conn)} "
+                f"pending={event_q.qsize()} lag={rm['lag_ms']:.0f}ms"
             )
         except Exception as e:
             log("ERR", f"{type(e).__name__}: {e}")
 
-        time.sleep(loop_sleep)
+        # Only idle between batches when caught up
+        if event_q.empty():
+            time.sleep(loop_sleep)
 
     try:
         conn.close()
@@ -1710,10 +1856,25 @@ def event_router_worker(
 # Tag Heat Memory System
 # =======================
 
+_TAG_HEAT: Optional[tag_heat.TagHeat] = None
+_TAG_HEAT_LOCK = threading.Lock()
+
+
 def ensure_heat_store(mem: Dict[str, Any]) -> None:
-    if "tag_heat" not in mem:
+    if not isinstance(mem.get("tag_heat"), dict):
         mem["tag_heat"] = {}
 
+
+def tag_heat_index(mem: Dict[str, Any]) -> tag_heat.TagHeat:
+    """Heap index over mem["tag_heat"]; rebuilt if that dict is replaced or edited behind its back."""
+    global _TAG_HEAT
+    ensure_heat_store(mem)
+    store = mem["tag_heat"]
+    with _TAG_HEAT_LOCK:
+        if _TAG_HEAT is None or _TAG_HEAT.store is not store or len(_TAG_HEAT) != len(store):
+            _TAG_HEAT = tag_heat.TagHeat(store)
+        return _TAG_HEAT
+
 def db_gc_done(conn: sqlite3.Connection, *, older_than_sec: int = 7*24*3600) -> int:
     cutoff = now_ts() - int(older_than_sec)
     cur = conn.execute(
@@ -1721,7 +1882,10 @@ def db_gc_done(conn: sqlite3.Connection, *, older_than_sec: int = 7*24*3600) ->
         (cutoff,)
     )
     conn.commit()
-    return int(getattr(cur, "rowcount", 0) or 0)
+    n = int(getattr(cur, "rowcount", 0) or 0)
+    if n:
+        QUEUE_STATS.invalidate()
+    return n
 # Put near other locks / globals
 status_lock = threading.Lock()
 memory_lock = threading.Lock()
@@ -1804,45 +1968,16 @@ def bump_tag_heat(
     boost: float = 10.0,
     default_half_life: float = 48.0
 ) -> None:
-    ensure_heat_store(mem)
-    now = now_ts()
-
-    for tag in tags:
-        tag = tag.lower().strip()
-        if not tag:
-            continue
-
-        if tag not in mem["tag_heat"]:
-            mem["tag_heat"][tag] = {
-                "heat": 0.0,
-                "half_life_hours": default_half_life,
-                "last_touched": now
-            }
-
-        mem["tag_heat"][tag]["heat"] += boost
-        mem["tag_heat"][tag]["last_touched"] = now
+    tag_heat_index(mem).bump(tags, boost=boost, now=now_ts(), half_life_hours=default_half_life)
 
 
 def decay_tag_heat(mem: Dict[str, Any]) -> None:
-    ensure_heat_store(mem)
-    now = now_ts()
-
-    for tag, data in list(mem["tag_heat"].items()):
-        heat = float(data.get("heat", 0))
-        half_life = float(data.get("half_life_hours", 48))
-        last = int(data.get("last_touched", now))
-
-        if heat <= 0:
-            continue
+    # Decay is implicit in the index; this only evicts cold tags.
+    tag_heat_index(mem).evict(now_ts())
 
-        dt_hours = max((now - last) / 3600.0, 0)
-        decayed = heat * (0.5 ** (dt_hours / max(half_life, 0.01)))
 
-        if decayed < 0.5:
-            del mem["tag_heat"][tag]
-            continue
-
-        data["heat"] = decayed
+# Weighted pick pool: the hottest eligible tags (the tail carries little weight)
+HOT_TAG_POOL = 32
 
 
 def pick_hot_tags(
@@ -1853,25 +1988,17 @@ def pick_hot_tags(
     explore_prob: float = 0.35
 ) -> List[str]:
 
-    ensure_heat_store(mem)
-    decay_tag_heat(mem)
+    index = tag_heat_index(mem)
 
     now = now_ts()
     last_spoken = mem.setdefault("tag_last_spoken", {})
 
-    pool, weights = [], []
-
-    for tag, data in mem["tag_heat"].items():
-        heat = float(data.get("heat", 0))
-        if heat < min_heat:
-            continue
-
-        last = int(last_spoken.get(tag, 0))
-        if now - last < cooldown_sec:
-            continue
-
-        pool.append(tag)
-        weights.append(heat)
+    hot = index.top(
+        max(HOT_TAG_POOL, k), now=now, min_heat=min_heat,
+        skip=lambda tag: now - int(last_spoken.get(tag, 0)) < cooldown_sec,
+    )
+    pool = [tag for tag, _ in hot]
+    weights = [heat for _, heat in hot]
 
     chosen = []
 
@@ -2209,6 +2336,41 @@ import numpy as np
 
 AUDIO_LEVEL = 0.0
 _AUDIO_SMOOTH = 0.85   # 0.7 = snappy, 0.9 = smooth
+_LEVEL_BLOCK = 512     # frames per waveform level step
+
+
+def _music_cut_active() -> bool:
+    """True when flows music is playing and voice must not talk over it."""
+    try:
+        return bool(
+            MUSIC_STATE.get("flows_enabled", False)
+            and MUSIC_STATE.get("playing")
+            and not MUSIC_STATE.get("allow_background_music")
+        )
+    except Exception:
+        return False
+
+
+def _voice_should_stop() -> bool:
+    """Polled by the mixer once per block while a TTS line plays."""
+    return SHOW_INTERRUPT.is_set() or _music_cut_active()
+
+
+def _level_envelope(pcm: np.ndarray, block: int = _LEVEL_BLOCK) -> np.ndarray:
+    """Smoothed per-block waveform level for a whole clip, computed once."""
+    mono = pcm[:, 0].astype(np.float32) / 32768.0
+    n = max(1, -(-len(mono) // block))
+    padded = np.zeros(n * block, dtype=np.float32)
+    padded[:len(mono)] = mono
+    rms = np.sqrt(np.mean(padded.reshape(n, block) ** 2, axis=1))
+    level = np.minimum(rms * 6.0, 1.0)
+
+    out = np.empty_like(level)
+    acc = 0.0
+    for i, x in enumerate(level):
+        acc = (_AUDIO_SMOOTH * acc) + ((1 - _AUDIO_SMOOTH) * float(x))
+        out[i] = acc
+    return out
 
 
 def speak(text: str, voice_key: str = None):
@@ -2229,23 +2391,6 @@ def speak(text: str, voice_key: str = None):
 
     if SHOW_INTERRUPT.is_set():
         return
-        
-    # Apply global volume/speed (Radio Dial)
-    try:
-        audio_cfg = CFG.get("audio", {})
-        vol = float(audio_cfg.get("volume", 1.0))
-        spd = float(audio_cfg.get("speed", 1.0))
-        
-        # Volume (simple gain)
-        if vol != 1.0:
-            data = data * vol
-            
-        # Speed (playback rate modification - chipmunk key)
-        # Higher speed = higher sample rate to consume samples faster
-        if spd != 1.0:
-            sr = int(sr * spd)
-    except Exception:
-        pass
 
 
     # =====================================================
@@ -2327,16 +2472,32 @@ def speak(text: str, voice_key: str = None):
             return
 
         try:
-            from voice_provider import get_voice_provider
-
-            provider = get_voice_provider(CFG, audio_cfg)
-            data, sr = provider.synthesize(
-                voice_key=voice_key,
-                text=text,
-                voice_map=merged_voice_map,
-            )
+            data = sr = None
+            via = "local"
+            if INFERENCE is not None:
+                try:
+                    via = "host"
+                    data, sr = INFERENCE.tts(
+                        _inference_audio_cfg(audio_cfg),
+                        voice_key=voice_key,
+                        text=text,
+                        voice_map=merged_voice_map,
+                    )
+                except inference_host.InferenceUnavailable as e:
+                    via = "local"
+                    _inference_fallback("audio", e)
+
+            if data is None:
+                from voice_provider import get_voice_provider
+
+                provider = get_voice_provider(CFG, audio_cfg)
+                data, sr = provider.synthesize(
+                    voice_key=voice_key,
+                    text=text,
+                    voice_map=merged_voice_map,
+                )
 
-            log("audio", f"TTS provider={voice_provider_type} voice={voice_key} chars={len(text)}")
+            log("audio", f"TTS provider={voice_provider_type} voice={voice_key} chars={len(text)} via={via}")
 
         except Exception as e:
             log("audio", f"TTS error [{voice_provider_type}]: {type(e).__name__}: {e}")
@@ -2348,96 +2509,83 @@ def speak(text: str, voice_key: str = None):
     if getattr(data, "ndim", 0) == 1:
         data = data.reshape(-1, 1)
 
+    # Apply global volume/speed (Radio Dial)
+    vol, spd = 1.0, 1.0
+    try:
+        vol = float(audio_cfg.get("volume", 1.0))
+        spd = float(audio_cfg.get("speed", 1.0))
+    except Exception:
+        pass
+
+    # Speed (playback rate modification - chipmunk key):
+    # treating the clip as recorded faster shortens it on resample
+    mixer = audio_mixer.get_mixer()
+    try:
+        pcm = mixer.bank.convert(data, int(sr * spd) if spd > 0 else sr)
+    except Exception as e:
+        log("audio", f"TTS convert failed: {type(e).__name__}: {e}")
+        return
+
+    rate = mixer.sample_rate
+
 
     # =====================================================
-    # Subtitle pacing (audio timeline)
+    # Subtitle pacing + waveform (precomputed per clip)
     # =====================================================
 
     words = text.split()
 
-    duration = len(data) / float(sr) if sr else 0.0
+    duration = len(pcm) / float(rate)
 
     if duration <= 0:
         duration = max(len(words) * 0.25, 1.0)
 
     word_time = max((duration / max(len(words), 1)) * 0.75, 0.08)
 
-    next_word_at = word_time
-    progress = []
+    # Frame at which each word appears
+    word_frames = np.round(np.arange(1, len(words) + 1) * word_time * rate).astype(np.int64)
+    levels = _level_envelope(pcm)
 
 
     # =====================================================
-    # Stream playback + synced subtitles + waveform
+    # Playback on the shared stream's voice bus
     # =====================================================
 
-    chunk = 512
-
-    try:
-        with sd.OutputStream(
-            samplerate=sr,
-            channels=data.shape[1],
-            dtype="float32"
-        ) as stream:
-
-            total = len(data)
-            pos = 0
-
-            while pos < total:
-
-                if SHOW_INTERRUPT.is_set():
-                    break
-
-                # -----------------------------
-                # MID-PLAY MUSIC CUT
-                # -----------------------------
-
-                try:
-                    # Only cut voice for music if flows plugin is enabled
-                    flows_enabled = MUSIC_STATE.get("flows_enabled", False)
-                    if flows_enabled and MUSIC_STATE.get("playing") and not MUSIC_STATE.get("allow_background_music"):
-                        log("audio", "Music resumed mid-TTS → cutting voice")
-                        break
-                except Exception:
-                    pass
-
-
-                end = min(pos + chunk, total)
-                block = data[pos:end]
-
-                stream.write(block)
-
-                # -----------------------------
-                # RMS waveform level
-                # -----------------------------
-
-                samples = block[:, 0]
-                rms = np.sqrt(np.mean(samples * samples))
-                level = min(rms * 6.0, 1.0)
-
-                AUDIO_LEVEL = (_AUDIO_SMOOTH * AUDIO_LEVEL) + ((1 - _AUDIO_SMOOTH) * level)
-
-                pos = end
-
-
-                # -----------------------------
-                # Subtitle progression (audio time)
-                # -----------------------------
-
-                audio_t = pos / float(sr)
+    # The mixer's render callback honours interrupts / music cuts itself;
+    # this loop only follows the voice's frame counter for subtitles/level.
+    vid = mixer.play(pcm, bus="voice", gain=vol, stop_if=_voice_should_stop)
+    if not vid:
+        log("audio", "audio stream failed: voice could not start")
+        return
 
-                while words and audio_t >= next_word_at:
+    shown = 0
+    last_pos = 0
+    # A stalled or closed output stream never advances the voice; give up
+    # once the clip has had its full length plus a margin
+    deadline = time.monotonic() + len(pcm) / float(rate) + 5.0
+    while True:
+        pos = mixer.position(vid)
+        if pos < 0:
+            break
+        last_pos = pos
 
-                    progress.append(words.pop(0))
+        if time.monotonic() > deadline:
+            mixer.stop(vid)
+            log("audio", f"TTS playback stalled at {pos}/{len(pcm)} frames; voice stopped")
+            break
 
-                    display = f"{voice_key.upper()}: " + " ".join(progress)
+        AUDIO_LEVEL = float(levels[min(pos // _LEVEL_BLOCK, len(levels) - 1)])
 
-                    subtitle_q.put(display)
+        due = int(np.searchsorted(word_frames, pos, side="right"))
+        if due > shown:
+            shown = due
+            subtitle_q.put(f"{voice_key.upper()}: " + " ".join(words[:due]))
 
-                    next_word_at += word_time
+        time.sleep(0.02)
 
-    except Exception as e:
-        log("audio", f"audio stream failed: {type(e).__name__}: {e}")
-        return
+    cut_short = last_pos < len(pcm) - 4 * mixer.block_size
+    if cut_short and _music_cut_active() and not SHOW_INTERRUPT.is_set():
+        log("audio", "Music resumed mid-TTS → cut voice")
 
 
     # =====================================================
@@ -2517,51 +2665,37 @@ def play_audio_bundle(bundle):
 
 def play_file_audio(audio_item: AudioItem) -> None:
     """Play file-based audio (music/sfx/world/ui) from AudioItem fields."""
-    if not HAS_PYGAME or not pygame.mixer.get_init():
-        return
-    
+    mixer = audio_mixer.get_mixer()
+
     # Check each file audio field and play if present
-    # Note: This is a simple implementation. ftb_audio_engine.py has the sophisticated
-    # multi-channel mixer with crossfade, ducking, etc.
-    # This function just plays files directly for basic support.
-    
+    # Note: This is a simple implementation. ftb_audio_engine.py drives the
+    # same mixer with crossfades, ducking, etc.
+    # This function just plays files directly (each decoded once, then cached).
+
     try:
-        # Music track (background, lower priority)
+        # Music track (background, lower priority); master_volume is the music
+        # volume, applied per voice so the shared music bus stays at unity
         if audio_item.music_track and os.path.exists(audio_item.music_track):
-            sound = pygame.mixer.Sound(audio_item.music_track)
-            channel = pygame.mixer.find_channel()
-            if channel:
-                channel.play(sound)
-        
+            music_volume = float((CFG.get("audio") or {}).get("master_volume", 0.8))
+            mixer.play(audio_item.music_track, bus="music", gain=music_volume)
+
         # World audio (engines, crashes)
         if audio_item.world_audio and os.path.exists(audio_item.world_audio):
-            sound = pygame.mixer.Sound(audio_item.world_audio)
-            channel = pygame.mixer.find_channel()
-            if channel:
-                channel.play(sound)
-        
+            mixer.play(audio_item.world_audio, bus="world")
+
         # UI audio (tactile feedback)
         if audio_item.ui_audio and os.path.exists(audio_item.ui_audio):
-            sound = pygame.mixer.Sound(audio_item.ui_audio)
-            channel = pygame.mixer.find_channel()
-            if channel:
-                channel.play(sound)
-        
+            mixer.play(audio_item.ui_audio, bus="ui")
+
         # SFX files (play each)
         for sfx_path in audio_item.sfx_files:
             if os.path.exists(sfx_path):
-                sound = pygame.mixer.Sound(sfx_path)
-                channel = pygame.mixer.find_channel()
-                if channel:
-                    channel.play(sound)
-        
+                mixer.play(sfx_path, bus="world")
+
         # Ambient loop (continuous background)
         if audio_item.ambient_loop and os.path.exists(audio_item.ambient_loop):
-            sound = pygame.mixer.Sound(audio_item.ambient_loop)
-            channel = pygame.mixer.find_channel()
-            if channel:
-                channel.play(sound, loops=-1)  # Loop indefinitely
-    
+            mixer.play(audio_item.ambient_loop, bus="ambient", loop=True)
+
     except Exception as e:
         log("audio", f"File audio playback error: {e}")
 
@@ -5224,6 +5358,29 @@ class StationUI:
 # LLM Client (Multi-Provider)
 # =======================
 
+# Shared inference host client; None runs providers in-process
+INFERENCE = inference_host.client_from_env(os.path.basename(os.path.abspath(STATION_DIR)) or STATION_NAME)
+_INFERENCE_WARN_TS = 0.0
+
+
+def _inference_fallback(role: str, e: Exception) -> None:
+    global _INFERENCE_WARN_TS
+    if time.time() - _INFERENCE_WARN_TS >= 60:
+        _INFERENCE_WARN_TS = time.time()
+        log(role, f"inference host unavailable, running locally: {e}")
+
+
+def _inference_audio_cfg(audio_cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """audio config with local model paths resolved, since the host has its own cwd."""
+    out = dict(audio_cfg)
+    for k in ("piper_bin", "kokoro_model", "kokoro_voices"):
+        if (out.get(k) or "").strip():
+            out[k] = resolve_cfg_path(out[k])
+    if (out.get("voices_provider") or "piper").strip().lower() == "piper" and not out.get("piper_bin"):
+        out["piper_bin"] = _auto_detect_piper_bin() or ""
+    return out
+
+
 def llm_generate(prompt: str, system: str, model: str, num_predict: int,
                  temperature: float, timeout: int = 10,
                  *, force_json: bool = False) -> str:
@@ -5246,16 +5403,28 @@ def llm_generate(prompt: str, system: str, model: str, num_predict: int,
         log("llm", f"req provider={provider_type} model={model} tok={int(num_predict)} timeout={int(timeout)}s json={force_json}")
         t0 = time.time()
 
-        provider = get_llm_provider(CFG)
-        out = provider.generate(
-            model=model,
-            prompt=prompt,
-            system=system,
-            num_predict=num_predict,
-            temperature=temperature,
-            timeout=timeout,
-            force_json=force_json,
-        )
+        out = None
+        if INFERENCE is not None:
+            try:
+                out = INFERENCE.llm(
+                    llm_cfg, model=model, prompt=prompt, system=system,
+                    num_predict=num_predict, temperature=temperature,
+                    timeout=timeout, force_json=force_json,
+                )
+            except inference_host.InferenceUnavailable as e:
+                _inference_fallback("llm", e)
+
+        if out is None:
+            provider = get_llm_provider(CFG)
+            out = provider.generate(
+                model=model,
+                prompt=prompt,
+                system=system,
+                num_predict=num_predict,
+                temperature=temperature,
+                timeout=timeout,
+                force_json=force_json,
+            )
 
         log("llm", f"ok provider={provider_type} model={model} dt={time.time()-t0:.2f}s chars={len(out)}")
         return out
@@ -5300,8 +5469,17 @@ def extractive_packet(seg: Dict[str, Any]) -> Dict[str, Any]:
 # SQLite Queue (Core Runtime)
 # =======================
 
-def db_connect() -> sqlite3.Connection:
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False, timeout=30)
+def db_connect(*, track_writes: bool = False) -> sqlite3.Connection:
+    """
+    Station DB connection. track_writes=True returns a TrackedConnection that
+    invalidates QUEUE_STATS on commits that change rows (for plugin code).
+    """
+    if track_writes:
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False, timeout=30,
+                               factory=queue_stats.TrackedConnection)
+        conn.on_write = QUEUE_STATS.invalidate
+    else:
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False, timeout=30)
 
     conn.execute("PRAGMA journal_mode=WAL;")
     conn.execute("PRAGMA synchronous=NORMAL;")
@@ -5349,6 +5527,11 @@ def db_connect() -> sqlite3.Connection:
     return conn
 
 
+def db_connect_tracked() -> sqlite3.Connection:
+    """db_connect() for plugins: their segment writes invalidate the queue counters."""
+    return db_connect(track_writes=True)
+
+
 def migrate_segments_table(conn: sqlite3.Connection) -> None:
     cur = conn.execute("PRAGMA table_info(segments);")
     cols = {r[1] for r in cur.fetchall()}
@@ -5384,7 +5567,7 @@ def db_mark_seen(conn: sqlite3.Connection, post_ids: List[str]) -> None:
     conn.commit()
 
 
-def db_enqueue_segment(conn: sqlite3.Connection, seg: Dict[str, Any]) -> bool:
+def db_enqueue_segment(conn: sqlite3.Connection, seg: Dict[str, Any], *, commit: bool = True) -> bool:
     source = seg.get("source", "feed")
     event_type = seg.get("event_type", "item")
 
@@ -5413,8 +5596,14 @@ def db_enqueue_segment(conn: sqlite3.Connection, seg: Dict[str, Any]) -> bool:
         seg.get("lead_voice", ""),
         json.dumps(seg.get("_sfx_files", []), ensure_ascii=False),
     ))
-    conn.commit()
-    return int(getattr(cur, "rowcount", 0) or 0) > 0
+    ok = int(getattr(cur, "rowcount", 0) or 0) > 0
+    # commit=False: the caller counts the row once its own commit succeeds
+    if commit:
+        with QUEUE_STATS.writing():
+            conn.commit()
+            if ok:
+                QUEUE_STATS.inserted(source)
+    return ok
 
 
 
@@ -5477,32 +5666,34 @@ def db_pop_next_segment(conn: sqlite3.Connection) -> Optional[Dict[str, Any]]:
     next_ptr = (rr_ptr + 1) % len(schedule)
 
     # single transaction: advance ptr + claim segment
-    try:
-        conn.execute("BEGIN;")
+    with QUEUE_STATS.writing():
+        try:
+            conn.execute("BEGIN;")
 
-        conn.execute(
-            "INSERT INTO scheduler_state(k,v) VALUES('rr_ptr', ?) "
-            "ON CONFLICT(k) DO UPDATE SET v=excluded.v;",
-            (str(int(next_ptr)),)
-        )
+            conn.execute(
+                "INSERT INTO scheduler_state(k,v) VALUES('rr_ptr', ?) "
+                "ON CONFLICT(k) DO UPDATE SET v=excluded.v;",
+                (str(int(next_ptr)),)
+            )
 
-        res = conn.execute(
-            "UPDATE segments SET status='claimed', claimed_ts=? "
-            "WHERE id=? AND status='queued';",
-            (now_ts(), seg_id)
-        )
+            res = conn.execute(
+                "UPDATE segments SET status='claimed', claimed_ts=? "
+                "WHERE id=? AND status='queued';",
+                (now_ts(), seg_id)
+            )
 
-        conn.execute("COMMIT;")
+            conn.execute("COMMIT;")
 
-    except Exception:
-        try:
-            conn.execute("ROLLBACK;")
         except Exception:
-            pass
-        return None
+            try:
+                conn.execute("ROLLBACK;")
+            except Exception:
+                pass
+            return None
 
-    if int(getattr(res, "rowcount", 0) or 0) == 0:
-        return None
+        if int(getattr(res, "rowcount", 0) or 0) == 0:
+            return None
+        QUEUE_STATS.moved(picked_row[4], "queued", "claimed")
 
     # decode JSON
     try:
@@ -5538,11 +5729,15 @@ def db_pop_next_segment(conn: sqlite3.Connection) -> Optional[Dict[str, Any]]:
 
 
 def db_mark_done(conn: sqlite3.Connection, seg_id: str) -> None:
-    conn.execute(
-        "UPDATE segments SET status='done' WHERE id=?;",
-        (seg_id,)
-    )
-    conn.commit()
+    prev = _segment_state(conn, seg_id)
+    with QUEUE_STATS.writing():
+        cur = conn.execute(
+            "UPDATE segments SET status='done' WHERE id=?;",
+            (seg_id,)
+        )
+        conn.commit()
+        if prev and int(getattr(cur, "rowcount", 0) or 0):
+            QUEUE_STATS.moved(prev[1], prev[0], "done")
 
 def save_memory_throttled(mem: Dict[str, Any], *, min_interval_sec: float = 2.0) -> None:
     now = now_ts()
@@ -5937,19 +6132,8 @@ def pick_diverse_candidates(
 
     return chosen
 def db_counts_by_source(conn, statuses=("queued", "claimed")):
-    ph = ",".join(["?"] * len(statuses))
-    rows = conn.execute(
-        f"""
-        SELECT COALESCE(source,'feed') AS s, COUNT(*) 
-        FROM segments
-        WHERE status IN ({ph})
-        GROUP BY COALESCE(source,'feed')
-        """,
-        tuple(statuses)
-    ).fetchall()
-
     out = {}
-    for s, n in rows:
+    for s, n in QUEUE_STATS.counts(conn, statuses).items():
         key = (s or "feed").strip().lower()
         out[key] = out.get(key, 0) + int(n or 0)
     return out
@@ -5965,17 +6149,8 @@ def can_enqueue_source(conn: sqlite3.Connection, source: str) -> bool:
         return True
 
     # count only active work (queued+claimed), and normalize sources
-    rows = conn.execute(
-        """
-        SELECT COALESCE(source,'feed') AS s, COUNT(*)
-        FROM segments
-        WHERE status IN ('queued','claimed')
-        GROUP BY COALESCE(source,'feed');
-        """
-    ).fetchall()
-
     counts: Dict[str, int] = {}
-    for s, c in rows:
+    for s, c in QUEUE_STATS.counts(conn, ("queued", "claimed")).items():
         k = _normalize_source_alias(s)
         counts[k] = counts.get(k, 0) + int(c or 0)
 
@@ -6179,6 +6354,99 @@ def apply_mix_budget(
 
     return out[:max_prompt]
 
+# =======================
+# Near-duplicate stories
+# =======================
+_NEAR_DUP: Optional[near_dup.NearDupIndex] = None
+_NEAR_DUP_LOCK = threading.Lock()
+
+
+def near_dup_index() -> near_dup.NearDupIndex:
+    """Process-wide index of recent candidates and enqueued segments (producer.near_dup.*)."""
+    global _NEAR_DUP
+    with _NEAR_DUP_LOCK:
+        if _NEAR_DUP is None:
+            _NEAR_DUP = near_dup.NearDupIndex(
+                threshold=float(cfg_get("producer.near_dup.threshold", 0.5) or 0.5),
+                max_items=int(cfg_get("producer.near_dup.max_items", 2000) or 2000),
+            )
+        return _NEAR_DUP
+
+
+def _story_text(c: Dict[str, Any]) -> str:
+    return f"{c.get('title', '') or ''}\n{(c.get('body', '') or '')[:600]}"
+
+
+def _story_key(c: Dict[str, Any]) -> str:
+    return str(c.get("post_id") or c.get("id") or "")
+
+
+def seed_near_dup_index(conn: sqlite3.Connection, limit: int = 500) -> int:
+    """Load recently produced segments so restarts don't re-air the same story."""
+    index = near_dup_index()
+    try:
+        rows = conn.execute(
+            "SELECT post_id, title, body FROM segments WHERE post_id IS NOT NULL "
+            "ORDER BY created_ts DESC LIMIT ?;", (int(limit),)
+        ).fetchall()
+    except Exception:
+        return 0
+    n = 0
+    for pid, title, body in reversed(rows):
+        if index.add(str(pid), _story_text({"title": title, "body": body}), kind="aired"):
+            n += 1
+    return n
+
+
+def collapse_near_duplicates(
+    candidates: List[Dict[str, Any]],
+    seen: set,
+    index: Optional[near_dup.NearDupIndex] = None,
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """
+    Drop unseen candidates that repeat an already-enqueued story, then collapse
+    the rest into near-duplicate clusters, keeping one representative each
+    (highest heur, then newest). Representatives carry dup_count/also_from.
+    """
+    index = index or near_dup_index()
+    stats = {"in": 0, "aired": 0, "merged": 0, "out": 0}
+
+    fresh: List[Dict[str, Any]] = []
+    for c in candidates or []:
+        pid = _story_key(c)
+        if not pid or pid in seen:
+            continue
+        stats["in"] += 1
+        if index.query(_story_text(c), key=pid, kinds=("aired",)):
+            stats["aired"] += 1
+            continue
+        fresh.append(c)
+
+    def rank(c: Dict[str, Any]):
+        try:
+            h = float(c.get("heur", 50.0) or 50.0)
+        except Exception:
+            h = 50.0
+        return (h, int(c.get("ts", 0) or 0))
+
+    out: List[Dict[str, Any]] = []
+    for group in index.cluster(fresh, _story_key, _story_text):
+        members = [fresh[i] for i in group]
+        rep = max(members, key=rank)
+        if len(members) > 1:
+            stats["merged"] += len(members) - 1
+            rep_src = (rep.get("source") or "feed").strip().lower()
+            rep = dict(rep)
+            rep["dup_count"] = len(members) - 1
+            rep["also_from"] = sorted(
+                {(m.get("source") or "feed").strip().lower() for m in members} - {rep_src}
+            )
+        out.append(rep)
+
+    stats["out"] = len(out)
+    return out, stats
+
+
 def producer_loop(stop_event: threading.Event, mem: Dict[str, Any]) -> None:
     """
     Zero show-language hardcoding.
@@ -6230,6 +6498,12 @@ def producer_loop(stop_event: threading.Event, mem: Dict[str, Any]) -> None:
     mem.setdefault("feed_candidates", [])
     mem.setdefault("_log_last", {})
 
+    near_dup_enabled = bool(cfg_get("producer.near_dup.enabled", True))
+    if near_dup_enabled:
+        n = seed_near_dup_index(conn)
+        if n:
+            log("producer", f"near-dup index seeded with {n} recent segments")
+
     def _is_muted(src: str, mix_weights: Dict[str, Any]) -> bool:
         """
         Hard mute rule:
@@ -6522,15 +6796,10 @@ def producer_loop(stop_event: threading.Event, mem: Dict[str, Any]) -> None:
                                 )
 
                                 # Tag heat: high heat -> prefer talk; low heat -> safer to play
-                                tag_heat = mem.get("tag_heat", {}) or {}
-                                max_heat = 0.0
-                                for tdata in tag_heat.values():
-                                    try:
-                                        h = float(tdata.get("heat", 0.0)) if isinstance(tdata, dict) else float(tdata or 0.0)
-                                        if h > max_heat:
-                                            max_heat = h
-                                    except Exception:
-                                        continue
+                                try:
+                                    max_heat = tag_heat_index(mem).max_heat(now_ts())
+                                except Exception:
+                                    max_heat = 0.0
                                 heat_factor = max_heat / (max_heat + 20.0) if max_heat >= 0 else 0.0
 
                                 streak = int(mem.get("_music_streak", 0) or 0)
@@ -6701,8 +6970,29 @@ def producer_loop(stop_event: threading.Event, mem: Dict[str, Any]) -> None:
             mix_weights = cfg_get("mix.weights", {}) or {}
             per_src_cap = _int("producer.per_source_cap", 4)
 
+            # One representative per near-duplicate story, none already aired
+            prompt_universe = candidates_all
+            if near_dup_enabled:
+                prompt_universe, nd_stats = collapse_near_duplicates(candidates_all, seen)
+                # Dropped stories count as seen, like aired ones, so they aren't
+                # re-hashed and re-clustered every cycle until they age out
+                kept = {_story_key(c) for c in prompt_universe}
+                dropped = sorted({_story_key(c) for c in candidates_all} - kept - seen - {""})
+                if dropped:
+                    try:
+                        db_mark_seen(conn, dropped)
+                        seen.update(dropped)
+                    except Exception as e:
+                        log("producer", f"near-dup mark seen failed: {type(e).__name__}: {e}")
+                if nd_stats["aired"] or nd_stats["merged"]:
+                    log_every(
+                        mem, "producer_near_dup", 10, "producer",
+                        f"near-dup: {nd_stats['in']}→{nd_stats['out']} candidates "
+                        f"({nd_stats['aired']} already aired, {nd_stats['merged']} merged)"
+                    )
+
             budgeted_universe = apply_mix_budget(
-                candidates_all=candidates_all,
+                candidates_all=prompt_universe,
                 seen=seen,
                 need=need,
                 max_prompt=prompt_max_candidates,
@@ -6777,6 +7067,8 @@ def producer_loop(stop_event: threading.Event, mem: Dict[str, Any]) -> None:
                     seen.add(str(pid))
                     enqueued += 1
                     update_world_state(ws, item, item)
+                    if near_dup_enabled:
+                        near_dup_index().add(str(pid), _story_text(seg_obj), kind="aired")
 
             save_memory_throttled(mem, min_interval_sec=1.5)
 
@@ -7016,6 +7308,7 @@ def rebalancer_worker(
                             qmarks = ",".join(["?"] * len(ids))
                             conn.execute(f"DELETE FROM segments WHERE id IN ({qmarks});", tuple(ids))
                             conn.commit()
+                            QUEUE_STATS.invalidate()
                             pruned += len(ids)
                             need -= len(ids)
                             log("rebalancer", f"pruned n={len(ids)} src={src} (cur={cur_count} > max_abs={max_abs})")
@@ -7035,6 +7328,7 @@ def rebalancer_worker(
                     qmarks = ",".join(["?"] * len(ids))
                     conn.execute(f"DELETE FROM segments WHERE id IN ({qmarks});", tuple(ids))
                     conn.commit()
+                    QUEUE_STATS.invalidate()
                     pruned += len(ids)
                     need -= len(ids)
                     log("rebalancer", f"pruned {len(ids)} queued rows globally to reduce queue")
@@ -7117,6 +7411,107 @@ def _format_context_block(
         return header + "\n" + "\n".join(flags) + "\n" + formatted
     return header + "\n" + formatted
 
+_CONTEXT_POOL = None
+_CONTEXT_POOL_LOCK = threading.Lock()
+
+
+def _context_pool():
+    """Bounded pool shared by all character context lookups."""
+    global _CONTEXT_POOL
+    with _CONTEXT_POOL_LOCK:
+        if _CONTEXT_POOL is None:
+            from concurrent.futures import ThreadPoolExecutor
+            workers = max(1, int(cfg_get("character_manager.context_workers", 4) or 4))
+            _CONTEXT_POOL = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ctx_engine")
+        return _CONTEXT_POOL
+
+
+def _resolve_context_query(decision: Dict[str, Any], context_chars: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Map one Character Manager context query to (character, engine config, params, reason)."""
+    if not isinstance(decision, dict):
+        return None
+    char_name = decision.get("character")
+    source_id = decision.get("source_id")
+    
+    if char_name not in context_chars:
+        return None
+
+    sources = context_chars[char_name]["sources"]
+    engine_config = None
+    if source_id:
+        engine_config = next((s for s in sources if s.get("id") == source_id), None)
+    if engine_config is None and len(sources) == 1:
+        engine_config = sources[0]
+    if engine_config is None:
+        return None
+
+    embedding_model = (cfg_get("models.embedding", "") or "").strip()
+    embedding_enabled = bool(cfg_get("embedding.enabled", False))
+    if embedding_model:
+        llm_cfg = CFG.get("llm") if isinstance(CFG.get("llm"), dict) else {}
+        engine_config = dict(engine_config)
+        engine_config["embedding_model"] = embedding_model
+        engine_config["embedding_provider"] = (llm_cfg.get("provider") or "ollama").strip().lower()
+        engine_config["embedding_endpoint"] = (llm_cfg.get("endpoint") or "").strip()
+        engine_config["embedding_api_key_env"] = (llm_cfg.get("api_key_env") or "").strip()
+        engine_config["embedding_enabled"] = embedding_enabled
+
+    return {
+        "character": char_name,
+        "engine_config": engine_config,
+        "query_params": decision.get("query_params", {}) or {},
+        "reason": decision.get("reason", ""),
+    }
+
+
+def _run_context_query(job: Dict[str, Any], station_dir: str) -> Optional[str]:
+    char_name = job["character"]
+    engine_config = job["engine_config"]
+    try:
+        result = query_context_engine(engine_config, job["query_params"], station_dir)
+    except Exception as e:
+        log("char_mgr", f"Context query error for {char_name}: {e}")
+        return None
+    if not result:
+        return None
+    engine_type = engine_config.get("type", "unknown")
+    formatted = _format_context_block(result, engine_type, char_name, engine_config, job["reason"])
+    log("char_mgr", f"Context fetched for {char_name}: {job['reason']}")
+    return formatted
+
+
+def _run_context_queries(jobs: List[Dict[str, Any]], station_dir: str) -> List[str]:
+    """
+    Query context engines concurrently on the shared pool and keep whatever
+    finishes before the deadline (character_manager.context_deadline_sec).
+    Stragglers keep running in the pool; their latency is still recorded.
+    Results keep the Character Manager's order.
+    """
+    if not jobs:
+        return []
+
+    from concurrent.futures import wait
+
+    deadline = float(cfg_get("character_manager.context_deadline_sec", 8.0) or 8.0)
+    pool = _context_pool()
+    futures = [pool.submit(_run_context_query, job, station_dir) for job in jobs]
+    done, not_done = wait(futures, timeout=deadline)
+
+    results = []
+    for job, fut in zip(jobs, futures):
+        if fut in done:
+            result = fut.result()
+            if result:
+                results.append(result)
+        else:
+            fut.cancel()  # only succeeds if it never started
+            record_context_timeout(job["engine_config"])
+    if not_done:
+        late = ", ".join(sorted({job["character"] for job, fut in zip(jobs, futures) if fut in not_done}))
+        log("char_mgr", f"Context deadline {deadline:.1f}s hit; using {len(done)}/{len(jobs)} results (late: {late})")
+    return results
+
+
 def character_manager_lookup(seg: Dict[str, Any], panel_voices: List[str], mem: Dict[str, Any]) -> Tuple[Optional[str], List[str]]:
     """
     Character Manager: Decides which characters are relevant and queries their context engines.
@@ -7245,50 +7640,14 @@ Rules:
         log("char_mgr", f"Character Manager decision error: {e}")
         return None, panel_voices
     
-    # Execute context queries
-    context_results = []
-    station_dir = STATION_DIR
-    
+    # Resolve each decision to an engine config, then query them concurrently
+    jobs = []
     for decision in context_queries:
-        char_name = decision.get("character")
-        source_id = decision.get("source_id")
-        query_params = decision.get("query_params", {})
-        reason = decision.get("reason", "")
-        
-        if char_name not in context_chars:
-            continue
-
-        sources = context_chars[char_name]["sources"]
-        engine_config = None
-        if source_id:
-            engine_config = next((s for s in sources if s.get("id") == source_id), None)
-        if engine_config is None and len(sources) == 1:
-            engine_config = sources[0]
-        if engine_config is None:
-            continue
-
-        embedding_model = (cfg_get("models.embedding", "") or "").strip()
-        embedding_enabled = bool(cfg_get("embedding.enabled", False))
-        if embedding_model:
-            llm_cfg = CFG.get("llm") if isinstance(CFG.get("llm"), dict) else {}
-            engine_config = dict(engine_config)
-            engine_config["embedding_model"] = embedding_model
-            engine_config["embedding_provider"] = (llm_cfg.get("provider") or "ollama").strip().lower()
-            engine_config["embedding_endpoint"] = (llm_cfg.get("endpoint") or "").strip()
-            engine_config["embedding_api_key_env"] = (llm_cfg.get("api_key_env") or "").strip()
-            engine_config["embedding_enabled"] = embedding_enabled
-        
-        # Query the context engine
-        try:
-            result = query_context_engine(engine_config, query_params, station_dir)
-            if result:
-                engine_type = engine_config.get("type", "unknown")
-                formatted = _format_context_block(result, engine_type, char_name, engine_config, reason)
-                context_results.append(formatted)
-                log("char_mgr", f"Context fetched for {char_name}: {reason}")
-        except Exception as e:
-            log("char_mgr", f"Context query error for {char_name}: {e}")
-            continue
+        job = _resolve_context_query(decision, context_chars)
+        if job:
+            jobs.append(job)
+    
+    context_results = _run_context_queries(jobs, STATION_DIR)
     
     # Return both context data and priority order
     context_data = "\n\n".join(context_results) if context_results else None
@@ -7731,8 +8090,7 @@ def station_id(mem: Dict[str, Any]) -> None:
     save_memory_throttled(mem, min_interval_sec=1.0)
 
 def db_distinct_queued_sources(conn: sqlite3.Connection) -> int:
-    cur = conn.execute("SELECT COUNT(DISTINCT COALESCE(source,'feed')) FROM segments WHERE status='queued';")
-    return int(cur.fetchone()[0] or 0)
+    return len(QUEUE_STATS.counts(conn, ("queued",)))
 
 
 # =======================
@@ -8001,16 +8359,13 @@ def host_loop(stop_event: threading.Event, mem: Dict[str, Any]) -> None:
 # =======================
 
 def db_depth_queued(conn) -> int:
-    cur = conn.execute("SELECT COUNT(*) FROM segments WHERE status='queued';")
-    return int(cur.fetchone()[0])
+    return QUEUE_STATS.total(conn, ("queued",))
 
 def db_depth_inflight(conn) -> int:
-    cur = conn.execute("SELECT COUNT(*) FROM segments WHERE status='claimed';")
-    return int(cur.fetchone()[0])
+    return QUEUE_STATS.total(conn, ("claimed",))
 
 def db_depth_total(conn) -> int:
-    cur = conn.execute("SELECT COUNT(*) FROM segments WHERE status IN ('queued','claimed');")
-    return int(cur.fetchone()[0])
+    return QUEUE_STATS.total(conn, ("queued", "claimed"))
 
 
 # =======================
@@ -8086,6 +8441,7 @@ def maybe_interrupt_for_callin():
     if SHOW_INTERRUPT.is_set():
         try:
             sd.stop()
+            audio_mixer.get_mixer().stop_bus("voice", fade_out=0.01)
         except Exception as e:
             log("ERR", f"{type(e).__name__}: {e}")
 
@@ -8322,6 +8678,7 @@ def ui_event_worker(stop_event: threading.Event, mem: Dict[str, Any]) -> None:
 
                     conn.commit()
                     conn.close()
+                    QUEUE_STATS.invalidate()
 
                     # Clear in-memory candidates too (otherwise it will instantly reuse the same old backlog)
                     try:
@@ -8617,6 +8974,7 @@ def ui_event_worker(stop_event: threading.Event, mem: Dict[str, Any]) -> None:
                         )
                         conn2.commit()
                         conn2.close()
+                        QUEUE_STATS.invalidate()
 
                         producer_kick.set()
 
@@ -8732,7 +9090,9 @@ def db_get_segment_by_id(conn, seg_id: str) -> Optional[Dict[str, Any]]:
 
 def status_worker(stop_event, station_dir, mem):
     """
-    Writes station_dir/status.json every 0.5s.
+    Publishes status every 0.5s on the local status channel (sent only when
+    it changed, plus heartbeats) and writes station_dir/status.json every
+    status.file_interval_sec as a fallback (every tick if the channel failed).
     Must NEVER crash. Uses its own DB connection.
     """
 
@@ -8744,6 +9104,18 @@ def status_worker(stop_event, station_dir, mem):
     except Exception:
         conn = None
 
+    channel = status_channel.StatusPublisher(station_dir)
+    channel_ok = channel.start()
+    if channel_ok:
+        log("status", f"status channel listening on {channel.address}")
+    else:
+        log("status", "status channel unavailable; writing status.json only")
+    try:
+        file_every = float(cfg_get("status.file_interval_sec", 5.0) or 5.0)
+    except Exception:
+        file_every = 5.0
+    last_file = 0.0
+
     last_ok_ts = 0
 
     while not stop_event.is_set():
@@ -8783,8 +9155,16 @@ def status_worker(stop_event, station_dir, mem):
                 "last_title": mem.get("last_title"),
                 "last_source": mem.get("last_source"),
             }
-
-            write_status(station_dir, data)
+            if HAS_CONTEXT_ENGINE:
+                data["context_engines"] = context_latency_stats()
+            data["queue_stats"] = QUEUE_STATS.snapshot()
+            data["router"] = dict(ROUTER_METRICS.snapshot(), queue=event_q.stats())
+
+            if channel_ok:
+                channel.publish(data)
+            if not channel_ok or time.monotonic() - last_file >= file_every:
+                write_status(station_dir, data)
+                last_file = time.monotonic()
             last_ok_ts = now_ts()
 
         except Exception as e:
@@ -8798,6 +9178,7 @@ def status_worker(stop_event, station_dir, mem):
 
         time.sleep(0.5)
 
+    channel.close()
     try:
         if conn is not None:
             conn.close()
@@ -8918,31 +9299,31 @@ def main():
 
     global CFG, CHARACTERS, LIVE_ROLES, STATION_MEMORY
 
+    _STARTUP.step("manifest")
+
     # ------------------
     # Load manifest
     # ------------------
 
     CFG = load_station_manifest()
     
+    _STARTUP.step("mixer")
+
     # ------------------
-    # Initialize pygame mixer for file audio (music/sfx)
+    # Start the shared mixer for file audio (music/sfx)
     # ------------------
-    
-    if HAS_PYGAME:
-        try:
-            pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
-            pygame.mixer.set_num_channels(16)  # Allow multiple simultaneous sounds
-            log("audio", "pygame.mixer initialized for file audio playback")
-            
-            # Apply master volume from config if present
-            audio_cfg = CFG.get("audio", {})
-            master_volume = audio_cfg.get("master_volume", 0.8)
-            pygame.mixer.music.set_volume(master_volume)
-            
-        except Exception as e:
-            log("audio", f"pygame.mixer initialization failed: {e}")
-    else:
-        log("audio", "pygame not available - file audio (music/sfx) disabled")
+
+    try:
+        audio_cfg = CFG.get("audio", {})
+        mixer = audio_mixer.get_mixer(
+            sink=audio_cfg.get("output", "device"),
+            log=lambda msg: log("audio", msg),
+        )
+        log("audio", f"Mixer started ({type(mixer.sink).__name__}, {mixer.sample_rate} Hz)")
+    except Exception as e:
+        log("audio", f"Mixer initialization failed: {e}")
+
+    _STARTUP.step("memory")
 
     # ------------------
     # Load Memory EARLY (before plugins need it)
@@ -8981,7 +9362,7 @@ def main():
         "SHOW_INTERRUPT": SHOW_INTERRUPT,
         "PBP_ACTIVE": PBP_ACTIVE,
         "audio_queue": audio_queue,
-        "db_connect": db_connect,
+        "db_connect": db_connect_tracked,
         "db_enqueue_segment": db_enqueue_segment,
     }
     
@@ -8998,6 +9379,7 @@ def main():
         ).rowcount
         _boot_conn.commit()
         _boot_conn.close()
+        QUEUE_STATS.invalidate()
         if _boot_flushed:
             log("init", f"🧹 Flushed {_boot_flushed} stale queued audio segments from previous session")
         else:
@@ -9005,6 +9387,8 @@ def main():
     except Exception as _boot_flush_err:
         log("init", f"⚠️  Could not flush stale audio on boot: {_boot_flush_err}")
     
+    _STARTUP.step("meta_plugins")
+
     # ------------------
     # Load Meta Plugins FIRST
     # ------------------
@@ -9012,6 +9396,8 @@ def main():
     plugin_dir = GLOBAL_PLUGINS_DIR or os.path.join(RADIO_OS_ROOT, "plugins")
     load_meta_plugins(plugin_dir)
 
+    _STARTUP.step("plugins")
+
     # ------------------
     # Load plugins ONCE (now with mem available)
     # ------------------
@@ -9044,6 +9430,8 @@ def main():
     except Exception as e:
         log("audio", f"sounddevice error: {e}")
 
+    _STARTUP.step("ui")
+
     # ------------------
     # UI
     # ------------------
@@ -9064,6 +9452,8 @@ def main():
         traceback.print_exc()
         raise
         
+    _STARTUP.step("characters")
+
     # ------------------
     # Characters
     # ------------------
@@ -9072,6 +9462,8 @@ def main():
     CHARACTERS = init_characters()
     LIVE_ROLES = compute_live_roles()
 
+    _STARTUP.step("meta_plugin_init")
+
     # ------------------
     # Initialize Active Meta Plugin
     # ------------------
@@ -9117,7 +9509,7 @@ def main():
         "cfg_get": cfg_get,
         # Database & Paths
         "db_enqueue_segment": db_enqueue_segment,
-        "db_connect": db_connect,
+        "db_connect": db_connect_tracked,
         "STATION_DIR": STATION_DIR,
     }
     
@@ -9149,6 +9541,8 @@ def main():
 
     ui.root.protocol("WM_DELETE_WINDOW", on_close)
 
+    _STARTUP.step("db_seed")
+
     # ------------------
     # DB seed
     # ------------------
@@ -9166,6 +9560,7 @@ def main():
             log("init", "Flushing queued segments (scheduler.flush_on_startup=true)")
             conn.execute("DELETE FROM segments WHERE status='queued';")
             conn.commit()
+            QUEUE_STATS.invalidate()
         
         log("init", "Enqueueing cold open")
         enqueue_cold_open(conn, mem)
@@ -9179,6 +9574,8 @@ def main():
 
     threads: List[threading.Thread] = []
 
+    _STARTUP.step("workers")
+
     # ------------------
     # Core workers
     # ------------------
@@ -9333,6 +9730,8 @@ def main():
     # Start config reloader
     _start_feed_config_reloader(active_feed_configs)
 
+    _STARTUP.step("threads")
+
     # ------------------
     # Start threads
     # ------------------
@@ -9348,6 +9747,12 @@ def main():
             raise
 
     log("init", "All threads started, entering UI mainloop")
+    _STARTUP.step("first_paint")
+    ui.root.after_idle(lambda: _STARTUP.finish(
+        STATION_DIR,
+        startup_trace.budget_from_env() or (CFG.get("startup") or {}).get("budget_ms"),
+        log,
+    ))
     try:
         ui.root.mainloop()
     finally:
@@ -7,7 +7,7 @@ Per-character optional context lookup system for accurate data injection.
 Supports three engine types:
 - API: HTTP requests to external APIs
 - DB: SQLite queries against local databases  
-- Text: File-based RAG with keyword/semantic search
+- Text: File-based RAG with keyword search over a persistent FTS5 index
 
 Used by Character Manager to provide accurate context before host generation.
 """
@@ -16,7 +16,10 @@ import os
 import json
 import time
 import sqlite3
+import hashlib
+import threading
 import requests
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
 
@@ -60,35 +63,160 @@ def get_env_or_config(key: str, config_value: Optional[str] = None) -> Optional[
 # ==============================================
 
 class ContextCache:
-    """Simple in-memory cache with TTL"""
-    
-    def __init__(self):
-        self._cache: Dict[str, Tuple[Any, float]] = {}
+    """Size-bounded LRU cache with TTL (thread-safe)"""
+    
+    def __init__(self, max_entries: int = 512, max_age: int = 3600):
+        """
+        Args:
+            max_entries: Least-recently-used entries are evicted beyond this
+            max_age: Entries older than this are dropped on set(), whatever TTL readers pass
+        """
+        self._cache: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+        self.max_age = max_age
     
     def get(self, key: str, ttl: int = 300) -> Optional[Any]:
         """Get cached value if not expired"""
-        if key not in self._cache:
-            return None
-        
-        value, timestamp = self._cache[key]
-        if time.time() - timestamp > ttl:
-            del self._cache[key]
-            return None
-        
-        return value
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            
+            value, timestamp = entry
+            if time.time() - timestamp > ttl:
+                del self._cache[key]
+                return None
+            
+            self._cache.move_to_end(key)
+            return value
     
     def set(self, key: str, value: Any):
         """Cache a value with current timestamp"""
-        self._cache[key] = (value, time.time())
+        now = time.time()
+        with self._lock:
+            self._cache[key] = (value, now)
+            self._cache.move_to_end(key)
+            
+            # Expired entries sit at the LRU end unless recently read
+            while self._cache:
+                oldest_key, (_, ts) = next(iter(self._cache.items()))
+                if len(self._cache) > self.max_entries or now - ts > self.max_age:
+                    self._cache.popitem(last=False)
+                else:
+                    break
     
     def clear(self):
         """Clear all cached values"""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+    
+    def __len__(self) -> int:
+        return len(self._cache)
 
 
 _global_cache = ContextCache()
 
 
+# ==============================================
+# Latency Stats
+# ==============================================
+
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class EngineLatencyStats:
+    """Per-engine latency histograms with fixed buckets (thread-safe)"""
+    
+    def __init__(self, buckets_ms: Tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self._lock = threading.Lock()
+        self._engines: Dict[str, Dict[str, Any]] = {}
+    
+    def _entry(self, engine: str) -> Dict[str, Any]:
+        entry = self._engines.get(engine)
+        if entry is None:
+            entry = self._engines[engine] = {
+                "count": 0, "errors": 0, "timeouts": 0,
+                "total_ms": 0.0, "max_ms": 0.0, "last_ms": 0.0,
+                "hist": [0] * (len(self.buckets_ms) + 1),
+            }
+        return entry
+    
+    def record(self, engine: str, elapsed_ms: float, ok: bool = True):
+        """Record one completed query (including ones the caller stopped waiting for)"""
+        slot = len(self.buckets_ms)
+        for i, upper in enumerate(self.buckets_ms):
+            if elapsed_ms <= upper:
+                slot = i
+                break
+        with self._lock:
+            entry = self._entry(engine)
+            entry["count"] += 1
+            entry["total_ms"] += elapsed_ms
+            entry["last_ms"] = elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+            entry["hist"][slot] += 1
+            if not ok:
+                entry["errors"] += 1
+    
+    def record_timeout(self, engine: str):
+        """Count a query whose result arrived after the caller's deadline"""
+        with self._lock:
+            self._entry(engine)["timeouts"] += 1
+    
+    def _percentile(self, hist: List[int], count: int, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile (None past the last bucket)"""
+        if not count:
+            return None
+        need = q * count
+        seen = 0
+        for i, n in enumerate(hist):
+            seen += n
+            if seen >= need:
+                return float(self.buckets_ms[i]) if i < len(self.buckets_ms) else None
+        return None
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """JSON-friendly summary per engine"""
+        labels = [f"<={b}ms" for b in self.buckets_ms] + [f">{self.buckets_ms[-1]}ms"]
+        out = {}
+        with self._lock:
+            for engine, e in self._engines.items():
+                count = e["count"]
+                out[engine] = {
+                    "count": count,
+                    "errors": e["errors"],
+                    "timeouts": e["timeouts"],
+                    "mean_ms": round(e["total_ms"] / count, 1) if count else None,
+                    "p50_ms": self._percentile(e["hist"], count, 0.50),
+                    "p95_ms": self._percentile(e["hist"], count, 0.95),
+                    "max_ms": round(e["max_ms"], 1),
+                    "last_ms": round(e["last_ms"], 1),
+                    "histogram": dict(zip(labels, e["hist"])),
+                }
+        return out
+
+
+_latency_stats = EngineLatencyStats()
+
+
+def engine_label(engine_config: Dict[str, Any]) -> str:
+    """Stable per-engine key for stats, e.g. 'api:weather'"""
+    engine_type = (engine_config.get("type") or "unknown").lower()
+    name = engine_config.get("id") or engine_config.get("name") or "default"
+    return f"{engine_type}:{name}"
+
+
+def context_latency_stats() -> Dict[str, Dict[str, Any]]:
+    """Per-engine latency histograms for status reporting"""
+    return _latency_stats.snapshot()
+
+
+def record_context_timeout(engine_config: Dict[str, Any]):
+    _latency_stats.record_timeout(engine_label(engine_config))
+
+
 # ==============================================
 # API Engine
 # ==============================================
@@ -258,15 +386,231 @@ def query_db_engine(config: Dict[str, Any], params: Dict[str, Any], station_dir:
 # Text/RAG Engine
 # ==============================================
 
+TEXT_EXTENSIONS = ("*.txt", "*.md")
+
+_index_locks: Dict[str, threading.Lock] = {}
+_index_locks_guard = threading.Lock()
+
+
+def _list_text_files(text_path: str) -> List[str]:
+    """The .txt/.md files a text source covers (a file, or a directory's top level)"""
+    if os.path.isfile(text_path):
+        return [text_path]
+    files: List[str] = []
+    if os.path.isdir(text_path):
+        for ext in TEXT_EXTENSIONS:
+            files.extend(str(p) for p in Path(text_path).glob(ext))
+    return sorted(files)
+
+
+def _chunk_text(content: str, chunk_size: int) -> List[Tuple[int, str]]:
+    """Fixed-size character chunks as (offset, text)"""
+    return [(i, content[i:i + chunk_size]) for i in range(0, len(content), chunk_size)]
+
+
+class TextIndex:
+    """
+    On-disk FTS5 index of a text source's chunks.
+    
+    Built incrementally: on each refresh only files whose mtime/size changed
+    are re-chunked; removed files are dropped. Queries rank chunks with BM25.
+    """
+    
+    SCHEMA_VERSION = "2"
+    
+    def __init__(self, text_path: str, index_path: str, chunk_size: int = 500):
+        self.text_path = text_path
+        self.index_path = index_path
+        self.chunk_size = chunk_size
+        with _index_locks_guard:
+            self._lock = _index_locks.setdefault(index_path, threading.Lock())
+    
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.index_path, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        return conn
+    
+    @staticmethod
+    def _create_tables(conn: sqlite3.Connection) -> None:
+        for table in ("chunks", "chunk_meta", "files"):
+            conn.execute(f"DROP TABLE IF EXISTS {table}")
+        conn.execute("CREATE TABLE files (path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER)")
+        # chunk_meta shares rowids with the FTS table so per-file deletes use an index
+        conn.execute("CREATE TABLE chunk_meta (id INTEGER PRIMARY KEY, path TEXT, offset INTEGER)")
+        conn.execute("CREATE INDEX chunk_meta_path ON chunk_meta (path)")
+        conn.execute("CREATE VIRTUAL TABLE chunks USING fts5(text, tokenize='unicode61')")
+    
+    @staticmethod
+    def _drop_file(conn: sqlite3.Connection, path: str) -> None:
+        conn.execute("DELETE FROM chunks WHERE rowid IN (SELECT id FROM chunk_meta WHERE path = ?)", (path,))
+        conn.execute("DELETE FROM chunk_meta WHERE path = ?", (path,))
+    
+    def refresh(self, conn: sqlite3.Connection) -> int:
+        """Bring the index up to date with the source. Returns files re-indexed."""
+        with self._lock:
+            meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+            layout = f"{self.SCHEMA_VERSION}:{self.chunk_size}"
+            
+            with conn:
+                if meta.get("layout") != layout:
+                    # New index, or schema/chunking changed: start over
+                    self._create_tables(conn)
+                    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('layout', ?)", (layout,))
+                
+                known = {row[0]: (row[1], row[2]) for row in conn.execute("SELECT path, mtime_ns, size FROM files")}
+                current = _list_text_files(self.text_path)
+                
+                for gone in set(known) - set(current):
+                    self._drop_file(conn, gone)
+                    conn.execute("DELETE FROM files WHERE path = ?", (gone,))
+                
+                updated = 0
+                for path in current:
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    stamp = (st.st_mtime_ns, st.st_size)
+                    if known.get(path) == stamp:
+                        continue
+                    
+                    try:
+                        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                            content = f.read()
+                    except Exception as e:
+                        print(f"Text engine error reading {path}: {e}")
+                        continue
+                    
+                    self._drop_file(conn, path)
+                    chunks = _chunk_text(content, self.chunk_size)
+                    first = (conn.execute("SELECT COALESCE(MAX(id), 0) FROM chunk_meta").fetchone()[0]) + 1
+                    conn.executemany(
+                        "INSERT INTO chunk_meta (id, path, offset) VALUES (?, ?, ?)",
+                        [(first + n, path, offset) for n, (offset, _) in enumerate(chunks)]
+                    )
+                    conn.executemany(
+                        "INSERT INTO chunks (rowid, text) VALUES (?, ?)",
+                        [(first + n, chunk) for n, (_, chunk) in enumerate(chunks)]
+                    )
+                    conn.execute(
+                        "INSERT OR REPLACE INTO files (path, mtime_ns, size) VALUES (?, ?, ?)",
+                        (path, stamp[0], stamp[1])
+                    )
+                    updated += 1
+            return updated
+    
+    @staticmethod
+    def _match_expression(search_terms: List[str]) -> str:
+        """OR of quoted prefix phrases, so 'race' still finds 'racing' like the old substring test"""
+        parts = []
+        for term in search_terms:
+            term = term.replace('"', '""').strip()
+            if term:
+                parts.append(f'"{term}" *')
+        return " OR ".join(parts)
+    
+    def search(self, search_terms: List[str], max_results: int = 5) -> List[Dict[str, Any]]:
+        expr = self._match_expression(search_terms)
+        if not expr:
+            return []
+        
+        conn = self._connect()
+        try:
+            self.refresh(conn)
+            try:
+                rows = conn.execute(
+                    "SELECT c.text, m.path, m.offset, c.rank FROM "
+                    "(SELECT rowid, text, bm25(chunks) AS rank FROM chunks "
+                    " WHERE chunks MATCH ? ORDER BY rank LIMIT ?) AS c "
+                    "JOIN chunk_meta AS m ON m.id = c.rowid ORDER BY c.rank",
+                    (expr, max_results)
+                ).fetchall()
+            except sqlite3.OperationalError:
+                # Terms FTS can't parse (e.g. punctuation only)
+                return []
+        finally:
+            conn.close()
+        
+        results = []
+        for text, path, offset, rank in rows:
+            chunk_lower = text.lower()
+            results.append({
+                "file": os.path.basename(path),
+                "offset": offset,
+                "text": text.strip(),
+                "score": round(-rank, 4),  # bm25() is lower-is-better
+                "matches": [t for t in search_terms if t in chunk_lower]
+            })
+        return results
+
+
+def _fts5_available() -> bool:
+    try:
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE VIRTUAL TABLE t USING fts5(x)")
+        conn.close()
+        return True
+    except sqlite3.Error:
+        return False
+
+
+HAS_FTS5 = _fts5_available()
+
+
+def _text_index_path(config: Dict[str, Any], text_path: str, chunk_size: int, station_dir: str) -> str:
+    """Index file location: config 'index_path', else <station>/.context_index/<hash>.sqlite"""
+    explicit = (config.get("index_path") or "").strip()
+    if explicit:
+        return resolve_context_path(station_dir, explicit)
+    base = station_dir or (text_path if os.path.isdir(text_path) else os.path.dirname(text_path))
+    digest = hashlib.sha1(f"{os.path.abspath(text_path)}:{chunk_size}".encode("utf-8")).hexdigest()[:16]
+    return os.path.join(base, ".context_index", f"{digest}.sqlite")
+
+
+def _scan_text_files(text_path: str, search_terms: List[str], chunk_size: int, max_results: int) -> List[Dict[str, Any]]:
+    """Full re-scan with substring scoring (fallback when FTS5 is unavailable)"""
+    results = []
+    
+    for file_path in _list_text_files(text_path):
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+            
+            # Score each chunk by keyword matches
+            for offset, chunk in _chunk_text(content, chunk_size):
+                chunk_lower = chunk.lower()
+                score = sum(1 for term in search_terms if term in chunk_lower)
+                
+                if score > 0:
+                    results.append({
+                        "file": os.path.basename(file_path),
+                        "offset": offset,
+                        "text": chunk.strip(),
+                        "score": score,
+                        "matches": [t for t in search_terms if t in chunk_lower]
+                    })
+        
+        except Exception as e:
+            print(f"Text engine error reading {file_path}: {e}")
+            continue
+    
+    # Sort by score and limit
+    results.sort(key=lambda x: x["score"], reverse=True)
+    return results[:max_results]
+
+
 def query_text_engine(config: Dict[str, Any], params: Dict[str, Any], station_dir: str = "") -> Optional[List[Dict[str, Any]]]:
     """
-    Execute text-based context lookup (simple keyword search).
+    Execute text-based context lookup (keyword search, BM25-ranked).
     
     Config:
         source: Path to text file or directory
         search_mode: "keyword" or "semantic" (semantic needs embeddings - future)
         max_results: Maximum number of results to return
         chunk_size: Characters per chunk (for file splitting)
+        index_path: Optional location of the on-disk index
     
     Params:
         query: Search query string
@@ -308,49 +652,16 @@ def query_text_engine(config: Dict[str, Any], params: Dict[str, Any], station_di
     if cached is not None:
         return cached
     
-    # Read files
-    files_to_search = []
-    if os.path.isfile(text_path):
-        files_to_search.append(text_path)
-    elif os.path.isdir(text_path):
-        # Search all .txt and .md files in directory
-        for ext in ["*.txt", "*.md"]:
-            files_to_search.extend(Path(text_path).glob(ext))
-    
-    results = []
-    
-    for file_path in files_to_search:
+    results = None
+    if HAS_FTS5:
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            # Split into chunks
-            chunks = []
-            for i in range(0, len(content), chunk_size):
-                chunk = content[i:i + chunk_size]
-                chunks.append((i, chunk))
-            
-            # Score each chunk by keyword matches
-            for offset, chunk in chunks:
-                chunk_lower = chunk.lower()
-                score = sum(1 for term in search_terms if term in chunk_lower)
-                
-                if score > 0:
-                    results.append({
-                        "file": os.path.basename(file_path),
-                        "offset": offset,
-                        "text": chunk.strip(),
-                        "score": score,
-                        "matches": [t for t in search_terms if t in chunk_lower]
-                    })
-        
+            index = TextIndex(text_path, _text_index_path(config, text_path, chunk_size, station_dir), chunk_size)
+            results = index.search(search_terms, max_results)
         except Exception as e:
-            print(f"Text engine error reading {file_path}: {e}")
-            continue
+            print(f"Text engine index error, falling back to scan: {e}")
     
-    # Sort by score and limit
-    results.sort(key=lambda x: x["score"], reverse=True)
-    results = results[:max_results]
+    if results is None:
+        results = _scan_text_files(text_path, search_terms, chunk_size, max_results)
     
     _global_cache.set(cache_key, results)
     return results
@@ -383,13 +694,22 @@ def query_context_engine(
     engine_type = engine_config.get("type", "").lower()
     
     if engine_type == "api":
-        return query_api_engine(engine_config, params, station_dir)
+        query_fn = query_api_engine
     elif engine_type == "db":
-        return query_db_engine(engine_config, params, station_dir)
+        query_fn = query_db_engine
     elif engine_type == "text":
-        return query_text_engine(engine_config, params, station_dir)
+        query_fn = query_text_engine
     else:
         return None
+    
+    t0 = time.perf_counter()
+    ok = False
+    try:
+        result = query_fn(engine_config, params, station_dir)
+        ok = True
+        return result
+    finally:
+        _latency_stats.record(engine_label(engine_config), (time.perf_counter() - t0) * 1000.0, ok)
 
 
 # ==============================================
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Event Router Primitives
+
+Building blocks for the host's event_router_worker:
+
+- EventQueue: drop-in for the station's event_q (put/get/get_nowait/qsize
+  with queue.Empty semantics) that is bounded and never blocks producers.
+  Each source has an overflow policy:
+    drop_oldest  evict that source's oldest pending event (default)
+    drop_new     reject the incoming event
+    merge        coalesce with a pending event of the same (type, key/title),
+                 keeping its place in line; drop_oldest when still full
+  When the whole queue is full the source with the most pending events
+  loses its oldest one, so one bursty feed can't push out everyone else.
+- DedupeRing: "seen within window_sec" check over time buckets; a whole
+  bucket expires at once instead of scanning every key. seen()/add() are
+  split so callers can record a key only once the event is committed.
+- RouterMetrics: queue lag (enqueue -> route) and throughput for status.
+"""
+from __future__ import annotations
+
+import math
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+POLICIES = ("drop_oldest", "drop_new", "merge")
+
+
+def _source_of(item: Any) -> str:
+    src = getattr(item, "source", None)
+    if src is None and isinstance(item, dict):
+        src = item.get("source")
+    return str(src or "?").strip().lower() or "?"
+
+
+def _merge_key(item: Any) -> Tuple[str, str]:
+    etype = getattr(item, "type", None)
+    payload = getattr(item, "payload", None)
+    if isinstance(item, dict):
+        etype = item.get("type")
+        payload = item.get("payload") or item.get("data")
+    payload = payload if isinstance(payload, dict) else {}
+    return str(etype or ""), str(payload.get("key") or payload.get("title") or "")
+
+
+class _Slot:
+    __slots__ = ("item", "ts", "source", "key", "alive")
+
+    def __init__(self, item: Any, ts: float, source: str, key: Optional[Tuple[str, str]]):
+        self.item = item
+        self.ts = ts
+        self.source = source
+        self.key = key
+        self.alive = True
+
+
+class EventQueue:
+    """Bounded, non-blocking multi-source event queue (queue.Queue-compatible reads)."""
+
+    def __init__(self, maxsize: int = 2000, per_source_max: int = 200,
+                 policies: Optional[Dict[str, str]] = None, default_policy: str = "drop_oldest"):
+        self._cv = threading.Condition()
+        self._fifo: Deque[_Slot] = deque()
+        self._by_source: Dict[str, Deque[_Slot]] = {}
+        self._by_key: Dict[Tuple[str, Tuple[str, str]], _Slot] = {}
+        self._counts: Dict[str, int] = {}  # live slots per source
+        self._size = 0
+        self.dropped: Dict[str, int] = {}
+        self.merged: Dict[str, int] = {}
+        self.maxsize = 2000
+        self.per_source_max = 200
+        self.policies: Dict[str, str] = {}
+        self.default_policy = "drop_oldest"
+        self.configure(maxsize, per_source_max, policies, default_policy)
+
+    def configure(self, maxsize: Optional[int] = None, per_source_max: Optional[int] = None,
+                  policies: Optional[Dict[str, str]] = None, default_policy: Optional[str] = None) -> None:
+        with self._cv:
+            if maxsize is not None:
+                self.maxsize = max(1, int(maxsize))
+            if per_source_max is not None:
+                self.per_source_max = max(1, int(per_source_max))
+            if policies is not None:
+                self.policies = {str(k).strip().lower(): str(v).strip().lower()
+                                 for k, v in policies.items() if str(v).strip().lower() in POLICIES}
+            if default_policy in POLICIES:
+                self.default_policy = default_policy
+
+    # ---------- internals (caller holds _cv) ----------
+
+    def _kill(self, slot: _Slot) -> None:
+        slot.alive = False
+        self._size -= 1
+        self._counts[slot.source] -= 1
+        q = self._by_source.get(slot.source)
+        if q:
+            while q and not q[0].alive:
+                q.popleft()
+        if slot.key is not None and self._by_key.get((slot.source, slot.key)) is slot:
+            del self._by_key[(slot.source, slot.key)]
+
+    def _oldest(self, source: str) -> Optional[_Slot]:
+        q = self._by_source.get(source)
+        while q and not q[0].alive:
+            q.popleft()
+        return q[0] if q else None
+
+    def _compact(self) -> None:
+        """Forget evicted slots still sitting in the FIFOs (they are skipped lazily otherwise)."""
+        self._fifo = deque(s for s in self._fifo if s.alive)
+        for src, q in list(self._by_source.items()):
+            live = deque(s for s in q if s.alive)
+            if live:
+                self._by_source[src] = live
+            else:
+                del self._by_source[src]
+                self._counts.pop(src, None)
+
+    def _drop(self, source: str) -> None:
+        self.dropped[source] = self.dropped.get(source, 0) + 1
+
+    def _pop(self) -> _Slot:
+        while self._fifo:
+            slot = self._fifo.popleft()
+            if slot.alive:
+                self._kill(slot)
+                return slot
+        raise queue.Empty
+
+    # ---------- producer side ----------
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> bool:
+        """Enqueue without blocking. False if the event was dropped or merged away."""
+        source = _source_of(item)
+        policy = self.policies.get(source, self.default_policy)
+        key = _merge_key(item) if policy == "merge" else None
+        now = time.monotonic()
+
+        with self._cv:
+            if key is not None:
+                prev = self._by_key.get((source, key))
+                if prev is not None and prev.alive:
+                    prev.item = item  # newer payload, original place in line
+                    self.merged[source] = self.merged.get(source, 0) + 1
+                    return False
+
+            if self._counts.get(source, 0) >= self.per_source_max:
+                if policy == "drop_new":
+                    self._drop(source)
+                    return False
+                victim = self._oldest(source)
+                if victim is not None:
+                    self._kill(victim)
+                    self._drop(source)
+
+            if self._size >= self.maxsize:
+                if policy == "drop_new":
+                    self._drop(source)
+                    return False
+                hog = max(self._counts, key=self._counts.__getitem__, default=None)
+                victim = self._oldest(hog) if hog is not None else None
+                if victim is not None:
+                    self._kill(victim)
+                    self._drop(hog)
+
+            if len(self._fifo) > 2 * self.maxsize + 64:
+                self._compact()
+
+            slot = _Slot(item, now, source, key)
+            self._fifo.append(slot)
+            self._by_source.setdefault(source, deque()).append(slot)
+            if key is not None:
+                self._by_key[(source, key)] = slot
+            self._size += 1
+            self._counts[source] = self._counts.get(source, 0) + 1
+            self._cv.notify()
+            return True
+
+    def put_nowait(self, item: Any) -> bool:
+        return self.put(item, block=False)
+
+    # ---------- consumer side ----------
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        with self._cv:
+            if block and self._size == 0:
+                self._cv.wait_for(lambda: self._size > 0, timeout)
+            return self._pop().item
+
+    def get_nowait(self) -> Any:
+        return self.get(block=False)
+
+    def get_batch(self, max_items: int, timeout: Optional[float] = None) -> List[Tuple[Any, float]]:
+        """Up to max_items (item, enqueue_monotonic_ts) pairs in FIFO order; waits only for the first."""
+        out: List[Tuple[Any, float]] = []
+        with self._cv:
+            if self._size == 0 and timeout:
+                self._cv.wait_for(lambda: self._size > 0, timeout)
+            while len(out) < max_items:
+                try:
+                    slot = self._pop()
+                except queue.Empty:
+                    break
+                out.append((slot.item, slot.ts))
+        return out
+
+    def qsize(self) -> int:
+        return self._size
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cv:
+            oldest = next((s.ts for s in self._fifo if s.alive), None)
+            pending = {src: n for src, n in self._counts.items() if n}
+            return {
+                "depth": self._size,
+                "maxsize": self.maxsize,
+                "pending": pending,
+                "oldest_age_sec": round(time.monotonic() - oldest, 3) if oldest is not None else 0.0,
+                "dropped": dict(self.dropped),
+                "merged": dict(self.merged),
+            }
+
+
+class DedupeRing:
+    """
+    Keys seen in the last window_sec, held in ceil(window/bucket)+1 time
+    buckets. Expiry swaps out a whole bucket; lookups check each live bucket.
+    """
+
+    def __init__(self, window_sec: float = 90.0, bucket_sec: float = 5.0):
+        self.window_sec = float(window_sec)
+        self.bucket_sec = max(float(bucket_sec), 0.001)
+        self._n = int(math.ceil(self.window_sec / self.bucket_sec)) + 1
+        self._buckets: List[set] = [set() for _ in range(self._n)]
+        self._epochs: List[int] = [-1] * self._n
+
+    def _live(self, epoch: int):
+        oldest = epoch - self._n + 1
+        for i in range(self._n):
+            if self._epochs[i] >= oldest:
+                yield self._buckets[i]
+
+    def seen(self, key: str, now: Optional[float] = None) -> bool:
+        """True if key was added within the window."""
+        now = time.time() if now is None else now
+        epoch = int(now // self.bucket_sec)
+        return any(key in bucket for bucket in self._live(epoch))
+
+    def add(self, key: str, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        epoch = int(now // self.bucket_sec)
+        i = epoch % self._n
+        if self._epochs[i] != epoch:
+            self._buckets[i] = set()  # whole bucket expires here
+            self._epochs[i] = epoch
+        self._buckets[i].add(key)
+
+    def check_and_add(self, key: str, now: Optional[float] = None) -> bool:
+        """True (and remember key) if key wasn't seen in the window; False for a duplicate."""
+        if self.seen(key, now):
+            return False
+        self.add(key, now)
+        return True
+
+    def __len__(self) -> int:
+        return sum(len(b) for b in self._buckets)
+
+
+class RouterMetrics:
+    """Queue lag (seconds from put to routing) and throughput, for status.json."""
+
+    def __init__(self, alpha: float = 0.2):
+        self.alpha = alpha
+        self.lag_ewma = 0.0
+        self.lag_max = 0.0
+        self.routed = 0
+        self.deduped = 0
+        self.batches = 0
+        self.last_batch = 0
+        self._lock = threading.Lock()
+
+    def record_batch(self, lags: List[float], routed: int, deduped: int) -> None:
+        with self._lock:
+            self.batches += 1
+            self.last_batch = len(lags)
+            self.routed += routed
+            self.deduped += deduped
+            if lags:
+                worst = max(lags)
+                self.lag_max = max(self.lag_max * 0.99, worst)
+                self.lag_ewma += self.alpha * (sum(lags) / len(lags) - self.lag_ewma)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "lag_ms": round(self.lag_ewma * 1000.0, 1),
+                "lag_max_ms": round(self.lag_max * 1000.0, 1),
+                "routed": self.routed,
+                "deduped": self.deduped,
+                "batches": self.batches,
+                "last_batch": self.last_batch,
+            }
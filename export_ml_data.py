@@ -1,8 +1,10 @@
-"""Export ML training data from database to JSON files for training."""
+"""Export ML training data from database to memory-mappable .npy shards (pass --json for the legacy JSON files)."""
 from plugins.ftb_state_db import query_ai_decisions, query_team_outcomes
+from plugins.ftb_ml_policy import export_training_arrays
 import json
 import glob
 import os
+import sys
 
 # Find latest database
 db_files = glob.glob("data/ml_training/*.db")
@@ -10,22 +12,28 @@ latest_db = max(db_files, key=os.path.getmtime)
 
 print(f"Exporting from: {latest_db}")
 
-# Query data
-decisions = query_ai_decisions(latest_db, limit=100000)
-outcomes = query_team_outcomes(latest_db, limit=10000)
+# Stream decisions straight into training arrays
+arrays_dir = os.path.join("data", "ml_training", "training_arrays")
+manifest = export_training_arrays(latest_db, arrays_dir)
 
-print(f"Decisions: {len(decisions)}")
-print(f"Outcomes: {len(outcomes)}")
-
-# Export to simple JSON files
-with open("training_decisions.json", "w") as f:
-    json.dump(decisions, f, indent=2)
+print(f"Decisions: {manifest['decisions_scanned']}")
+print(f"Training rows: {manifest['rows']} in {len(manifest['shards'])} shard(s)")
+print(f"\nExported to:")
+print(f"  {arrays_dir}")
 
-with open("training_outcomes.json", "w") as f:
-    json.dump(outcomes, f, indent=2)
+if "--json" in sys.argv:
+    # Legacy JSON export
+    decisions = query_ai_decisions(latest_db, limit=100000)
+    outcomes = query_team_outcomes(latest_db, limit=10000)
+    
+    with open("training_decisions.json", "w") as f:
+        json.dump(decisions, f)
+    
+    with open("training_outcomes.json", "w") as f:
+        json.dump(outcomes, f)
+    
+    print(f"  training_decisions.json ({os.path.getsize('training_decisions.json')} bytes)")
+    print(f"  training_outcomes.json ({os.path.getsize('training_outcomes.json')} bytes)")
 
-print(f"\nExported to:")
-print(f"  training_decisions.json ({os.path.getsize('training_decisions.json')} bytes)")
-print(f"  training_outcomes.json ({os.path.getsize('training_outcomes.json')} bytes)")
 print(f"\nReady to train with:")
-print(f"  python -m plugins.ftb_ml_policy training_decisions.json training_outcomes.json models/test_policy_v1.pth")
+print(f"  python -m plugins.ftb_ml_policy {arrays_dir} models/test_policy_v1.pth")
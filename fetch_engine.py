@@ -0,0 +1,593 @@
+#!/usr/bin/env python3
+"""
+Shared Feed Fetch Engine
+
+One asyncio event loop (one thread) does the HTTP for every feed plugin.
+Plugins submit URLs and only parse what comes back.
+
+- Per-host keep-alive connection pools with a connection cap
+- Per-host rate limits (minimum spacing between requests, Retry-After on 429/503)
+- ETag / If-Modified-Since conditional GETs; a 304 short-circuits to the
+  cached body with not_modified=True so plugins can skip parsing entirely
+- Shared response cache (LRU) with optional max_age reuse across plugins
+- Jittered poll waits so feeds don't all fire on the same second
+
+Stdlib only (asyncio streams + ssl), HTTP/1.1 with chunked and gzip/deflate
+bodies, redirects followed. Point it at http://127.0.0.1 to test against a
+local stub server.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import random
+import ssl
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urljoin, urlsplit
+
+
+DEFAULT_USER_AGENT = "RadioOS/1.0"
+DEFAULT_TIMEOUT = 10.0
+MAX_REDIRECTS = 5
+MAX_BODY_BYTES = 16 * 1024 * 1024
+IDLE_CONNECTION_TTL = 30.0          # Drop pooled keep-alive sockets idle this long
+CACHE_MAX_ENTRIES = 512
+# Request headers that change the response; part of the cache key
+CACHE_VARY_HEADERS = ("authorization", "cookie", "accept", "accept-language")
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+@dataclass
+class HostPolicy:
+    """Per-host limits. min_interval spaces request starts (seconds)."""
+    max_connections: int = 4
+    min_interval: float = 0.0
+
+
+@dataclass
+class FetchResponse:
+    status: int
+    url: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    not_modified: bool = False      # Server answered 304; body is the cached copy
+    from_cache: bool = False        # Served from cache (304 or within max_age)
+    truncated: bool = False         # Body hit MAX_BODY_BYTES before the server closed
+    elapsed: float = 0.0
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300 or self.not_modified
+
+    @property
+    def text(self) -> str:
+        charset = "utf-8"
+        ctype = self.headers.get("content-type", "")
+        for part in ctype.split(";")[1:]:
+            k, _, v = part.strip().partition("=")
+            if k.lower() == "charset" and v:
+                charset = v.strip('"')
+        try:
+            return self.body.decode(charset, errors="replace")
+        except LookupError:
+            return self.body.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.body.decode("utf-8", errors="replace") or "null")
+
+
+@dataclass
+class _CacheEntry:
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    etag: str
+    last_modified: str
+    stored_ts: float
+
+
+def _cache_key(method: str, url: str, headers: Dict[str, str]) -> str:
+    """method + URL + a digest of the headers that vary the response (credentials stay out of the key)."""
+    vary = "\n".join(f"{k}:{headers[k]}" for k in CACHE_VARY_HEADERS if k in headers)
+    if not vary:
+        return f"{method} {url}"
+    return f"{method} {url} {hashlib.sha1(vary.encode('utf-8')).hexdigest()}"
+
+
+class _HostPool:
+    """Keep-alive connections, connection cap and request spacing for one host."""
+
+    def __init__(self, policy: HostPolicy):
+        self.policy = policy
+        self.idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter, float]] = []
+        self.slots = asyncio.Semaphore(max(1, policy.max_connections))
+        self.next_start = 0.0
+        self.requests = 0
+        self.not_modified = 0
+        self.errors = 0
+
+    async def wait_turn(self) -> None:
+        """Reserve the next start slot for this host and sleep until it."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        start = max(now, self.next_start)
+        self.next_start = start + self.policy.min_interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def back_off(self, seconds: float) -> None:
+        loop = asyncio.get_running_loop()
+        self.next_start = max(self.next_start, loop.time() + seconds)
+
+    def take_idle(self):
+        now = time.monotonic()
+        while self.idle:
+            reader, writer, ts = self.idle.pop()
+            if now - ts < IDLE_CONNECTION_TTL and not writer.is_closing() and not reader.at_eof():
+                return reader, writer
+            writer.close()
+        return None
+
+    def put_idle(self, reader, writer) -> None:
+        if len(self.idle) < self.policy.max_connections:
+            self.idle.append((reader, writer, time.monotonic()))
+        else:
+            writer.close()
+
+
+class FetchEngine:
+    """Asyncio HTTP fetcher running on its own daemon thread."""
+
+    def __init__(self, user_agent: str = DEFAULT_USER_AGENT):
+        self.user_agent = user_agent
+        self._policies: Dict[str, HostPolicy] = {}
+        self._pools: Dict[Tuple[str, str, int], _HostPool] = {}
+        self._cache: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._cache_bytes = 0
+        self._cache_lock = threading.Lock()
+        self._ssl = ssl.create_default_context()
+        self._stats = {"requests": 0, "not_modified": 0, "cache_hits": 0,
+                       "errors": 0, "bytes": 0}
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name="fetch_engine", daemon=True)
+        self._thread.start()
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    # ------------------------------------------------------------------
+    # Public (thread-safe, blocking) API
+    # ------------------------------------------------------------------
+
+    def set_host_policy(self, host: str, max_connections: Optional[int] = None,
+                        min_interval: Optional[float] = None) -> None:
+        """Configure limits for a host (e.g. 'old.reddit.com')."""
+        host = host.lower()
+        policy = self._policies.setdefault(host, HostPolicy())
+        if max_connections is not None:
+            policy.max_connections = max(1, int(max_connections))
+        if min_interval is not None:
+            policy.min_interval = max(0.0, float(min_interval))
+
+    def fetch(self, url: str, method: str = "GET", params: Optional[Dict[str, Any]] = None,
+              headers: Optional[Dict[str, str]] = None, json_body: Any = None,
+              timeout: float = DEFAULT_TIMEOUT, conditional: bool = True,
+              max_age: float = 0.0) -> FetchResponse:
+        """Fetch one URL. Never raises; failures come back with status 0 and error set.
+
+        Args:
+            conditional: Send ETag/Last-Modified validators from the cache (GET only)
+            max_age: Reuse a cached response younger than this without a request
+        """
+        return self.fetch_many([dict(url=url, method=method, params=params, headers=headers,
+                                     json_body=json_body, timeout=timeout,
+                                     conditional=conditional, max_age=max_age)],
+                               timeout=timeout)[0]
+
+    def fetch_many(self, requests: List[Dict[str, Any]],
+                   timeout: float = DEFAULT_TIMEOUT) -> List[FetchResponse]:
+        """Fetch several requests concurrently (subject to host policies).
+
+        Each request is a dict of fetch() keyword arguments. Results keep the
+        input order. Every request has its own deadline; one that runs out
+        (e.g. queued behind a 429 back-off) comes back with status 0 while the
+        others keep their results.
+        """
+        if not requests:
+            return []
+        deadlines = self._deadlines(requests, timeout)
+        future = asyncio.run_coroutine_threadsafe(self._fetch_all(requests, deadlines), self._loop)
+        try:
+            return future.result(timeout=max(deadlines) + 5)
+        except Exception as e:
+            future.cancel()
+            return [FetchResponse(status=0, url=r["url"], error=f"{type(e).__name__}: {e}")
+                    for r in requests]
+
+    def _deadlines(self, requests: List[Dict[str, Any]], timeout: float) -> List[float]:
+        """Per-request budget: its timeout (allowing one retry) plus host spacing ahead of it."""
+        queued: Dict[str, int] = {}
+        out = []
+        for r in requests:
+            host = (urlsplit(r["url"]).hostname or "").lower()
+            ahead = queued.get(host, 0)
+            queued[host] = ahead + 1
+            req_timeout = float(r.get("timeout") or timeout)
+            out.append(req_timeout * 2 + ahead * self._policy_for(host).min_interval + 1)
+        return out
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cache_lock:
+            stats = dict(self._stats)
+            stats["cache_entries"] = len(self._cache)
+            stats["cache_bytes"] = self._cache_bytes
+        stats["hosts"] = {
+            f"{scheme}://{host}:{port}": {"requests": pool.requests,
+                                           "not_modified": pool.not_modified,
+                                           "errors": pool.errors,
+                                           "idle_connections": len(pool.idle)}
+            for (scheme, host, port), pool in list(self._pools.items())
+        }
+        return stats
+
+    def clear_cache(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_bytes = 0
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+
+    def _cache_get(self, key: str) -> Optional[_CacheEntry]:
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+            return entry
+
+    def _cache_put(self, key: str, entry: _CacheEntry) -> None:
+        with self._cache_lock:
+            old = self._cache.pop(key, None)
+            if old is not None:
+                self._cache_bytes -= len(old.body)
+            self._cache[key] = entry
+            self._cache_bytes += len(entry.body)
+            while self._cache and (len(self._cache) > CACHE_MAX_ENTRIES
+                                   or self._cache_bytes > CACHE_MAX_BYTES):
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes -= len(evicted.body)
+
+    def _cache_refresh(self, key: str, entry: _CacheEntry) -> None:
+        """Restart entry's max_age window after a 304 (if it is still the cached one)."""
+        with self._cache_lock:
+            if self._cache.get(key) is entry:
+                self._cache[key] = replace(entry, stored_ts=time.time())
+                self._cache.move_to_end(key)
+
+    def _bump(self, key: str, n: int = 1) -> None:
+        with self._cache_lock:
+            self._stats[key] += n
+
+    # ------------------------------------------------------------------
+    # Request pipeline (event loop thread)
+    # ------------------------------------------------------------------
+
+    def _policy_for(self, host: str) -> HostPolicy:
+        host = (host or "").lower()
+        policy = self._policies.get(host)
+        if policy is None:
+            # Inherit a parent-domain policy (reddit.com covers old.reddit.com)
+            parts = host.split(".")
+            for i in range(1, len(parts) - 1):
+                policy = self._policies.get(".".join(parts[i:]))
+                if policy is not None:
+                    break
+        return policy or HostPolicy()
+
+    def _pool_for(self, scheme: str, host: str, port: int) -> _HostPool:
+        key = (scheme, host, port)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = _HostPool(self._policy_for(host))
+        else:
+            # Pick up set_host_policy() calls made after the pool was created
+            pool.policy = self._policy_for(host)
+        return pool
+
+    async def _fetch_all(self, requests: List[Dict[str, Any]],
+                         deadlines: List[float]) -> List[FetchResponse]:
+        results = await asyncio.gather(
+            *(asyncio.wait_for(self._fetch(**req), timeout=deadline)
+              for req, deadline in zip(requests, deadlines)),
+            return_exceptions=True,
+        )
+        out = []
+        for req, result in zip(requests, results):
+            if isinstance(result, BaseException):
+                self._bump("errors")
+                if isinstance(result, asyncio.TimeoutError):
+                    error = "TimeoutError: request deadline passed"
+                else:
+                    error = f"{type(result).__name__}: {result}"
+                result = FetchResponse(status=0, url=req["url"], error=error)
+            out.append(result)
+        return out
+
+    async def _fetch(self, url: str, method: str = "GET", params: Optional[Dict[str, Any]] = None,
+                     headers: Optional[Dict[str, str]] = None, json_body: Any = None,
+                     timeout: float = DEFAULT_TIMEOUT, conditional: bool = True,
+                     max_age: float = 0.0) -> FetchResponse:
+        started = time.monotonic()
+        method = method.upper()
+        if params:
+            url = url + ("&" if urlsplit(url).query else "?") + urlencode(params, doseq=True)
+
+        req_headers = {"user-agent": self.user_agent}
+        for k, v in (headers or {}).items():
+            req_headers[k.lower()] = str(v)
+
+        cacheable = method == "GET"
+        cache_key = _cache_key(method, url, req_headers)
+        cached = self._cache_get(cache_key) if cacheable else None
+
+        if cached is not None and max_age > 0 and time.time() - cached.stored_ts < max_age:
+            self._bump("cache_hits")
+            return FetchResponse(status=cached.status, url=url, headers=cached.headers,
+                                 body=cached.body, from_cache=True,
+                                 elapsed=time.monotonic() - started)
+
+        body = b""
+        if json_body is not None:
+            body = json.dumps(json_body).encode("utf-8")
+            req_headers.setdefault("content-type", "application/json")
+        if cached is not None and conditional:
+            if cached.etag:
+                req_headers["if-none-match"] = cached.etag
+            if cached.last_modified:
+                req_headers["if-modified-since"] = cached.last_modified
+
+        try:
+            status, resp_headers, resp_body, final_url, truncated = \
+                await self._request_following_redirects(method, url, req_headers, body, timeout)
+        except Exception as e:
+            self._bump("errors")
+            return FetchResponse(status=0, url=url, error=f"{type(e).__name__}: {e}",
+                                 elapsed=time.monotonic() - started)
+
+        self._bump("requests")
+        self._bump("bytes", len(resp_body))
+        elapsed = time.monotonic() - started
+
+        if status == 304 and cached is not None:
+            self._bump("not_modified")
+            self._cache_refresh(cache_key, cached)
+            return FetchResponse(status=cached.status, url=final_url, headers=cached.headers,
+                                 body=cached.body, not_modified=True, from_cache=True,
+                                 elapsed=elapsed)
+
+        if cacheable and status == 200 and not truncated:
+            self._cache_put(cache_key, _CacheEntry(
+                status=status, headers=resp_headers, body=resp_body,
+                etag=resp_headers.get("etag", ""),
+                last_modified=resp_headers.get("last-modified", ""),
+                stored_ts=time.time(),
+            ))
+
+        return FetchResponse(status=status, url=final_url, headers=resp_headers,
+                             body=resp_body, truncated=truncated, elapsed=elapsed)
+
+    async def _request_following_redirects(self, method: str, url: str,
+                                           headers: Dict[str, str], body: bytes, timeout: float):
+        for _ in range(MAX_REDIRECTS + 1):
+            status, resp_headers, resp_body, truncated = await self._request(
+                method, url, headers, body, timeout)
+            location = resp_headers.get("location")
+            if status in (301, 302, 303, 307, 308) and location:
+                url = urljoin(url, location)
+                if status == 303 or (status in (301, 302) and method == "POST"):
+                    method, body = "GET", b""
+                    headers = {k: v for k, v in headers.items()
+                               if k not in ("content-type", "content-length")}
+                continue
+            return status, resp_headers, resp_body, url, truncated
+        raise RuntimeError(f"too many redirects for {url}")
+
+    async def _request(self, method: str, url: str, headers: Dict[str, str], body: bytes,
+                       timeout: float):
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https"):
+            raise ValueError(f"unsupported scheme: {scheme}")
+        host = (parts.hostname or "").lower()
+        port = parts.port or (443 if scheme == "https" else 80)
+        pool = self._pool_for(scheme, host, port)
+
+        async with pool.slots:
+            # Rate-limit spacing is not counted against the request timeout
+            await pool.wait_turn()
+            pool.requests += 1
+            try:
+                result = await asyncio.wait_for(
+                    self._exchange(pool, scheme, host, port, parts, method, headers, body),
+                    timeout=timeout,
+                )
+            except Exception:
+                pool.errors += 1
+                raise
+
+        status, resp_headers = result[0], result[1]
+        if status == 304:
+            pool.not_modified += 1
+        elif status in (429, 503):
+            pool.back_off(_retry_after_seconds(resp_headers.get("retry-after"), default=30.0))
+        return result
+
+    async def _exchange(self, pool: _HostPool, scheme: str, host: str, port: int,
+                        parts, method: str, headers: Dict[str, str], body: bytes):
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        host_header = host if parts.port is None else f"{host}:{port}"
+
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {host_header}",
+                 "Accept-Encoding: gzip, deflate", "Connection: keep-alive"]
+        lines += [f"{k}: {v}" for k, v in headers.items()]
+        if body or method in ("POST", "PUT", "PATCH"):
+            lines.append(f"Content-Length: {len(body)}")
+        request_bytes = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+        # A pooled socket may have been closed by the server; retry once fresh
+        for attempt in range(2):
+            conn = pool.take_idle() if attempt == 0 else None
+            reused = conn is not None
+            if conn is None:
+                conn = await asyncio.open_connection(
+                    host, port, ssl=self._ssl if scheme == "https" else None,
+                    server_hostname=host if scheme == "https" else None,
+                )
+            reader, writer = conn
+            try:
+                writer.write(request_bytes)
+                await writer.drain()
+                status, resp_headers, resp_body, keep_alive, truncated = \
+                    await _read_response(reader, method)
+            except (ConnectionError, asyncio.IncompleteReadError, _EmptyResponse):
+                writer.close()
+                if reused:
+                    continue
+                raise
+            except BaseException:
+                writer.close()
+                raise
+            if keep_alive:
+                pool.put_idle(reader, writer)
+            else:
+                writer.close()
+            return status, resp_headers, resp_body, truncated
+        raise ConnectionError(f"connection to {host} failed")
+
+
+class _EmptyResponse(Exception):
+    pass
+
+
+async def _read_response(reader: asyncio.StreamReader, method: str):
+    status_line = await reader.readline()
+    if not status_line:
+        raise _EmptyResponse()
+    version, _, rest = status_line.decode("latin-1").strip().partition(" ")
+    status = int(rest.split(" ", 1)[0])
+
+    headers: Dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        k, _, v = line.decode("latin-1").partition(":")
+        k = k.strip().lower()
+        v = v.strip()
+        headers[k] = f"{headers[k]}, {v}" if k in headers and k != "set-cookie" else v
+
+    keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+    truncated = False
+
+    if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+        body = b""
+    elif "chunked" in headers.get("transfer-encoding", "").lower():
+        chunks = []
+        size_total = 0
+        while True:
+            size_line = await reader.readline()
+            size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+            if size == 0:
+                # Trailers end with a blank line
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                break
+            size_total += size
+            if size_total > MAX_BODY_BYTES:
+                raise ValueError("response too large")
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        body = b"".join(chunks)
+    elif "content-length" in headers:
+        length = int(headers["content-length"])
+        if length > MAX_BODY_BYTES:
+            raise ValueError("response too large")
+        body = await reader.readexactly(length)
+    else:
+        # No length: the body runs until the server closes the connection
+        chunks = []
+        size_total = 0
+        while size_total < MAX_BODY_BYTES:
+            chunk = await reader.read(min(65536, MAX_BODY_BYTES - size_total))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size_total += len(chunk)
+        else:
+            truncated = not reader.at_eof() and bool(await reader.read(1))
+        body = b"".join(chunks)
+        keep_alive = False
+
+    encoding = headers.get("content-encoding", "").lower()
+    if encoding == "gzip":
+        body = zlib.decompress(body, 16 + zlib.MAX_WBITS)
+    elif encoding == "deflate":
+        try:
+            body = zlib.decompress(body)
+        except zlib.error:
+            body = zlib.decompress(body, -zlib.MAX_WBITS)
+
+    return status, headers, body, keep_alive, truncated
+
+
+def _retry_after_seconds(value: Optional[str], default: float) -> float:
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except Exception:
+        return default
+
+
+# ----------------------------------------------------------------------
+# Module-level helpers
+# ----------------------------------------------------------------------
+
+_engine: Optional[FetchEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_fetch_engine() -> FetchEngine:
+    """Process-wide FetchEngine (started on first use)."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = FetchEngine()
+        return _engine
+
+
+def jittered(seconds: float, jitter: float = 0.15) -> float:
+    """seconds ± jitter fraction, so pollers spread out instead of aligning."""
+    return max(0.0, seconds * random.uniform(1.0 - jitter, 1.0 + jitter))
+
+
+def wait_jittered(stop_event, seconds: float, jitter: float = 0.15) -> bool:
+    """Sleep a jittered poll interval; returns True if stop_event was set."""
+    return stop_event.wait(jittered(seconds, jitter))
@@ -0,0 +1,591 @@
+#!/usr/bin/env python3
+"""
+Inference Host
+
+One process that owns the LLM/TTS providers for every station on the box,
+so voice models (Kokoro, Piper) are loaded once and a single scheduler
+fronts Ollama instead of N uncoordinated clients.
+
+- Server: `python inference_host.py [--tts-workers 1] [--llm-workers 2]`
+  listens on a Unix socket (TCP 127.0.0.1 where AF_UNIX is unavailable) and
+  writes its address to ~/.radioOS/inference.addr (or --addr-file).
+- Providers are built with the station's own llm/audio config and cached
+  per config, so stations sharing a voice model share one instance. The
+  client sends the provider env vars it resolved (API keys injected by the
+  shell/launcher, voices dir) with each request, since the host was started
+  with whatever env the first station had.
+- A provider that can't be built on the host (missing key, missing model)
+  is reported as unavailable, so the station falls back to running locally.
+- Each op (llm, tts) has a worker pool fed round-robin across stations:
+  a station with a deep backlog can't starve the others.
+- Client: InferenceClient multiplexes requests from any thread over one
+  connection. Station runtimes use it when RADIO_OS_INFERENCE_ADDR is set
+  ("auto" reads the well-known address file) and fall back to local
+  providers when the host is unreachable.
+
+Wire format: 8-byte header (json length, payload length, big-endian u32)
+followed by a JSON header and an optional binary payload (TTS audio as
+float32).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import socket
+import struct
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+ENV_ADDR = "RADIO_OS_INFERENCE_ADDR"
+ADDR_NAME = "inference.addr"
+
+_FRAME = struct.Struct(">II")
+
+# Env vars the provider factories read, besides the config's own api_key_env
+_PROVIDER_ENV = (
+    "OPENAI_API_KEY", "ANTHROPIC_API_KEY", "GOOGLE_API_KEY",
+    "ELEVENLABS_API_KEY", "AZURE_SPEECH_KEY", "RADIO_OS_VOICES",
+)
+
+
+class InferenceUnavailable(ConnectionError):
+    """The inference host can't be reached; callers should run locally."""
+
+
+class InferenceError(RuntimeError):
+    """The host ran the request and the provider failed."""
+
+
+def default_addr_file() -> str:
+    if os.name == "nt":
+        base = os.path.join(os.getenv("APPDATA", os.path.expanduser("~")), "RadioOS")
+    else:
+        base = os.path.expanduser("~/.radioOS")
+    return os.path.join(base, ADDR_NAME)
+
+
+# =======================
+# Framing
+# =======================
+
+def _send_frame(sock: socket.socket, header: Dict[str, Any], payload: bytes = b"") -> None:
+    head = json.dumps(header, ensure_ascii=False, default=str).encode("utf-8")
+    sock.sendall(_FRAME.pack(len(head), len(payload)) + head + payload)
+
+
+def _recv_exact(sock: socket.socket, n: int) -> bytes:
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(min(n - len(buf), 1 << 20))
+        if not chunk:
+            raise ConnectionError("connection closed")
+        buf += chunk
+    return bytes(buf)
+
+
+def _recv_frame(sock: socket.socket) -> Tuple[Dict[str, Any], bytes]:
+    hlen, plen = _FRAME.unpack(_recv_exact(sock, _FRAME.size))
+    header = json.loads(_recv_exact(sock, hlen).decode("utf-8"))
+    payload = _recv_exact(sock, plen) if plen else b""
+    return header, payload
+
+
+def _parse_addr(addr: str) -> Optional[Tuple[int, Any]]:
+    kind, _, rest = (addr or "").strip().partition(":")
+    if kind == "unix" and rest and hasattr(socket, "AF_UNIX"):
+        return socket.AF_UNIX, rest
+    if kind == "tcp" and rest:
+        host, _, port = rest.rpartition(":")
+        try:
+            return socket.AF_INET, (host, int(port))
+        except ValueError:
+            return None
+    return None
+
+
+# =======================
+# Fair scheduling
+# =======================
+
+class FairQueue:
+    """Per-station FIFOs served round-robin. get() blocks until a job is available."""
+
+    def __init__(self):
+        self._queues: Dict[str, Deque[Any]] = {}
+        self._order: Deque[str] = deque()
+        self._cv = threading.Condition()
+
+    def put(self, station: str, job: Any) -> None:
+        with self._cv:
+            q = self._queues.get(station)
+            if q is None:
+                q = self._queues[station] = deque()
+            if not q:
+                self._order.append(station)
+            q.append(job)
+            self._cv.notify()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Any]:
+        with self._cv:
+            if not self._order and not self._cv.wait_for(lambda: bool(self._order), timeout):
+                return None
+            station = self._order.popleft()
+            q = self._queues[station]
+            job = q.popleft()
+            if q:
+                self._order.append(station)  # back of the line
+            return job
+
+    def depths(self) -> Dict[str, int]:
+        with self._cv:
+            return {s: len(q) for s, q in self._queues.items() if q}
+
+
+# =======================
+# Server
+# =======================
+
+def _cfg_key(*parts: Any) -> str:
+    return hashlib.sha1(json.dumps(parts, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def provider_env(cfg: Dict[str, Any]) -> Dict[str, str]:
+    """The caller's values for the env vars a provider built from cfg may read."""
+    names = set(_PROVIDER_ENV)
+    key_env = str(cfg.get("api_key_env") or "").strip()
+    if key_env:
+        names.add(key_env)
+    return {k: os.environ[k] for k in sorted(names) if os.environ.get(k)}
+
+
+class InferenceHost:
+    """Shared provider cache + per-op worker pools behind a local socket."""
+
+    def __init__(self, tts_workers: int = 1, llm_workers: int = 2, log: Callable[[str], None] = print):
+        self.log = log
+        self.pools = {"tts": FairQueue(), "llm": FairQueue()}
+        self.workers = {"tts": max(1, int(tts_workers)), "llm": max(1, int(llm_workers))}
+        self._providers: Dict[str, Tuple[Any, threading.Lock]] = {}
+        self._providers_lock = threading.Lock()
+        self._build_lock = threading.Lock()  # providers read os.environ while building
+        self._stats: Dict[str, Dict[str, Dict[str, float]]] = {}
+        self._stats_lock = threading.Lock()
+        self._sock: Optional[socket.socket] = None
+        self._unix_path: Optional[str] = None
+        self._stop = threading.Event()
+        self.address: Optional[str] = None
+        self.addr_file: Optional[str] = None
+
+    # ---------- providers ----------
+
+    def _build(self, op: str, cfg: Dict[str, Any], env: Dict[str, str]) -> Any:
+        with self._build_lock:
+            saved = {k: os.environ.get(k) for k in env}
+            os.environ.update(env)
+            try:
+                if op == "llm":
+                    from model_provider import get_llm_provider
+                    return get_llm_provider({"llm": cfg})
+                from voice_provider import get_voice_provider
+                return get_voice_provider({"audio": cfg}, cfg)
+            finally:
+                for k, v in saved.items():
+                    if v is None:
+                        os.environ.pop(k, None)
+                    else:
+                        os.environ[k] = v
+
+    def _provider(self, op: str, cfg: Dict[str, Any],
+                  env: Optional[Dict[str, str]] = None) -> Tuple[Any, threading.Lock]:
+        env = {str(k): str(v) for k, v in (env or {}).items()}
+        key = _cfg_key(op, cfg, env)
+        with self._providers_lock:
+            hit = self._providers.get(key)
+            if hit is not None:
+                return hit
+        try:
+            provider = self._build(op, cfg, env)
+        except Exception as e:
+            # Not the station's fault: it can still build this provider itself
+            raise InferenceUnavailable(f"{op} provider unavailable on host: {type(e).__name__}: {e}") from e
+        with self._providers_lock:
+            # Local models aren't assumed thread-safe: one call at a time per instance
+            hit = self._providers.setdefault(key, (provider, threading.Lock()))
+        self.log(f"[inference] new {op} provider {type(provider).__name__} ({len(self._providers)} cached)")
+        return hit
+
+    def _run(self, req: Dict[str, Any]) -> Tuple[Dict[str, Any], bytes]:
+        op = req["op"]
+        if op == "llm":
+            # HTTP providers are stateless; concurrency is bounded by llm_workers
+            provider, _ = self._provider("llm", req.get("llm_cfg") or {}, req.get("env"))
+            text = provider.generate(
+                model=req["model"],
+                prompt=req.get("prompt", ""),
+                system=req.get("system", ""),
+                num_predict=int(req.get("num_predict", 200)),
+                temperature=float(req.get("temperature", 0.7)),
+                timeout=int(req.get("timeout", 10)),
+                force_json=bool(req.get("force_json", False)),
+            )
+            return {"text": text}, b""
+
+        provider, lock = self._provider("tts", req.get("audio_cfg") or {}, req.get("env"))
+        with lock:
+            data, sr = provider.synthesize(
+                voice_key=req.get("voice_key", "host"),
+                text=req.get("text", ""),
+                voice_map=req.get("voice_map") or {},
+            )
+        arr = np.ascontiguousarray(np.asarray(data, dtype=np.float32))
+        return {"sr": int(sr), "shape": list(arr.shape)}, arr.tobytes()
+
+    def _record(self, station: str, op: str, wait: float, run: float, ok: bool) -> None:
+        with self._stats_lock:
+            st = self._stats.setdefault(station, {}).setdefault(
+                op, {"n": 0, "errors": 0, "wait_sec": 0.0, "run_sec": 0.0})
+            st["n"] += 1
+            st["errors"] += 0 if ok else 1
+            st["wait_sec"] += wait
+            st["run_sec"] += run
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            per_station = json.loads(json.dumps(self._stats))
+        return {
+            "workers": dict(self.workers),
+            "providers": len(self._providers),
+            "queued": {op: q.depths() for op, q in self.pools.items()},
+            "stations": per_station,
+        }
+
+    def _worker(self, op: str) -> None:
+        pool = self.pools[op]
+        while not self._stop.is_set():
+            job = pool.get(timeout=0.5)
+            if job is None:
+                continue
+            conn, send_lock, req, enq_ts = job
+            t0 = time.monotonic()
+            try:
+                header, payload = self._run(req)
+                header.update(id=req["id"], ok=True)
+                ok = True
+            except InferenceUnavailable as e:
+                header, payload = {"id": req["id"], "ok": False, "unavailable": True, "error": str(e)}, b""
+                ok = False
+            except Exception as e:
+                header, payload = {"id": req["id"], "ok": False, "error": f"{type(e).__name__}: {e}"}, b""
+                ok = False
+            self._record(req.get("station", "?"), op, t0 - enq_ts, time.monotonic() - t0, ok)
+            try:
+                with send_lock:
+                    _send_frame(conn, header, payload)
+            except OSError:
+                pass  # station went away
+
+    # ---------- connections ----------
+
+    def _serve_conn(self, conn: socket.socket) -> None:
+        send_lock = threading.Lock()
+        try:
+            while not self._stop.is_set():
+                req, _ = _recv_frame(conn)
+                op = req.get("op")
+                if op in self.pools:
+                    self.pools[op].put(str(req.get("station") or "?"), (conn, send_lock, req, time.monotonic()))
+                    continue
+                if op == "ping":
+                    reply = {"id": req.get("id"), "ok": True, "pid": os.getpid()}
+                elif op == "stats":
+                    reply = {"id": req.get("id"), "ok": True, "stats": self.stats()}
+                else:
+                    reply = {"id": req.get("id"), "ok": False, "error": f"unknown op: {op}"}
+                with send_lock:
+                    _send_frame(conn, reply)
+        except (OSError, ValueError, struct.error):
+            pass
+        finally:
+            try:
+                conn.close()
+            except OSError:
+                pass
+
+    def start(self, addr_file: Optional[str] = None) -> str:
+        addr_file = addr_file or default_addr_file()
+        os.makedirs(os.path.dirname(addr_file) or ".", exist_ok=True)
+        if hasattr(socket, "AF_UNIX") and sys.platform != "win32":
+            digest = hashlib.sha1(os.path.abspath(addr_file).encode("utf-8")).hexdigest()[:12]
+            path = os.path.join(tempfile.gettempdir(), f"radio_os_inference_{digest}.sock")
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.bind(path)
+            self._unix_path = path
+            self.address = f"unix:{path}"
+        else:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.bind(("127.0.0.1", 0))
+            self.address = "tcp:127.0.0.1:{}".format(sock.getsockname()[1])
+        sock.listen(32)
+        self._sock = sock
+
+        for op, n in self.workers.items():
+            for i in range(n):
+                threading.Thread(target=self._worker, args=(op,), name=f"inference_{op}_{i}", daemon=True).start()
+
+        tmp = f"{addr_file}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.address)
+        os.replace(tmp, addr_file)
+        self.addr_file = addr_file
+        self.log(f"[inference] listening on {self.address} (tts_workers={self.workers['tts']} llm_workers={self.workers['llm']})")
+        return self.address
+
+    def serve_forever(self) -> None:
+        try:
+            while not self._stop.is_set():
+                try:
+                    conn, _ = self._sock.accept()
+                except OSError:
+                    if self._stop.is_set():
+                        break
+                    time.sleep(0.1)
+                    continue
+                threading.Thread(target=self._serve_conn, args=(conn,), daemon=True).start()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+        if self._unix_path:
+            try:
+                os.remove(self._unix_path)
+            except OSError:
+                pass
+        addr_file = self.addr_file
+        if addr_file:
+            try:
+                with open(addr_file, "r", encoding="utf-8") as f:
+                    mine = f.read().strip() == self.address
+                if mine:
+                    os.remove(addr_file)
+            except OSError:
+                pass
+
+
+# =======================
+# Client
+# =======================
+
+class InferenceClient:
+    """
+    Thread-safe client for one station. Requests are multiplexed over one
+    connection; a dropped connection is re-dialled at most every retry_sec.
+    """
+
+    def __init__(self, addr: str, station: str, retry_sec: float = 5.0):
+        self.addr = addr
+        self.station = station
+        self.retry_sec = float(retry_sec)
+        self._sock: Optional[socket.socket] = None
+        self._send_lock = threading.Lock()
+        self._conn_lock = threading.Lock()
+        self._pending: Dict[int, Future] = {}
+        self._next_id = 0
+        self._last_fail = 0.0
+
+    def _resolve(self) -> Optional[Tuple[int, Any]]:
+        addr = self.addr
+        if addr.strip().lower() == "auto":
+            try:
+                with open(default_addr_file(), "r", encoding="utf-8") as f:
+                    addr = f.read()
+            except OSError:
+                return None
+        return _parse_addr(addr)
+
+    def _connect(self) -> socket.socket:
+        with self._conn_lock:
+            if self._sock is not None:
+                return self._sock
+            if time.monotonic() - self._last_fail < self.retry_sec:
+                raise InferenceUnavailable("inference host unavailable (retrying later)")
+            target = self._resolve()
+            if target is None:
+                self._last_fail = time.monotonic()
+                raise InferenceUnavailable(f"no inference host address ({self.addr})")
+            sock = socket.socket(target[0], socket.SOCK_STREAM)
+            try:
+                sock.settimeout(2.0)
+                sock.connect(target[1])
+                sock.settimeout(None)
+            except OSError as e:
+                sock.close()
+                self._last_fail = time.monotonic()
+                raise InferenceUnavailable(f"inference host unreachable: {e}") from e
+            self._sock = sock
+            threading.Thread(target=self._reader, args=(sock,), name="inference_client", daemon=True).start()
+            return sock
+
+    def _reader(self, sock: socket.socket) -> None:
+        try:
+            while True:
+                header, payload = _recv_frame(sock)
+                fut = self._pending.pop(header.get("id"), None)
+                if fut is not None:
+                    fut.set_result((header, payload))
+        except (OSError, ValueError, struct.error):
+            pass
+        with self._conn_lock:
+            if self._sock is sock:
+                self._sock = None
+                self._last_fail = time.monotonic()
+        for rid in list(self._pending):
+            fut = self._pending.pop(rid, None)
+            if fut is not None and not fut.done():
+                fut.set_exception(InferenceUnavailable("inference host connection lost"))
+        try:
+            sock.close()
+        except OSError:
+            pass
+
+    def call(self, req: Dict[str, Any], payload: bytes = b"", timeout: float = 60.0) -> Tuple[Dict[str, Any], bytes]:
+        sock = self._connect()
+        fut: Future = Future()
+        with self._send_lock:
+            self._next_id += 1
+            rid = self._next_id
+            self._pending[rid] = fut
+            try:
+                _send_frame(sock, dict(req, id=rid, station=self.station), payload)
+            except OSError as e:
+                self._pending.pop(rid, None)
+                raise InferenceUnavailable(f"inference host send failed: {e}") from e
+        try:
+            header, data = fut.result(timeout=timeout)
+        except FutureTimeout:
+            self._pending.pop(rid, None)
+            raise
+        if header.get("unavailable"):
+            raise InferenceUnavailable(header.get("error") or "inference host can't serve this request")
+        if not header.get("ok"):
+            raise InferenceError(header.get("error") or "inference failed")
+        return header, data
+
+    def ping(self, timeout: float = 2.0) -> bool:
+        try:
+            self.call({"op": "ping"}, timeout=timeout)
+            return True
+        except Exception:
+            return False
+
+    def llm(self, llm_cfg: Dict[str, Any], model: str, prompt: str, system: str,
+            num_predict: int, temperature: float, timeout: int = 10,
+            force_json: bool = False, queue_slack: float = 60.0) -> str:
+        header, _ = self.call({
+            "op": "llm", "llm_cfg": llm_cfg, "model": model, "prompt": prompt,
+            "system": system, "num_predict": int(num_predict),
+            "temperature": float(temperature), "timeout": int(timeout),
+            "force_json": bool(force_json), "env": provider_env(llm_cfg),
+        }, timeout=float(timeout) + float(queue_slack))
+        return header.get("text", "")
+
+    def tts(self, audio_cfg: Dict[str, Any], voice_key: str, text: str,
+            voice_map: Dict[str, str], timeout: float = 120.0) -> Tuple[np.ndarray, int]:
+        header, payload = self.call({
+            "op": "tts", "audio_cfg": audio_cfg, "voice_key": voice_key,
+            "text": text, "voice_map": voice_map, "env": provider_env(audio_cfg),
+        }, timeout=timeout)
+        data = np.frombuffer(payload, dtype=np.float32).reshape(header.get("shape") or (-1,)).copy()
+        return data, int(header["sr"])
+
+
+def client_from_env(station: str) -> Optional[InferenceClient]:
+    """InferenceClient when RADIO_OS_INFERENCE_ADDR is set (an address or "auto"), else None."""
+    addr = (os.environ.get(ENV_ADDR) or "").strip()
+    return InferenceClient(addr, station) if addr else None
+
+
+def ensure_host(addr_file: Optional[str] = None, wait_sec: float = 10.0,
+                extra_args: Optional[List[str]] = None) -> Optional[str]:
+    """
+    Address of a running inference host, spawning one (detached) if the
+    address file is missing or stale. None if it didn't come up in time.
+    """
+    import subprocess
+
+    addr_file = addr_file or default_addr_file()
+
+    def _alive() -> Optional[str]:
+        try:
+            with open(addr_file, "r", encoding="utf-8") as f:
+                addr = f.read().strip()
+        except OSError:
+            return None
+        return addr if InferenceClient(addr, "shell", retry_sec=0).ping() else None
+
+    addr = _alive()
+    if addr:
+        return addr
+
+    cmd = [sys.executable, "-u", os.path.abspath(__file__), "--addr-file", addr_file] + list(extra_args or [])
+    kwargs: Dict[str, Any] = {"cwd": os.path.dirname(os.path.abspath(__file__)),
+                              "stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+    if sys.platform == "win32":
+        kwargs["creationflags"] = getattr(subprocess, "CREATE_NO_WINDOW", 0) | getattr(subprocess, "DETACHED_PROCESS", 0)
+    else:
+        kwargs["start_new_session"] = True
+    subprocess.Popen(cmd, **kwargs)
+
+    deadline = time.monotonic() + wait_sec
+    while time.monotonic() < deadline:
+        addr = _alive()
+        if addr:
+            return addr
+        time.sleep(0.2)
+    return None
+
+
+if __name__ == "__main__":
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Shared LLM/TTS host for Radio OS stations")
+    ap.add_argument("--addr-file", default=None, help=f"where to publish the address (default {default_addr_file()})")
+    ap.add_argument("--tts-workers", type=int, default=1)
+    ap.add_argument("--llm-workers", type=int, default=2)
+    ap.add_argument("--stats", action="store_true", help="print stats from a running host and exit")
+    args = ap.parse_args()
+
+    if args.stats:
+        try:
+            with open(args.addr_file or default_addr_file(), "r", encoding="utf-8") as f:
+                client = InferenceClient(f.read().strip(), "cli", retry_sec=0)
+            print(json.dumps(client.call({"op": "stats"}, timeout=5)[0].get("stats"), indent=2))
+        except Exception as e:
+            print(f"[inference] no running host: {e}")
+            sys.exit(1)
+        sys.exit(0)
+
+    host = InferenceHost(tts_workers=args.tts_workers, llm_workers=args.llm_workers)
+    host.start(args.addr_file)
+    try:
+        host.serve_forever()
+    except KeyboardInterrupt:
+        pass
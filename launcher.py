@@ -1,5 +1,7 @@
 import subprocess, os, sys, yaml, json
 
+import inference_host
+
 BASE_DIR = os.path.dirname(__file__)
 
 def get_global_config_path() -> str:
@@ -91,6 +93,16 @@ def launch_station(station_id: str):
         env["VISUAL_MODEL_MAX_IMAGE_SIZE"] = str(visual_cfg.get("max_image_size", "1024"))
         env["VISUAL_MODEL_IMAGE_QUALITY"] = str(visual_cfg.get("image_quality", "85"))
 
+    # Supervisor mode: share one LLM/TTS host across stations
+    inf_cfg = global_cfg.get("inference_host", {}) or {}
+    if inf_cfg.get("enabled") and inference_host.ENV_ADDR not in env:
+        addr = inference_host.ensure_host(extra_args=[
+            "--tts-workers", str(int(inf_cfg.get("tts_workers", 1))),
+            "--llm-workers", str(int(inf_cfg.get("llm_workers", 2))),
+        ])
+        if addr:
+            env[inference_host.ENV_ADDR] = addr
+
     runtime = os.path.join(BASE_DIR, "runtime.py")
 
     return subprocess.Popen(
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Index
+
+MinHash signatures over normalized text shingles, bucketed with LSH bands, so
+the same story arriving from several feeds (RSS, Reddit, Bluesky, alerts...)
+can be recognised without comparing every pair.
+
+- signature(text): num_perm MinHash values over character 5-gram shingles
+- NearDupIndex: bounded, thread-safe index of recent items (candidates or
+  aired segments); query() returns stored keys whose estimated Jaccard
+  similarity is >= threshold
+- cluster(): groups a batch of items into near-duplicate clusters
+
+With the defaults (64 permutations, 32 bands of 2 rows) pairs above ~0.4
+similarity almost always share a bucket; the threshold check then uses the
+full signature.
+"""
+from __future__ import annotations
+
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+_MERSENNE = (1 << 31) - 1
+_URL_RE = re.compile(r"https?://\S+|www\.\S+")
+_NON_WORD_RE = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase, drop URLs and punctuation, collapse whitespace."""
+    text = _URL_RE.sub(" ", (text or "").lower())
+    return " ".join(_NON_WORD_RE.sub(" ", text).split())
+
+
+def shingle_hashes(text: str, k: int = 5, max_chars: int = 1200) -> np.ndarray:
+    """Unique crc32 hashes of the character k-grams of normalized text."""
+    norm = normalize_text(text)[:max_chars]
+    if not norm:
+        return np.zeros(0, dtype=np.uint64)
+    if len(norm) <= k:
+        grams = {norm}
+    else:
+        grams = {norm[i:i + k] for i in range(len(norm) - k + 1)}
+    return np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64, count=len(grams))
+
+
+class MinHasher:
+    """Fixed family of num_perm universal hashes (a*x + b) mod (2^31 - 1)."""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.a = rng.integers(1, _MERSENNE, size=num_perm, dtype=np.uint64)[:, None]
+        self.b = rng.integers(0, _MERSENNE, size=num_perm, dtype=np.uint64)[:, None]
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """(num_perm,) uint32 MinHash signature, or None for empty text."""
+        hashes = shingle_hashes(text)
+        if hashes.size == 0:
+            return None
+        x = hashes[None, :] % _MERSENNE
+        # a, x < 2^31 so a*x + b fits in uint64
+        return ((self.a * x + self.b) % _MERSENNE).min(axis=1).astype(np.uint32)
+
+
+def similarity(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return float(np.count_nonzero(sig_a == sig_b)) / float(len(sig_a))
+
+
+class NearDupIndex:
+    """
+    Recent-items index: key -> (signature, kind). Oldest entries are evicted
+    beyond max_items. Signatures are cached per (key, text) so re-checking the
+    same candidate list every producer cycle is cheap.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 32, threshold: float = 0.5,
+                 max_items: int = 2000, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.hasher = MinHasher(num_perm, seed)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.max_items = max_items
+        self._items: "OrderedDict[str, Tuple[np.ndarray, str]]" = OrderedDict()
+        self._buckets: List[Dict[bytes, set]] = [{} for _ in range(bands)]
+        self._sig_cache: "OrderedDict[Tuple[str, int], Optional[np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    # ---------- signatures ----------
+
+    def signature(self, key: str, text: str) -> Optional[np.ndarray]:
+        ck = (key, zlib.crc32((text or "").encode("utf-8", "ignore")))
+        with self._lock:
+            if ck in self._sig_cache:
+                self._sig_cache.move_to_end(ck)
+                return self._sig_cache[ck]
+        sig = self.hasher.signature(text)
+        with self._lock:
+            self._sig_cache[ck] = sig
+            while len(self._sig_cache) > max(4 * self.max_items, 1024):
+                self._sig_cache.popitem(last=False)
+        return sig
+
+    def _band_keys(self, sig: np.ndarray) -> List[bytes]:
+        r = self.rows
+        return [sig[i * r:(i + 1) * r].tobytes() for i in range(self.bands)]
+
+    # ---------- index ----------
+
+    def add(self, key: str, text: str, kind: str = "candidate") -> bool:
+        """Index an item (re-adding a key refreshes it). False if the text is empty."""
+        sig = self.signature(key, text)
+        if sig is None:
+            return False
+        with self._lock:
+            if key in self._items:
+                self._remove(key)
+            self._items[key] = (sig, kind)
+            for band, bk in zip(self._buckets, self._band_keys(sig)):
+                band.setdefault(bk, set()).add(key)
+            while len(self._items) > self.max_items:
+                self._remove(next(iter(self._items)))
+        return True
+
+    def _remove(self, key: str) -> None:
+        sig, _ = self._items.pop(key)
+        for band, bk in zip(self._buckets, self._band_keys(sig)):
+            keys = band.get(bk)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del band[bk]
+
+    def query(self, text: str, key: str = "", kinds: Optional[Iterable[str]] = None,
+              threshold: Optional[float] = None) -> List[Tuple[str, float]]:
+        """Indexed keys similar to text, best first (excluding key itself)."""
+        sig = self.signature(key, text) if key else self.hasher.signature(text)
+        if sig is None:
+            return []
+        thr = self.threshold if threshold is None else threshold
+        kinds = set(kinds) if kinds else None
+        with self._lock:
+            cands = set()
+            for band, bk in zip(self._buckets, self._band_keys(sig)):
+                cands |= band.get(bk, set())
+            cands.discard(key)
+            out = []
+            for other in cands:
+                osig, okind = self._items[other]
+                if kinds and okind not in kinds:
+                    continue
+                sim = similarity(sig, osig)
+                if sim >= thr:
+                    out.append((other, sim))
+        out.sort(key=lambda kv: kv[1], reverse=True)
+        return out
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    # ---------- batch clustering ----------
+
+    def cluster(self, items: List[Any], key_fn: Callable[[Any], str],
+                text_fn: Callable[[Any], str]) -> List[List[int]]:
+        """
+        Group items into near-duplicate clusters (lists of indexes, input
+        order preserved inside each). Uses a throwaway LSH table, so the
+        index contents are not touched.
+        """
+        parent = list(range(len(items)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        sigs: List[Optional[np.ndarray]] = [self.signature(key_fn(it), text_fn(it)) for it in items]
+        buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(self.bands)]
+        for i, sig in enumerate(sigs):
+            if sig is None:
+                continue
+            for band, bk in zip(buckets, self._band_keys(sig)):
+                for j in band.get(bk, ()):
+                    ri, rj = find(i), find(j)
+                    if ri != rj and similarity(sig, sigs[j]) >= self.threshold:
+                        parent[max(ri, rj)] = min(ri, rj)
+                band.setdefault(bk, []).append(i)
+
+        groups: Dict[int, List[int]] = {}
+        for i in range(len(items)):
+            groups.setdefault(find(i), []).append(i)
+        return sorted(groups.values(), key=lambda g: g[0])
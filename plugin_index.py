@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Plugin Index
+
+Static (AST) inspection of plugins/*.py so hosts can list plugins and decide
+what to import without executing any plugin code. Each file is summarised
+once and cached by mtime/size in plugins/__pycache__/plugin_index.json.
+
+Per-plugin info:
+- name, path, plugin_name, plugin_desc, is_feed
+- has_feed_worker, has_register_widgets
+- widgets: [{key, title, default_panel}] from literal registry.register(...)
+  calls, or None when registration is dynamic (plugin must be imported)
+- defaults: literal FEED_DEFAULTS / DEFAULT_FEED_CFG / DEFAULT_CONFIG dict,
+  with defaults_dynamic=True when one exists but isn't a literal
+"""
+from __future__ import annotations
+
+import ast
+import glob
+import importlib.util
+import json
+import os
+import sys
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+INDEX_VERSION = 1
+CACHE_NAME = "plugin_index.json"
+DEFAULTS_NAMES = ("FEED_DEFAULTS", "DEFAULT_FEED_CFG", "DEFAULT_CONFIG")
+
+_load_lock = threading.RLock()
+
+
+# =======================
+# AST scan
+# =======================
+
+def _module_level(body: Iterable[ast.stmt]) -> Iterator[ast.stmt]:
+    """Statements that run at import time (descends into if/try/with, not defs)."""
+    for node in body:
+        yield node
+        if isinstance(node, ast.If):
+            yield from _module_level(node.body)
+            yield from _module_level(node.orelse)
+        elif isinstance(node, ast.Try):
+            yield from _module_level(node.body)
+            for h in node.handlers:
+                yield from _module_level(h.body)
+            yield from _module_level(node.orelse)
+            yield from _module_level(node.finalbody)
+        elif isinstance(node, ast.With):
+            yield from _module_level(node.body)
+
+
+_MISSING = object()
+
+
+def _literal(node: Optional[ast.AST]) -> Any:
+    if node is None:
+        return _MISSING
+    try:
+        return ast.literal_eval(node)
+    except Exception:
+        return _MISSING
+
+
+def _widget_specs(fn: ast.AST) -> Optional[List[Dict[str, Any]]]:
+    """Literal registry.register(key, ..., title=, default_panel=) calls, or None if any are dynamic."""
+    specs: List[Dict[str, Any]] = []
+    for node in ast.walk(fn):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                and node.func.attr == "register"):
+            continue
+        kw = {k.arg: k.value for k in node.keywords if k.arg}
+        key = _literal(node.args[0] if node.args else kw.get("key"))
+        if not isinstance(key, str):
+            return None
+        title = _literal(kw.get("title"))
+        panel = _literal(kw.get("default_panel"))
+        specs.append({
+            "key": key.strip().lower(),
+            "title": title if isinstance(title, str) else None,
+            "default_panel": panel if isinstance(panel, str) else "right",
+        })
+    return specs
+
+
+def scan_plugin(path: str) -> Dict[str, Any]:
+    """Summarise one plugin file without importing it."""
+    name = os.path.splitext(os.path.basename(path))[0]
+    info: Dict[str, Any] = {
+        "name": name,
+        "path": path,
+        "plugin_name": None,
+        "plugin_desc": "",
+        "is_feed": True,  # default, same as the loaders
+        "has_feed_worker": False,
+        "has_register_widgets": False,
+        "widgets": [],
+        "defaults": None,
+        "defaults_dynamic": False,
+        "error": None,
+    }
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=path)
+    except Exception as e:
+        info["error"] = f"{type(e).__name__}: {e}"
+        info["widgets"] = None
+        return info
+
+    for node in _module_level(tree.body):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if node.name == "feed_worker":
+                info["has_feed_worker"] = True
+            elif node.name == "register_widgets":
+                info["has_register_widgets"] = True
+                info["widgets"] = _widget_specs(node)
+            continue
+
+        if isinstance(node, ast.Assign):
+            targets = [t.id for t in node.targets if isinstance(t, ast.Name)]
+            value = node.value
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            targets = [node.target.id]
+            value = node.value
+        else:
+            continue
+
+        for target in targets:
+            if target == "feed_worker":
+                info["has_feed_worker"] = True
+            elif target == "register_widgets":
+                info["has_register_widgets"] = True
+                info["widgets"] = None
+            elif target == "PLUGIN_NAME":
+                v = _literal(value)
+                info["plugin_name"] = v if isinstance(v, str) else None
+            elif target == "PLUGIN_DESC":
+                v = _literal(value)
+                info["plugin_desc"] = v if isinstance(v, str) else ""
+            elif target == "IS_FEED":
+                v = _literal(value)
+                info["is_feed"] = bool(v) if v is not _MISSING else True
+            elif target in DEFAULTS_NAMES and info["defaults"] is None:
+                v = _literal(value)
+                if isinstance(v, dict):
+                    info["defaults"] = v
+                    info["defaults_dynamic"] = False
+                else:
+                    info["defaults_dynamic"] = True
+    return info
+
+
+# =======================
+# Cached index
+# =======================
+
+def _cache_path(plugin_dir: str) -> str:
+    return os.path.join(plugin_dir, "__pycache__", CACHE_NAME)
+
+
+def _read_cache(plugin_dir: str) -> Dict[str, Any]:
+    try:
+        with open(_cache_path(plugin_dir), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == INDEX_VERSION and isinstance(data.get("files"), dict):
+            return data["files"]
+    except Exception:
+        pass
+    return {}
+
+
+def _write_cache(plugin_dir: str, files: Dict[str, Any]) -> None:
+    path = _cache_path(plugin_dir)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": INDEX_VERSION, "files": files}, f)
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.remove(tmp)
+        except Exception:
+            pass
+
+
+def build_index(plugin_dir: str) -> Dict[str, Dict[str, Any]]:
+    """
+    name -> info for every plugins/*.py. Unchanged files come from the cache;
+    changed or new ones are re-scanned and the cache is rewritten.
+    """
+    cached = _read_cache(plugin_dir)
+    files: Dict[str, Any] = {}
+    index: Dict[str, Dict[str, Any]] = {}
+    dirty = False
+
+    for path in sorted(glob.glob(os.path.join(plugin_dir, "*.py"))):
+        fname = os.path.basename(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        stamp = [st.st_mtime_ns, st.st_size]
+
+        entry = cached.get(fname)
+        if entry and entry.get("stamp") == stamp:
+            info = entry["info"]
+            info["path"] = path
+        else:
+            info = scan_plugin(path)
+            dirty = True
+
+        files[fname] = {"stamp": stamp, "info": info}
+        index[info["name"]] = info
+
+    if dirty or set(files) != set(cached):
+        _write_cache(plugin_dir, files)
+    return index
+
+
+def resolve(index: Dict[str, Dict[str, Any]], key: str) -> Optional[str]:
+    """Module name for a manifest plugin key (module name or declared PLUGIN_NAME)."""
+    key = (key or "").strip().lower()
+    if not key:
+        return None
+    for name in index:
+        if name.lower() == key:
+            return name
+    for name, info in index.items():
+        declared = info.get("plugin_name")
+        if isinstance(declared, str) and declared.strip().lower() == key:
+            return name
+    return None
+
+
+def widget_owner(index: Dict[str, Dict[str, Any]], widget_key: str) -> Optional[str]:
+    """Plugin that statically registers widget_key (last one wins, like registration order)."""
+    widget_key = (widget_key or "").strip().lower()
+    owner = None
+    for name, info in index.items():
+        for spec in info.get("widgets") or []:
+            if spec["key"] == widget_key:
+                owner = name
+    return owner
+
+
+def import_plugin(name: str, path: str):
+    """Execute a plugin module once and register it in sys.modules."""
+    with _load_lock:
+        mod = sys.modules.get(name)
+        if mod is not None and os.path.abspath(getattr(mod, "__file__", "") or "") == os.path.abspath(path):
+            return mod
+        spec = importlib.util.spec_from_file_location(name, path)
+        mod = importlib.util.module_from_spec(spec)
+        sys.modules[name] = mod  # Register first so other plugins can find it
+        try:
+            spec.loader.exec_module(mod)
+        except Exception:
+            sys.modules.pop(name, None)
+            raise
+        return mod
@@ -1,10 +1,10 @@
 import time
-import requests
 import hashlib
 from typing import Any, Dict, List
 
 # Import runtime objects
 from runtime import StationEvent, event_q
+from fetch_engine import get_fetch_engine, wait_jittered
 
 
 # Plugin metadata
@@ -50,35 +50,39 @@ def get_bsky_token(identifier: str, password: str) -> str:
     if not identifier or not password:
         return ""
 
+    engine = get_fetch_engine()
+
     try:
-        r = requests.post(
+        r = engine.fetch(
             "https://bsky.social/xrpc/com.atproto.server.createSession",
-            json={"identifier": identifier, "password": password},
+            method="POST",
+            json_body={"identifier": identifier, "password": password},
             headers={"User-Agent": "RadioOS/1.0"},
             timeout=10
         )
-        if r.status_code == 200:
+        if r.status == 200:
             _BSKY_SESSION = r.json().get("accessJwt")
             _BSKY_SESSION_TS = now
             return _BSKY_SESSION
         else:
-            print(f"[Bluesky] Auth failed: {r.status_code} {r.text}")
+            print(f"[Bluesky] Auth failed: {r.status or r.error} {r.text}")
             
             # Retry with suffix if missing
             if "." not in identifier:
                 print(f"[Bluesky] Retrying with .bsky.social suffix...")
-                r2 = requests.post(
+                r2 = engine.fetch(
                     "https://bsky.social/xrpc/com.atproto.server.createSession",
-                    json={"identifier": identifier + ".bsky.social", "password": password},
+                    method="POST",
+                    json_body={"identifier": identifier + ".bsky.social", "password": password},
                     headers={"User-Agent": "RadioOS/1.0"},
                     timeout=10
                 )
-                if r2.status_code == 200:
+                if r2.status == 200:
                     _BSKY_SESSION = r2.json().get("accessJwt")
                     _BSKY_SESSION_TS = now
                     return _BSKY_SESSION
                 else:
-                    print(f"[Bluesky] Auth retry failed: {r2.status_code} {r2.text}")
+                    print(f"[Bluesky] Auth retry failed: {r2.status or r2.error} {r2.text}")
 
     except Exception as e:
         print(f"[Bluesky] Auth exception: {e}")
@@ -102,81 +106,89 @@ def fetch_bluesky_tags(tags: List[str], identifier: str = "", password: str = ""
         # Fallback to public (likely broken/limited)
         base_url = "https://public.api.bsky.app/xrpc/app.bsky.feed.searchPosts"
 
-    for tag in tags:
-        # Fetch both "Latest" (News) and "Top" (Existing/Trending)
-        for sort_order in ["latest", "top"]:
-            try:
-                # Split limit to avoid double-dipping too hard
-                eff_limit = max(5, int(limit / 2))
-                
-                r = requests.get(
-                    base_url,
-                    params={
-                        "q": f"#{tag}",
-                        "limit": eff_limit,
-                        "sort": sort_order
-                    },
-                    headers=headers,
-                    timeout=10
-                )
+    # Split limit to avoid double-dipping too hard
+    eff_limit = max(5, int(limit / 2))
+
+    # Fetch both "Latest" (News) and "Top" (Existing/Trending) for every tag
+    # in one concurrent batch through the shared fetch engine
+    jobs = [(tag, sort_order) for tag in tags for sort_order in ["latest", "top"]]
+    responses = get_fetch_engine().fetch_many([
+        {
+            "url": base_url,
+            "params": {
+                "q": f"#{tag}",
+                "limit": eff_limit,
+                "sort": sort_order
+            },
+            "headers": headers,
+            "timeout": 10,
+        }
+        for tag, sort_order in jobs
+    ], timeout=10)
+
+    for (tag, sort_order), r in zip(jobs, responses):
+        try:
+            # Results unchanged since last poll: nothing new to emit
+            if r.not_modified:
+                continue
 
-                if r.status_code != 200:
-                    print(f"[Bluesky] Error fetching #{tag} ({sort_order}): {r.status_code}")
+            if r.status != 200:
+                print(f"[Bluesky] Error fetching #{tag} ({sort_order}): {r.status or r.error}")
+                continue
+
+            posts = r.json().get("posts", [])
+            print(f"[Bluesky] #{tag} ({sort_order}) found {len(posts)} items")
+
+            for p in posts:
+
+                pid = p.get("uri")
+                if not pid:
                     continue
 
-                posts = r.json().get("posts", [])
-                print(f"[Bluesky] #{tag} ({sort_order}) found {len(posts)} items")
-
-                for p in posts:
-
-                    pid = p.get("uri")
-                    if not pid:
-                        continue
-
-                    text = (p.get("record") or {}).get("text", "")
-                    author = (p.get("author") or {}).get("displayName") or (p.get("author") or {}).get("handle") or "Unknown"
-                    like_count = p.get("likeCount", 0)
-                    reply_count = p.get("replyCount", 0)
-                    repost_count = p.get("repostCount", 0)
-                    
-                    # Format for radio: synthesize context that invites analysis and discussion
-                    # Don't just restate - provide angles for commentary
-                    angle_parts = []
-                    
-                    # Provide engagement as context for discussion, not as narration
-                    if like_count > 100 or repost_count > 20:
-                        angle_parts.append(f"{author} is getting viral attention on Bluesky.")
-                    elif like_count > 10:
-                        angle_parts.append(f"{author} weighs in on #{tag}.")
-                    
-                    # Add the content as material to discuss, not to repeat verbatim
-                    angle_parts.append(f"Their take: {text}")
-                    
-                    # Frame engagement as a discussion angle
-                    engagement_context = ""
-                    if reply_count > 10:
-                        engagement_context = f"The community is actively debating this with {reply_count} replies."
-                    elif like_count > 50:
-                        engagement_context = f"Resonating with {like_count} people so far."
-                    
-                    if engagement_context:
-                        angle_parts.append(engagement_context)
-                    
-                    # Provide explicit angle guidance for synthesis
-                    synthesis_angle = "Discuss the perspective and what it means for the conversation around this topic."
-                    if repost_count > 20:
-                        synthesis_angle = "Analyze why this take is spreading and what it reveals about the current discourse."
-                    
-                    out.append({
-                        "post_id": pid,
-                        "title": f"Bluesky discussion: {author} on #{tag}",
-                        "body": " ".join(angle_parts),
-                        "angle": synthesis_angle,
-                        "key_points": ["author's main argument", "community reaction", "broader implications"],
-                    })
-
-            except Exception:
-                pass
+                text = (p.get("record") or {}).get("text", "")
+                author = (p.get("author") or {}).get("displayName") or (p.get("author") or {}).get("handle") or "Unknown"
+                like_count = p.get("likeCount", 0)
+                reply_count = p.get("replyCount", 0)
+                repost_count = p.get("repostCount", 0)
+                
+                # Format for radio: synthesize context that invites analysis and discussion
+                # Don't just restate - provide angles for commentary
+                angle_parts = []
+                
+                # Provide engagement as context for discussion, not as narration
+                if like_count > 100 or repost_count > 20:
+                    angle_parts.append(f"{author} is getting viral attention on Bluesky.")
+                elif like_count > 10:
+                    angle_parts.append(f"{author} weighs in on #{tag}.")
+                
+                # Add the content as material to discuss, not to repeat verbatim
+                angle_parts.append(f"Their take: {text}")
+                
+                # Frame engagement as a discussion angle
+                engagement_context = ""
+                if reply_count > 10:
+                    engagement_context = f"The community is actively debating this with {reply_count} replies."
+                elif like_count > 50:
+                    engagement_context = f"Resonating with {like_count} people so far."
+                
+                if engagement_context:
+                    angle_parts.append(engagement_context)
+                
+                # Provide explicit angle guidance for synthesis
+                synthesis_angle = "Discuss the perspective and what it means for the conversation around this topic."
+                if repost_count > 20:
+                    synthesis_angle = "Analyze why this take is spreading and what it reveals about the current discourse."
+                
+                out.append({
+                    "post_id": pid,
+                    "title": f"Bluesky discussion: {author} on #{tag}",
+                    "body": " ".join(angle_parts),
+                    "angle": synthesis_angle,
+                    "key_points": ["author's main argument", "community reaction", "broader implications"],
+                })
+
+        except Exception:
+            pass
 
     return out
 
@@ -277,7 +289,7 @@ def feed_worker(stop_event, mem, cfg, runtime=None):
             if burst_delay > 0:
                 time.sleep(burst_delay)
 
-        time.sleep(poll_sec)
+        wait_jittered(stop_event, poll_sec)
 
 
 # ======================================================
@@ -3,6 +3,10 @@
 FromTheBackmarker Audio Engine
 Four-channel audio system: world, music, narrator, ui
 
+All playback goes through the shared software mixer (audio_mixer): sounds
+are decoded once into a resident PCM bank and mixed onto per-channel buses
+in a single output stream.
+
 Implements:
 - Modal drift music system (performance-based theme variants)
 - World audio (engines, crashes, ambient motorsport)
@@ -24,18 +28,27 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 try:
-    import pygame
-    import pygame.mixer
-    HAS_PYGAME = True
+    import audio_mixer
+    HAS_MIXER = audio_mixer.sf is not None
 except ImportError:
-    HAS_PYGAME = False
-    print("[ftb_audio_engine] WARNING: pygame not installed. Audio engine disabled.", file=sys.stderr)
+    audio_mixer = None
+    HAS_MIXER = False
+if not HAS_MIXER:
+    print("[ftb_audio_engine] WARNING: numpy/soundfile not installed. Audio engine disabled.", file=sys.stderr)
 
 # Plugin metadata
 PLUGIN_NAME = "ftb_audio_engine"
 PLUGIN_DESC = "Multi-channel audio engine for FromTheBackmarker"
 IS_FEED = True  # Feed plugin - runs audio engine worker
 
+# FTB's own mixer buses. Channel volumes, ducking and PBP mute are set as
+# gains on these, so the station's music/world/ambient/ui buses (used by
+# the host's file audio) are never touched.
+MUSIC_BUS = 'ftb_music'
+WORLD_BUS = 'ftb_world'
+AMBIENT_BUS = 'ftb_ambient'
+UI_BUS = 'ftb_ui'
+
 # =======================
 # Audio Event Types
 # =======================
@@ -148,12 +161,16 @@ class StateMusicController:
     """
     Modal drift music system.
     Manages theme variants (minor/neutral/major) with crossfade.
+    Volume lives on FTB's music bus so ducking and PBP mute are
+    ramped in the render loop rather than stepped from here.
     """
     
-    def __init__(self, audio_dir: str, runtime: Dict[str, Any], config: Dict[str, Any]):
+    def __init__(self, audio_dir: str, runtime: Dict[str, Any], config: Dict[str, Any],
+                 mixer: Optional[Any] = None):
         self.audio_dir = Path(audio_dir)
         self.runtime = runtime
         self.config = config
+        self.mixer = mixer
         
         # Theme variants
         self.variants = {
@@ -169,12 +186,13 @@ class StateMusicController:
         self.crossfade_duration = config.get('crossfade_duration', 6.0)
         self.is_ducking = False
         self.duck_volume = 0.02  # Very faint during speech
+        self.duck_ramp = 0.2  # Seconds to duck when speech starts
         self.normal_volume = config.get('channel_volumes', {}).get('music', 0.08)  # Very low background volume
         self.pbp_muted = False  # True when PBP mode has muted music entirely
         
-        # Pygame channels
-        self.music_channel = None
-        self.crossfade_channel = None
+        # Mixer voices
+        self.music_voice = 0
+        self.crossfade_voice = 0
         
     def select_variant(self, scalar: float) -> str:
         """Select theme variant based on performance scalar"""
@@ -185,6 +203,12 @@ class StateMusicController:
         else:
             return 'neutral'
     
+    def _bus_level(self) -> float:
+        """Music bus gain for the current mute/duck state"""
+        if self.pbp_muted:
+            return 0.0
+        return self.duck_volume if self.is_ducking else self.normal_volume
+    
     def update(self, performance_scalar: float, dt: float) -> None:
         """
         Update music state based on performance.
@@ -202,7 +226,7 @@ class StateMusicController:
             self.crossfade_progress = 0.0
             self._start_crossfade()
         
-        # Update crossfade progress
+        # Track crossfade progress (the gain ramps themselves run in the mixer)
         if self.crossfade_progress < 1.0:
             self.crossfade_progress += dt / self.crossfade_duration
             if self.crossfade_progress >= 1.0:
@@ -211,7 +235,7 @@ class StateMusicController:
     
     def _start_crossfade(self) -> None:
         """Begin crossfade to target variant"""
-        if not HAS_PYGAME or not pygame.mixer.get_init():
+        if self.mixer is None:
             return
         
         target_file = self.variants.get(self.target_variant)
@@ -220,36 +244,24 @@ class StateMusicController:
             self.crossfade_progress = 1.0
             return
         
-        try:
-            # Load and play target on crossfade channel
-            sound = pygame.mixer.Sound(target_file)
-            if self.crossfade_channel is None:
-                self.crossfade_channel = pygame.mixer.Channel(1)
-            self.crossfade_channel.play(sound, loops=-1)
-            self.crossfade_channel.set_volume(0.0)
-        except Exception as e:
-            self.runtime.get('log', print)(f"[ftb_audio_engine] Crossfade start error: {e}")
+        # Both ramps start on the same sample; the old voice stops itself at the end
+        self.crossfade_voice = self.mixer.crossfade(
+            self.music_voice, target_file, self.crossfade_duration, bus=MUSIC_BUS, loop=True
+        )
+        if not self.crossfade_voice:
+            self.runtime.get('log', print)(f"[ftb_audio_engine] Crossfade start error: could not load {target_file}")
+            self.crossfade_progress = 1.0
     
     def _complete_crossfade(self) -> None:
-        """Complete crossfade, swap channels"""
-        if not HAS_PYGAME or not pygame.mixer.get_init():
-            return
-        
-        # Swap channels
-        if self.music_channel:
-            self.music_channel.stop()
-        self.music_channel = self.crossfade_channel
-        self.crossfade_channel = None
+        """Complete crossfade, swap voices"""
+        if self.crossfade_voice:
+            self.music_voice = self.crossfade_voice
+        self.crossfade_voice = 0
         self.current_variant = self.target_variant
-        
-        # Set correct volume (ducking or normal)
-        target_volume = self.duck_volume if self.is_ducking else self.normal_volume
-        if self.music_channel:
-            self.music_channel.set_volume(target_volume)
     
     def start(self) -> None:
         """Start playing initial theme"""
-        if not HAS_PYGAME or not pygame.mixer.get_init():
+        if self.mixer is None:
             return
         
         initial_file = self.variants.get(self.current_variant)
@@ -257,59 +269,42 @@ class StateMusicController:
             self.runtime.get('log', print)(f"[ftb_audio_engine] Initial music file not found: {initial_file}")
             return
         
-        try:
-            sound = pygame.mixer.Sound(initial_file)
-            if self.music_channel is None:
-                self.music_channel = pygame.mixer.Channel(0)
-            self.music_channel.play(sound, loops=-1)
-            self.music_channel.set_volume(self.normal_volume)
-        except Exception as e:
-            self.runtime.get('log', print)(f"[ftb_audio_engine] Music start error: {e}")
+        # Decode all variants up front so later crossfades never hit the disk
+        self.mixer.bank.preload(p for p in self.variants.values() if os.path.exists(p))
+        self.mixer.set_bus_gain(MUSIC_BUS, self._bus_level())
+        self.music_voice = self.mixer.play(initial_file, bus=MUSIC_BUS, loop=True)
+        if not self.music_voice:
+            self.runtime.get('log', print)(f"[ftb_audio_engine] Music start error: could not load {initial_file}")
     
     def set_ducking(self, ducking: bool, duration: float = 1.5) -> None:
-        """Duck music for narrator (gradually reduce volume)"""
+        """Duck music for narrator (quick duck, gradual restore)"""
         self.is_ducking = ducking
-        target_volume = self.duck_volume if ducking else self.normal_volume
         
         # PBP mute overrides ducking
-        if self.pbp_muted:
+        if self.pbp_muted or self.mixer is None:
             return
         
-        if self.music_channel:
-            self.music_channel.set_volume(target_volume)
+        self.mixer.set_bus_gain(MUSIC_BUS, self._bus_level(), ramp=self.duck_ramp if ducking else duration)
     
     def set_pbp_mute(self, muted: bool) -> None:
         """
         Mute / unmute music for PBP mode.
-        Uses a smooth fade via a background thread.
+        Fades the music bus over ~2 seconds.
         When muted, volume → 0.  When unmuted, restore to normal/duck level.
         """
         self.pbp_muted = muted
-        target = 0.0 if muted else (self.duck_volume if self.is_ducking else self.normal_volume)
-        
-        if self.music_channel:
-            # Threaded fade over ~2 seconds (40 steps × 50ms)
-            def _fade():
-                ch = self.music_channel
-                if not ch:
-                    return
-                start_vol = ch.get_volume()
-                steps = 40
-                for i in range(1, steps + 1):
-                    vol = start_vol + (target - start_vol) * (i / steps)
-                    try:
-                        ch.set_volume(max(0.0, vol))
-                    except Exception:
-                        break
-                    time.sleep(0.05)
-            threading.Thread(target=_fade, daemon=True, name="MusicFade").start()
+        if self.mixer is not None:
+            self.mixer.set_bus_gain(MUSIC_BUS, self._bus_level(), ramp=2.0)
     
     def stop(self) -> None:
         """Stop music playback"""
-        if self.music_channel:
-            self.music_channel.stop()
-        if self.crossfade_channel:
-            self.crossfade_channel.stop()
+        if self.mixer is None:
+            return
+        for vid in (self.music_voice, self.crossfade_voice):
+            if vid:
+                self.mixer.stop(vid, fade_out=0.5)
+        self.music_voice = 0
+        self.crossfade_voice = 0
 
 
 # =======================
@@ -322,12 +317,15 @@ class AmbientAudioManager:
     - garage.ogg, toolbox.ogg (mechanical ambient)
     - distantchatter.ogg, distantpa.ogg (crowd/PA ambient)
     Each sound loops and fades on its own schedule for layered atmosphere.
+    Fades are handed to the mixer as gain ramps; this class only schedules them.
     """
     
-    def __init__(self, audio_dir: str, runtime: Dict[str, Any], config: Dict[str, Any]):
+    def __init__(self, audio_dir: str, runtime: Dict[str, Any], config: Dict[str, Any],
+                 mixer: Optional[Any] = None):
         self.audio_dir = Path(audio_dir)
         self.runtime = runtime
         self.config = config
+        self.mixer = mixer
         
         self.base_volume = config.get('channel_volumes', {}).get('ambient', 0.15)
         
@@ -335,7 +333,7 @@ class AmbientAudioManager:
         self.ambient_sounds = {
             'garage': {
                 'file': 'world/ambient/garage.ogg',
-                'channel': None,
+                'voice': 0,
                 'fade_in_duration': (3.0, 8.0),  # Random range
                 'fade_out_duration': (5.0, 12.0),
                 'silence_duration': (10.0, 30.0),
@@ -347,7 +345,7 @@ class AmbientAudioManager:
             },
             'toolbox': {
                 'file': 'world/ambient/toolbox.ogg',
-                'channel': None,
+                'voice': 0,
                 'fade_in_duration': (4.0, 10.0),
                 'fade_out_duration': (6.0, 15.0),
                 'silence_duration': (15.0, 45.0),
@@ -359,7 +357,7 @@ class AmbientAudioManager:
             },
             'distantchatter': {
                 'file': 'world/ambient/distantchatter.ogg',
-                'channel': None,
+                'voice': 0,
                 'fade_in_duration': (5.0, 12.0),
                 'fade_out_duration': (8.0, 20.0),
                 'silence_duration': (5.0, 20.0),
@@ -371,7 +369,7 @@ class AmbientAudioManager:
             },
             'distantpa': {
                 'file': 'world/ambient/distantpa.ogg',
-                'channel': None,
+                'voice': 0,
                 'fade_in_duration': (6.0, 15.0),
                 'fade_out_duration': (10.0, 25.0),
                 'silence_duration': (20.0, 60.0),
@@ -383,17 +381,14 @@ class AmbientAudioManager:
             }
         }
         
-        self.channel_offset = 10  # Start at channel 10
-        self._assign_channels()
+        if self.mixer is not None:
+            self.mixer.set_bus_gain(AMBIENT_BUS, self.base_volume)
         self._init_timers()
     
-    def _assign_channels(self):
-        """Assign pygame channels to each ambient sound"""
-        if not HAS_PYGAME or not pygame.mixer.get_init():
-            return
-        
-        for idx, sound_name in enumerate(self.ambient_sounds.keys()):
-            self.ambient_sounds[sound_name]['channel'] = pygame.mixer.Channel(self.channel_offset + idx)
+    def sound_paths(self) -> List[str]:
+        """Existing ambient files (for preloading)"""
+        paths = [self.audio_dir / d['file'] for d in self.ambient_sounds.values()]
+        return [str(p) for p in paths if p.exists()]
     
     def _init_timers(self):
         """Initialize random timers for staggered starts"""
@@ -403,8 +398,8 @@ class AmbientAudioManager:
             sound_data['state_timer'] = 0.0
     
     def update(self, dt: float):
-        """Update all ambient sounds (fade in/out logic)"""
-        if not HAS_PYGAME or not pygame.mixer.get_init():
+        """Advance the fade in/out schedule"""
+        if self.mixer is None:
             return
         
         for sound_name, sound_data in self.ambient_sounds.items():
@@ -423,9 +418,6 @@ class AmbientAudioManager:
                     sound_data['current_volume'] = sound_data['target_volume']
                 else:
                     sound_data['current_volume'] = sound_data['target_volume'] * progress
-                
-                if sound_data['channel']:
-                    sound_data['channel'].set_volume(sound_data['current_volume'] * self.base_volume)
             
             elif sound_data['state'] == 'playing':
                 if sound_data['state_timer'] >= sound_data['next_duration']:
@@ -438,13 +430,11 @@ class AmbientAudioManager:
                     sound_data['state_timer'] = 0.0
                     sound_data['next_duration'] = random.uniform(*sound_data['silence_duration'])
                     sound_data['current_volume'] = 0.0
-                    if sound_data['channel']:
-                        sound_data['channel'].stop()
+                    if sound_data['voice']:
+                        self.mixer.stop(sound_data['voice'])
+                        sound_data['voice'] = 0
                 else:
                     sound_data['current_volume'] = sound_data['target_volume'] * (1.0 - progress)
-                
-                if sound_data['channel']:
-                    sound_data['channel'].set_volume(sound_data['current_volume'] * self.base_volume)
     
     def _start_fade_in(self, sound_name: str):
         """Begin fade-in for an ambient sound"""
@@ -455,17 +445,16 @@ class AmbientAudioManager:
             self.runtime.get('log', print)(f"[ambient] File not found: {sound_file}")
             return
         
-        try:
-            sound = pygame.mixer.Sound(str(sound_file))
-            channel = sound_data['channel']
-            if channel:
-                channel.play(sound, loops=-1)
-                channel.set_volume(0.0)
-                sound_data['state'] = 'fading_in'
-                sound_data['state_timer'] = 0.0
-                sound_data['next_duration'] = random.uniform(*sound_data['fade_in_duration'])
-        except Exception as e:
-            self.runtime.get('log', print)(f"[ambient] Error playing {sound_name}: {e}")
+        fade_in = random.uniform(*sound_data['fade_in_duration'])
+        voice = self.mixer.play(str(sound_file), bus=AMBIENT_BUS, gain=sound_data['target_volume'],
+                                loop=True, fade_in=fade_in)
+        if not voice:
+            self.runtime.get('log', print)(f"[ambient] Error playing {sound_name}")
+            return
+        sound_data['voice'] = voice
+        sound_data['state'] = 'fading_in'
+        sound_data['state_timer'] = 0.0
+        sound_data['next_duration'] = fade_in
     
     def _start_fade_out(self, sound_name: str):
         """Begin fade-out for an ambient sound"""
@@ -473,12 +462,15 @@ class AmbientAudioManager:
         sound_data['state'] = 'fading_out'
         sound_data['state_timer'] = 0.0
         sound_data['next_duration'] = random.uniform(*sound_data['fade_out_duration'])
+        if sound_data['voice']:
+            self.mixer.set_gain(sound_data['voice'], 0.0, ramp=sound_data['next_duration'])
     
     def stop_all(self):
         """Stop all ambient sounds"""
         for sound_data in self.ambient_sounds.values():
-            if sound_data['channel']:
-                sound_data['channel'].stop()
+            if sound_data['voice'] and self.mixer is not None:
+                self.mixer.stop(sound_data['voice'], fade_out=0.5)
+            sound_data['voice'] = 0
             sound_data['state'] = 'silent'
             sound_data['current_volume'] = 0.0
 
@@ -492,71 +484,102 @@ class WorldAudioController:
     Manages race audio: engines, crashes, crowd reactions, ambient motorsport texture.
     """
     
-    def __init__(self, audio_dir: str, runtime: Dict[str, Any], config: Dict[str, Any]):
+    # Crowd reaction type -> file in world/ambient
+    CROWD_SOUNDS = {
+        'cheer': 'crowdcheer_oneshot.ogg',
+        'chatter': 'crowdchatter_oneshot.ogg',
+        'whoop': 'crowdwhoop.ogg'
+    }
+    
+    def __init__(self, audio_dir: str, runtime: Dict[str, Any], config: Dict[str, Any],
+                 mixer: Optional[Any] = None):
         self.audio_dir = Path(audio_dir)
         self.runtime = runtime
         self.config = config
+        self.mixer = mixer
         
-        # Channels
-        self.engine_channel = None
-        self.crash_channel = None
-        self.crowd_channel = None
+        # Mixer voices
+        self.engine_voice = 0
+        self.crash_voice = 0
+        self.crowd_voice = 0
         
         # State
         self.current_engine_league = None
-        self.current_engine_sound = None  # Keep reference to loaded sound
-        self.engine_loop_start_pos = 20.0  # Start loops at 20 seconds in
-        self.engine_first_play = True
+        self.engine_loop_start_pos = 20.0  # Loops restart 20 seconds in
         self.silence_until = 0  # Timestamp for post-crash silence
         
         self.volume = config.get('channel_volumes', {}).get('world', 0.5)
+        if self.mixer is not None:
+            self.mixer.set_bus_gain(WORLD_BUS, self.volume)
+        
+        # Directory listings are scanned once, not per event
+        self._engine_files: Dict[str, List[Path]] = {}
+        self._crash_files: Dict[str, List[Path]] = {}
         
         # Ambient manager
-        self.ambient_manager = AmbientAudioManager(audio_dir, runtime, config)
+        self.ambient_manager = AmbientAudioManager(audio_dir, runtime, config, mixer)
+    
+    def _engine_variants(self, league_tier: str) -> List[Path]:
+        """Engine recordings for a tier (OGG preferred, then WAV)"""
+        if league_tier not in self._engine_files:
+            engine_dir = self.audio_dir / 'world' / 'engines' / league_tier
+            files: List[Path] = []
+            if engine_dir.exists():
+                files = sorted(engine_dir.glob('*.ogg')) or sorted(engine_dir.glob('*.wav'))
+            self._engine_files[league_tier] = files
+        return self._engine_files[league_tier]
+    
+    def _crash_variants(self, crash_type: str) -> List[Path]:
+        """Crash samples for a type (OGG preferred, then WAV)"""
+        if crash_type not in self._crash_files:
+            crash_dir = self.audio_dir / 'world' / 'crashes'
+            files: List[Path] = []
+            if crash_dir.exists():
+                files = sorted(crash_dir.glob(f'{crash_type}*.ogg')) or sorted(crash_dir.glob(f'{crash_type}*.wav'))
+            self._crash_files[crash_type] = files
+        return self._crash_files[crash_type]
+    
+    def oneshot_paths(self) -> List[str]:
+        """Crash and crowd one-shots (small, worth decoding eagerly)"""
+        paths = [p for t in ('hard', 'medium', 'light') for p in self._crash_variants(t)]
+        crowd_dir = self.audio_dir / 'world' / 'ambient'
+        paths += [crowd_dir / f for f in self.CROWD_SOUNDS.values() if (crowd_dir / f).exists()]
+        return [str(p) for p in paths]
     
     def play_engine_loop(self, league_tier: str) -> None:
         """
         Play engine audio loop for current league tier.
         These are full onboard lap recordings that should loop continuously
-        as ambient background audio throughout the race.
+        as ambient background audio throughout the race. The first pass plays
+        from the top; later passes restart at engine_loop_start_pos.
         
         Args:
             league_tier: 'grassroots', 'midformula', 'formulaz'
         """
-        if not HAS_PYGAME or not pygame.mixer.get_init():
+        if self.mixer is None:
             return
         
         if self.current_engine_league == league_tier:
             return  # Already playing correct engine
         
-        engine_dir = self.audio_dir / 'world' / 'engines' / league_tier
-        if not engine_dir.exists():
-            return
-        
-        # Pick random variant (OGG preferred, then WAV)
-        engine_files = list(engine_dir.glob('*.ogg'))
-        if not engine_files:
-            engine_files = list(engine_dir.glob('*.wav'))
+        engine_files = self._engine_variants(league_tier)
         if not engine_files:
             return
         
         engine_file = random.choice(engine_files)
         
-        try:
-            sound = pygame.mixer.Sound(str(engine_file))
-            if self.engine_channel is None:
-                self.engine_channel = pygame.mixer.Channel(2)
-            
-            # Loop indefinitely - pygame will handle seamless looping
-            # Note: For loop point at 20s, would need pygame.mixer.music or custom implementation
-            # For now, loop from beginning which works for most onboard audio
-            self.engine_channel.play(sound, loops=-1)
-            self.engine_channel.set_volume(self.volume * 0.3)  # Engines at 30% - ambient background
-            self.current_engine_league = league_tier
-            
-            self.runtime.get('log', print)(f"[ftb_audio_engine] Engine audio started: {league_tier}")
-        except Exception as e:
-            self.runtime.get('log', print)(f"[ftb_audio_engine] Engine audio error: {e}")
+        # Decoded once; stays resident for the next race at this tier
+        voice = self.mixer.play(str(engine_file), bus=WORLD_BUS, gain=0.3,  # Engines at 30% - ambient background
+                                loop=True, loop_start=self.engine_loop_start_pos, fade_in=0.5)
+        if not voice:
+            self.runtime.get('log', print)(f"[ftb_audio_engine] Engine audio error: could not load {engine_file}")
+            return
+        if self.engine_voice:
+            self.mixer.stop(self.engine_voice, fade_out=0.5)
+        self.engine_voice = voice
+        self.current_engine_league = league_tier
+        
+        self.runtime.get('log', print)(f"[ftb_audio_engine] Engine audio started: {league_tier}")
     
     def play_crash(self, severity: float) -> None:
         """
@@ -565,7 +588,7 @@ class WorldAudioController:
         Args:
             severity: 0.0-1.0, determines crash intensity
         """
-        if not HAS_PYGAME or not pygame.mixer.get_init():
+        if self.mixer is None:
             return
         
         # Determine crash type
@@ -579,32 +602,25 @@ class WorldAudioController:
             crash_type = 'light'
             silence_duration = 0.0
         
-        crash_dir = self.audio_dir / 'world' / 'crashes'
-        
-        # Try .ogg first, then .wav
-        crash_files = list(crash_dir.glob(f'{crash_type}*.ogg'))
-        if not crash_files:
-            crash_files = list(crash_dir.glob(f'{crash_type}*.wav'))
-        
+        crash_files = self._crash_variants(crash_type)
         if not crash_files:
             return
         
         crash_file = random.choice(crash_files)
         
-        try:
-            sound = pygame.mixer.Sound(str(crash_file))
-            if self.crash_channel is None:
-                self.crash_channel = pygame.mixer.Channel(3)
-            self.crash_channel.play(sound)
-            self.crash_channel.set_volume(self.volume * 0.6)  # Crashes at 60%
-            
-            # Post-crash silence (fade out engines briefly)
-            if silence_duration > 0:
-                self.silence_until = time.time() + silence_duration
-                if self.engine_channel:
-                    self.engine_channel.set_volume(0.0)
-        except Exception as e:
-            self.runtime.get('log', print)(f"[ftb_audio_engine] Crash audio error: {e}")
+        # One crash at a time, like the old dedicated channel
+        if self.crash_voice:
+            self.mixer.stop(self.crash_voice, fade_out=0.02)
+        self.crash_voice = self.mixer.play(str(crash_file), bus=WORLD_BUS, gain=0.6)  # Crashes at 60%
+        if not self.crash_voice:
+            self.runtime.get('log', print)(f"[ftb_audio_engine] Crash audio error: could not load {crash_file}")
+            return
+        
+        # Post-crash silence (fade out engines briefly)
+        if silence_duration > 0:
+            self.silence_until = time.time() + silence_duration
+            if self.engine_voice:
+                self.mixer.set_gain(self.engine_voice, 0.0, ramp=0.05)
     
     def play_crowd_reaction(self, reaction_type: str = 'cheer') -> None:
         """
@@ -613,31 +629,20 @@ class WorldAudioController:
         Args:
             reaction_type: 'cheer', 'chatter', 'whoop' for different crowd reactions
         """
-        if not HAS_PYGAME or not pygame.mixer.get_init():
+        if self.mixer is None:
             return
         
         crowd_dir = self.audio_dir / 'world' / 'ambient'
-        
-        # Map reaction types to files
-        sound_map = {
-            'cheer': 'crowdcheer_oneshot.ogg',
-            'chatter': 'crowdchatter_oneshot.ogg',
-            'whoop': 'crowdwhoop.ogg'
-        }
-        
-        sound_file = crowd_dir / sound_map.get(reaction_type, 'crowdcheer_oneshot.ogg')
+        sound_file = crowd_dir / self.CROWD_SOUNDS.get(reaction_type, 'crowdcheer_oneshot.ogg')
         
         if not sound_file.exists():
             return
         
-        try:
-            sound = pygame.mixer.Sound(str(sound_file))
-            if self.crowd_channel is None:
-                self.crowd_channel = pygame.mixer.Channel(4)
-            self.crowd_channel.play(sound)
-            self.crowd_channel.set_volume(self.volume * 0.5)
-        except Exception as e:
-            self.runtime.get('log', print)(f"[ftb_audio_engine] Crowd audio error: {e}")
+        if self.crowd_voice:
+            self.mixer.stop(self.crowd_voice, fade_out=0.05)
+        self.crowd_voice = self.mixer.play(str(sound_file), bus=WORLD_BUS, gain=0.5)
+        if not self.crowd_voice:
+            self.runtime.get('log', print)(f"[ftb_audio_engine] Crowd audio error: could not load {sound_file}")
     
     def update(self, dt: float = 0.05) -> None:
         """
@@ -649,16 +654,17 @@ class WorldAudioController:
         # Check for end of post-crash silence
         if self.silence_until > 0 and time.time() >= self.silence_until:
             self.silence_until = 0
-            if self.engine_channel:
-                self.engine_channel.set_volume(self.volume * 0.4)
+            if self.engine_voice and self.mixer is not None:
+                self.mixer.set_gain(self.engine_voice, 0.4, ramp=0.5)
         
         # Update ambient sounds
         self.ambient_manager.update(dt)
     
     def stop_engine(self) -> None:
         """Stop engine loop (race ended)"""
-        if self.engine_channel:
-            self.engine_channel.stop()
+        if self.engine_voice and self.mixer is not None:
+            self.mixer.stop(self.engine_voice, fade_out=1.0)
+        self.engine_voice = 0
         self.current_engine_league = None
         
         # Stop ambient sounds too
@@ -675,21 +681,25 @@ class UIAudioController:
     Dry, mechanical, non-musical.
     """
     
-    def __init__(self, audio_dir: str, runtime: Dict[str, Any], config: Dict[str, Any]):
+    def __init__(self, audio_dir: str, runtime: Dict[str, Any], config: Dict[str, Any],
+                 mixer: Optional[Any] = None):
         self.audio_dir = Path(audio_dir)
         self.runtime = runtime
         self.config = config
+        self.mixer = mixer
         
         self.enabled = config.get('ui_audio_enabled', True)
         self.volume = config.get('channel_volumes', {}).get('ui', 0.15)
+        if self.mixer is not None:
+            self.mixer.set_bus_gain(UI_BUS, self.volume)
         
         # Preload UI sounds
         self.sounds = {}
         self._load_sounds()
     
     def _load_sounds(self) -> None:
-        """Preload UI sound files"""
-        if not HAS_PYGAME or not pygame.mixer.get_init():
+        """Preload UI sound files into the mixer's PCM bank"""
+        if self.mixer is None:
             return
         
         ui_dir = self.audio_dir / 'ui'
@@ -701,7 +711,7 @@ class UIAudioController:
             sound_file = ui_dir / f'{stype}.wav'
             if sound_file.exists():
                 try:
-                    self.sounds[stype] = pygame.mixer.Sound(str(sound_file))
+                    self.sounds[stype] = self.mixer.bank.get(sound_file)
                 except Exception as e:
                     self.runtime.get('log', print)(f"[ftb_audio_engine] Failed to load {stype}: {e}")
     
@@ -712,13 +722,12 @@ class UIAudioController:
         Args:
             sound_type: 'click', 'confirm', 'error', 'toggle', 'alert'
         """
-        if not self.enabled or not HAS_PYGAME:
+        if not self.enabled or self.mixer is None:
             return
         
         sound = self.sounds.get(sound_type)
-        if sound:
-            sound.set_volume(self.volume)
-            sound.play()
+        if sound is not None:
+            self.mixer.play(sound, bus=UI_BUS)
 
 
 # =======================
@@ -775,27 +784,26 @@ class FTBAudioEngine:
         station_dir = os.environ.get('STATION_DIR', '')
         self.audio_dir = os.path.join(station_dir, 'audio')
         
-        # Initialize pygame mixer (only if not already initialized)
-        if HAS_PYGAME:
+        # Shared mixer (started by the host if it got there first)
+        self.mixer = None
+        if HAS_MIXER:
             try:
-                if not pygame.mixer.get_init():
-                    pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
-                    pygame.mixer.set_num_channels(16)  # Reserve more channels for ambient sounds
-                    log_fn = self.runtime.get('log', lambda role, msg: print(f"[{role}] {msg}"))
-                    log_fn("ftb_audio", "pygame.mixer initialized with 16 channels")
-                else:
-                    log_fn = self.runtime.get('log', lambda role, msg: print(f"[{role}] {msg}"))
-                    log_fn("ftb_audio", "Using existing pygame.mixer")
+                self.mixer = audio_mixer.get_mixer(
+                    sink=config.get('output', 'device'),
+                    log=lambda msg: print(msg, file=sys.stderr)
+                )
+                log_fn = self.runtime.get('log', lambda role, msg: print(f"[{role}] {msg}"))
+                log_fn("ftb_audio", f"Using shared mixer ({type(self.mixer.sink).__name__})")
             except Exception as e:
-                print(f"[ftb_audio_engine] pygame.mixer init failed: {e}", file=sys.stderr)
+                print(f"[ftb_audio_engine] mixer init failed: {e}", file=sys.stderr)
         
         # Controllers
         self.performance_calc = PerformanceScalarCalculator(
             weights=config.get('performance_weights', {})
         )
-        self.music_controller = StateMusicController(self.audio_dir, runtime, config)
-        self.world_controller = WorldAudioController(self.audio_dir, runtime, config)
-        self.ui_controller = UIAudioController(self.audio_dir, runtime, config)
+        self.music_controller = StateMusicController(self.audio_dir, runtime, config, self.mixer)
+        self.world_controller = WorldAudioController(self.audio_dir, runtime, config, self.mixer)
+        self.ui_controller = UIAudioController(self.audio_dir, runtime, config, self.mixer)
         self.narrator_bridge = NarratorMusicBridge(self.music_controller)
         
         # State
@@ -810,21 +818,32 @@ class FTBAudioEngine:
     
     def start(self) -> None:
         """Start audio engine"""
-        if not HAS_PYGAME:
-            self.runtime.get('log', print)("[ftb_audio_engine] Pygame not available, engine disabled")
+        if self.mixer is None:
+            self.runtime.get('log', print)("[ftb_audio_engine] Mixer not available, engine disabled")
             return
         
         self.running = True
         self.music_controller.start()
         
+        # Decode one-shots and ambient loops off the event path
+        threading.Thread(target=self._preload, daemon=True, name="AudioPreload").start()
+        
         # Start worker thread
         self.worker_thread = threading.Thread(target=self._worker_loop, daemon=True, name="AudioEngine")
         self.worker_thread.start()
         
         self.runtime.get('log', print)("[ftb_audio_engine] Audio engine started")
     
+    def _preload(self) -> None:
+        """Warm the PCM bank so the first crash/crowd/ambient play doesn't decode"""
+        paths = self.world_controller.oneshot_paths() + self.world_controller.ambient_manager.sound_paths()
+        loaded = self.mixer.bank.preload(paths)
+        self.runtime.get('log', print)(
+            f"[ftb_audio_engine] Preloaded {loaded} sounds ({self.mixer.bank.memory_bytes() // 1024} KiB resident)"
+        )
+    
     def stop(self) -> None:
-        """Stop audio engine"""
+        """Stop audio engine (the shared mixer keeps running for other users)"""
         self.running = False
         self.music_controller.stop()
         self.world_controller.stop_engine()
@@ -965,8 +984,8 @@ def feed_worker(stop_event, mem: Dict[str, Any], payload: Dict[str, Any], runtim
     event_q = runtime.get('event_q')
     ui_cmd_q = runtime.get('ui_cmd_q')
     
-    if not HAS_PYGAME:
-        log("[ftb_audio_engine] pygame not available, skipping audio engine")
+    if not HAS_MIXER:
+        log("[ftb_audio_engine] mixer not available, skipping audio engine")
         return
     
     # Get audio config from runtime manifest
@@ -20,8 +20,7 @@ import sys
 
 # Import state DB for calendar queries
 try:
-    sys.path.insert(0, "plugins")
-    import ftb_state_db
+    from plugins import ftb_state_db
 except Exception:
     ftb_state_db = None
 
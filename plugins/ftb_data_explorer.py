@@ -6,7 +6,6 @@ without loading everything into the main game state.
 """
 
 from typing import Any, Dict, List, Optional
-import sqlite3
 from plugins import ftb_state_db
 
 PLUGIN_NAME = "FTB Data Explorer"
@@ -82,26 +81,24 @@ def query_season_summaries(db_path: str, team_name: Optional[str] = None, limit:
         return []
     
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with ftb_state_db.read_connection(db_path) as conn:
+            cursor = conn.cursor()
         
-        if team_name:
-            cursor.execute("""
-                SELECT * FROM season_summaries
-                WHERE team_name = ?
-                ORDER BY season DESC
-                LIMIT ?
-            """, (team_name, limit))
-        else:
-            cursor.execute("""
-                SELECT * FROM season_summaries
-                ORDER BY season DESC, total_points DESC
-                LIMIT ?
-            """, (limit,))
+            if team_name:
+                cursor.execute("""
+                    SELECT * FROM season_summaries
+                    WHERE team_name = ?
+                    ORDER BY season DESC
+                    LIMIT ?
+                """, (team_name, limit))
+            else:
+                cursor.execute("""
+                    SELECT * FROM season_summaries
+                    ORDER BY season DESC, total_points DESC
+                    LIMIT ?
+                """, (limit,))
         
-        rows = cursor.fetchall()
-        conn.close()
+            rows = cursor.fetchall()
         
         return [dict(row) for row in rows]
     except Exception as e:
@@ -151,26 +148,24 @@ def query_career_stats(db_path: str, entity_name: Optional[str] = None, role: Op
         return []
     
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with ftb_state_db.read_connection(db_path) as conn:
+            cursor = conn.cursor()
         
-        query = "SELECT * FROM career_totals WHERE 1=1"
-        params = []
+            query = "SELECT * FROM career_totals WHERE 1=1"
+            params = []
         
-        if entity_name:
-            query += " AND entity_name = ?"
-            params.append(entity_name)
+            if entity_name:
+                query += " AND entity_name = ?"
+                params.append(entity_name)
         
-        if role:
-            query += " AND role = ?"
-            params.append(role)
+            if role:
+                query += " AND role = ?"
+                params.append(role)
         
-        query += " ORDER BY races_entered DESC LIMIT 100"
+            query += " ORDER BY races_entered DESC LIMIT 100"
         
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
         
         return [dict(row) for row in rows]
     except Exception as e:
@@ -184,26 +179,24 @@ def query_team_outcomes(db_path: str, team_name: Optional[str] = None, season: O
         return []
     
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with ftb_state_db.read_connection(db_path) as conn:
+            cursor = conn.cursor()
         
-        query = "SELECT * FROM team_outcomes WHERE 1=1"
-        params = []
+            query = "SELECT * FROM team_outcomes WHERE 1=1"
+            params = []
         
-        if team_name:
-            query += " AND team_name = ?"
-            params.append(team_name)
+            if team_name:
+                query += " AND team_name = ?"
+                params.append(team_name)
         
-        if season:
-            query += " AND season = ?"
-            params.append(season)
+            if season:
+                query += " AND season = ?"
+                params.append(season)
         
-        query += " ORDER BY season DESC, championship_position ASC LIMIT 100"
+            query += " ORDER BY season DESC, championship_position ASC LIMIT 100"
         
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
         
         return [dict(row) for row in rows]
     except Exception as e:
@@ -217,26 +210,24 @@ def query_championship_history(db_path: str, league_id: Optional[str] = None, li
         return []
     
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with ftb_state_db.read_connection(db_path) as conn:
+            cursor = conn.cursor()
         
-        if league_id:
-            cursor.execute("""
-                SELECT * FROM championship_history
-                WHERE league_id = ?
-                ORDER BY season DESC, championship_position ASC
-                LIMIT ?
-            """, (league_id, limit))
-        else:
-            cursor.execute("""
-                SELECT * FROM championship_history
-                ORDER BY season DESC, championship_position ASC
-                LIMIT ?
-            """, (limit,))
+            if league_id:
+                cursor.execute("""
+                    SELECT * FROM championship_history
+                    WHERE league_id = ?
+                    ORDER BY season DESC, championship_position ASC
+                    LIMIT ?
+                """, (league_id, limit))
+            else:
+                cursor.execute("""
+                    SELECT * FROM championship_history
+                    ORDER BY season DESC, championship_position ASC
+                    LIMIT ?
+                """, (limit,))
         
-        rows = cursor.fetchall()
-        conn.close()
+            rows = cursor.fetchall()
         
         return [dict(row) for row in rows]
     except Exception as e:
@@ -250,23 +241,22 @@ def query_all_tables(db_path: str) -> Dict[str, int]:
         return {}
     
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
+        with ftb_state_db.read_connection(db_path) as conn:
+            cursor = conn.cursor()
         
-        # Get all table names
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
-        tables = [row[0] for row in cursor.fetchall()]
+            # Get all table names
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
+            tables = [row[0] for row in cursor.fetchall()]
         
-        # Get count for each table
-        counts = {}
-        for table in tables:
-            try:
-                cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                counts[table] = cursor.fetchone()[0]
-            except Exception:
-                counts[table] = 0
+            # Get count for each table
+            counts = {}
+            for table in tables:
+                try:
+                    cursor.execute(f"SELECT COUNT(*) FROM {table}")
+                    counts[table] = cursor.fetchone()[0]
+                except Exception:
+                    counts[table] = 0
         
-        conn.close()
         return counts
     except Exception as e:
         print(f"[FTB Data] Error querying table counts: {e}")
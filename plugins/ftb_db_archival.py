@@ -21,10 +21,17 @@ Cold database stores:
 """
 
 import sqlite3
+import threading
 import time
+from contextlib import contextmanager, nullcontext
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
 
+try:
+    from plugins import ftb_state_db
+except ImportError:
+    ftb_state_db = None
+
 
 # Archival policy configuration
 ARCHIVAL_POLICY = {
@@ -85,12 +92,51 @@ ARCHIVAL_POLICY = {
     
     # Whether to vacuum after archival
     'vacuum_after_archive': True,
-    
+
+    # Rows moved per transaction (keeps hot DB write locks short)
+    'chunk_rows': 500,
+
+    # Pause between chunks so the game can take the write lock
+    'chunk_pause_seconds': 0.05,
+
+    # Pages released per incremental_vacuum step
+    'vacuum_pages_per_step': 256,
+
+    # Let a run switch a pre-existing DB to incremental auto_vacuum itself.
+    # That is a full VACUUM holding the writer lock, so it's off by default;
+    # use enable_incremental_vacuum() / the enable-vacuum command offline.
+    'convert_auto_vacuum': False,
+
     # Minimum hot DB size before archival is suggested (MB)
     'archive_threshold_mb': 500,
 }
 
 
+@contextmanager
+def _plain_connection(db_path: str, commit: bool):
+    conn = sqlite3.connect(db_path)
+    try:
+        yield conn
+        if commit:
+            conn.commit()
+    finally:
+        conn.close()
+
+
+def _read_connection(db_path: str):
+    """Pooled read connection from ftb_state_db (plain connection without it)."""
+    if ftb_state_db is None:
+        return _plain_connection(db_path, commit=False)
+    return ftb_state_db.read_connection(db_path)
+
+
+def _write_connection(db_path: str):
+    """The shared serialized writer from ftb_state_db (plain connection without it)."""
+    if ftb_state_db is None:
+        return _plain_connection(db_path, commit=True)
+    return ftb_state_db.get_connection(db_path)
+
+
 def get_db_size_mb(db_path: str) -> float:
     """Get database file size in megabytes."""
     try:
@@ -116,233 +162,436 @@ def init_cold_db(cold_db_path: str, hot_db_path: str) -> None:
         hot_db_path: Path to hot database (to copy schema from)
     """
     # Get schema from hot database
-    hot_conn = sqlite3.connect(hot_db_path)
-    hot_cursor = hot_conn.cursor()
-    
-    # Get all CREATE TABLE statements from hot DB
-    hot_cursor.execute("""
-        SELECT sql FROM sqlite_master 
-        WHERE type='table' AND sql IS NOT NULL
-        ORDER BY name
-    """)
-    create_statements = [row[0] for row in hot_cursor.fetchall()]
-    
-    # Get all CREATE INDEX statements from hot DB
-    hot_cursor.execute("""
-        SELECT sql FROM sqlite_master 
-        WHERE type='index' AND sql IS NOT NULL
-        ORDER BY name
-    """)
-    index_statements = [row[0] for row in hot_cursor.fetchall()]
-    
-    hot_conn.close()
+    with _read_connection(hot_db_path) as hot_conn:
+        hot_cursor = hot_conn.cursor()
+        
+        # Get all CREATE TABLE statements from hot DB
+        hot_cursor.execute("""
+            SELECT sql FROM sqlite_master 
+            WHERE type='table' AND sql IS NOT NULL
+            ORDER BY name
+        """)
+        create_statements = [row[0] for row in hot_cursor.fetchall()]
+        
+        # Get all CREATE INDEX statements from hot DB
+        hot_cursor.execute("""
+            SELECT sql FROM sqlite_master 
+            WHERE type='index' AND sql IS NOT NULL
+            ORDER BY name
+        """)
+        index_statements = [row[0] for row in hot_cursor.fetchall()]
     
     # Create cold database with same schema
-    cold_conn = sqlite3.connect(cold_db_path)
-    cold_cursor = cold_conn.cursor()
-    
-    for stmt in create_statements:
-        try:
-            cold_cursor.execute(stmt)
-        except sqlite3.Error as e:
-            print(f"[FTB Archival] Warning: Could not create table in cold DB: {e}")
-    
-    for stmt in index_statements:
-        try:
-            cold_cursor.execute(stmt)
-        except sqlite3.Error as e:
-            print(f"[FTB Archival] Warning: Could not create index in cold DB: {e}")
-    
-    cold_conn.commit()
-    cold_conn.close()
+    with _write_connection(cold_db_path) as cold_conn:
+        cold_cursor = cold_conn.cursor()
+        
+        for stmt in create_statements:
+            try:
+                cold_cursor.execute(stmt)
+            except sqlite3.Error as e:
+                print(f"[FTB Archival] Warning: Could not create table in cold DB: {e}")
+        
+        for stmt in index_statements:
+            try:
+                cold_cursor.execute(stmt)
+            except sqlite3.Error as e:
+                print(f"[FTB Archival] Warning: Could not create index in cold DB: {e}")
     
     print(f"[FTB Archival] Initialized cold database: {cold_db_path}")
 
 
 def get_current_season(hot_db_path: str) -> int:
     """Get current season from hot database."""
-    conn = sqlite3.connect(hot_db_path)
-    cursor = conn.cursor()
-    
     try:
-        cursor.execute("SELECT season FROM game_state_snapshot WHERE id = 1")
-        row = cursor.fetchone()
+        with _read_connection(hot_db_path) as conn:
+            row = conn.execute("SELECT season FROM game_state_snapshot WHERE id = 1").fetchone()
         season = row[0] if row else 1
     except Exception:
         season = 1
     
-    conn.close()
     return season
 
 
-def archive_old_data(hot_db_path: str, cold_db_path: Optional[str] = None, 
-                     verbose: bool = True) -> Dict[str, Any]:
+def _build_archive_jobs(conn: sqlite3.Connection) -> List[Tuple[str, str, int]]:
     """
-    Archive old data from hot database to cold database.
+    Work out which (table, column, cutoff) ranges should move to cold storage.
     
-    Args:
-        hot_db_path: Path to hot database
-        cold_db_path: Path to cold database (auto-generated if None)
-        verbose: Whether to print progress
-    
-    Returns:
-        Dictionary with archival statistics
+    Season-based tables use the hot season window from ARCHIVAL_POLICY;
+    tick-based tables keep the most recent 1000 ticks.
     """
-    if cold_db_path is None:
-        cold_db_path = get_cold_db_path(hot_db_path)
-    
-    # Check if cold DB exists, create if not
-    if not Path(cold_db_path).exists():
-        if verbose:
-            print(f"[FTB Archival] Creating cold database...")
-        init_cold_db(cold_db_path, hot_db_path)
-    
-    current_season = get_current_season(hot_db_path)
-    hot_seasons_count = ARCHIVAL_POLICY['hot_seasons_count']
-    archive_cutoff_season = current_season - hot_seasons_count
-    
-    if verbose:
-        print(f"[FTB Archival] Current season: {current_season}")
-        print(f"[FTB Archival] Archiving data older than season {archive_cutoff_season}")
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT season, tick FROM main.game_state_snapshot WHERE id = 1")
+        row = cursor.fetchone()
+    except sqlite3.Error:
+        row = None
+    current_season = row[0] if row else 1
+    current_tick = row[1] if row else None
     
-    stats = {
-        'archived_rows': {},
-        'deleted_rows': {},
-        'tables_processed': [],
-        'errors': [],
-        'start_time': time.time(),
-    }
+    jobs = []
+    season_cutoff = current_season - ARCHIVAL_POLICY['hot_seasons_count']
+    for table, season_col in ARCHIVAL_POLICY['archive_by_season_tables'].items():
+        if season_col is None:
+            continue
+        jobs.append((table, season_col, season_cutoff))
     
-    hot_conn = sqlite3.connect(hot_db_path)
-    cold_conn = sqlite3.connect(cold_db_path)
+    if current_tick is not None:
+        tick_cutoff = current_tick - 1000
+        for table, tick_col in ARCHIVAL_POLICY['archive_by_tick_tables'].items():
+            jobs.append((table, tick_col, tick_cutoff))
     
-    hot_cursor = hot_conn.cursor()
-    cold_cursor = cold_conn.cursor()
+    return jobs
+
+
+def _ensure_cold_table(conn: sqlite3.Connection, table: str) -> Optional[List[str]]:
+    """
+    Make sure `table` exists in the attached cold DB and return the columns
+    shared by both copies (hot tables may have gained columns via migrations
+    after the cold DB was created). Returns None if the hot table is missing.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT sql FROM main.sqlite_master WHERE type='table' AND name=?",
+        (table,)
+    )
+    row = cursor.fetchone()
+    if not row:
+        return None
+    
+    cursor.execute(
+        "SELECT 1 FROM cold.sqlite_master WHERE type='table' AND name=?",
+        (table,)
+    )
+    if not cursor.fetchone():
+        create_sql = row[0].replace(f"CREATE TABLE {table}", f"CREATE TABLE cold.{table}", 1)
+        cursor.execute(create_sql)
+    
+    cursor.execute(f"PRAGMA main.table_info({table})")
+    hot_cols = [col[1] for col in cursor.fetchall()]
+    cursor.execute(f"PRAGMA cold.table_info({table})")
+    cold_cols = {col[1] for col in cursor.fetchall()}
+    return [col for col in hot_cols if col in cold_cols]
+
+
+def _load_progress(conn: sqlite3.Connection, table: str) -> Optional[Tuple[int, int, int]]:
+    """Return (cutoff, last_rowid, rows_moved) for an unfinished run of `table`."""
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT cutoff, last_rowid, rows_moved FROM cold.archival_progress
+        WHERE table_name = ? AND completed = 0
+    """, (table,))
+    return cursor.fetchone()
+
+
+class ChunkedArchiver:
+    """
+    Moves old rows from the hot DB to the cold DB in small keyset-paginated
+    chunks so the running game never waits on a long write lock.
+    
+    Each chunk is copied and deleted inside one transaction spanning both
+    databases (cold is ATTACHed to the hot connection), and the chunk's
+    position is recorded in `cold.archival_progress` in that same
+    transaction. An interrupted run therefore resumes from the last committed
+    chunk with the same cutoff it started with. Once every table is done the
+    hot DB free pages are released with incremental VACUUM.
+    
+    Use `run()` to archive synchronously, or `start()` to archive on a
+    background thread and poll `progress` / `stats`.
+    """
     
-    try:
-        # Archive season-based tables
-        for table, season_col in ARCHIVAL_POLICY['archive_by_season_tables'].items():
-            if season_col is None:
-                continue
-            
-            try:
-                # Check if table exists
-                hot_cursor.execute(
-                    "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
-                    (table,)
-                )
-                if not hot_cursor.fetchone():
-                    continue
-                
-                # Get rows to archive
-                hot_cursor.execute(f"""
-                    SELECT * FROM {table} WHERE {season_col} < ?
-                """, (archive_cutoff_season,))
-                rows = hot_cursor.fetchall()
-                
-                if not rows:
-                    if verbose:
-                        print(f"[FTB Archival] {table}: No rows to archive")
-                    continue
-                
-                # Get column names
-                hot_cursor.execute(f"PRAGMA table_info({table})")
-                columns = [col[1] for col in hot_cursor.fetchall()]
-                placeholders = ','.join(['?' for _ in columns])
-                
-                # Insert into cold database
-                cold_cursor.executemany(
-                    f"INSERT OR REPLACE INTO {table} VALUES ({placeholders})",
-                    rows
-                )
-                
-                # Delete from hot database
-                hot_cursor.execute(f"""
-                    DELETE FROM {table} WHERE {season_col} < ?
-                """, (archive_cutoff_season,))
-                
-                deleted_count = hot_cursor.rowcount
-                stats['archived_rows'][table] = len(rows)
-                stats['deleted_rows'][table] = deleted_count
-                stats['tables_processed'].append(table)
-                
-                if verbose:
-                    print(f"[FTB Archival] {table}: Archived {len(rows)} rows, deleted {deleted_count} from hot DB")
-            
-            except Exception as e:
-                error_msg = f"Error archiving {table}: {e}"
-                stats['errors'].append(error_msg)
-                if verbose:
-                    print(f"[FTB Archival] {error_msg}")
+    def __init__(self, hot_db_path: str, cold_db_path: Optional[str] = None,
+                 chunk_rows: Optional[int] = None, pause_seconds: Optional[float] = None,
+                 verbose: bool = False):
+        self.hot_db_path = hot_db_path
+        self.cold_db_path = cold_db_path or get_cold_db_path(hot_db_path)
+        self.chunk_rows = chunk_rows or ARCHIVAL_POLICY['chunk_rows']
+        self.pause_seconds = (ARCHIVAL_POLICY['chunk_pause_seconds']
+                              if pause_seconds is None else pause_seconds)
+        self.verbose = verbose
+        
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.progress: Dict[str, Any] = {
+            'table': None,
+            'rows_moved': 0,
+            'chunks': 0,
+            'phase': 'idle',
+        }
+        self.stats: Dict[str, Any] = {}
+    
+    # ------------------------------------------------------------------
+    # Control
+    # ------------------------------------------------------------------
+    
+    def start(self) -> None:
+        """Run the archiver on a daemon thread."""
+        if self.is_running():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.run, name="FTBArchiver", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Ask the archiver to stop after the current chunk commits."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+    
+    def is_running(self) -> bool:
+        return bool(self._thread and self._thread.is_alive())
+    
+    def _log(self, message: str) -> None:
+        if self.verbose:
+            print(f"[FTB Archival] {message}")
+    
+    def _set_progress(self, **kwargs) -> None:
+        with self._lock:
+            self.progress.update(kwargs)
+    
+    def snapshot_progress(self) -> Dict[str, Any]:
+        """Thread-safe copy of the current progress dict."""
+        with self._lock:
+            return dict(self.progress)
+    
+    # ------------------------------------------------------------------
+    # Archival
+    # ------------------------------------------------------------------
+    
+    def run(self) -> Dict[str, Any]:
+        """Archive all configured tables. Returns the archival stats dict."""
+        stats = {
+            'archived_rows': {},
+            'deleted_rows': {},
+            'tables_processed': [],
+            'errors': [],
+            'chunks': 0,
+            'resumed_tables': [],
+            'interrupted': False,
+            'start_time': time.time(),
+        }
+        self.stats = stats
         
-        # Archive events buffer (special case - by tick and age)
         try:
-            # Archive events older than 1000 ticks
-            hot_cursor.execute("""
-                SELECT tick FROM game_state_snapshot WHERE id = 1
+            self._run(stats)
+        except Exception as e:
+            # Setup failures (cold DB init, ATTACH) end the run; report them to the caller
+            stats['error'] = f"{type(e).__name__}: {e}"
+            stats['errors'].append(f"Archival failed: {e}")
+            self._log(f"Archival failed: {e}")
+        finally:
+            stats['end_time'] = time.time()
+            stats['duration_seconds'] = stats['end_time'] - stats['start_time']
+            if stats.get('error'):
+                phase = 'failed'
+            elif stats['interrupted']:
+                phase = 'interrupted'
+            else:
+                phase = 'done'
+            self._set_progress(phase=phase)
+        
+        self._log(f"Complete in {stats['duration_seconds']:.2f}s ({stats['chunks']} chunks)")
+        if not stats.get('error'):
+            self._log(f"Hot DB size: {get_db_size_mb(self.hot_db_path):.2f} MB")
+            self._log(f"Cold DB size: {get_db_size_mb(self.cold_db_path):.2f} MB")
+        return stats
+    
+    def _run(self, stats: Dict[str, Any]) -> None:
+        if not Path(self.cold_db_path).exists():
+            self._log("Creating cold database...")
+            init_cold_db(self.cold_db_path, self.hot_db_path)
+        
+        # Autocommit mode so chunk transactions are controlled explicitly
+        conn = sqlite3.connect(self.hot_db_path, timeout=30, isolation_level=None)
+        try:
+            conn.execute("ATTACH DATABASE ? AS cold", (self.cold_db_path,))
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cold.archival_progress (
+                    table_name TEXT PRIMARY KEY,
+                    cutoff INTEGER NOT NULL,
+                    last_rowid INTEGER NOT NULL,
+                    rows_moved INTEGER NOT NULL DEFAULT 0,
+                    completed INTEGER NOT NULL DEFAULT 0,
+                    updated_ts REAL NOT NULL
+                )
             """)
-            current_tick_row = hot_cursor.fetchone()
-            if current_tick_row:
-                current_tick = current_tick_row[0]
-                archive_tick_cutoff = current_tick - 1000
+            
+            for table, column, cutoff in _build_archive_jobs(conn):
+                if self._stop_event.is_set():
+                    stats['interrupted'] = True
+                    break
+                try:
+                    self._archive_table(conn, table, column, cutoff, stats)
+                except Exception as e:
+                    try:
+                        conn.execute("ROLLBACK")
+                    except sqlite3.Error:
+                        pass
+                    error_msg = f"Error archiving {table}: {e}"
+                    stats['errors'].append(error_msg)
+                    self._log(error_msg)
+            
+            conn.execute("DETACH DATABASE cold")
+            
+            if not stats['interrupted'] and ARCHIVAL_POLICY['vacuum_after_archive']:
+                self._set_progress(table=None, phase='vacuum')
+                self._incremental_vacuum(conn)
+        finally:
+            conn.close()
+    
+    def _archive_table(self, conn: sqlite3.Connection, table: str, column: str,
+                       cutoff: int, stats: Dict[str, Any]) -> None:
+        columns = _ensure_cold_table(conn, table)
+        if not columns:
+            return
+        
+        last_rowid, moved = 0, 0
+        resumed = _load_progress(conn, table)
+        if resumed:
+            # Keep the original cutoff so a resumed run finishes the same range
+            cutoff, last_rowid, moved = resumed
+            stats['resumed_tables'].append(table)
+            self._log(f"{table}: resuming after rowid {last_rowid} ({moved} rows already moved)")
+        
+        col_list = ','.join(columns)
+        self._set_progress(table=table, phase='archiving')
+        
+        while not self._stop_event.is_set():
+            # Queue behind the game's in-process writes instead of contending on the file lock
+            with self._writer_slot():
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    row = conn.execute(f"""
+                        SELECT MAX(rowid), COUNT(*) FROM (
+                            SELECT rowid FROM main.{table}
+                            WHERE {column} < ? AND rowid > ?
+                            ORDER BY rowid LIMIT ?
+                        )
+                    """, (cutoff, last_rowid, self.chunk_rows)).fetchone()
+                    chunk_end, chunk_count = row[0], row[1]
+                
+                    if not chunk_count:
+                        conn.execute("""
+                            INSERT OR REPLACE INTO cold.archival_progress
+                                (table_name, cutoff, last_rowid, rows_moved, completed, updated_ts)
+                            VALUES (?, ?, ?, ?, 1, ?)
+                        """, (table, cutoff, last_rowid, moved, time.time()))
+                        conn.execute("COMMIT")
+                        break
                 
-                hot_cursor.execute("""
-                    SELECT * FROM events_buffer WHERE tick < ?
-                """, (archive_tick_cutoff,))
-                event_rows = hot_cursor.fetchall()
+                    conn.execute(f"""
+                        INSERT OR REPLACE INTO cold.{table} ({col_list})
+                        SELECT {col_list} FROM main.{table}
+                        WHERE {column} < ? AND rowid > ? AND rowid <= ?
+                    """, (cutoff, last_rowid, chunk_end))
+                    deleted = conn.execute(f"""
+                        DELETE FROM main.{table}
+                        WHERE {column} < ? AND rowid > ? AND rowid <= ?
+                    """, (cutoff, last_rowid, chunk_end)).rowcount
                 
-                if event_rows:
-                    hot_cursor.execute("PRAGMA table_info(events_buffer)")
-                    event_columns = [col[1] for col in hot_cursor.fetchall()]
-                    placeholders = ','.join(['?' for _ in event_columns])
-                    
-                    cold_cursor.executemany(
-                        f"INSERT OR REPLACE INTO events_buffer VALUES ({placeholders})",
-                        event_rows
-                    )
-                    
-                    hot_cursor.execute("""
-                        DELETE FROM events_buffer WHERE tick < ?
-                    """, (archive_tick_cutoff,))
-                    
-                    deleted_count = hot_cursor.rowcount
-                    stats['archived_rows']['events_buffer'] = len(event_rows)
-                    stats['deleted_rows']['events_buffer'] = deleted_count
-                    
-                    if verbose:
-                        print(f"[FTB Archival] events_buffer: Archived {len(event_rows)} old events")
+                    moved += chunk_count
+                    last_rowid = chunk_end
+                    conn.execute("""
+                        INSERT OR REPLACE INTO cold.archival_progress
+                            (table_name, cutoff, last_rowid, rows_moved, completed, updated_ts)
+                        VALUES (?, ?, ?, ?, 0, ?)
+                    """, (table, cutoff, last_rowid, moved, time.time()))
+                    conn.execute("COMMIT")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+            
+            stats['archived_rows'][table] = stats['archived_rows'].get(table, 0) + chunk_count
+            stats['deleted_rows'][table] = stats['deleted_rows'].get(table, 0) + deleted
+            stats['chunks'] += 1
+            with self._lock:
+                self.progress['rows_moved'] += chunk_count
+                self.progress['chunks'] += 1
+            
+            # Yield the write lock to the game between chunks
+            time.sleep(self.pause_seconds)
+        else:
+            stats['interrupted'] = True
         
-        except Exception as e:
-            error_msg = f"Error archiving events_buffer: {e}"
-            stats['errors'].append(error_msg)
-            if verbose:
-                print(f"[FTB Archival] {error_msg}")
+        if table in stats['archived_rows']:
+            stats['tables_processed'].append(table)
+            self._log(f"{table}: Archived {stats['archived_rows'][table]} rows")
+        else:
+            self._log(f"{table}: No rows to archive")
+    
+    def _writer_slot(self):
+        """The shared FTB writer lock for the hot DB (no-op without ftb_state_db)."""
+        if ftb_state_db is None:
+            return nullcontext()
+        return ftb_state_db.get_db_manager(self.hot_db_path).hold_writer()
+    
+    def _incremental_vacuum(self, conn: sqlite3.Connection) -> None:
+        """
+        Return free pages to the filesystem in small steps.
         
-        # Commit changes
-        hot_conn.commit()
-        cold_conn.commit()
+        Databases created before auto_vacuum was enabled need one full VACUUM
+        to switch to incremental mode. That stalls every writer, so unless
+        ARCHIVAL_POLICY['convert_auto_vacuum'] is set the reclaim is skipped
+        and left to enable_incremental_vacuum().
+        """
+        mode = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+        if mode != 2:
+            if not ARCHIVAL_POLICY['convert_auto_vacuum']:
+                print("[FTB Archival] Skipping space reclaim: hot DB is not in incremental "
+                      "auto_vacuum mode (run the enable-vacuum command while the game is closed)")
+                self._set_progress(vacuum='skipped')
+                return
+            self._log("Enabling incremental auto_vacuum (one-time full VACUUM)...")
+            with self._writer_slot():
+                conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                conn.execute("VACUUM")
+            return
         
-        # Vacuum hot database to reclaim space
-        if ARCHIVAL_POLICY['vacuum_after_archive']:
-            if verbose:
-                print("[FTB Archival] Vacuuming hot database...")
-            hot_cursor.execute("VACUUM")
-            if verbose:
-                print("[FTB Archival] Vacuum complete")
+        pages = ARCHIVAL_POLICY['vacuum_pages_per_step']
+        while not self._stop_event.is_set():
+            free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            self._set_progress(free_pages=free_pages)
+            if free_pages <= 0:
+                break
+            with self._writer_slot():
+                # execute() steps the pragma once (one page); executescript runs it to completion
+                conn.executescript(f"PRAGMA incremental_vacuum({int(pages)});")
+            time.sleep(self.pause_seconds)
+
+
+def archive_old_data(hot_db_path: str, cold_db_path: Optional[str] = None, 
+                     verbose: bool = True) -> Dict[str, Any]:
+    """
+    Archive old data from hot database to cold database.
     
-    finally:
-        hot_conn.close()
-        cold_conn.close()
+    Runs a ChunkedArchiver in the calling thread. Use ChunkedArchiver.start()
+    directly to archive in the background while the game keeps running.
     
-    stats['end_time'] = time.time()
-    stats['duration_seconds'] = stats['end_time'] - stats['start_time']
+    Args:
+        hot_db_path: Path to hot database
+        cold_db_path: Path to cold database (auto-generated if None)
+        verbose: Whether to print progress
     
-    if verbose:
-        print(f"[FTB Archival] Complete in {stats['duration_seconds']:.2f}s")
-        print(f"[FTB Archival] Hot DB size: {get_db_size_mb(hot_db_path):.2f} MB")
-        print(f"[FTB Archival] Cold DB size: {get_db_size_mb(cold_db_path):.2f} MB")
+    Returns:
+        Dictionary with archival statistics
+    """
+    archiver = ChunkedArchiver(hot_db_path, cold_db_path, verbose=verbose)
+    return archiver.run()
+
+
+def enable_incremental_vacuum(hot_db_path: str) -> bool:
+    """
+    Switch an existing hot DB to incremental auto_vacuum (one full VACUUM).
     
-    return stats
+    Maintenance step for databases created before auto_vacuum was enabled;
+    run it while the game is closed. Returns False if it was already enabled.
+    """
+    with _write_connection(hot_db_path) as conn:
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+            return False
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("VACUUM")
+        return True
 
 
 def query_across_databases(hot_db_path: str, query: str, params: Tuple = (),
@@ -367,27 +616,19 @@ def query_across_databases(hot_db_path: str, query: str, params: Tuple = (),
     results = []
     
     # Query hot database
-    hot_conn = sqlite3.connect(hot_db_path)
-    hot_cursor = hot_conn.cursor()
     try:
-        hot_cursor.execute(query, params)
-        results.extend(hot_cursor.fetchall())
+        with _read_connection(hot_db_path) as hot_conn:
+            results.extend(tuple(row) for row in hot_conn.execute(query, params).fetchall())
     except sqlite3.Error as e:
         print(f"[FTB Archival] Error querying hot DB: {e}")
-    finally:
-        hot_conn.close()
     
     # Query cold database if it exists
     if Path(cold_db_path).exists():
-        cold_conn = sqlite3.connect(cold_db_path)
-        cold_cursor = cold_conn.cursor()
         try:
-            cold_cursor.execute(query, params)
-            results.extend(cold_cursor.fetchall())
+            with _read_connection(cold_db_path) as cold_conn:
+                results.extend(tuple(row) for row in cold_conn.execute(query, params).fetchall())
         except sqlite3.Error as e:
             print(f"[FTB Archival] Error querying cold DB: {e}")
-        finally:
-            cold_conn.close()
     
     return results
 
@@ -425,10 +666,9 @@ def get_archival_stats(hot_db_path: str, cold_db_path: Optional[str] = None) ->
     
     # Get hot DB stats
     if stats['hot_db']['exists']:
-        hot_conn = sqlite3.connect(hot_db_path)
-        hot_cursor = hot_conn.cursor()
-        
-        try:
+        with _read_connection(hot_db_path) as hot_conn:
+            hot_cursor = hot_conn.cursor()
+            
             # Get current season
             hot_cursor.execute("SELECT season FROM game_state_snapshot WHERE id = 1")
             row = hot_cursor.fetchone()
@@ -447,16 +687,12 @@ def get_archival_stats(hot_db_path: str, cold_db_path: Optional[str] = None) ->
                     stats['hot_db']['table_counts'][table] = count
                 except Exception:
                     pass
-        
-        finally:
-            hot_conn.close()
     
     # Get cold DB stats
     if stats['cold_db']['exists']:
-        cold_conn = sqlite3.connect(cold_db_path)
-        cold_cursor = cold_conn.cursor()
-        
-        try:
+        with _read_connection(cold_db_path) as cold_conn:
+            cold_cursor = cold_conn.cursor()
+            
             cold_cursor.execute("""
                 SELECT name FROM sqlite_master WHERE type='table' ORDER BY name
             """)
@@ -469,9 +705,6 @@ def get_archival_stats(hot_db_path: str, cold_db_path: Optional[str] = None) ->
                     stats['cold_db']['table_counts'][table] = count
                 except Exception:
                     pass
-        
-        finally:
-            cold_conn.close()
     
     # Determine if archival is recommended
     threshold_mb = ARCHIVAL_POLICY['archive_threshold_mb']
@@ -503,12 +736,6 @@ def restore_from_cold(hot_db_path: str, table: str, season: int,
         print(f"[FTB Archival] Cold database does not exist: {cold_db_path}")
         return 0
     
-    cold_conn = sqlite3.connect(cold_db_path)
-    hot_conn = sqlite3.connect(hot_db_path)
-    
-    cold_cursor = cold_conn.cursor()
-    hot_cursor = hot_conn.cursor()
-    
     rows_restored = 0
     
     try:
@@ -518,28 +745,31 @@ def restore_from_cold(hot_db_path: str, table: str, season: int,
             print(f"[FTB Archival] Table {table} is not configured for archival")
             return 0
         
-        # Get rows from cold database
-        cold_cursor.execute(f"""
-            SELECT * FROM {table} WHERE {season_col} = ?
-        """, (season,))
-        rows = cold_cursor.fetchall()
+        with _read_connection(cold_db_path) as cold_conn:
+            cold_cursor = cold_conn.cursor()
+            
+            # Get rows from cold database
+            cold_cursor.execute(f"""
+                SELECT * FROM {table} WHERE {season_col} = ?
+            """, (season,))
+            rows = [tuple(row) for row in cold_cursor.fetchall()]
+            
+            # Get column names
+            cold_cursor.execute(f"PRAGMA table_info({table})")
+            columns = [col[1] for col in cold_cursor.fetchall()]
         
         if not rows:
             print(f"[FTB Archival] No data found in cold DB for {table} season {season}")
             return 0
         
-        # Get column names
-        cold_cursor.execute(f"PRAGMA table_info({table})")
-        columns = [col[1] for col in cold_cursor.fetchall()]
         placeholders = ','.join(['?' for _ in columns])
         
         # Insert into hot database
-        hot_cursor.executemany(
-            f"INSERT OR REPLACE INTO {table} VALUES ({placeholders})",
-            rows
-        )
-        
-        hot_conn.commit()
+        with _write_connection(hot_db_path) as hot_conn:
+            hot_conn.executemany(
+                f"INSERT OR REPLACE INTO {table} VALUES ({placeholders})",
+                rows
+            )
         rows_restored = len(rows)
         
         print(f"[FTB Archival] Restored {rows_restored} rows from cold DB to hot DB")
@@ -547,10 +777,6 @@ def restore_from_cold(hot_db_path: str, table: str, season: int,
     except Exception as e:
         print(f"[FTB Archival] Error restoring data: {e}")
     
-    finally:
-        cold_conn.close()
-        hot_conn.close()
-    
     return rows_restored
 
 
@@ -605,12 +831,8 @@ def query_race_results_extended(
         return query_across_databases(hot_db_path, query, tuple(params), cold_db_path)
     else:
         # Query hot database only (default, fast)
-        hot_conn = sqlite3.connect(hot_db_path)
-        hot_cursor = hot_conn.cursor()
-        hot_cursor.execute(query, tuple(params))
-        results = hot_cursor.fetchall()
-        hot_conn.close()
-        return results
+        with _read_connection(hot_db_path) as hot_conn:
+            return [tuple(row) for row in hot_conn.execute(query, tuple(params)).fetchall()]
 
 
 def query_financial_history_extended(
@@ -657,12 +879,8 @@ def query_financial_history_extended(
     if include_cold and Path(cold_db_path).exists():
         return query_across_databases(hot_db_path, query, tuple(params), cold_db_path)
     else:
-        hot_conn = sqlite3.connect(hot_db_path)
-        hot_cursor = hot_conn.cursor()
-        hot_cursor.execute(query, tuple(params))
-        results = hot_cursor.fetchall()
-        hot_conn.close()
-        return results
+        with _read_connection(hot_db_path) as hot_conn:
+            return [tuple(row) for row in hot_conn.execute(query, tuple(params)).fetchall()]
 
 
 def query_decision_history_extended(
@@ -709,12 +927,8 @@ def query_decision_history_extended(
     if include_cold and Path(cold_db_path).exists():
         return query_across_databases(hot_db_path, query, tuple(params), cold_db_path)
     else:
-        hot_conn = sqlite3.connect(hot_db_path)
-        hot_cursor = hot_conn.cursor()
-        hot_cursor.execute(query, tuple(params))
-        results = hot_cursor.fetchall()
-        hot_conn.close()
-        return results
+        with _read_connection(hot_db_path) as hot_conn:
+            return [tuple(row) for row in hot_conn.execute(query, tuple(params)).fetchall()]
 
 
 def has_cold_database(hot_db_path: str, cold_db_path: Optional[str] = None) -> bool:
@@ -749,6 +963,7 @@ if __name__ == "__main__":
         print("  archive  - Archive old data to cold database (default)")
         print("  stats    - Show hot/cold database statistics")
         print("  restore <table> <season> - Restore data from cold to hot")
+        print("  enable-vacuum - Switch hot DB to incremental auto_vacuum (game closed)")
         print()
         print("Example:")
         print("  python ftb_db_archival.py /path/to/ftb_state.db archive")
@@ -794,6 +1009,12 @@ if __name__ == "__main__":
         rows = restore_from_cold(hot_db, table, season)
         print(f"Restored {rows} rows")
     
+    elif command == "enable-vacuum":
+        if enable_incremental_vacuum(hot_db):
+            print("Incremental auto_vacuum enabled")
+        else:
+            print("Incremental auto_vacuum already enabled")
+    
     else:
         print(f"Unknown command: {command}")
         sys.exit(1)
@@ -16,6 +16,7 @@ Features:
 import tkinter as tk
 from tkinter import ttk, messagebox
 import sqlite3
+import time
 from typing import Any, Dict, List, Optional, Tuple
 import json
 from dataclasses import dataclass
@@ -131,7 +132,12 @@ class HistoricalDataQuery:
     
     @contextmanager
     def _get_connection(self):
-        """Context manager for database connections."""
+        """Context manager for (read-only) database connections."""
+        if ftb_state_db is not None:
+            with ftb_state_db.read_connection(self.db_path) as conn:
+                yield conn
+            return
+        
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
         try:
@@ -323,6 +329,10 @@ class FTBDBExplorerWidget:
         self.frame = None
         self.notebook = None
         
+        # Background archival job (ftb_db_archival.ChunkedArchiver)
+        self._archiver = None
+        self._last_archival_rows = 0
+        
         self._build_ui()
     
     def _build_ui(self):
@@ -820,39 +830,71 @@ Archived Tables:
         ):
             return
         
-        try:
-            self._log_archival("Starting archival process...")
-            
-            # Run archival
-            stats = ftb_db_archival.archive_old_data(self.db_path, verbose=False)
-            
-            # Log results
-            total_archived = sum(stats['archived_rows'].values())
-            self._log_archival(f"✓ Archived {total_archived} total rows")
-            
-            for table, count in stats['archived_rows'].items():
-                self._log_archival(f"  • {table}: {count} rows")
-            
-            if stats['errors']:
-                self._log_archival(f"⚠️  {len(stats['errors'])} errors occurred")
-                for error in stats['errors']:
-                    self._log_archival(f"  • {error}")
-            
-            self._log_archival(f"Completed in {stats['duration_seconds']:.2f}s")
-            
-            # Refresh stats
-            self._refresh_archival_stats()
-            
-            messagebox.showinfo(
-                "Archival Complete",
-                f"Successfully archived {total_archived} rows.\n"
-                f"Time: {stats['duration_seconds']:.2f}s"
-            )
+        if self._archiver and self._archiver.is_running():
+            self._log_archival("Archival already in progress")
+            return
         
-        except Exception as e:
-            error_msg = f"Error during archival: {str(e)}"
-            self._log_archival(f"❌ {error_msg}")
-            messagebox.showerror("Archival Error", error_msg)
+        self._log_archival("Starting archival process...")
+        
+        # Archive on a background thread in small chunks so the game keeps running
+        self._archiver = ftb_db_archival.ChunkedArchiver(self.db_path)
+        self._archiver.start()
+        self._last_archival_rows = 0
+        self.frame.after(500, self._poll_archival)
+    
+    def _poll_archival(self):
+        """Report background archival progress and finish up when done."""
+        archiver = self._archiver
+        if archiver is None:
+            return
+        
+        progress = archiver.snapshot_progress()
+        if archiver.is_running():
+            if progress['rows_moved'] != self._last_archival_rows:
+                self._last_archival_rows = progress['rows_moved']
+                self._log_archival(
+                    f"  ... {progress['table']}: {progress['rows_moved']} rows moved "
+                    f"({progress['chunks']} chunks)"
+                )
+            self.frame.after(500, self._poll_archival)
+            return
+        
+        self._archiver = None
+        stats = archiver.stats or {}
+        
+        if stats.get('error'):
+            self._log_archival(f"❌ Archival failed: {stats['error']}")
+            messagebox.showerror("Archival Failed", f"Archival failed:\n{stats['error']}")
+            return
+        
+        duration = stats.get('duration_seconds', 0.0)
+        
+        # Log results
+        archived_rows = stats.get('archived_rows', {})
+        total_archived = sum(archived_rows.values())
+        self._log_archival(f"✓ Archived {total_archived} total rows")
+        
+        for table, count in archived_rows.items():
+            self._log_archival(f"  • {table}: {count} rows")
+        
+        if stats.get('errors'):
+            self._log_archival(f"⚠️  {len(stats['errors'])} errors occurred")
+            for error in stats['errors']:
+                self._log_archival(f"  • {error}")
+        
+        if stats.get('interrupted'):
+            self._log_archival("Archival stopped early; it will resume on the next run")
+        
+        self._log_archival(f"Completed in {duration:.2f}s")
+        
+        # Refresh stats
+        self._refresh_archival_stats()
+        
+        messagebox.showinfo(
+            "Archival Complete",
+            f"Successfully archived {total_archived} rows.\n"
+            f"Time: {duration:.2f}s"
+        )
     
     def _view_cold_db_stats(self):
         """Show detailed cold database statistics."""
@@ -4540,7 +4540,7 @@ class SimState:
                 if hasattr(team, 'championship_position') and hasattr(team, 'league_id'):
                     # Find league size
                     league_size = 10  # default
-                    for league in self.leagues:
+                    for league in self.leagues.values():
                         if league.league_id == team.league_id:
                             league_size = len(league.teams)
                             break
@@ -4748,7 +4748,7 @@ class SimState:
         candidates = []
         
         # Search all leagues
-        for league in self.leagues:
+        for league in self.leagues.values():
             for team in league.teams:
                 # Don't poach from own team
                 if team == acquiring_team:
@@ -5625,6 +5625,61 @@ class SimState:
             telemetry=data.get('telemetry', {}),
         )
     
+    # Binary snapshot: b"FTBS" + version + flags, then a pickle (protocol 5) of
+    # the sim attributes. Pickle keeps shared references (a Team is both in
+    # ai_teams and its league), Random objects and Entity.__dict__ as-is.
+    _SNAPSHOT_MAGIC = b"FTBS"
+    _SNAPSHOT_VERSION = 1
+    _SNAPSHOT_ZLIB = 0x01
+    # UI playback/dirty-flag state that is not part of the simulated world
+    _SNAPSHOT_TRANSIENT = frozenset({
+        '_live_pbp_events', '_live_pbp_cursor', '_live_pbp_start_ts',
+        '_live_race_result', '_watch_current_race_live',
+        '_contracts_dirty', '_stats_dirty', '_team_dirty', '_finance_dirty',
+        '_development_dirty', '_sponsors_dirty', '_car_dirty',
+        '_manager_career_dirty', '_audio_settings_dirty', '_roster_dirty',
+        '_rd_projects_dirty',
+    })
+    
+    def snapshot(self, compress: bool = False) -> bytes:
+        """Fast in-memory copy of the whole world (teams, entities, contracts,
+        leagues, RNG streams incl. the global `random` state) for rewinding or
+        branching. compress=True trades a few ms for a ~4x smaller blob."""
+        import pickle
+        import zlib
+        
+        attrs = {k: v for k, v in self.__dict__.items() if k not in self._SNAPSHOT_TRANSIENT}
+        payload = pickle.dumps((attrs, random.getstate()), protocol=5)
+        flags = 0
+        if compress:
+            payload = zlib.compress(payload, 1)
+            flags |= self._SNAPSHOT_ZLIB
+        return self._SNAPSHOT_MAGIC + bytes((self._SNAPSHOT_VERSION, flags)) + payload
+    
+    @classmethod
+    def restore(cls, data: bytes, global_rng: bool = False) -> 'SimState':
+        """Rebuild a SimState from snapshot() bytes. The result shares nothing
+        with the original. global_rng=True also rewinds the module-level
+        `random` generator (needed for bit-exact replays)."""
+        import pickle
+        import zlib
+        
+        if data[:4] != cls._SNAPSHOT_MAGIC:
+            raise ValueError("Not a SimState snapshot")
+        if data[4] != cls._SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version {data[4]}")
+        payload = data[6:]
+        if data[5] & cls._SNAPSHOT_ZLIB:
+            payload = zlib.decompress(payload)
+        attrs, rng_state = pickle.loads(payload)
+        
+        state = cls.__new__(cls)
+        state.__dict__.update(attrs)
+        state.mark_dirty('all')
+        if global_rng:
+            random.setstate(rng_state)
+        return state
+    
     def save_to_json(self, path: str) -> None:
         """Serialize state to JSON with full entity persistence"""
         def serialize_team(team: Team) -> Dict[str, Any]:
@@ -9826,7 +9881,9 @@ class FTBSimulation:
         # ============================================
         # QUALIFYING
         # ============================================
-        qual_weights = QUALIFYING_WEIGHTS['default'].copy()
+        # Copy the per-category dicts too: track modifiers below scale them in place
+        qual_weights = {k: dict(v) if isinstance(v, dict) else v
+                        for k, v in QUALIFYING_WEIGHTS['default'].items()}
         
         # Apply track modifiers to qualifying weights
         if track_modifiers:
@@ -12563,7 +12620,6 @@ class FTBSimulation:
         Execute team fold/collapse - removes team from competition and archives to history.
         Returns fold event if successful, None if fold is prevented (e.g., player team).
         """
-        import sqlite3
         import json
         
         # Prevent folding the player team (this would be game over)
@@ -12612,38 +12668,35 @@ class FTBSimulation:
         
         try:
             db_path = getattr(state, 'state_db_path', None)
-            if db_path:
-                conn = sqlite3.connect(db_path)
-                cursor = conn.cursor()
-                
-                # Archive to folded_teams
-                metadata = {
-                    'tier': team.tier,
-                    'ownership_type': team.ownership_type,
-                    'principal': team.principal_name,
-                    'bailout_history': getattr(team, '_bailout_history', [])
-                }
-                
-                cursor.execute("""
-                    INSERT INTO folded_teams 
-                    (id, team_name, fold_tick, fold_season, final_budget_cash, final_reputation, 
-                     fold_reason, championship_position, seasons_active, metadata_json)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    team_id,
-                    team.name,
-                    state.tick,
-                    getattr(state, 'season', 1),
-                    team.budget.cash,
-                    team.standing_metrics.get('reputation', 0),
-                    fold_reason,
-                    championship_position,
-                    seasons_active,
-                    json.dumps(metadata)
-                ))
+            if db_path and ftb_state_db:
+                with ftb_state_db.get_connection(db_path) as conn:
+                    cursor = conn.cursor()
+                
+                    # Archive to folded_teams
+                    metadata = {
+                        'tier': team.tier,
+                        'ownership_type': team.ownership_type,
+                        'principal': team.principal_name,
+                        'bailout_history': getattr(team, '_bailout_history', [])
+                    }
                 
-                conn.commit()
-                conn.close()
+                    cursor.execute("""
+                        INSERT INTO folded_teams 
+                        (id, team_name, fold_tick, fold_season, final_budget_cash, final_reputation, 
+                         fold_reason, championship_position, seasons_active, metadata_json)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, (
+                        team_id,
+                        team.name,
+                        state.tick,
+                        getattr(state, 'season', 1),
+                        team.budget.cash,
+                        team.standing_metrics.get('reputation', 0),
+                        fold_reason,
+                        championship_position,
+                        seasons_active,
+                        json.dumps(metadata)
+                    ))
                 _dbg(f"[FTB] Team {team.name} archived to folded_teams table")
         except Exception as e:
             _dbg(f"[FTB] Error archiving folded team: {e}")
@@ -29419,6 +29472,10 @@ class FTBController:
             try:
                 ftb_state_db.close_connection_cache(db_path)
                 os.remove(db_path)
+                # WAL sidecar files (normally removed when the last connection closes)
+                for suffix in ('-wal', '-shm'):
+                    if os.path.exists(db_path + suffix):
+                        os.remove(db_path + suffix)
                 existed = False
             except Exception as e:
                 self.log('ftb', f'Failed to reset state DB: {e}')
@@ -29495,58 +29552,54 @@ class FTBController:
         
         try:
             import json
-            import sqlite3
             
-            conn = sqlite3.connect(self.state_db_path)
-            cursor = conn.cursor()
+            with ftb_state_db.get_connection(self.state_db_path) as conn:
+                cursor = conn.cursor()
             
-            game_id = getattr(self.state, 'game_id', '')
+                game_id = getattr(self.state, 'game_id', '')
             
-            # Write race day phase
-            ftb_state_db.upsert_game_state(
-                cursor, game_id, 'race_day_phase', str(rds.phase)
-            )
-            
-            # Write current lap and total laps
-            ftb_state_db.upsert_game_state(
-                cursor, game_id, 'race_day_current_lap', str(rds.current_lap)
-            )
-            ftb_state_db.upsert_game_state(
-                cursor, game_id, 'race_day_total_laps', str(rds.total_laps)
-            )
-            
-            # Write league tier (for audio params)
-            if self.state and self.state.player_team:
-                player_league = None
-                for league in self.state.leagues.values():
-                    if self.state.player_team in league.teams:
-                        player_league = league
-                        break
-                
-                if player_league:
-                    ftb_state_db.upsert_game_state(
-                        cursor, game_id, 'player_league_tier', str(player_league.tier)
-                    )
+                # Write race day phase
+                ftb_state_db.upsert_game_state(
+                    cursor, game_id, 'race_day_phase', str(rds.phase)
+                )
             
-            # Write live standings (full field for narrator + UI)
-            if rds.live_standings:
-                # Write individual position keys (backwards-compatible for narrator)
-                for i, standing in enumerate(rds.live_standings, 1):
-                    key = f'race_day_standings_p{i}'
-                    value = json.dumps(standing)
-                    ftb_state_db.upsert_game_state(cursor, game_id, key, value)
-                # Also write full standings as single JSON array
+                # Write current lap and total laps
                 ftb_state_db.upsert_game_state(
-                    cursor, game_id, 'race_day_standings_full',
-                    json.dumps(rds.live_standings)
+                    cursor, game_id, 'race_day_current_lap', str(rds.current_lap)
                 )
                 ftb_state_db.upsert_game_state(
-                    cursor, game_id, 'race_day_standings_count',
-                    str(len(rds.live_standings))
+                    cursor, game_id, 'race_day_total_laps', str(rds.total_laps)
                 )
             
-            conn.commit()
-            conn.close()
+                # Write league tier (for audio params)
+                if self.state and self.state.player_team:
+                    player_league = None
+                    for league in self.state.leagues.values():
+                        if self.state.player_team in league.teams:
+                            player_league = league
+                            break
+                
+                    if player_league:
+                        ftb_state_db.upsert_game_state(
+                            cursor, game_id, 'player_league_tier', str(player_league.tier)
+                        )
+            
+                # Write live standings (full field for narrator + UI)
+                if rds.live_standings:
+                    # Write individual position keys (backwards-compatible for narrator)
+                    for i, standing in enumerate(rds.live_standings, 1):
+                        key = f'race_day_standings_p{i}'
+                        value = json.dumps(standing)
+                        ftb_state_db.upsert_game_state(cursor, game_id, key, value)
+                    # Also write full standings as single JSON array
+                    ftb_state_db.upsert_game_state(
+                        cursor, game_id, 'race_day_standings_full',
+                        json.dumps(rds.live_standings)
+                    )
+                    ftb_state_db.upsert_game_state(
+                        cursor, game_id, 'race_day_standings_count',
+                        str(len(rds.live_standings))
+                    )
             
         except Exception as e:
             self.log("ftb", f"Error writing race day state to DB: {e}")
@@ -10,9 +10,16 @@ Architecture:
 - Training: MSE loss on action scores weighted by team success
 
 Usage:
-    from plugins.ftb_ml_policy import TeamPrincipalPolicy, train_policy
+    from plugins.ftb_ml_policy import TeamPrincipalPolicy, export_training_arrays, train_policy_arrays
+    
+    # Export (streams ai_decisions into memory-mappable .npy shards)
+    export_training_arrays('data/ml_training/run_xxx.db', 'data/ml_training/run_xxx_arrays')
     
     # Train
+    train_policy_arrays('data/ml_training/run_xxx_arrays',
+                        checkpoint_path='stations/FromTheBackmarker/models/baseline_policy_v1.pth')
+    
+    # (Legacy JSON exports still work)
     train_policy(training_data_path='data/ml_training/run_xxx_decisions.json',
                  outcomes_path='data/ml_training/run_xxx_outcomes.json',
                  checkpoint_path='stations/FromTheBackmarker/models/baseline_policy_v1.pth')
@@ -22,9 +29,12 @@ Usage:
     scores = policy.score_actions(team_state, actions, principal_stats)
 """
 
+import glob
 import json
+import os
+import time
 import numpy as np
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, Iterable, List, Tuple, Any, Optional
 from pathlib import Path
 
 # Import PyTorch only when actually using the module
@@ -45,6 +55,246 @@ PLUGIN_DESC = "Machine-learned team principal decision policy"
 IS_FEED = False
 
 
+# ============================================================================
+# FEATURE ENCODING + COLUMNAR EXPORT (NumPy only - no PyTorch needed)
+# ============================================================================
+
+STATE_DIM = 15
+ACTION_DIM = 5
+MIN_SUCCESS_SCORE = 30.0  # Teams below this are not imitated
+
+ARRAYS_VERSION = 1
+ARRAYS_MANIFEST = "manifest.json"
+ARRAY_COLUMNS = ("state", "action", "target")
+
+
+def encode_state_features(team_state: Dict[str, Any], out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Team state dict -> (STATE_DIM,) float32 vector (last 5 slots are padding)."""
+    if out is None:
+        out = np.zeros(STATE_DIM, dtype=np.float32)
+    else:
+        out[:] = 0.0
+    out[0] = team_state.get('budget', 0.0) / 100000.0  # Normalize to $100k
+    out[1] = team_state.get('budget_ratio', 0.0)
+    out[2] = float(team_state.get('num_drivers', 0))
+    out[3] = float(team_state.get('num_engineers', 0))
+    out[4] = float(team_state.get('num_mechanics', 0))
+    out[5] = float(team_state.get('has_strategist', 0))
+    out[6] = float(team_state.get('tier', 1)) / 5.0  # Normalize to 0-1
+    out[7] = team_state.get('championship_position', 99) / 20.0  # Normalize
+    out[8] = team_state.get('morale', 50.0) / 100.0
+    out[9] = team_state.get('reputation', 50.0) / 100.0
+    return out
+
+
+def _action_type(action_name: str) -> float:
+    if 'hire' in action_name:
+        return 1.0
+    if 'fire' in action_name:
+        return 2.0
+    if 'develop' in action_name:
+        return 3.0
+    if 'purchase' in action_name or 'buy' in action_name:
+        return 4.0
+    if 'upgrade' in action_name:
+        return 5.0
+    return 0.0
+
+
+def encode_action_features(action: Dict[str, Any], out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Action dict -> (ACTION_DIM,) float32 vector (last 2 slots are padding)."""
+    if out is None:
+        out = np.zeros(ACTION_DIM, dtype=np.float32)
+    else:
+        out[:] = 0.0
+    out[0] = _action_type(action.get('name', 'unknown')) / 5.0  # Normalize
+    out[1] = action.get('cost', 0.0) / 100000.0  # Normalize to $100k
+    out[2] = 1.0 if action.get('target') else 0.0
+    return out
+
+
+def imitation_target(action_chosen: Dict[str, Any], action_scores: Optional[Dict[str, float]],
+                     success_score: float) -> float:
+    """Score of the chosen action, weighted by how well the team did."""
+    base_score = (action_scores or {}).get(action_chosen.get('name'), 50.0)
+    return base_score * (success_score / 50.0)
+
+
+def calculate_team_success_scores(outcomes: Iterable[Dict]) -> Dict[str, float]:
+    """
+    Calculate success score for each team based on outcomes.
+    
+    Success = 0.3*solvency + 0.25*standing_stability + 0.25*roi + 0.2*survival
+    """
+    team_scores = {}
+    
+    for outcome in outcomes:
+        team_id = outcome['team_id']
+        
+        # Solvency score (0-100)
+        solvency = outcome['budget_health_score']
+        
+        # Standing stability (inverse of position, scaled)
+        standing = 100.0 - (outcome['championship_position'] * 5.0)
+        standing = max(0.0, min(100.0, standing))
+        
+        # ROI score (already 0-100)
+        roi = outcome['roi_score']
+        
+        # Survival (binary -> 0 or 100)
+        survival = 100.0 if outcome['survival_flag'] else 0.0
+        
+        # Weighted sum
+        success_score = (
+            0.3 * solvency +
+            0.25 * standing +
+            0.25 * roi +
+            0.2 * survival
+        )
+        
+        # Use max if team appears multiple times (multi-season)
+        if team_id in team_scores:
+            team_scores[team_id] = max(team_scores[team_id], success_score)
+        else:
+            team_scores[team_id] = success_score
+    
+    return team_scores
+
+
+class _ShardWriter:
+    """Fills fixed-width column buffers and flushes them as <name>.<column>.npy shards."""
+    
+    def __init__(self, output_dir: str, shard_size: int, seed: int):
+        self.output_dir = output_dir
+        self.shard_size = max(1, int(shard_size))
+        self.rng = np.random.default_rng(seed)
+        self.state = np.zeros((self.shard_size, STATE_DIM), dtype=np.float32)
+        self.action = np.zeros((self.shard_size, ACTION_DIM), dtype=np.float32)
+        self.target = np.zeros((self.shard_size, 1), dtype=np.float32)
+        self.n = 0
+        self.shards: List[Dict[str, Any]] = []
+    
+    def add(self, state_vector: Dict, action_chosen: Dict, target: float):
+        encode_state_features(state_vector, self.state[self.n])
+        encode_action_features(action_chosen, self.action[self.n])
+        self.target[self.n, 0] = target
+        self.n += 1
+        if self.n == self.shard_size:
+            self.flush()
+    
+    def flush(self):
+        if self.n == 0:
+            return
+        # Shuffle rows once at export so training can read contiguous slices
+        order = self.rng.permutation(self.n)
+        name = f"shard_{len(self.shards):05d}"
+        for col, buf in (("state", self.state), ("action", self.action), ("target", self.target)):
+            np.save(os.path.join(self.output_dir, f"{name}.{col}.npy"), buf[:self.n][order])
+        self.shards.append({'name': name, 'rows': self.n})
+        self.n = 0
+
+
+def export_training_arrays(
+    db_path: str,
+    output_dir: str,
+    team_scores: Optional[Dict[str, float]] = None,
+    shard_size: int = 65536,
+    min_success: float = MIN_SUCCESS_SCORE,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """
+    Stream ai_decisions rows into fixed-width float32 shards for training.
+    
+    Writes output_dir/shard_NNNNN.{state,action,target}.npy plus manifest.json.
+    Rows from teams under min_success are dropped and targets are pre-weighted,
+    so the shards are exactly what the policy trains on.
+    
+    Args:
+        db_path: FTB state database with ai_decisions / team_outcomes
+        output_dir: Directory for the shards (created if missing)
+        team_scores: team_id -> success score (default: computed from team_outcomes)
+        shard_size: Rows per shard
+        min_success: Success threshold for imitation
+        seed: Seed for the per-shard row shuffle
+    
+    Returns:
+        The manifest dict
+    """
+    try:
+        from plugins.ftb_state_db import read_connection
+    except ImportError:
+        from ftb_state_db import read_connection
+    
+    os.makedirs(output_dir, exist_ok=True)
+    for old in glob.glob(os.path.join(output_dir, "shard_*.npy")):
+        os.remove(old)
+    
+    writer = _ShardWriter(output_dir, shard_size, seed)
+    scanned = 0
+    
+    with read_connection(db_path) as conn:
+        cursor = conn.cursor()
+        if team_scores is None:
+            cursor.execute("""
+                SELECT team_id, championship_position, budget_health_score,
+                       roi_score, survival_flag
+                FROM team_outcomes
+            """)
+            team_scores = calculate_team_success_scores(dict(row) for row in cursor)
+        
+        cursor.execute("""
+            SELECT team_id, state_vector_json, action_chosen_json, action_scores_json
+            FROM ai_decisions ORDER BY decision_id
+        """)
+        for team_id, state_json, action_json, scores_json in cursor:
+            scanned += 1
+            success_score = team_scores.get(team_id, 0.0)
+            if success_score < min_success:
+                continue
+            action_chosen = json.loads(action_json)
+            target = imitation_target(
+                action_chosen, json.loads(scores_json) if scores_json else None, success_score
+            )
+            writer.add(json.loads(state_json), action_chosen, target)
+    writer.flush()
+    
+    manifest = {
+        'version': ARRAYS_VERSION,
+        'source_db': os.path.abspath(db_path),
+        'state_dim': STATE_DIM,
+        'action_dim': ACTION_DIM,
+        'columns': list(ARRAY_COLUMNS),
+        'min_success': min_success,
+        'decisions_scanned': scanned,
+        'rows': sum(s['rows'] for s in writer.shards),
+        'shards': writer.shards,
+        'generated_at': time.time()
+    }
+    with open(os.path.join(output_dir, ARRAYS_MANIFEST), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def load_array_shards(array_dir: str) -> Tuple[Dict[str, Any], List[Dict[str, np.ndarray]]]:
+    """Manifest plus memory-mapped (read-only) columns for every shard in array_dir."""
+    with open(os.path.join(array_dir, ARRAYS_MANIFEST), 'r') as f:
+        manifest = json.load(f)
+    if manifest.get('version') != ARRAYS_VERSION:
+        raise ValueError(f"Unsupported training array version: {manifest.get('version')}")
+    
+    shards = []
+    for shard in manifest['shards']:
+        shards.append({
+            col: np.load(os.path.join(array_dir, f"{shard['name']}.{col}.npy"), mmap_mode='r')
+            for col in ARRAY_COLUMNS
+        })
+    return manifest, shards
+
+
+def is_array_dir(path: str) -> bool:
+    return os.path.isfile(os.path.join(path, ARRAYS_MANIFEST))
+
+
 if TORCH_AVAILABLE:
     class TeamStateEncoder(nn.Module):
         """Encodes team state into fixed-size embedding."""
@@ -163,46 +413,11 @@ if TORCH_AVAILABLE:
         
         def _encode_state(self, team_state: Dict[str, float]) -> torch.Tensor:
             """Convert team state dict to tensor."""
-            features = [
-                team_state.get('budget', 0.0) / 100000.0,  # Normalize to $100k
-                team_state.get('budget_ratio', 0.0),
-                float(team_state.get('num_drivers', 0)),
-                float(team_state.get('num_engineers', 0)),
-                float(team_state.get('num_mechanics', 0)),
-                float(team_state.get('has_strategist', 0)),
-                float(team_state.get('tier', 1)) / 5.0,  # Normalize to 0-1
-                team_state.get('championship_position', 99) / 20.0,  # Normalize
-                team_state.get('morale', 50.0) / 100.0,
-                team_state.get('reputation', 50.0) / 100.0,
-                # Pad to state_dim=15
-                0.0, 0.0, 0.0, 0.0, 0.0
-            ]
-            return torch.tensor(features[:self.state_dim], dtype=torch.float32)
+            return torch.from_numpy(encode_state_features(team_state)[:self.state_dim].copy())
         
         def _encode_action(self, action: Dict[str, Any]) -> torch.Tensor:
             """Convert action dict to tensor."""
-            # Action type encoding (one-hot-ish)
-            action_name = action.get('name', 'unknown')
-            action_type = 0.0
-            if 'hire' in action_name:
-                action_type = 1.0
-            elif 'fire' in action_name:
-                action_type = 2.0
-            elif 'develop' in action_name:
-                action_type = 3.0
-            elif 'purchase' in action_name or 'buy' in action_name:
-                action_type = 4.0
-            elif 'upgrade' in action_name:
-                action_type = 5.0
-            
-            features = [
-                action_type / 5.0,  # Normalize
-                action.get('cost', 0.0) / 100000.0,  # Normalize to $100k
-                1.0 if action.get('target') else 0.0,
-                # Pad to action_dim=5
-                0.0, 0.0
-            ]
-            return torch.tensor(features[:self.action_dim], dtype=torch.float32)
+            return torch.from_numpy(encode_action_features(action)[:self.action_dim].copy())
         
         def save(self, path: str):
             """Save model checkpoint."""
@@ -234,125 +449,133 @@ if TORCH_AVAILABLE:
                 decisions: List of decision dicts from ai_decisions table
                 outcomes: Dict mapping team_id -> success_score
             """
-            self.samples = []
+            kept = [d for d in decisions if outcomes.get(d['team_id'], 0.0) >= MIN_SUCCESS_SCORE]
             
-            for decision in decisions:
-                team_id = decision['team_id']
-                success_score = outcomes.get(team_id, 0.0)
-                
-                # Skip if team was unsuccessful
-                if success_score < 30.0:  # Threshold for "successful"
-                    continue
-                
-                state_vector = decision['state_vector']
-                action_chosen = decision['action_chosen']
-                
-                # Get the score for the chosen action
-                action_scores = decision.get('action_scores', {})
-                base_score = action_scores.get(action_chosen['name'], 50.0)
-                
-                # Weight by team success
-                weighted_score = base_score * (success_score / 50.0)
-                
-                self.samples.append({
-                    'state': state_vector,
-                    'action': action_chosen,
-                    'target_score': weighted_score
-                })
+            # Encode once up front; __getitem__ just slices
+            self.state = np.zeros((len(kept), STATE_DIM), dtype=np.float32)
+            self.action = np.zeros((len(kept), ACTION_DIM), dtype=np.float32)
+            self.target = np.zeros((len(kept), 1), dtype=np.float32)
+            for i, decision in enumerate(kept):
+                encode_state_features(decision['state_vector'], self.state[i])
+                encode_action_features(decision['action_chosen'], self.action[i])
+                self.target[i, 0] = imitation_target(
+                    decision['action_chosen'], decision.get('action_scores'),
+                    outcomes[decision['team_id']]
+                )
         
         def __len__(self):
-            return len(self.samples)
+            return len(self.target)
         
         def __getitem__(self, idx):
-            sample = self.samples[idx]
-            
-            # Encode state
-            state_features = [
-                sample['state'].get('budget', 0.0) / 100000.0,
-                sample['state'].get('budget_ratio', 0.0),
-                float(sample['state'].get('num_drivers', 0)),
-                float(sample['state'].get('num_engineers', 0)),
-                float(sample['state'].get('num_mechanics', 0)),
-                float(sample['state'].get('has_strategist', 0)),
-                float(sample['state'].get('tier', 1)) / 5.0,
-                sample['state'].get('championship_position', 99) / 20.0,
-                sample['state'].get('morale', 50.0) / 100.0,
-                sample['state'].get('reputation', 50.0) / 100.0,
-                0.0, 0.0, 0.0, 0.0, 0.0
-            ]
-            
-            # Encode action
-            action_name = sample['action'].get('name', 'unknown')
-            action_type = 0.0
-            if 'hire' in action_name:
-                action_type = 1.0
-            elif 'fire' in action_name:
-                action_type = 2.0
-            elif 'develop' in action_name:
-                action_type = 3.0
-            elif 'purchase' in action_name or 'buy' in action_name:
-                action_type = 4.0
-            elif 'upgrade' in action_name:
-                action_type = 5.0
-            
-            action_features = [
-                action_type / 5.0,
-                sample['action'].get('cost', 0.0) / 100000.0,
-                1.0 if sample['action'].get('target') else 0.0,
-                0.0, 0.0
-            ]
-            
             return {
-                'state': torch.tensor(state_features[:15], dtype=torch.float32),
-                'action': torch.tensor(action_features[:5], dtype=torch.float32),
-                'target_score': torch.tensor([sample['target_score']], dtype=torch.float32)
+                'state': torch.from_numpy(self.state[idx]),
+                'action': torch.from_numpy(self.action[idx]),
+                'target_score': torch.from_numpy(self.target[idx])
             }
 
 
-    def calculate_team_success_scores(outcomes: List[Dict]) -> Dict[str, float]:
+    class ShardedDecisionDataset(Dataset):
         """
-        Calculate success score for each team based on outcomes.
+        Pre-batched view over export_training_arrays() shards.
         
-        Success = 0.3*solvency + 0.25*standing_stability + 0.25*roi + 0.2*survival
+        Columns are np.load(mmap_mode='r')'d, and item i is the i-th contiguous
+        batch_size slice of a shard, so use DataLoader(batch_size=None).
+        Rows were shuffled at export; shuffle=True on the loader reorders batches.
         """
-        team_scores = {}
         
-        for outcome in outcomes:
-            team_id = outcome['team_id']
-            
-            # Solvency score (0-100)
-            solvency = outcome['budget_health_score']
+        def __init__(self, array_dir: str, batch_size: int = 64):
+            self.manifest, self.shards = load_array_shards(array_dir)
+            self.batch_size = max(1, int(batch_size))
+            self.batches: List[Tuple[int, int, int]] = []  # (shard, start, stop)
+            for si, shard in enumerate(self.shards):
+                rows = len(shard['target'])
+                for start in range(0, rows, self.batch_size):
+                    self.batches.append((si, start, min(start + self.batch_size, rows)))
+        
+        @property
+        def rows(self) -> int:
+            return int(self.manifest.get('rows', 0))
+        
+        def __len__(self):
+            return len(self.batches)
+        
+        def __getitem__(self, idx):
+            si, start, stop = self.batches[idx]
+            shard = self.shards[si]
+            # np.array() copies the mapped slice into a writable buffer for torch
+            return {
+                'state': torch.from_numpy(np.array(shard['state'][start:stop])),
+                'action': torch.from_numpy(np.array(shard['action'][start:stop])),
+                'target_score': torch.from_numpy(np.array(shard['target'][start:stop]))
+            }
+
+
+    def _fit_policy(train_loader, val_loader, checkpoint_path: str, epochs: int, learning_rate: float):
+        """Shared training loop; saves the best-validation checkpoint."""
+        model = TeamPrincipalPolicy()
+        optimizer = optim.Adam(model.parameters(), lr=learning_rate)
+        criterion = nn.MSELoss()
+        
+        print(f"[FTB ML] Training for {epochs} epochs...")
+        
+        best_val_loss = float('inf')
+        
+        for epoch in range(epochs):
+            # Training
+            model.train()
+            train_loss = 0.0
+            for batch in train_loader:
+                optimizer.zero_grad()
+                
+                state = batch['state']
+                action = batch['action']
+                target = batch['target_score']
+                
+                pred = model(state, action)
+                loss = criterion(pred, target)
+                
+                loss.backward()
+                optimizer.step()
+                
+                train_loss += loss.item()
             
-            # Standing stability (inverse of position, scaled)
-            standing = 100.0 - (outcome['championship_position'] * 5.0)
-            standing = max(0.0, min(100.0, standing))
+            train_loss /= max(len(train_loader), 1)
             
-            # ROI score (already 0-100)
-            roi = outcome['roi_score']
+            # Validation
+            model.eval()
+            val_loss = 0.0
+            with torch.no_grad():
+                for batch in val_loader:
+                    state = batch['state']
+                    action = batch['action']
+                    target = batch['target_score']
+                    
+                    pred = model(state, action)
+                    loss = criterion(pred, target)
+                    
+                    val_loss += loss.item()
             
-            # Survival (binary -> 0 or 100)
-            survival = 100.0 if outcome['survival_flag'] else 0.0
+            # No validation data -> fall back to train loss for checkpointing
+            val_loss = val_loss / len(val_loader) if len(val_loader) else train_loss
             
-            # Weighted sum
-            success_score = (
-                0.3 * solvency +
-                0.25 * standing +
-                0.25 * roi +
-                0.2 * survival
-            )
+            # Print progress
+            if (epoch + 1) % 5 == 0:
+                print(f"  Epoch {epoch+1}/{epochs} - Train Loss: {train_loss:.4f} - Val Loss: {val_loss:.4f}")
             
-            # Use max if team appears multiple times (multi-season)
-            if team_id in team_scores:
-                team_scores[team_id] = max(team_scores[team_id], success_score)
-            else:
-                team_scores[team_id] = success_score
+            # Save best model
+            if val_loss < best_val_loss:
+                best_val_loss = val_loss
+                model.save(checkpoint_path)
+                print(f"    Saved new best model (val_loss={val_loss:.4f})")
         
-        return team_scores
+        print(f"[FTB ML] Training complete!")
+        print(f"  Best validation loss: {best_val_loss:.4f}")
+        print(f"  Model saved to: {checkpoint_path}")
 
 
     def train_policy(
         training_data_path: str,
-        outcomes_path: str,
+        outcomes_path: Optional[str],
         checkpoint_path: str,
         epochs: int = 50,
         batch_size: int = 64,
@@ -363,14 +586,20 @@ if TORCH_AVAILABLE:
         Train team principal policy via imitation learning.
         
         Args:
-            training_data_path: Path to decisions JSON
-            outcomes_path: Path to outcomes JSON
+            training_data_path: Path to decisions JSON, or an export_training_arrays() directory
+            outcomes_path: Path to outcomes JSON (unused for array directories)
             checkpoint_path: Where to save trained model
             epochs: Number of training epochs
             batch_size: Batch size for training
             learning_rate: Learning rate
             validation_split: Fraction of data for validation
         """
+        if is_array_dir(training_data_path):
+            return train_policy_arrays(
+                training_data_path, checkpoint_path, epochs=epochs, batch_size=batch_size,
+                learning_rate=learning_rate, validation_split=validation_split
+            )
+        
         print(f"[FTB ML] Training imitation learning policy...")
         print(f"  Data: {training_data_path}")
         print(f"  Outcomes: {outcomes_path}")
@@ -405,65 +634,45 @@ if TORCH_AVAILABLE:
         train_loader = DataLoader(train_dataset, batch_size=batch_size, shuffle=True)
         val_loader = DataLoader(val_dataset, batch_size=batch_size, shuffle=False)
         
-        # Create model
-        model = TeamPrincipalPolicy()
-        optimizer = optim.Adam(model.parameters(), lr=learning_rate)
-        criterion = nn.MSELoss()
+        _fit_policy(train_loader, val_loader, checkpoint_path, epochs, learning_rate)
+
+
+    def train_policy_arrays(
+        array_dir: str,
+        checkpoint_path: str,
+        epochs: int = 50,
+        batch_size: int = 64,
+        learning_rate: float = 0.001,
+        validation_split: float = 0.2,
+        num_workers: int = 0
+    ):
+        """
+        Train from memory-mapped shards written by export_training_arrays().
         
-        print(f"[FTB ML] Training for {epochs} epochs...")
+        The train/val split is made over whole batches, so every batch the
+        DataLoader yields is one contiguous slice of a mapped shard.
+        """
+        print(f"[FTB ML] Training imitation learning policy...")
+        print(f"  Arrays: {array_dir}")
         
-        best_val_loss = float('inf')
+        dataset = ShardedDecisionDataset(array_dir, batch_size=batch_size)
+        print(f"  Mapped {len(dataset.shards)} shards, {dataset.rows} training samples "
+              f"({len(dataset)} batches of {dataset.batch_size})")
         
-        for epoch in range(epochs):
-            # Training
-            model.train()
-            train_loss = 0.0
-            for batch in train_loader:
-                optimizer.zero_grad()
-                
-                state = batch['state']
-                action = batch['action']
-                target = batch['target_score']
-                
-                pred = model(state, action)
-                loss = criterion(pred, target)
-                
-                loss.backward()
-                optimizer.step()
-                
-                train_loss += loss.item()
-            
-            train_loss /= len(train_loader)
-            
-            # Validation
-            model.eval()
-            val_loss = 0.0
-            with torch.no_grad():
-                for batch in val_loader:
-                    state = batch['state']
-                    action = batch['action']
-                    target = batch['target_score']
-                    
-                    pred = model(state, action)
-                    loss = criterion(pred, target)
-                    
-                    val_loss += loss.item()
-            
-            val_loss /= len(val_loader)
-            
-            # Print progress
-            if (epoch + 1) % 5 == 0:
-                print(f"  Epoch {epoch+1}/{epochs} - Train Loss: {train_loss:.4f} - Val Loss: {val_loss:.4f}")
-            
-            # Save best model
-            if val_loss < best_val_loss:
-                best_val_loss = val_loss
-                model.save(checkpoint_path)
-                print(f"    Saved new best model (val_loss={val_loss:.4f})")
+        if dataset.rows == 0:
+            print("[FTB ML] ERROR: No training samples! Check success criteria.")
+            return
         
-        print(f"[FTB ML] Training complete!")
-        print(f"  Best validation loss: {best_val_loss:.4f}")
-        print(f"  Model saved to: {checkpoint_path}")
+        val_size = int(len(dataset) * validation_split)
+        train_size = len(dataset) - val_size
+        train_dataset, val_dataset = torch.utils.data.random_split(
+            dataset, [train_size, val_size]
+        )
+        
+        train_loader = DataLoader(train_dataset, batch_size=None, shuffle=True, num_workers=num_workers)
+        val_loader = DataLoader(val_dataset, batch_size=None, shuffle=False, num_workers=num_workers)
+        
+        _fit_policy(train_loader, val_loader, checkpoint_path, epochs, learning_rate)
 
 
 # ============================================================================
@@ -484,6 +693,10 @@ else:
     def train_policy(*args, **kwargs):
         """Dummy training function when PyTorch not available."""
         raise ImportError("PyTorch not installed - cannot train ML policy. Install with: pip install torch")
+    
+    def train_policy_arrays(*args, **kwargs):
+        """Dummy training function when PyTorch not available."""
+        raise ImportError("PyTorch not installed - cannot train ML policy. Install with: pip install torch")
 
 
 def register_widgets(registry, runtime_stub):
@@ -495,8 +708,14 @@ if __name__ == "__main__":
     # Example training run
     import sys
     
+    if len(sys.argv) >= 2 and is_array_dir(sys.argv[1]):
+        checkpoint_path = sys.argv[2] if len(sys.argv) > 2 else "models/baseline_policy_v1.pth"
+        train_policy_arrays(sys.argv[1], checkpoint_path)
+        sys.exit(0)
+    
     if len(sys.argv) < 3:
         print("Usage: python ftb_ml_policy.py <decisions_json> <outcomes_json> [checkpoint_path]")
+        print("       python ftb_ml_policy.py <arrays_dir> [checkpoint_path]")
         sys.exit(1)
     
     decisions_path = sys.argv[1]
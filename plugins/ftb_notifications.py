@@ -11,12 +11,13 @@ Provides toast notifications and notification center for important game events:
 """
 
 import queue
-import sqlite3
 import time
 from dataclasses import dataclass, asdict
 from typing import Any, Dict, List, Optional, Callable
 from datetime import datetime
 
+from plugins import ftb_state_db
+
 # UI imports
 try:
     import customtkinter as ctk
@@ -73,99 +74,89 @@ MAX_HISTORY = 100
 
 def init_notifications_table(db_path: str) -> None:
     """Initialize notifications table in state database"""
-    conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
-    
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS notifications (
-            notification_id TEXT PRIMARY KEY,
-            timestamp REAL NOT NULL,
-            category TEXT NOT NULL,
-            title TEXT NOT NULL,
-            message TEXT NOT NULL,
-            priority INTEGER NOT NULL,
-            dismissible INTEGER NOT NULL,
-            read INTEGER NOT NULL,
-            metadata TEXT
-        )
-    """)
+    with ftb_state_db.get_connection(db_path) as conn:
+        cur = conn.cursor()
     
-    # Index for querying unread notifications
-    cur.execute("""
-        CREATE INDEX IF NOT EXISTS idx_notifications_read 
-        ON notifications(read, timestamp DESC)
-    """)
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS notifications (
+                notification_id TEXT PRIMARY KEY,
+                timestamp REAL NOT NULL,
+                category TEXT NOT NULL,
+                title TEXT NOT NULL,
+                message TEXT NOT NULL,
+                priority INTEGER NOT NULL,
+                dismissible INTEGER NOT NULL,
+                read INTEGER NOT NULL,
+                metadata TEXT
+            )
+        """)
     
-    conn.commit()
-    conn.close()
+        # Index for querying unread notifications
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_notifications_read 
+            ON notifications(read, timestamp DESC)
+        """)
 
 
 def write_notification(db_path: str, notif: Notification) -> None:
     """Write notification to database"""
-    conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
-    
-    import json
-    metadata_json = json.dumps(notif.metadata) if notif.metadata else None
+    with ftb_state_db.get_connection(db_path) as conn:
+        cur = conn.cursor()
     
-    cur.execute("""
-        INSERT OR REPLACE INTO notifications 
-        (notification_id, timestamp, category, title, message, priority, dismissible, read, metadata)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        notif.notification_id,
-        notif.timestamp,
-        notif.category,
-        notif.title,
-        notif.message,
-        notif.priority,
-        1 if notif.dismissible else 0,
-        1 if notif.read else 0,
-        metadata_json
-    ))
+        import json
+        metadata_json = json.dumps(notif.metadata) if notif.metadata else None
     
-    conn.commit()
-    conn.close()
+        cur.execute("""
+            INSERT OR REPLACE INTO notifications 
+            (notification_id, timestamp, category, title, message, priority, dismissible, read, metadata)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            notif.notification_id,
+            notif.timestamp,
+            notif.category,
+            notif.title,
+            notif.message,
+            notif.priority,
+            1 if notif.dismissible else 0,
+            1 if notif.read else 0,
+            metadata_json
+        ))
 
 
 def mark_notification_read(db_path: str, notification_id: str) -> None:
     """Mark notification as read"""
-    conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
-    
-    cur.execute("""
-        UPDATE notifications 
-        SET read = 1 
-        WHERE notification_id = ?
-    """, (notification_id,))
+    with ftb_state_db.get_connection(db_path) as conn:
+        cur = conn.cursor()
     
-    conn.commit()
-    conn.close()
+        cur.execute("""
+            UPDATE notifications 
+            SET read = 1 
+            WHERE notification_id = ?
+        """, (notification_id,))
 
 
 def query_notifications(db_path: str, unread_only: bool = False, limit: int = 50) -> List[Notification]:
     """Query notifications from database"""
-    conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
-    
-    if unread_only:
-        cur.execute("""
-            SELECT notification_id, timestamp, category, title, message, priority, dismissible, read, metadata
-            FROM notifications
-            WHERE read = 0
-            ORDER BY timestamp DESC
-            LIMIT ?
-        """, (limit,))
-    else:
-        cur.execute("""
-            SELECT notification_id, timestamp, category, title, message, priority, dismissible, read, metadata
-            FROM notifications
-            ORDER BY timestamp DESC
-            LIMIT ?
-        """, (limit,))
-    
-    rows = cur.fetchall()
-    conn.close()
+    with ftb_state_db.read_connection(db_path) as conn:
+        cur = conn.cursor()
+    
+        if unread_only:
+            cur.execute("""
+                SELECT notification_id, timestamp, category, title, message, priority, dismissible, read, metadata
+                FROM notifications
+                WHERE read = 0
+                ORDER BY timestamp DESC
+                LIMIT ?
+            """, (limit,))
+        else:
+            cur.execute("""
+                SELECT notification_id, timestamp, category, title, message, priority, dismissible, read, metadata
+                FROM notifications
+                ORDER BY timestamp DESC
+                LIMIT ?
+            """, (limit,))
+    
+        rows = cur.fetchall()
     
     import json
     notifications = []
@@ -189,40 +180,31 @@ def query_notifications(db_path: str, unread_only: bool = False, limit: int = 50
 
 def clear_old_notifications(db_path: str, days_to_keep: int = 30) -> None:
     """Clear notifications older than specified days"""
-    conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
+    with ftb_state_db.get_connection(db_path) as conn:
+        cur = conn.cursor()
     
-    cutoff_timestamp = time.time() - (days_to_keep * 86400)
+        cutoff_timestamp = time.time() - (days_to_keep * 86400)
     
-    cur.execute("""
-        DELETE FROM notifications
-        WHERE timestamp < ? AND read = 1
-    """, (cutoff_timestamp,))
-    
-    conn.commit()
-    conn.close()
+        cur.execute("""
+            DELETE FROM notifications
+            WHERE timestamp < ? AND read = 1
+        """, (cutoff_timestamp,))
 
 
 def clear_all_notifications(db_path: str) -> None:
     """Clear all notifications from database (used when starting new game or loading save)"""
-    conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
+    with ftb_state_db.get_connection(db_path) as conn:
+        cur = conn.cursor()
     
-    cur.execute("DELETE FROM notifications")
-    
-    conn.commit()
-    conn.close()
+        cur.execute("DELETE FROM notifications")
 
 
 def mark_all_as_read(db_path: str) -> None:
     """Mark all notifications as read"""
-    conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
-    
-    cur.execute("UPDATE notifications SET read = 1")
+    with ftb_state_db.get_connection(db_path) as conn:
+        cur = conn.cursor()
     
-    conn.commit()
-    conn.close()
+        cur.execute("UPDATE notifications SET read = 1")
 
 
 # ==============================================================================
@@ -22,7 +22,7 @@ import os
 # Import game state structures
 try:
     sys.path.insert(0, "plugins")
-    import ftb_state_db
+    from plugins import ftb_state_db
     from ftb_game import RaceResult, LapData, RaceEventRecord
     from plugins import ftb_race_day
 except Exception:
@@ -13,40 +13,321 @@ Game writes comprehensive state snapshots after each tick.
 import sqlite3
 import json
 import threading
+import time
 import os
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from contextlib import contextmanager
 
 
-# Thread-local storage for connection pooling
-_thread_local = threading.local()
-
-
 # ============================================================================
-# CONNECTION HELPERS
+# CONNECTION MANAGER
 # ============================================================================
 
-def close_connection_cache(db_path: Optional[str] = None) -> None:
-    """Close cached SQLite connections, optionally for a specific DB path."""
-    if not hasattr(_thread_local, "connections"):
-        return
+# Per-connection prepared statement cache (sqlite3 default is 128); the FTB
+# query set is larger than that once the narrator, explorer and game overlap
+STATEMENT_CACHE_SIZE = 256
+
+CONNECTION_PRAGMAS = {
+    'mmap_size': 256 * 1024 * 1024,   # Map up to 256 MB of the file for reads
+    'cache_size': -32000,             # ~32 MB page cache per connection
+    'busy_timeout': 5000,             # ms to wait on a lock held by another process
+}
+
+READ_POOL_SIZE = 4
+
+# Hooks called as hook(db_path, sql, elapsed_seconds, kind) after every statement
+_query_hooks: List[Any] = []
+
+
+def add_query_hook(hook) -> None:
+    """Register a per-query timing hook: hook(db_path, sql, elapsed_s, kind)."""
+    if hook not in _query_hooks:
+        _query_hooks.append(hook)
+
+
+def remove_query_hook(hook) -> None:
+    if hook in _query_hooks:
+        _query_hooks.remove(hook)
+
+
+def _normalize_sql(sql: str) -> str:
+    """Collapse whitespace so the same statement aggregates under one key."""
+    return " ".join(sql.split())[:200]
+
+
+class _TimedCursor(sqlite3.Cursor):
+    """Cursor that reports execute() timings to its FTBConnectionManager."""
+    
+    def _timed(self, method, sql, args):
+        manager = self.connection._ftb_manager
+        if manager is None:
+            return method(sql, args)
+        start = time.perf_counter()
+        try:
+            return method(sql, args)
+        finally:
+            manager._record(sql, time.perf_counter() - start, self.connection._ftb_kind)
+    
+    def execute(self, sql, parameters=()):
+        return self._timed(super().execute, sql, parameters)
+    
+    def executemany(self, sql, seq_of_parameters):
+        return self._timed(super().executemany, sql, seq_of_parameters)
+
+
+class _TimedConnection(sqlite3.Connection):
+    """Connection whose cursors (including conn.execute) are timed."""
+    
+    _ftb_manager = None
+    _ftb_kind = 'read'
+    
+    def cursor(self, factory=_TimedCursor):
+        return super().cursor(factory)
+    
+    # sqlite3's C shortcuts bypass cursor().execute, so route them explicitly
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+    
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
 
-    if db_path:
-        conn = _thread_local.connections.pop(db_path, None)
-        if conn:
+class FTBConnectionManager:
+    """Shared access layer for one FTB SQLite database.
+    
+    - Writes go through a single long-lived writer connection guarded by a
+      re-entrant lock, so in-process writers never contend on SQLite locks
+    - Reads borrow from a small pool of query_only connections; WAL mode
+      lets them run alongside the writer
+    - Connections live for the life of the manager so sqlite3's prepared
+      statement cache is reused across calls
+    - Every statement is timed into per-SQL stats and the module query hooks
+    """
+    
+    def __init__(self, db_path: str, read_pool_size: int = READ_POOL_SIZE):
+        self.db_path = db_path
+        self.read_pool_size = read_pool_size
+        self._writer: Optional[sqlite3.Connection] = None
+        self._writer_lock = threading.RLock()
+        self._writer_owner: Optional[int] = None
+        self._readers: List[sqlite3.Connection] = []
+        self._readers_created = 0
+        self._pool_cond = threading.Condition()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._stats_lock = threading.Lock()
+        self._closed = False
+    
+    # ------------------------------------------------------------------
+    # Connection setup
+    # ------------------------------------------------------------------
+    
+    def _open(self, kind: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               factory=_TimedConnection,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+        conn._ftb_kind = kind
+        conn.row_factory = sqlite3.Row
+        for pragma, value in CONNECTION_PRAGMAS.items():
+            conn.execute(f"PRAGMA {pragma} = {value}")
+        if kind == 'write':
+            # auto_vacuum only takes effect before the first table exists, so
+            # it has to precede the WAL switch (which initializes the file);
+            # lets archival shrink the DB with incremental_vacuum
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+        else:
+            conn.execute("PRAGMA query_only = ON")
+        # Start timing once setup pragmas are out of the way
+        conn._ftb_manager = self
+        return conn
+    
+    def _get_writer(self) -> sqlite3.Connection:
+        if self._writer is None:
+            self._writer = self._open('write')
+        return self._writer
+    
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+    
+    @contextmanager
+    def write(self):
+        """Serialized writer connection; commits on success, rolls back on error.
+        
+        Re-entrant: nested write() blocks in the same thread share the
+        connection (inner blocks commit early, as the old per-thread cache did).
+        """
+        with self._writer_lock:
+            conn = self._get_writer()
+            outer_owner = self._writer_owner
+            self._writer_owner = threading.get_ident()
             try:
-                conn.close()
+                yield conn
+                conn.commit()
             except Exception:
-                pass
-        return
-
-    for conn in _thread_local.connections.values():
+                conn.rollback()
+                raise
+            finally:
+                self._writer_owner = outer_owner
+    
+    @contextmanager
+    def hold_writer(self):
+        """Hold the writer lock while writing through a separate connection.
+        
+        For maintenance connections that need their own setup (e.g. archival
+        with an ATTACH'd cold DB) so they still queue behind in-process writes.
+        """
+        with self._writer_lock:
+            yield
+    
+    @contextmanager
+    def read(self):
+        """Pooled read-only connection.
+        
+        A thread that is inside write() reads through the writer instead, so
+        it sees its own uncommitted changes.
+        """
+        if self._writer_owner == threading.get_ident():
+            yield self._writer
+            return
+        
+        # Make sure the file exists and is in WAL mode before readers attach
+        if self._writer is None:
+            with self._writer_lock:
+                self._get_writer()
+        
+        conn = self._acquire_reader()
         try:
-            conn.close()
+            yield conn
+        finally:
+            self._release_reader(conn)
+    
+    def _acquire_reader(self) -> sqlite3.Connection:
+        with self._pool_cond:
+            while True:
+                if self._readers:
+                    return self._readers.pop()
+                if self._readers_created < self.read_pool_size:
+                    self._readers_created += 1
+                    break
+                self._pool_cond.wait()
+        try:
+            return self._open('read')
         except Exception:
-            pass
-    _thread_local.connections = {}
+            with self._pool_cond:
+                self._readers_created -= 1
+                self._pool_cond.notify()
+            raise
+    
+    def _release_reader(self, conn: sqlite3.Connection) -> None:
+        with self._pool_cond:
+            if self._closed:
+                self._readers_created -= 1
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            else:
+                self._readers.append(conn)
+            self._pool_cond.notify()
+    
+    # ------------------------------------------------------------------
+    # Timing
+    # ------------------------------------------------------------------
+    
+    def _record(self, sql: str, elapsed: float, kind: str) -> None:
+        key = _normalize_sql(sql)
+        with self._stats_lock:
+            entry = self._stats.get(key)
+            if entry is None:
+                entry = self._stats[key] = {'kind': kind, 'count': 0,
+                                            'total_ms': 0.0, 'max_ms': 0.0}
+            ms = elapsed * 1000.0
+            entry['count'] += 1
+            entry['total_ms'] += ms
+            if ms > entry['max_ms']:
+                entry['max_ms'] = ms
+        for hook in list(_query_hooks):
+            try:
+                hook(self.db_path, sql, elapsed, kind)
+            except Exception:
+                pass
+    
+    def get_query_stats(self, top: int = 20) -> List[Dict[str, Any]]:
+        """Slowest statements by total time, with count/avg/max in ms."""
+        with self._stats_lock:
+            rows = [dict(entry, sql=sql) for sql, entry in self._stats.items()]
+        for row in rows:
+            row['avg_ms'] = row['total_ms'] / row['count'] if row['count'] else 0.0
+        rows.sort(key=lambda r: r['total_ms'], reverse=True)
+        return rows[:top]
+    
+    def reset_query_stats(self) -> None:
+        with self._stats_lock:
+            self._stats.clear()
+    
+    def close(self) -> None:
+        """Close the writer and idle readers; borrowed readers close on release."""
+        with self._writer_lock:
+            if self._writer is not None:
+                try:
+                    self._writer.close()
+                except Exception:
+                    pass
+                self._writer = None
+        with self._pool_cond:
+            self._closed = True
+            for conn in self._readers:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+                self._readers_created -= 1
+            self._readers = []
+            self._pool_cond.notify_all()
+
+
+_managers: Dict[str, FTBConnectionManager] = {}
+_managers_lock = threading.Lock()
+
+
+def get_db_manager(db_path: str) -> FTBConnectionManager:
+    """Shared FTBConnectionManager for a DB path (created on first use)."""
+    key = os.path.abspath(db_path)
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = _managers[key] = FTBConnectionManager(db_path)
+        return manager
+
+
+@contextmanager
+def get_connection(db_path: str):
+    """Serialized write connection for db_path (commits on success)."""
+    with get_db_manager(db_path).write() as conn:
+        yield conn
+
+
+@contextmanager
+def read_connection(db_path: str):
+    """Pooled read-only connection for db_path."""
+    with get_db_manager(db_path).read() as conn:
+        yield conn
+
+
+def close_connection_cache(db_path: Optional[str] = None) -> None:
+    """Close pooled SQLite connections, optionally for a specific DB path."""
+    with _managers_lock:
+        if db_path:
+            managers = [_managers.pop(os.path.abspath(db_path), None)]
+        else:
+            managers = list(_managers.values())
+            _managers.clear()
+    for manager in managers:
+        if manager:
+            manager.close()
 
 
 def backup_db(src_path: str, dest_path: str) -> None:
@@ -57,9 +338,132 @@ def backup_db(src_path: str, dest_path: str) -> None:
         return
 
     os.makedirs(os.path.dirname(os.path.abspath(dest_path)), exist_ok=True)
-    with sqlite3.connect(src_path) as src_conn:
+    with read_connection(src_path) as src_conn:
         with sqlite3.connect(dest_path) as dest_conn:
             src_conn.backup(dest_conn)
+        dest_conn.close()
+
+
+# ============================================================================
+# WRITE NOTIFICATIONS
+# ============================================================================
+
+class EventNotifier:
+    """In-process wakeup channel from DB writers (the game) to readers (the narrator).
+    
+    Writers call notify() after committing events or a tick snapshot. The
+    pending summary (latest tick, max priority, urgency, event count and the
+    time of the first un-consumed write) accumulates until a reader
+    consume()s it, so readers can block in wait() instead of polling SQLite.
+    
+    Snapshot-only writes (no events) happen every tick, so they end a wait at
+    most once per tick_interval seconds after the first one is recorded.
+    """
+    
+    def __init__(self, tick_interval: float = 5.0):
+        self.tick_interval = tick_interval
+        self._cond = threading.Condition()
+        self._pending: Optional[Dict[str, Any]] = None
+        self._generation = 0
+    
+    def notify(self, tick: int, max_priority: Optional[float] = None,
+               urgent: bool = False, event_count: int = 0) -> None:
+        """Record a committed write and wake waiting readers."""
+        import time
+        
+        with self._cond:
+            pending = self._pending
+            fresh = pending is None
+            if fresh:
+                pending = self._pending = {
+                    'tick': tick,
+                    'max_priority': None,
+                    'urgent': False,
+                    'event_count': 0,
+                    'first_ts': time.time(),
+                }
+            pending['tick'] = max(pending['tick'], tick)
+            if max_priority is not None:
+                prev = pending['max_priority']
+                pending['max_priority'] = max_priority if prev is None else max(prev, max_priority)
+            pending['urgent'] = pending['urgent'] or urgent
+            pending['event_count'] += event_count
+            # Later snapshot-only writes just advance the tick; waiters are already
+            # timing the first one
+            if fresh or event_count or urgent or max_priority is not None:
+                self._cond.notify_all()
+    
+    def wake(self) -> None:
+        """Wake waiting readers without recording a write (stop/resume)."""
+        with self._cond:
+            self._generation += 1
+            self._cond.notify_all()
+    
+    def peek(self) -> Optional[Dict[str, Any]]:
+        with self._cond:
+            return dict(self._pending) if self._pending else None
+    
+    def consume(self) -> Optional[Dict[str, Any]]:
+        """Take the pending summary, resetting it for the next writes."""
+        with self._cond:
+            pending, self._pending = self._pending, None
+            return pending
+    
+    def wait(self, timeout: Optional[float] = None, want_events: bool = True,
+             urgent_only: bool = False, until: Optional[Callable[[], bool]] = None) -> bool:
+        """Block until a matching write is pending, wake() is called or timeout.
+        
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+            want_events: If False, only wake() or the timeout end the wait
+            urgent_only: Only urgent pending writes end the wait
+            until: Reader state checked under the lock (e.g. "suspended changed"),
+                so a wake() between the reader's own check and this call isn't lost
+        
+        Returns:
+            True if woken before the timeout
+        """
+        import time
+        
+        with self._cond:
+            generation = self._generation
+            deadline = None if timeout is None else time.monotonic() + timeout
+            
+            while True:
+                if self._generation != generation or (until is not None and until()):
+                    return True
+                
+                hold = None
+                pending = self._pending
+                if want_events and pending is not None and (pending['urgent'] or not urgent_only):
+                    if pending['event_count'] or pending['urgent'] or pending['max_priority'] is not None:
+                        return True
+                    hold = pending['first_ts'] + self.tick_interval - time.time()
+                    if hold <= 0:
+                        return True
+                
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                waits = [w for w in (remaining, hold) if w is not None]
+                self._cond.wait(min(waits) if waits else None)
+
+
+_notifiers: Dict[str, EventNotifier] = {}
+_notifiers_lock = threading.Lock()
+
+# Events at or above this priority (or critical/major severity) wake readers immediately
+URGENT_EVENT_PRIORITY = 80.0
+
+
+def get_event_notifier(db_path: str) -> EventNotifier:
+    """Shared EventNotifier for a state DB path."""
+    key = os.path.abspath(db_path)
+    with _notifiers_lock:
+        notifier = _notifiers.get(key)
+        if notifier is None:
+            notifier = _notifiers[key] = EventNotifier()
+        return notifier
 
 
 # ============================================================================
@@ -72,831 +476,829 @@ def init_db(db_path: str) -> None:
     Args:
         db_path: Path to SQLite database file
     """
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    with get_connection(db_path) as conn:
+        cursor = conn.cursor()
     
-    # Game state snapshot (singleton row)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS game_state_snapshot (
-            id INTEGER PRIMARY KEY CHECK (id = 1),
-            tick INTEGER NOT NULL,
-            phase TEXT NOT NULL,
-            season INTEGER NOT NULL,
-            day_of_year INTEGER NOT NULL,
-            time_mode TEXT NOT NULL,
-            control_mode TEXT NOT NULL,
-            active_tab TEXT,
-            seed TEXT NOT NULL,
-            game_id TEXT,
-            races_completed_this_season INTEGER DEFAULT 0,
-            last_updated_ts REAL NOT NULL
-        )
-    """)
+        # Game state snapshot (singleton row)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS game_state_snapshot (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                tick INTEGER NOT NULL,
+                phase TEXT NOT NULL,
+                season INTEGER NOT NULL,
+                day_of_year INTEGER NOT NULL,
+                time_mode TEXT NOT NULL,
+                control_mode TEXT NOT NULL,
+                active_tab TEXT,
+                seed TEXT NOT NULL,
+                game_id TEXT,
+                races_completed_this_season INTEGER DEFAULT 0,
+                last_updated_ts REAL NOT NULL
+            )
+        """)
     
-    # Player state (singleton row)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS player_state (
-            id INTEGER PRIMARY KEY CHECK (id = 1),
-            team_name TEXT NOT NULL,
-            budget REAL NOT NULL,
-            championship_position INTEGER,
-            points REAL NOT NULL,
-            morale REAL NOT NULL,
-            reputation REAL NOT NULL,
-            tier INTEGER NOT NULL,
-            league_id TEXT NOT NULL,
-            focus TEXT,
-            identity_json TEXT NOT NULL,
-            ownership_type TEXT DEFAULT 'hired_manager'
-        )
-    """)
+        # Player state (singleton row)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS player_state (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                team_name TEXT NOT NULL,
+                budget REAL NOT NULL,
+                championship_position INTEGER,
+                points REAL NOT NULL,
+                morale REAL NOT NULL,
+                reputation REAL NOT NULL,
+                tier INTEGER NOT NULL,
+                league_id TEXT NOT NULL,
+                focus TEXT,
+                identity_json TEXT NOT NULL,
+                ownership_type TEXT DEFAULT 'hired_manager'
+            )
+        """)
     
-    # Teams snapshot
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS teams (
-            team_name TEXT PRIMARY KEY,
-            tier INTEGER NOT NULL,
-            league_id TEXT NOT NULL,
-            budget REAL NOT NULL,
-            championship_position INTEGER,
-            points REAL NOT NULL,
-            is_player_team INTEGER NOT NULL,
-            principal_name TEXT,
-            ownership_type TEXT,
-            standing_metrics_json TEXT,
-            infrastructure_summary_json TEXT
-        )
-    """)
+        # Teams snapshot
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS teams (
+                team_name TEXT PRIMARY KEY,
+                tier INTEGER NOT NULL,
+                league_id TEXT NOT NULL,
+                budget REAL NOT NULL,
+                championship_position INTEGER,
+                points REAL NOT NULL,
+                is_player_team INTEGER NOT NULL,
+                principal_name TEXT,
+                ownership_type TEXT,
+                standing_metrics_json TEXT,
+                infrastructure_summary_json TEXT
+            )
+        """)
     
-    # Entities (drivers, engineers, mechanics, strategists)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS entities (
-            entity_id INTEGER PRIMARY KEY,
-            entity_type TEXT NOT NULL,
-            name TEXT NOT NULL,
-            age INTEGER NOT NULL,
-            team_name TEXT,
-            overall_rating REAL NOT NULL,
-            stats_json TEXT NOT NULL,
-            contract_end_day INTEGER,
-            salary REAL,
-            is_free_agent INTEGER DEFAULT 0,
-            time_in_pool_days INTEGER DEFAULT 0,
-            exit_reason TEXT
-        )
-    """)
+        # Entities (drivers, engineers, mechanics, strategists)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS entities (
+                entity_id INTEGER PRIMARY KEY,
+                entity_type TEXT NOT NULL,
+                name TEXT NOT NULL,
+                age INTEGER NOT NULL,
+                team_name TEXT,
+                overall_rating REAL NOT NULL,
+                stats_json TEXT NOT NULL,
+                contract_end_day INTEGER,
+                salary REAL,
+                is_free_agent INTEGER DEFAULT 0,
+                time_in_pool_days INTEGER DEFAULT 0,
+                exit_reason TEXT
+            )
+        """)
     
-    # Events buffer for narrator
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS events_buffer (
-            event_id INTEGER PRIMARY KEY,
-            tick INTEGER NOT NULL,
-            event_type TEXT NOT NULL,
-            category TEXT NOT NULL,
-            priority REAL NOT NULL,
-            severity TEXT NOT NULL,
-            team TEXT,
-            data_json TEXT NOT NULL,
-            emitted_to_narrator INTEGER DEFAULT 0,
-            created_ts REAL NOT NULL
-        )
-    """)
+        # Events buffer for narrator
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS events_buffer (
+                event_id INTEGER PRIMARY KEY,
+                tick INTEGER NOT NULL,
+                event_type TEXT NOT NULL,
+                category TEXT NOT NULL,
+                priority REAL NOT NULL,
+                severity TEXT NOT NULL,
+                team TEXT,
+                data_json TEXT NOT NULL,
+                emitted_to_narrator INTEGER DEFAULT 0,
+                created_ts REAL NOT NULL
+            )
+        """)
     
-    # League standings
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS league_standings (
-            league_id TEXT PRIMARY KEY,
-            tier INTEGER NOT NULL,
-            league_name TEXT NOT NULL,
-            standings_json TEXT NOT NULL
-        )
-    """)
+        # League standings
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS league_standings (
+                league_id TEXT PRIMARY KEY,
+                tier INTEGER NOT NULL,
+                league_name TEXT NOT NULL,
+                standings_json TEXT NOT NULL
+            )
+        """)
     
-    # Job board
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS job_board (
-            listing_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            team_name TEXT NOT NULL,
-            role TEXT NOT NULL,
-            tier INTEGER NOT NULL,
-            salary REAL NOT NULL,
-            visibility_threshold REAL DEFAULT 0.0,
-            created_tick INTEGER NOT NULL
-        )
-    """)
+        # Job board
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS job_board (
+                listing_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                team_name TEXT NOT NULL,
+                role TEXT NOT NULL,
+                tier INTEGER NOT NULL,
+                salary REAL NOT NULL,
+                visibility_threshold REAL DEFAULT 0.0,
+                created_tick INTEGER NOT NULL
+            )
+        """)
     
-    # Sponsorships (extended with rich behavioral profiles)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS sponsorships (
-            sponsorship_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            team_name TEXT NOT NULL,
-            sponsor_name TEXT NOT NULL,
-            sponsor_id TEXT,
-            tier TEXT NOT NULL,
-            financial_tier TEXT,
-            industry TEXT,
-            sub_industry TEXT,
-            base_payment_per_season INTEGER NOT NULL,
-            duration_seasons INTEGER NOT NULL,
-            seasons_active INTEGER DEFAULT 0,
-            confidence REAL DEFAULT 100.0,
-            contract_type TEXT DEFAULT 'season_partnership',
-            evaluation_cadence INTEGER DEFAULT 5,
-            signed_tick INTEGER DEFAULT 0,
-            last_evaluated_tick INTEGER DEFAULT 0,
-            warning_issued INTEGER DEFAULT 0,
-            has_bailed_out INTEGER DEFAULT 0,
-            bailout_count INTEGER DEFAULT 0,
-            brand_profile_json TEXT,
-            contract_behavior_json TEXT,
-            activation_style_json TEXT,
-            narrative_hooks_json TEXT,
-            exclusivity_clauses_json TEXT,
-            performance_history_json TEXT
-        )
-    """)
+        # Sponsorships (extended with rich behavioral profiles)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS sponsorships (
+                sponsorship_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                team_name TEXT NOT NULL,
+                sponsor_name TEXT NOT NULL,
+                sponsor_id TEXT,
+                tier TEXT NOT NULL,
+                financial_tier TEXT,
+                industry TEXT,
+                sub_industry TEXT,
+                base_payment_per_season INTEGER NOT NULL,
+                duration_seasons INTEGER NOT NULL,
+                seasons_active INTEGER DEFAULT 0,
+                confidence REAL DEFAULT 100.0,
+                contract_type TEXT DEFAULT 'season_partnership',
+                evaluation_cadence INTEGER DEFAULT 5,
+                signed_tick INTEGER DEFAULT 0,
+                last_evaluated_tick INTEGER DEFAULT 0,
+                warning_issued INTEGER DEFAULT 0,
+                has_bailed_out INTEGER DEFAULT 0,
+                bailout_count INTEGER DEFAULT 0,
+                brand_profile_json TEXT,
+                contract_behavior_json TEXT,
+                activation_style_json TEXT,
+                narrative_hooks_json TEXT,
+                exclusivity_clauses_json TEXT,
+                performance_history_json TEXT
+            )
+        """)
     
-    # Free agents pool
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS free_agents (
-            entity_id INTEGER PRIMARY KEY,
-            role TEXT NOT NULL,
-            age INTEGER NOT NULL,
-            tier INTEGER NOT NULL,
-            overall_rating REAL NOT NULL,
-            asking_salary REAL NOT NULL,
-            time_in_pool_days INTEGER DEFAULT 0,
-            exit_reason TEXT
-        )
-    """)
+        # Free agents pool
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS free_agents (
+                entity_id INTEGER PRIMARY KEY,
+                role TEXT NOT NULL,
+                age INTEGER NOT NULL,
+                tier INTEGER NOT NULL,
+                overall_rating REAL NOT NULL,
+                asking_salary REAL NOT NULL,
+                time_in_pool_days INTEGER DEFAULT 0,
+                exit_reason TEXT
+            )
+        """)
     
-    # Folded teams (historical record of team collapses)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS folded_teams (
-            id TEXT PRIMARY KEY,
-            team_name TEXT NOT NULL,
-            fold_tick INTEGER NOT NULL,
-            fold_season INTEGER NOT NULL,
-            final_budget_cash REAL,
-            final_reputation REAL,
-            fold_reason TEXT NOT NULL,
-            championship_position INTEGER,
-            seasons_active INTEGER,
-            metadata_json TEXT
-        )
-    """)
+        # Folded teams (historical record of team collapses)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS folded_teams (
+                id TEXT PRIMARY KEY,
+                team_name TEXT NOT NULL,
+                fold_tick INTEGER NOT NULL,
+                fold_season INTEGER NOT NULL,
+                final_budget_cash REAL,
+                final_reputation REAL,
+                fold_reason TEXT NOT NULL,
+                championship_position INTEGER,
+                seasons_active INTEGER,
+                metadata_json TEXT
+            )
+        """)
     
-    # Penalties
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS penalties (
-            penalty_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            race_id INTEGER,
-            team_name TEXT NOT NULL,
-            driver_name TEXT,
-            penalty_type TEXT NOT NULL,
-            magnitude INTEGER NOT NULL,
-            reason TEXT NOT NULL,
-            game_day INTEGER NOT NULL,
-            tier INTEGER NOT NULL,
-            issued_by TEXT DEFAULT 'Stewards',
-            appealable INTEGER DEFAULT 0,
-            applied INTEGER DEFAULT 0,
-            metadata_json TEXT
-        )
-    """)
+        # Penalties
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS penalties (
+                penalty_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                race_id INTEGER,
+                team_name TEXT NOT NULL,
+                driver_name TEXT,
+                penalty_type TEXT NOT NULL,
+                magnitude INTEGER NOT NULL,
+                reason TEXT NOT NULL,
+                game_day INTEGER NOT NULL,
+                tier INTEGER NOT NULL,
+                issued_by TEXT DEFAULT 'Stewards',
+                appealable INTEGER DEFAULT 0,
+                applied INTEGER DEFAULT 0,
+                metadata_json TEXT
+            )
+        """)
     
-    # Index for efficient penalty queries
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_penalties_team_day ON penalties(team_name, game_day DESC)
-    """)
+        # Index for efficient penalty queries
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_penalties_team_day ON penalties(team_name, game_day DESC)
+        """)
     
-    # Narrator context (singleton row)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS narrator_context (
-            id INTEGER PRIMARY KEY CHECK (id = 1),
-            last_commentary_time REAL,
-            topics_discussed_json TEXT DEFAULT '[]',
-            active_themes_json TEXT DEFAULT '[]',
-            player_streak_data_json TEXT DEFAULT '{}',
-            segment_history_json TEXT DEFAULT '{}',
-            player_team TEXT,
-            save_timestamp REAL,
-            current_motif TEXT DEFAULT 'quiet climb',
-            open_loop TEXT DEFAULT '',
-            named_focus TEXT DEFAULT '',
-            stakes_axis TEXT DEFAULT 'budget',
-            tone TEXT DEFAULT 'wry',
-            last_generated_spine TEXT DEFAULT '',
-            last_generated_beat TEXT DEFAULT '',
-            claim_tags_json TEXT DEFAULT '[]',
-            segments_since_motif_change INTEGER DEFAULT 0
-        )
-    """)
+        # Narrator context (singleton row)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS narrator_context (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                last_commentary_time REAL,
+                topics_discussed_json TEXT DEFAULT '[]',
+                active_themes_json TEXT DEFAULT '[]',
+                player_streak_data_json TEXT DEFAULT '{}',
+                segment_history_json TEXT DEFAULT '{}',
+                player_team TEXT,
+                save_timestamp REAL,
+                current_motif TEXT DEFAULT 'quiet climb',
+                open_loop TEXT DEFAULT '',
+                named_focus TEXT DEFAULT '',
+                stakes_axis TEXT DEFAULT 'budget',
+                tone TEXT DEFAULT 'wry',
+                last_generated_spine TEXT DEFAULT '',
+                last_generated_beat TEXT DEFAULT '',
+                claim_tags_json TEXT DEFAULT '[]',
+                segments_since_motif_change INTEGER DEFAULT 0
+            )
+        """)
     
-    # UI context (singleton row)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS ui_context (
-            id INTEGER PRIMARY KEY CHECK (id = 1),
-            active_tab TEXT NOT NULL,
-            last_tab_change_tick INTEGER NOT NULL
-        )
-    """)
+        # UI context (singleton row)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS ui_context (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                active_tab TEXT NOT NULL,
+                last_tab_change_tick INTEGER NOT NULL
+            )
+        """)
     
-    # Calendar entries (forward-looking projection for strategic planning)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS calendar_entries (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            entry_day INTEGER NOT NULL,
-            entry_type TEXT NOT NULL,
-            category TEXT NOT NULL,
-            entity_id INTEGER,
-            title TEXT NOT NULL,
-            description TEXT NOT NULL,
-            is_player_authored INTEGER DEFAULT 0,
-            priority INTEGER DEFAULT 50,
-            action_required INTEGER DEFAULT 0,
-            metadata_json TEXT,
-            created_at REAL NOT NULL
-        )
-    """)
+        # Calendar entries (forward-looking projection for strategic planning)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS calendar_entries (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                entry_day INTEGER NOT NULL,
+                entry_type TEXT NOT NULL,
+                category TEXT NOT NULL,
+                entity_id INTEGER,
+                title TEXT NOT NULL,
+                description TEXT NOT NULL,
+                is_player_authored INTEGER DEFAULT 0,
+                priority INTEGER DEFAULT 50,
+                action_required INTEGER DEFAULT 0,
+                metadata_json TEXT,
+                created_at REAL NOT NULL
+            )
+        """)
     
-    # League economic state (global sponsor market health)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS league_economic_state (
-            season INTEGER PRIMARY KEY,
-            sponsor_market_multiplier REAL DEFAULT 1.0,
-            recent_folds_count INTEGER DEFAULT 0,
-            tier_stability REAL DEFAULT 1.0,
-            last_update_tick INTEGER DEFAULT 0,
-            metadata_json TEXT
-        )
-    """)
+        # League economic state (global sponsor market health)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS league_economic_state (
+                season INTEGER PRIMARY KEY,
+                sponsor_market_multiplier REAL DEFAULT 1.0,
+                recent_folds_count INTEGER DEFAULT 0,
+                tier_stability REAL DEFAULT 1.0,
+                last_update_tick INTEGER DEFAULT 0,
+                metadata_json TEXT
+            )
+        """)
     
-    # Decision history (player and delegate decisions)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS decision_history (
-            decision_id TEXT PRIMARY KEY,
-            tick INTEGER NOT NULL,
-            season INTEGER NOT NULL,
-            game_day INTEGER NOT NULL,
-            category TEXT NOT NULL,
-            decision_text TEXT NOT NULL,
-            options_json TEXT NOT NULL,
-            chosen_option_id TEXT,
-            chosen_option_label TEXT,
-            immediate_cost REAL DEFAULT 0.0,
-            rationale TEXT,
-            resolved_by TEXT,
-            metadata_json TEXT
-        )
-    """)
+        # Decision history (player and delegate decisions)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS decision_history (
+                decision_id TEXT PRIMARY KEY,
+                tick INTEGER NOT NULL,
+                season INTEGER NOT NULL,
+                game_day INTEGER NOT NULL,
+                category TEXT NOT NULL,
+                decision_text TEXT NOT NULL,
+                options_json TEXT NOT NULL,
+                chosen_option_id TEXT,
+                chosen_option_label TEXT,
+                immediate_cost REAL DEFAULT 0.0,
+                rationale TEXT,
+                resolved_by TEXT,
+                metadata_json TEXT
+            )
+        """)
     
-    # Race results archive (historical performance records)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS race_results_archive (
-            race_id TEXT PRIMARY KEY,
-            season INTEGER NOT NULL,
-            round_number INTEGER NOT NULL,
-            league_id TEXT NOT NULL,
-            track_name TEXT NOT NULL,
-            tick INTEGER NOT NULL,
-            player_team_name TEXT NOT NULL,
-            player_drivers_json TEXT NOT NULL,
-            finish_positions_json TEXT NOT NULL,
-            grid_position INTEGER,
-            prize_money REAL DEFAULT 0.0,
-            fastest_lap_holder TEXT,
-            incidents_json TEXT,
-            championship_position_after INTEGER,
-            points_after REAL,
-            metadata_json TEXT
-        )
-    """)
+        # Race results archive (historical performance records)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS race_results_archive (
+                race_id TEXT PRIMARY KEY,
+                season INTEGER NOT NULL,
+                round_number INTEGER NOT NULL,
+                league_id TEXT NOT NULL,
+                track_name TEXT NOT NULL,
+                tick INTEGER NOT NULL,
+                player_team_name TEXT NOT NULL,
+                player_drivers_json TEXT NOT NULL,
+                finish_positions_json TEXT NOT NULL,
+                grid_position INTEGER,
+                prize_money REAL DEFAULT 0.0,
+                fastest_lap_holder TEXT,
+                incidents_json TEXT,
+                championship_position_after INTEGER,
+                points_after REAL,
+                metadata_json TEXT
+            )
+        """)
     
-    # Financial transactions (all income and expenses)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS financial_transactions (
-            transaction_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            tick INTEGER NOT NULL,
-            season INTEGER NOT NULL,
-            game_day INTEGER NOT NULL,
-            type TEXT NOT NULL,
-            category TEXT NOT NULL,
-            amount REAL NOT NULL,
-            balance_after REAL NOT NULL,
-            description TEXT NOT NULL,
-            related_entity TEXT,
-            metadata_json TEXT
-        )
-    """)
+        # Financial transactions (all income and expenses)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS financial_transactions (
+                transaction_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                tick INTEGER NOT NULL,
+                season INTEGER NOT NULL,
+                game_day INTEGER NOT NULL,
+                type TEXT NOT NULL,
+                category TEXT NOT NULL,
+                amount REAL NOT NULL,
+                balance_after REAL NOT NULL,
+                description TEXT NOT NULL,
+                related_entity TEXT,
+                metadata_json TEXT
+            )
+        """)
     
-    # Season summaries (end-of-season performance records)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS season_summaries (
-            season INTEGER PRIMARY KEY,
-            team_name TEXT NOT NULL,
-            tier TEXT NOT NULL,
-            league_id TEXT NOT NULL,
-            championship_position INTEGER,
-            total_points REAL DEFAULT 0.0,
-            races_entered INTEGER DEFAULT 0,
-            wins INTEGER DEFAULT 0,
-            podiums INTEGER DEFAULT 0,
-            poles INTEGER DEFAULT 0,
-            season_prize_money REAL DEFAULT 0.0,
-            season_sponsor_income REAL DEFAULT 0.0,
-            season_expenses REAL DEFAULT 0.0,
-            starting_balance REAL DEFAULT 0.0,
-            ending_balance REAL DEFAULT 0.0,
-            promoted INTEGER DEFAULT 0,
-            relegated INTEGER DEFAULT 0,
-            metadata_json TEXT
-        )
-    """)
+        # Season summaries (end-of-season performance records)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS season_summaries (
+                season INTEGER PRIMARY KEY,
+                team_name TEXT NOT NULL,
+                tier TEXT NOT NULL,
+                league_id TEXT NOT NULL,
+                championship_position INTEGER,
+                total_points REAL DEFAULT 0.0,
+                races_entered INTEGER DEFAULT 0,
+                wins INTEGER DEFAULT 0,
+                podiums INTEGER DEFAULT 0,
+                poles INTEGER DEFAULT 0,
+                season_prize_money REAL DEFAULT 0.0,
+                season_sponsor_income REAL DEFAULT 0.0,
+                season_expenses REAL DEFAULT 0.0,
+                starting_balance REAL DEFAULT 0.0,
+                ending_balance REAL DEFAULT 0.0,
+                promoted INTEGER DEFAULT 0,
+                relegated INTEGER DEFAULT 0,
+                metadata_json TEXT
+            )
+        """)
     
-    # ML TRAINING: AI decisions log (for imitation learning)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS ai_decisions (
-            decision_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            tick INTEGER NOT NULL,
-            season INTEGER NOT NULL,
-            team_id TEXT NOT NULL,
-            team_name TEXT NOT NULL,
-            state_vector_json TEXT NOT NULL,
-            action_chosen_json TEXT NOT NULL,
-            action_scores_json TEXT,
-            principal_stats_json TEXT NOT NULL,
-            budget_before REAL NOT NULL,
-            budget_after REAL NOT NULL,
-            championship_position INTEGER,
-            created_ts REAL NOT NULL
-        )
-    """)
+        # ML TRAINING: AI decisions log (for imitation learning)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS ai_decisions (
+                decision_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                tick INTEGER NOT NULL,
+                season INTEGER NOT NULL,
+                team_id TEXT NOT NULL,
+                team_name TEXT NOT NULL,
+                state_vector_json TEXT NOT NULL,
+                action_chosen_json TEXT NOT NULL,
+                action_scores_json TEXT,
+                principal_stats_json TEXT NOT NULL,
+                budget_before REAL NOT NULL,
+                budget_after REAL NOT NULL,
+                championship_position INTEGER,
+                created_ts REAL NOT NULL
+            )
+        """)
     
-    # ML TRAINING: Team outcomes (for success scoring)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS team_outcomes (
-            outcome_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            team_id TEXT NOT NULL,
-            team_name TEXT NOT NULL,
-            season INTEGER NOT NULL,
-            championship_position INTEGER NOT NULL,
-            total_points REAL DEFAULT 0.0,
-            starting_budget REAL NOT NULL,
-            ending_budget REAL NOT NULL,
-            budget_health_score REAL DEFAULT 0.0,
-            roi_score REAL DEFAULT 0.0,
-            survival_flag INTEGER DEFAULT 1,
-            folded_tick INTEGER,
-            seasons_survived INTEGER DEFAULT 1,
-            created_ts REAL NOT NULL
-        )
-    """)
+        # ML TRAINING: Team outcomes (for success scoring)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS team_outcomes (
+                outcome_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                team_id TEXT NOT NULL,
+                team_name TEXT NOT NULL,
+                season INTEGER NOT NULL,
+                championship_position INTEGER NOT NULL,
+                total_points REAL DEFAULT 0.0,
+                starting_budget REAL NOT NULL,
+                ending_budget REAL NOT NULL,
+                budget_health_score REAL DEFAULT 0.0,
+                roi_score REAL DEFAULT 0.0,
+                survival_flag INTEGER DEFAULT 1,
+                folded_tick INTEGER,
+                seasons_survived INTEGER DEFAULT 1,
+                created_ts REAL NOT NULL
+            )
+        """)
     
-    # Create indexes for common queries
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_emitted ON events_buffer(emitted_to_narrator)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_tick ON events_buffer(tick)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_entities_team ON entities(team_name)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_entities_free_agent ON entities(is_free_agent)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_job_board_tier ON job_board(tier)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_sponsorships_team ON sponsorships(team_name)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_sponsorships_sponsor_id ON sponsorships(sponsor_id, team_name)")
-    
-    # Indexes for history tables
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_decision_history_tick ON decision_history(tick DESC)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_decision_history_category ON decision_history(category, tick DESC)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_race_results_season ON race_results_archive(season DESC, round_number DESC)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_financial_transactions_tick ON financial_transactions(tick DESC)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_financial_transactions_type ON financial_transactions(type, category, tick DESC)")
-    
-    # Indexes for ML training tables
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_ai_decisions_team ON ai_decisions(team_id, season, tick)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_ai_decisions_tick ON ai_decisions(tick DESC)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_team_outcomes_team ON team_outcomes(team_id, season)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_team_outcomes_success ON team_outcomes(budget_health_score DESC, roi_score DESC)")
-    
-    # ========================================================================
-    # HISTORICAL DATA SYSTEM - Phase 1 Foundation
-    # ========================================================================
-    
-    # I. TEAM HISTORICAL RECORDS
-    
-    # Team career totals (all-time stats)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS team_career_totals (
-            team_name TEXT PRIMARY KEY,
-            seasons_entered INTEGER DEFAULT 0,
-            races_entered INTEGER DEFAULT 0,
-            wins_total INTEGER DEFAULT 0,
-            podiums_total INTEGER DEFAULT 0,
-            poles_total INTEGER DEFAULT 0,
-            fastest_laps_total INTEGER DEFAULT 0,
-            points_total REAL DEFAULT 0.0,
-            championships_won INTEGER DEFAULT 0,
-            runner_up_finishes INTEGER DEFAULT 0,
-            constructors_titles INTEGER DEFAULT 0,
-            total_dnfs INTEGER DEFAULT 0,
-            mechanical_dnfs INTEGER DEFAULT 0,
-            crash_dnfs INTEGER DEFAULT 0,
-            win_rate REAL DEFAULT 0.0,
-            podium_rate REAL DEFAULT 0.0,
-            points_per_race_career REAL DEFAULT 0.0,
-            reliability_career REAL DEFAULT 0.0,
-            championship_conversion_rate REAL DEFAULT 0.0,
-            titles_per_top3_season REAL DEFAULT 0.0,
-            last_updated_tick INTEGER NOT NULL
-        )
-    """)
+        # Create indexes for common queries
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_emitted ON events_buffer(emitted_to_narrator)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_tick ON events_buffer(tick)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_entities_team ON entities(team_name)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_entities_free_agent ON entities(is_free_agent)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_job_board_tier ON job_board(tier)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_sponsorships_team ON sponsorships(team_name)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_sponsorships_sponsor_id ON sponsorships(sponsor_id, team_name)")
+    
+        # Indexes for history tables
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_decision_history_tick ON decision_history(tick DESC)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_decision_history_category ON decision_history(category, tick DESC)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_race_results_season ON race_results_archive(season DESC, round_number DESC)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_financial_transactions_tick ON financial_transactions(tick DESC)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_financial_transactions_type ON financial_transactions(type, category, tick DESC)")
+    
+        # Indexes for ML training tables
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_ai_decisions_team ON ai_decisions(team_id, season, tick)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_ai_decisions_tick ON ai_decisions(tick DESC)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_team_outcomes_team ON team_outcomes(team_id, season)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_team_outcomes_success ON team_outcomes(budget_health_score DESC, roi_score DESC)")
+    
+        # ========================================================================
+        # HISTORICAL DATA SYSTEM - Phase 1 Foundation
+        # ========================================================================
+    
+        # I. TEAM HISTORICAL RECORDS
+    
+        # Team career totals (all-time stats)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS team_career_totals (
+                team_name TEXT PRIMARY KEY,
+                seasons_entered INTEGER DEFAULT 0,
+                races_entered INTEGER DEFAULT 0,
+                wins_total INTEGER DEFAULT 0,
+                podiums_total INTEGER DEFAULT 0,
+                poles_total INTEGER DEFAULT 0,
+                fastest_laps_total INTEGER DEFAULT 0,
+                points_total REAL DEFAULT 0.0,
+                championships_won INTEGER DEFAULT 0,
+                runner_up_finishes INTEGER DEFAULT 0,
+                constructors_titles INTEGER DEFAULT 0,
+                total_dnfs INTEGER DEFAULT 0,
+                mechanical_dnfs INTEGER DEFAULT 0,
+                crash_dnfs INTEGER DEFAULT 0,
+                win_rate REAL DEFAULT 0.0,
+                podium_rate REAL DEFAULT 0.0,
+                points_per_race_career REAL DEFAULT 0.0,
+                reliability_career REAL DEFAULT 0.0,
+                championship_conversion_rate REAL DEFAULT 0.0,
+                titles_per_top3_season REAL DEFAULT 0.0,
+                last_updated_tick INTEGER NOT NULL
+            )
+        """)
     
-    # Team era performance
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS regulation_eras (
-            era_id TEXT PRIMARY KEY,
-            era_label TEXT NOT NULL,
-            start_season INTEGER NOT NULL,
-            end_season INTEGER,
-            major_regulation_changes TEXT,
-            description TEXT,
-            created_tick INTEGER NOT NULL
-        )
-    """)
+        # Team era performance
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS regulation_eras (
+                era_id TEXT PRIMARY KEY,
+                era_label TEXT NOT NULL,
+                start_season INTEGER NOT NULL,
+                end_season INTEGER,
+                major_regulation_changes TEXT,
+                description TEXT,
+                created_tick INTEGER NOT NULL
+            )
+        """)
     
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS team_era_performance (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            team_name TEXT NOT NULL,
-            era_id TEXT NOT NULL,
-            era_label TEXT NOT NULL,
-            start_season INTEGER NOT NULL,
-            end_season INTEGER NOT NULL,
-            races_entered INTEGER DEFAULT 0,
-            avg_finish REAL DEFAULT 0.0,
-            avg_cpi REAL DEFAULT 0.0,
-            cpi_percentile REAL DEFAULT 0.0,
-            championships INTEGER DEFAULT 0,
-            wins INTEGER DEFAULT 0,
-            podiums INTEGER DEFAULT 0,
-            performance_vs_previous_era REAL DEFAULT 0.0,
-            decline_after_rule_change REAL DEFAULT 0.0,
-            adaptability_score REAL DEFAULT 50.0,
-            last_updated_tick INTEGER NOT NULL,
-            UNIQUE(team_name, era_id)
-        )
-    """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS team_era_performance (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                team_name TEXT NOT NULL,
+                era_id TEXT NOT NULL,
+                era_label TEXT NOT NULL,
+                start_season INTEGER NOT NULL,
+                end_season INTEGER NOT NULL,
+                races_entered INTEGER DEFAULT 0,
+                avg_finish REAL DEFAULT 0.0,
+                avg_cpi REAL DEFAULT 0.0,
+                cpi_percentile REAL DEFAULT 0.0,
+                championships INTEGER DEFAULT 0,
+                wins INTEGER DEFAULT 0,
+                podiums INTEGER DEFAULT 0,
+                performance_vs_previous_era REAL DEFAULT 0.0,
+                decline_after_rule_change REAL DEFAULT 0.0,
+                adaptability_score REAL DEFAULT 50.0,
+                last_updated_tick INTEGER NOT NULL,
+                UNIQUE(team_name, era_id)
+            )
+        """)
     
-    # Team peak & valley metrics
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS team_peak_valley (
-            team_name TEXT PRIMARY KEY,
-            best_season_finish INTEGER,
-            best_season_finish_year INTEGER,
-            worst_season_finish INTEGER,
-            worst_season_finish_year INTEGER,
-            best_single_season_points REAL DEFAULT 0.0,
-            best_season_points_year INTEGER,
-            worst_season_points REAL DEFAULT 0.0,
-            worst_season_points_year INTEGER,
-            longest_title_drought INTEGER DEFAULT 0,
-            longest_win_drought INTEGER DEFAULT 0,
-            longest_podium_drought INTEGER DEFAULT 0,
-            current_title_drought INTEGER DEFAULT 0,
-            current_win_drought INTEGER DEFAULT 0,
-            current_podium_drought INTEGER DEFAULT 0,
-            biggest_season_overperformance REAL DEFAULT 0.0,
-            biggest_season_collapse REAL DEFAULT 0.0,
-            volatility_index REAL DEFAULT 0.0,
-            golden_era_start INTEGER,
-            golden_era_end INTEGER,
-            golden_era_avg_finish REAL,
-            consecutive_top3_seasons INTEGER DEFAULT 0,
-            last_updated_tick INTEGER NOT NULL
-        )
-    """)
+        # Team peak & valley metrics
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS team_peak_valley (
+                team_name TEXT PRIMARY KEY,
+                best_season_finish INTEGER,
+                best_season_finish_year INTEGER,
+                worst_season_finish INTEGER,
+                worst_season_finish_year INTEGER,
+                best_single_season_points REAL DEFAULT 0.0,
+                best_season_points_year INTEGER,
+                worst_season_points REAL DEFAULT 0.0,
+                worst_season_points_year INTEGER,
+                longest_title_drought INTEGER DEFAULT 0,
+                longest_win_drought INTEGER DEFAULT 0,
+                longest_podium_drought INTEGER DEFAULT 0,
+                current_title_drought INTEGER DEFAULT 0,
+                current_win_drought INTEGER DEFAULT 0,
+                current_podium_drought INTEGER DEFAULT 0,
+                biggest_season_overperformance REAL DEFAULT 0.0,
+                biggest_season_collapse REAL DEFAULT 0.0,
+                volatility_index REAL DEFAULT 0.0,
+                golden_era_start INTEGER,
+                golden_era_end INTEGER,
+                golden_era_avg_finish REAL,
+                consecutive_top3_seasons INTEGER DEFAULT 0,
+                last_updated_tick INTEGER NOT NULL
+            )
+        """)
     
-    # II. DRIVER HISTORICAL ARCHIVES
+        # II. DRIVER HISTORICAL ARCHIVES
     
-    # Driver career stats
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS driver_career_stats (
-            driver_name TEXT PRIMARY KEY,
-            career_starts INTEGER DEFAULT 0,
-            career_wins INTEGER DEFAULT 0,
-            career_podiums INTEGER DEFAULT 0,
-            career_poles INTEGER DEFAULT 0,
-            career_points REAL DEFAULT 0.0,
-            career_dnfs INTEGER DEFAULT 0,
-            career_teams_driven_for INTEGER DEFAULT 0,
-            championships_won INTEGER DEFAULT 0,
-            best_season_finish INTEGER,
-            best_season_finish_year INTEGER,
-            worst_season_finish INTEGER,
-            worst_season_finish_year INTEGER,
-            win_rate_career REAL DEFAULT 0.0,
-            podium_rate_career REAL DEFAULT 0.0,
-            points_per_race_career REAL DEFAULT 0.0,
-            reliability_career REAL DEFAULT 0.0,
-            clutch_index REAL DEFAULT 0.0,
-            debut_season INTEGER,
-            debut_team TEXT,
-            current_team TEXT,
-            seasons_active INTEGER DEFAULT 0,
-            is_retired INTEGER DEFAULT 0,
-            retirement_season INTEGER,
-            last_updated_tick INTEGER NOT NULL
-        )
-    """)
+        # Driver career stats
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS driver_career_stats (
+                driver_name TEXT PRIMARY KEY,
+                career_starts INTEGER DEFAULT 0,
+                career_wins INTEGER DEFAULT 0,
+                career_podiums INTEGER DEFAULT 0,
+                career_poles INTEGER DEFAULT 0,
+                career_points REAL DEFAULT 0.0,
+                career_dnfs INTEGER DEFAULT 0,
+                career_teams_driven_for INTEGER DEFAULT 0,
+                championships_won INTEGER DEFAULT 0,
+                best_season_finish INTEGER,
+                best_season_finish_year INTEGER,
+                worst_season_finish INTEGER,
+                worst_season_finish_year INTEGER,
+                win_rate_career REAL DEFAULT 0.0,
+                podium_rate_career REAL DEFAULT 0.0,
+                points_per_race_career REAL DEFAULT 0.0,
+                reliability_career REAL DEFAULT 0.0,
+                clutch_index REAL DEFAULT 0.0,
+                debut_season INTEGER,
+                debut_team TEXT,
+                current_team TEXT,
+                seasons_active INTEGER DEFAULT 0,
+                is_retired INTEGER DEFAULT 0,
+                retirement_season INTEGER,
+                last_updated_tick INTEGER NOT NULL
+            )
+        """)
     
-    # Driver team stints
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS driver_team_stints (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            driver_name TEXT NOT NULL,
-            team_name TEXT NOT NULL,
-            start_season INTEGER NOT NULL,
-            end_season INTEGER,
-            races INTEGER DEFAULT 0,
-            wins INTEGER DEFAULT 0,
-            podiums INTEGER DEFAULT 0,
-            points REAL DEFAULT 0.0,
-            years_at_team INTEGER DEFAULT 0,
-            teammate_name TEXT,
-            performance_delta_vs_teammate REAL DEFAULT 0.0,
-            teammate_comparison_index REAL DEFAULT 0.0,
-            quali_head_to_head_wins INTEGER DEFAULT 0,
-            quali_head_to_head_losses INTEGER DEFAULT 0,
-            race_head_to_head_wins INTEGER DEFAULT 0,
-            race_head_to_head_losses INTEGER DEFAULT 0,
-            last_updated_tick INTEGER NOT NULL,
-            UNIQUE(driver_name, team_name, start_season)
-        )
-    """)
+        # Driver team stints
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS driver_team_stints (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                driver_name TEXT NOT NULL,
+                team_name TEXT NOT NULL,
+                start_season INTEGER NOT NULL,
+                end_season INTEGER,
+                races INTEGER DEFAULT 0,
+                wins INTEGER DEFAULT 0,
+                podiums INTEGER DEFAULT 0,
+                points REAL DEFAULT 0.0,
+                years_at_team INTEGER DEFAULT 0,
+                teammate_name TEXT,
+                performance_delta_vs_teammate REAL DEFAULT 0.0,
+                teammate_comparison_index REAL DEFAULT 0.0,
+                quali_head_to_head_wins INTEGER DEFAULT 0,
+                quali_head_to_head_losses INTEGER DEFAULT 0,
+                race_head_to_head_wins INTEGER DEFAULT 0,
+                race_head_to_head_losses INTEGER DEFAULT 0,
+                last_updated_tick INTEGER NOT NULL,
+                UNIQUE(driver_name, team_name, start_season)
+            )
+        """)
     
-    # Driver development curve
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS driver_development_curve (
-            driver_name TEXT PRIMARY KEY,
-            peak_rating REAL DEFAULT 0.0,
-            peak_rating_age INTEGER,
-            peak_performance_season INTEGER,
-            peak_performance_metric REAL DEFAULT 0.0,
-            age_curve_json TEXT,
-            mettle_under_pressure_index REAL DEFAULT 0.0,
-            performance_when_championship_close REAL DEFAULT 0.0,
-            post_crash_recovery_performance REAL DEFAULT 0.0,
-            improvement_rate REAL DEFAULT 0.0,
-            consistency_index REAL DEFAULT 0.0,
-            volatility_score REAL DEFAULT 0.0,
-            last_updated_tick INTEGER NOT NULL
-        )
-    """)
+        # Driver development curve
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS driver_development_curve (
+                driver_name TEXT PRIMARY KEY,
+                peak_rating REAL DEFAULT 0.0,
+                peak_rating_age INTEGER,
+                peak_performance_season INTEGER,
+                peak_performance_metric REAL DEFAULT 0.0,
+                age_curve_json TEXT,
+                mettle_under_pressure_index REAL DEFAULT 0.0,
+                performance_when_championship_close REAL DEFAULT 0.0,
+                post_crash_recovery_performance REAL DEFAULT 0.0,
+                improvement_rate REAL DEFAULT 0.0,
+                consistency_index REAL DEFAULT 0.0,
+                volatility_score REAL DEFAULT 0.0,
+                last_updated_tick INTEGER NOT NULL
+            )
+        """)
     
-    # III. LEAGUE & CHAMPIONSHIP HISTORY
+        # III. LEAGUE & CHAMPIONSHIP HISTORY
     
-    # Championship history
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS championship_history (
-            season INTEGER NOT NULL,
-            league_id TEXT NOT NULL,
-            tier INTEGER NOT NULL,
-            champion_team TEXT NOT NULL,
-            champion_points REAL NOT NULL,
-            runner_up_team TEXT NOT NULL,
-            runner_up_points REAL NOT NULL,
-            third_place_team TEXT NOT NULL,
-            third_place_points REAL NOT NULL,
-            title_margin REAL NOT NULL,
-            title_decided_round INTEGER,
-            avg_points_to_win REAL DEFAULT 0.0,
-            most_dominant_season REAL DEFAULT 0.0,
-            closest_title_fight REAL DEFAULT 0.0,
-            is_repeat_champion INTEGER DEFAULT 0,
-            consecutive_titles_for_winner INTEGER DEFAULT 0,
-            parity_index REAL DEFAULT 0.0,
-            championship_compression_score REAL DEFAULT 0.0,
-            last_updated_tick INTEGER NOT NULL,
-            PRIMARY KEY (season, league_id)
-        )
-    """)
+        # Championship history
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS championship_history (
+                season INTEGER NOT NULL,
+                league_id TEXT NOT NULL,
+                tier INTEGER NOT NULL,
+                champion_team TEXT NOT NULL,
+                champion_points REAL NOT NULL,
+                runner_up_team TEXT NOT NULL,
+                runner_up_points REAL NOT NULL,
+                third_place_team TEXT NOT NULL,
+                third_place_points REAL NOT NULL,
+                title_margin REAL NOT NULL,
+                title_decided_round INTEGER,
+                avg_points_to_win REAL DEFAULT 0.0,
+                most_dominant_season REAL DEFAULT 0.0,
+                closest_title_fight REAL DEFAULT 0.0,
+                is_repeat_champion INTEGER DEFAULT 0,
+                consecutive_titles_for_winner INTEGER DEFAULT 0,
+                parity_index REAL DEFAULT 0.0,
+                championship_compression_score REAL DEFAULT 0.0,
+                last_updated_tick INTEGER NOT NULL,
+                PRIMARY KEY (season, league_id)
+            )
+        """)
     
-    # Tier definitions and history
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS tier_definitions (
-            season INTEGER NOT NULL,
-            performance_tier TEXT NOT NULL,
-            min_percentile REAL NOT NULL,
-            max_percentile REAL NOT NULL,
-            PRIMARY KEY (season, performance_tier)
-        )
-    """)
+        # Tier definitions and history
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS tier_definitions (
+                season INTEGER NOT NULL,
+                performance_tier TEXT NOT NULL,
+                min_percentile REAL NOT NULL,
+                max_percentile REAL NOT NULL,
+                PRIMARY KEY (season, performance_tier)
+            )
+        """)
     
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS team_tier_history (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            team_name TEXT NOT NULL,
-            season INTEGER NOT NULL,
-            tier INTEGER NOT NULL,
-            performance_tier TEXT NOT NULL,
-            tier_percentile REAL DEFAULT 0.0,
-            seasons_in_tier INTEGER DEFAULT 0,
-            total_seasons_in_tier INTEGER DEFAULT 0,
-            promoted_from_tier INTEGER,
-            relegated_from_tier INTEGER,
-            tier_change_reason TEXT,
-            last_updated_tick INTEGER NOT NULL,
-            UNIQUE(team_name, season)
-        )
-    """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS team_tier_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                team_name TEXT NOT NULL,
+                season INTEGER NOT NULL,
+                tier INTEGER NOT NULL,
+                performance_tier TEXT NOT NULL,
+                tier_percentile REAL DEFAULT 0.0,
+                seasons_in_tier INTEGER DEFAULT 0,
+                total_seasons_in_tier INTEGER DEFAULT 0,
+                promoted_from_tier INTEGER,
+                relegated_from_tier INTEGER,
+                tier_change_reason TEXT,
+                last_updated_tick INTEGER NOT NULL,
+                UNIQUE(team_name, season)
+            )
+        """)
     
-    # IV. STREAK TRACKING
+        # IV. STREAK TRACKING
     
-    # Active team streaks
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS active_streaks (
-            team_name TEXT PRIMARY KEY,
-            current_points_streak INTEGER DEFAULT 0,
-            current_podium_streak INTEGER DEFAULT 0,
-            current_dnf_streak INTEGER DEFAULT 0,
-            current_win_streak INTEGER DEFAULT 0,
-            consecutive_points_finishes INTEGER DEFAULT 0,
-            consecutive_outqualified_teammate INTEGER DEFAULT 0,
-            consecutive_mechanical_failures INTEGER DEFAULT 0,
-            consecutive_top5_finishes INTEGER DEFAULT 0,
-            consecutive_outside_top10 INTEGER DEFAULT 0,
-            longest_points_streak_ever INTEGER DEFAULT 0,
-            longest_win_streak_ever INTEGER DEFAULT 0,
-            longest_dnf_streak_ever INTEGER DEFAULT 0,
-            longest_podium_streak_ever INTEGER DEFAULT 0,
-            last_points_finish_race TEXT,
-            last_points_finish_season INTEGER,
-            last_podium_race TEXT,
-            last_podium_season INTEGER,
-            last_win_race TEXT,
-            last_win_season INTEGER,
-            last_dnf_race TEXT,
-            last_dnf_season INTEGER,
-            last_updated_tick INTEGER NOT NULL
-        )
-    """)
+        # Active team streaks
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS active_streaks (
+                team_name TEXT PRIMARY KEY,
+                current_points_streak INTEGER DEFAULT 0,
+                current_podium_streak INTEGER DEFAULT 0,
+                current_dnf_streak INTEGER DEFAULT 0,
+                current_win_streak INTEGER DEFAULT 0,
+                consecutive_points_finishes INTEGER DEFAULT 0,
+                consecutive_outqualified_teammate INTEGER DEFAULT 0,
+                consecutive_mechanical_failures INTEGER DEFAULT 0,
+                consecutive_top5_finishes INTEGER DEFAULT 0,
+                consecutive_outside_top10 INTEGER DEFAULT 0,
+                longest_points_streak_ever INTEGER DEFAULT 0,
+                longest_win_streak_ever INTEGER DEFAULT 0,
+                longest_dnf_streak_ever INTEGER DEFAULT 0,
+                longest_podium_streak_ever INTEGER DEFAULT 0,
+                last_points_finish_race TEXT,
+                last_points_finish_season INTEGER,
+                last_podium_race TEXT,
+                last_podium_season INTEGER,
+                last_win_race TEXT,
+                last_win_season INTEGER,
+                last_dnf_race TEXT,
+                last_dnf_season INTEGER,
+                last_updated_tick INTEGER NOT NULL
+            )
+        """)
     
-    # Active driver streaks
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS driver_active_streaks (
-            driver_name TEXT PRIMARY KEY,
-            current_points_streak INTEGER DEFAULT 0,
-            current_podium_streak INTEGER DEFAULT 0,
-            current_dnf_streak INTEGER DEFAULT 0,
-            current_win_streak INTEGER DEFAULT 0,
-            consecutive_outqualified_teammate INTEGER DEFAULT 0,
-            longest_points_streak_ever INTEGER DEFAULT 0,
-            longest_win_streak_ever INTEGER DEFAULT 0,
-            longest_podium_streak_ever INTEGER DEFAULT 0,
-            last_updated_tick INTEGER NOT NULL
-        )
-    """)
+        # Active driver streaks
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS driver_active_streaks (
+                driver_name TEXT PRIMARY KEY,
+                current_points_streak INTEGER DEFAULT 0,
+                current_podium_streak INTEGER DEFAULT 0,
+                current_dnf_streak INTEGER DEFAULT 0,
+                current_win_streak INTEGER DEFAULT 0,
+                consecutive_outqualified_teammate INTEGER DEFAULT 0,
+                longest_points_streak_ever INTEGER DEFAULT 0,
+                longest_win_streak_ever INTEGER DEFAULT 0,
+                longest_podium_streak_ever INTEGER DEFAULT 0,
+                last_updated_tick INTEGER NOT NULL
+            )
+        """)
     
-    # V. COMPOSITE METRICS
+        # V. COMPOSITE METRICS
     
-    # Team pulse metrics
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS team_pulse_metrics (
-            team_name TEXT PRIMARY KEY,
-            team_pulse REAL DEFAULT 50.0,
-            performance_trend_component REAL DEFAULT 0.0,
-            financial_stability_component REAL DEFAULT 0.0,
-            development_speed_component REAL DEFAULT 0.0,
-            league_percentile_component REAL DEFAULT 0.0,
-            competitive_tier TEXT DEFAULT 'midfield',
-            narrative_temperature TEXT DEFAULT 'stable',
-            last_updated_tick INTEGER NOT NULL
-        )
-    """)
+        # Team pulse metrics
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS team_pulse_metrics (
+                team_name TEXT PRIMARY KEY,
+                team_pulse REAL DEFAULT 50.0,
+                performance_trend_component REAL DEFAULT 0.0,
+                financial_stability_component REAL DEFAULT 0.0,
+                development_speed_component REAL DEFAULT 0.0,
+                league_percentile_component REAL DEFAULT 0.0,
+                competitive_tier TEXT DEFAULT 'midfield',
+                narrative_temperature TEXT DEFAULT 'stable',
+                last_updated_tick INTEGER NOT NULL
+            )
+        """)
     
-    # Team prestige
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS team_prestige (
-            team_name TEXT PRIMARY KEY,
-            prestige_index REAL DEFAULT 50.0,
-            championship_prestige REAL DEFAULT 0.0,
-            wins_prestige REAL DEFAULT 0.0,
-            longevity_prestige REAL DEFAULT 0.0,
-            era_dominance_prestige REAL DEFAULT 0.0,
-            financial_resilience_prestige REAL DEFAULT 0.0,
-            legacy_tier TEXT DEFAULT 'emerging',
-            last_updated_tick INTEGER NOT NULL
-        )
-    """)
+        # Team prestige
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS team_prestige (
+                team_name TEXT PRIMARY KEY,
+                prestige_index REAL DEFAULT 50.0,
+                championship_prestige REAL DEFAULT 0.0,
+                wins_prestige REAL DEFAULT 0.0,
+                longevity_prestige REAL DEFAULT 0.0,
+                era_dominance_prestige REAL DEFAULT 0.0,
+                financial_resilience_prestige REAL DEFAULT 0.0,
+                legacy_tier TEXT DEFAULT 'emerging',
+                last_updated_tick INTEGER NOT NULL
+            )
+        """)
     
-    # Driver legacy
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS driver_legacy (
-            driver_name TEXT PRIMARY KEY,
-            legacy_score REAL DEFAULT 50.0,
-            titles_legacy REAL DEFAULT 0.0,
-            win_rate_legacy REAL DEFAULT 0.0,
-            teammate_dominance_legacy REAL DEFAULT 0.0,
-            clutch_index_legacy REAL DEFAULT 0.0,
-            peak_rating_legacy REAL DEFAULT 0.0,
-            longevity_legacy REAL DEFAULT 0.0,
-            legacy_tier TEXT DEFAULT 'developing',
-            last_updated_tick INTEGER NOT NULL
-        )
-    """)
+        # Driver legacy
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS driver_legacy (
+                driver_name TEXT PRIMARY KEY,
+                legacy_score REAL DEFAULT 50.0,
+                titles_legacy REAL DEFAULT 0.0,
+                win_rate_legacy REAL DEFAULT 0.0,
+                teammate_dominance_legacy REAL DEFAULT 0.0,
+                clutch_index_legacy REAL DEFAULT 0.0,
+                peak_rating_legacy REAL DEFAULT 0.0,
+                longevity_legacy REAL DEFAULT 0.0,
+                legacy_tier TEXT DEFAULT 'developing',
+                last_updated_tick INTEGER NOT NULL
+            )
+        """)
     
-    # VI. EXPECTATION MODELS
+        # VI. EXPECTATION MODELS
     
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS expectation_models (
-            team_name TEXT NOT NULL,
-            season INTEGER NOT NULL,
-            round_number INTEGER NOT NULL,
-            expected_finish REAL DEFAULT 0.0,
-            actual_finish INTEGER,
-            expectation_gap REAL DEFAULT 0.0,
-            historical_baseline_finish REAL DEFAULT 0.0,
-            regression_to_mean_indicator REAL DEFAULT 0.0,
-            sustainable_performance_score REAL DEFAULT 0.0,
-            overachieving_vs_history_index REAL DEFAULT 0.0,
-            strongest_start_comparison TEXT,
-            performance_vs_career_avg REAL DEFAULT 0.0,
-            created_tick INTEGER NOT NULL,
-            PRIMARY KEY (team_name, season, round_number)
-        )
-    """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS expectation_models (
+                team_name TEXT NOT NULL,
+                season INTEGER NOT NULL,
+                round_number INTEGER NOT NULL,
+                expected_finish REAL DEFAULT 0.0,
+                actual_finish INTEGER,
+                expectation_gap REAL DEFAULT 0.0,
+                historical_baseline_finish REAL DEFAULT 0.0,
+                regression_to_mean_indicator REAL DEFAULT 0.0,
+                sustainable_performance_score REAL DEFAULT 0.0,
+                overachieving_vs_history_index REAL DEFAULT 0.0,
+                strongest_start_comparison TEXT,
+                performance_vs_career_avg REAL DEFAULT 0.0,
+                created_tick INTEGER NOT NULL,
+                PRIMARY KEY (team_name, season, round_number)
+            )
+        """)
     
-    # VII. TIME-BASED METRICS
+        # VII. TIME-BASED METRICS
     
-    # Momentum metrics
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS momentum_metrics (
-            team_name TEXT PRIMARY KEY,
-            form_last_3_races REAL DEFAULT 0.0,
-            form_last_5_races REAL DEFAULT 0.0,
-            momentum_slope REAL DEFAULT 0.0,
-            momentum_state TEXT DEFAULT 'stable',
-            last_updated_tick INTEGER NOT NULL
-        )
-    """)
+        # Momentum metrics
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS momentum_metrics (
+                team_name TEXT PRIMARY KEY,
+                form_last_3_races REAL DEFAULT 0.0,
+                form_last_5_races REAL DEFAULT 0.0,
+                momentum_slope REAL DEFAULT 0.0,
+                momentum_state TEXT DEFAULT 'stable',
+                last_updated_tick INTEGER NOT NULL
+            )
+        """)
     
-    # Narrative heat scores
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS narrative_heat_scores (
-            team_name TEXT NOT NULL,
-            story_type TEXT NOT NULL,
-            heat_score REAL DEFAULT 0.0,
-            peak_heat REAL DEFAULT 0.0,
-            decay_rate REAL DEFAULT 5.0,
-            story_start_tick INTEGER NOT NULL,
-            last_boosted_tick INTEGER NOT NULL,
-            days_since_last_boost INTEGER DEFAULT 0,
-            story_description TEXT,
-            key_players TEXT,
-            PRIMARY KEY (team_name, story_type)
-        )
-    """)
+        # Narrative heat scores
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS narrative_heat_scores (
+                team_name TEXT NOT NULL,
+                story_type TEXT NOT NULL,
+                heat_score REAL DEFAULT 0.0,
+                peak_heat REAL DEFAULT 0.0,
+                decay_rate REAL DEFAULT 5.0,
+                story_start_tick INTEGER NOT NULL,
+                last_boosted_tick INTEGER NOT NULL,
+                days_since_last_boost INTEGER DEFAULT 0,
+                story_description TEXT,
+                key_players TEXT,
+                PRIMARY KEY (team_name, story_type)
+            )
+        """)
     
-    # VIII. HISTORICAL INDEXES
-    
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_team_career_championships ON team_career_totals(championships_won DESC)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_team_career_wins ON team_career_totals(wins_total DESC)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_era_performance_team ON team_era_performance(team_name)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_era_performance_era ON team_era_performance(era_id)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_driver_career_championships ON driver_career_stats(championships_won DESC)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_driver_career_wins ON driver_career_stats(career_wins DESC)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_driver_stints_driver ON driver_team_stints(driver_name)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_driver_stints_team ON driver_team_stints(team_name)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_championship_history_season ON championship_history(season)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_championship_history_champion ON championship_history(champion_team)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_team_tier_history_team ON team_tier_history(team_name)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_team_tier_history_season ON team_tier_history(season)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_expectation_team_season ON expectation_models(team_name, season)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_narrative_heat_team ON narrative_heat_scores(team_name)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_narrative_heat_score ON narrative_heat_scores(heat_score DESC)")
-    
-    # Initialize default tier definitions
-    cursor.execute("""
-        INSERT OR IGNORE INTO tier_definitions (season, performance_tier, min_percentile, max_percentile) VALUES
-        (0, 'dominant', 0.0, 5.0),
-        (0, 'contender', 5.0, 20.0),
-        (0, 'upper_midfield', 20.0, 40.0),
-        (0, 'midfield', 40.0, 60.0),
-        (0, 'lower_midfield', 60.0, 80.0),
-        (0, 'backmarker', 80.0, 95.0),
-        (0, 'crisis', 95.0, 100.0)
-    """)
+        # VIII. HISTORICAL INDEXES
+    
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_team_career_championships ON team_career_totals(championships_won DESC)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_team_career_wins ON team_career_totals(wins_total DESC)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_era_performance_team ON team_era_performance(team_name)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_era_performance_era ON team_era_performance(era_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_driver_career_championships ON driver_career_stats(championships_won DESC)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_driver_career_wins ON driver_career_stats(career_wins DESC)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_driver_stints_driver ON driver_team_stints(driver_name)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_driver_stints_team ON driver_team_stints(team_name)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_championship_history_season ON championship_history(season)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_championship_history_champion ON championship_history(champion_team)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_team_tier_history_team ON team_tier_history(team_name)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_team_tier_history_season ON team_tier_history(season)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_expectation_team_season ON expectation_models(team_name, season)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_narrative_heat_team ON narrative_heat_scores(team_name)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_narrative_heat_score ON narrative_heat_scores(heat_score DESC)")
+    
+        # Initialize default tier definitions
+        cursor.execute("""
+            INSERT OR IGNORE INTO tier_definitions (season, performance_tier, min_percentile, max_percentile) VALUES
+            (0, 'dominant', 0.0, 5.0),
+            (0, 'contender', 5.0, 20.0),
+            (0, 'upper_midfield', 20.0, 40.0),
+            (0, 'midfield', 40.0, 60.0),
+            (0, 'lower_midfield', 60.0, 80.0),
+            (0, 'backmarker', 80.0, 95.0),
+            (0, 'crisis', 95.0, 100.0)
+        """)
     
-    # Generic key-value store for streaming state (race day, etc.)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS game_state_kv (
-            game_id TEXT NOT NULL,
-            key TEXT NOT NULL,
-            value TEXT,
-            updated_ts REAL,
-            PRIMARY KEY (game_id, key)
-        )
-    """)
+        # Generic key-value store for streaming state (race day, etc.)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS game_state_kv (
+                game_id TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT,
+                updated_ts REAL,
+                PRIMARY KEY (game_id, key)
+            )
+        """)
     
-    conn.commit()
-    conn.close()
     
     print(f"[FTB State DB] Initialized database at {db_path}")
     
@@ -913,162 +1315,161 @@ def migrate_history_tables(db_path: str) -> None:
     Args:
         db_path: Path to SQLite database file
     """
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    with get_connection(db_path) as conn:
+        cursor = conn.cursor()
     
-    try:
-        # Check if history tables exist
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        existing_tables = {row[0] for row in cursor.fetchall()}
+        try:
+            # Check if history tables exist
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+            existing_tables = {row[0] for row in cursor.fetchall()}
         
-        # Add decision_history if missing
-        if 'decision_history' not in existing_tables:
-            print("[FTB State DB] Creating decision_history table...")
-            cursor.execute("""
-                CREATE TABLE decision_history (
-                    decision_id TEXT PRIMARY KEY,
-                    tick INTEGER NOT NULL,
-                    season INTEGER NOT NULL,
-                    game_day INTEGER NOT NULL,
-                    category TEXT NOT NULL,
-                    decision_text TEXT NOT NULL,
-                    options_json TEXT NOT NULL,
-                    chosen_option_id TEXT,
-                    chosen_option_label TEXT,
-                    immediate_cost REAL DEFAULT 0.0,
-                    rationale TEXT,
-                    resolved_by TEXT,
-                    metadata_json TEXT
-                )
-            """)
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_decision_history_tick ON decision_history(tick DESC)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_decision_history_category ON decision_history(category, tick DESC)")
+            # Add decision_history if missing
+            if 'decision_history' not in existing_tables:
+                print("[FTB State DB] Creating decision_history table...")
+                cursor.execute("""
+                    CREATE TABLE decision_history (
+                        decision_id TEXT PRIMARY KEY,
+                        tick INTEGER NOT NULL,
+                        season INTEGER NOT NULL,
+                        game_day INTEGER NOT NULL,
+                        category TEXT NOT NULL,
+                        decision_text TEXT NOT NULL,
+                        options_json TEXT NOT NULL,
+                        chosen_option_id TEXT,
+                        chosen_option_label TEXT,
+                        immediate_cost REAL DEFAULT 0.0,
+                        rationale TEXT,
+                        resolved_by TEXT,
+                        metadata_json TEXT
+                    )
+                """)
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_decision_history_tick ON decision_history(tick DESC)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_decision_history_category ON decision_history(category, tick DESC)")
         
-        # Add race_results_archive if missing
-        if 'race_results_archive' not in existing_tables:
-            print("[FTB State DB] Creating race_results_archive table...")
-            cursor.execute("""
-                CREATE TABLE race_results_archive (
-                    race_id TEXT PRIMARY KEY,
-                    season INTEGER NOT NULL,
-                    round_number INTEGER NOT NULL,
-                    league_id TEXT NOT NULL,
-                    track_name TEXT NOT NULL,
-                    tick INTEGER NOT NULL,
-                    player_team_name TEXT NOT NULL,
-                    player_drivers_json TEXT NOT NULL,
-                    finish_positions_json TEXT NOT NULL,
-                    grid_position INTEGER,
-                    prize_money REAL DEFAULT 0.0,
-                    fastest_lap_holder TEXT,
-                    incidents_json TEXT,
-                    championship_position_after INTEGER,
-                    points_after REAL,
-                    metadata_json TEXT
-                )
-            """)
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_race_results_season ON race_results_archive(season DESC, round_number DESC)")
+            # Add race_results_archive if missing
+            if 'race_results_archive' not in existing_tables:
+                print("[FTB State DB] Creating race_results_archive table...")
+                cursor.execute("""
+                    CREATE TABLE race_results_archive (
+                        race_id TEXT PRIMARY KEY,
+                        season INTEGER NOT NULL,
+                        round_number INTEGER NOT NULL,
+                        league_id TEXT NOT NULL,
+                        track_name TEXT NOT NULL,
+                        tick INTEGER NOT NULL,
+                        player_team_name TEXT NOT NULL,
+                        player_drivers_json TEXT NOT NULL,
+                        finish_positions_json TEXT NOT NULL,
+                        grid_position INTEGER,
+                        prize_money REAL DEFAULT 0.0,
+                        fastest_lap_holder TEXT,
+                        incidents_json TEXT,
+                        championship_position_after INTEGER,
+                        points_after REAL,
+                        metadata_json TEXT
+                    )
+                """)
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_race_results_season ON race_results_archive(season DESC, round_number DESC)")
         
-        # Add financial_transactions if missing
-        if 'financial_transactions' not in existing_tables:
-            print("[FTB State DB] Creating financial_transactions table...")
-            cursor.execute("""
-                CREATE TABLE financial_transactions (
-                    transaction_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    tick INTEGER NOT NULL,
-                    season INTEGER NOT NULL,
-                    game_day INTEGER NOT NULL,
-                    type TEXT NOT NULL,
-                    category TEXT NOT NULL,
-                    amount REAL NOT NULL,
-                    balance_after REAL NOT NULL,
-                    description TEXT NOT NULL,
-                    related_entity TEXT,
-                    metadata_json TEXT
-                )
-            """)
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_financial_transactions_tick ON financial_transactions(tick DESC)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_financial_transactions_type ON financial_transactions(type, category, tick DESC)")
+            # Add financial_transactions if missing
+            if 'financial_transactions' not in existing_tables:
+                print("[FTB State DB] Creating financial_transactions table...")
+                cursor.execute("""
+                    CREATE TABLE financial_transactions (
+                        transaction_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        tick INTEGER NOT NULL,
+                        season INTEGER NOT NULL,
+                        game_day INTEGER NOT NULL,
+                        type TEXT NOT NULL,
+                        category TEXT NOT NULL,
+                        amount REAL NOT NULL,
+                        balance_after REAL NOT NULL,
+                        description TEXT NOT NULL,
+                        related_entity TEXT,
+                        metadata_json TEXT
+                    )
+                """)
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_financial_transactions_tick ON financial_transactions(tick DESC)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_financial_transactions_type ON financial_transactions(type, category, tick DESC)")
         
-        # Add season_summaries if missing
-        if 'season_summaries' not in existing_tables:
-            print("[FTB State DB] Creating season_summaries table...")
-            cursor.execute("""
-                CREATE TABLE season_summaries (
-                    season INTEGER PRIMARY KEY,
-                    team_name TEXT NOT NULL,
-                    tier TEXT NOT NULL,
-                    league_id TEXT NOT NULL,
-                    championship_position INTEGER,
-                    total_points REAL DEFAULT 0.0,
-                    races_entered INTEGER DEFAULT 0,
-                    wins INTEGER DEFAULT 0,
-                    podiums INTEGER DEFAULT 0,
-                    poles INTEGER DEFAULT 0,
-                    season_prize_money REAL DEFAULT 0.0,
-                    season_sponsor_income REAL DEFAULT 0.0,
-                    season_expenses REAL DEFAULT 0.0,
-                    starting_balance REAL DEFAULT 0.0,
-                    ending_balance REAL DEFAULT 0.0,
-                    promoted INTEGER DEFAULT 0,
-                    relegated INTEGER DEFAULT 0,
-                    metadata_json TEXT
-                )
-            """)
+            # Add season_summaries if missing
+            if 'season_summaries' not in existing_tables:
+                print("[FTB State DB] Creating season_summaries table...")
+                cursor.execute("""
+                    CREATE TABLE season_summaries (
+                        season INTEGER PRIMARY KEY,
+                        team_name TEXT NOT NULL,
+                        tier TEXT NOT NULL,
+                        league_id TEXT NOT NULL,
+                        championship_position INTEGER,
+                        total_points REAL DEFAULT 0.0,
+                        races_entered INTEGER DEFAULT 0,
+                        wins INTEGER DEFAULT 0,
+                        podiums INTEGER DEFAULT 0,
+                        poles INTEGER DEFAULT 0,
+                        season_prize_money REAL DEFAULT 0.0,
+                        season_sponsor_income REAL DEFAULT 0.0,
+                        season_expenses REAL DEFAULT 0.0,
+                        starting_balance REAL DEFAULT 0.0,
+                        ending_balance REAL DEFAULT 0.0,
+                        promoted INTEGER DEFAULT 0,
+                        relegated INTEGER DEFAULT 0,
+                        metadata_json TEXT
+                    )
+                """)
         
-        # ML TRAINING: Add ai_decisions table if missing
-        if 'ai_decisions' not in existing_tables:
-            print("[FTB State DB] Creating ai_decisions table for ML training...")
-            cursor.execute("""
-                CREATE TABLE ai_decisions (
-                    decision_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    tick INTEGER NOT NULL,
-                    season INTEGER NOT NULL,
-                    team_id TEXT NOT NULL,
-                    team_name TEXT NOT NULL,
-                    state_vector_json TEXT NOT NULL,
-                    action_chosen_json TEXT NOT NULL,
-                    action_scores_json TEXT,
-                    principal_stats_json TEXT NOT NULL,
-                    budget_before REAL NOT NULL,
-                    budget_after REAL NOT NULL,
-                    championship_position INTEGER,
-                    created_ts REAL NOT NULL
-                )
-            """)
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_ai_decisions_team ON ai_decisions(team_id, season, tick)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_ai_decisions_tick ON ai_decisions(tick DESC)")
+            # ML TRAINING: Add ai_decisions table if missing
+            if 'ai_decisions' not in existing_tables:
+                print("[FTB State DB] Creating ai_decisions table for ML training...")
+                cursor.execute("""
+                    CREATE TABLE ai_decisions (
+                        decision_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        tick INTEGER NOT NULL,
+                        season INTEGER NOT NULL,
+                        team_id TEXT NOT NULL,
+                        team_name TEXT NOT NULL,
+                        state_vector_json TEXT NOT NULL,
+                        action_chosen_json TEXT NOT NULL,
+                        action_scores_json TEXT,
+                        principal_stats_json TEXT NOT NULL,
+                        budget_before REAL NOT NULL,
+                        budget_after REAL NOT NULL,
+                        championship_position INTEGER,
+                        created_ts REAL NOT NULL
+                    )
+                """)
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_ai_decisions_team ON ai_decisions(team_id, season, tick)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_ai_decisions_tick ON ai_decisions(tick DESC)")
         
-        # ML TRAINING: Add team_outcomes table if missing
-        if 'team_outcomes' not in existing_tables:
-            print("[FTB State DB] Creating team_outcomes table for ML training...")
-            cursor.execute("""
-                CREATE TABLE team_outcomes (
-                    outcome_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    team_id TEXT NOT NULL,
-                    team_name TEXT NOT NULL,
-                    season INTEGER NOT NULL,
-                    championship_position INTEGER NOT NULL,
-                    total_points REAL DEFAULT 0.0,
-                    starting_budget REAL NOT NULL,
-                    ending_budget REAL NOT NULL,
-                    budget_health_score REAL DEFAULT 0.0,
-                    roi_score REAL DEFAULT 0.0,
-                    survival_flag INTEGER DEFAULT 1,
-                    folded_tick INTEGER,
-                    seasons_survived INTEGER DEFAULT 1,
-                    created_ts REAL NOT NULL
-                )
-            """)
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_team_outcomes_team ON team_outcomes(team_id, season)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_team_outcomes_success ON team_outcomes(budget_health_score DESC, roi_score DESC)")
+            # ML TRAINING: Add team_outcomes table if missing
+            if 'team_outcomes' not in existing_tables:
+                print("[FTB State DB] Creating team_outcomes table for ML training...")
+                cursor.execute("""
+                    CREATE TABLE team_outcomes (
+                        outcome_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        team_id TEXT NOT NULL,
+                        team_name TEXT NOT NULL,
+                        season INTEGER NOT NULL,
+                        championship_position INTEGER NOT NULL,
+                        total_points REAL DEFAULT 0.0,
+                        starting_budget REAL NOT NULL,
+                        ending_budget REAL NOT NULL,
+                        budget_health_score REAL DEFAULT 0.0,
+                        roi_score REAL DEFAULT 0.0,
+                        survival_flag INTEGER DEFAULT 1,
+                        folded_tick INTEGER,
+                        seasons_survived INTEGER DEFAULT 1,
+                        created_ts REAL NOT NULL
+                    )
+                """)
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_team_outcomes_team ON team_outcomes(team_id, season)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_team_outcomes_success ON team_outcomes(budget_health_score DESC, roi_score DESC)")
         
-        conn.commit()
-        print("[FTB State DB] History tables migration complete")
-    except Exception as e:
-        print(f"[FTB State DB] Warning: Could not migrate history tables: {e}")
-    finally:
-        conn.close()
+            conn.commit()
+            print("[FTB State DB] History tables migration complete")
+        except Exception as e:
+            print(f"[FTB State DB] Warning: Could not migrate history tables: {e}")
+            conn.rollback()
 
 
 def migrate_narrator_context_schema(db_path: str) -> None:
@@ -1079,44 +1480,43 @@ def migrate_narrator_context_schema(db_path: str) -> None:
     Args:
         db_path: Path to SQLite database file
     """
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    with get_connection(db_path) as conn:
+        cursor = conn.cursor()
     
-    try:
-        # Get current columns
-        cursor.execute("PRAGMA table_info(narrator_context)")
-        existing_columns = {row[1] for row in cursor.fetchall()}
-        
-        # Define new columns with their types and defaults
-        new_columns = {
-            'player_team': "TEXT",
-            'current_motif': "TEXT DEFAULT 'quiet climb'",
-            'open_loop': "TEXT DEFAULT ''",
-            'named_focus': "TEXT DEFAULT ''",
-            'stakes_axis': "TEXT DEFAULT 'budget'",
-            'tone': "TEXT DEFAULT 'wry'",
-            'last_generated_spine': "TEXT DEFAULT ''",
-            'last_generated_beat': "TEXT DEFAULT ''",
-            'claim_tags_json': "TEXT DEFAULT '[]'",
-            'segments_since_motif_change': "INTEGER DEFAULT 0"
-        }
+        try:
+            # Get current columns
+            cursor.execute("PRAGMA table_info(narrator_context)")
+            existing_columns = {row[1] for row in cursor.fetchall()}
+        
+            # Define new columns with their types and defaults
+            new_columns = {
+                'player_team': "TEXT",
+                'current_motif': "TEXT DEFAULT 'quiet climb'",
+                'open_loop': "TEXT DEFAULT ''",
+                'named_focus': "TEXT DEFAULT ''",
+                'stakes_axis': "TEXT DEFAULT 'budget'",
+                'tone': "TEXT DEFAULT 'wry'",
+                'last_generated_spine': "TEXT DEFAULT ''",
+                'last_generated_beat': "TEXT DEFAULT ''",
+                'claim_tags_json': "TEXT DEFAULT '[]'",
+                'segments_since_motif_change': "INTEGER DEFAULT 0"
+            }
         
-        # Add missing columns
-        for col_name, col_def in new_columns.items():
-            if col_name not in existing_columns:
-                try:
-                    cursor.execute(f"ALTER TABLE narrator_context ADD COLUMN {col_name} {col_def}")
-                    print(f"[FTB State DB] Added column {col_name} to narrator_context")
-                except sqlite3.OperationalError as e:
-                    # Column might already exist or duplicate column error
-                    if "duplicate column" not in str(e).lower():
-                        print(f"[FTB State DB] Warning: Could not add column {col_name}: {e}")
+            # Add missing columns
+            for col_name, col_def in new_columns.items():
+                if col_name not in existing_columns:
+                    try:
+                        cursor.execute(f"ALTER TABLE narrator_context ADD COLUMN {col_name} {col_def}")
+                        print(f"[FTB State DB] Added column {col_name} to narrator_context")
+                    except sqlite3.OperationalError as e:
+                        # Column might already exist or duplicate column error
+                        if "duplicate column" not in str(e).lower():
+                            print(f"[FTB State DB] Warning: Could not add column {col_name}: {e}")
         
-        conn.commit()
-    except Exception as e:
-        print(f"[FTB State DB] Schema migration error: {e}")
-    finally:
-        conn.close()
+            conn.commit()
+        except Exception as e:
+            print(f"[FTB State DB] Schema migration error: {e}")
+            conn.rollback()
 
 
 def migrate_seed_column(db_path: str) -> None:
@@ -1127,97 +1527,96 @@ def migrate_seed_column(db_path: str) -> None:
     Args:
         db_path: Path to SQLite database file
     """
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    with get_connection(db_path) as conn:
+        cursor = conn.cursor()
     
-    try:
-        # Check current column type
-        cursor.execute("PRAGMA table_info(game_state_snapshot)")
-        columns = {row[1]: row[2] for row in cursor.fetchall()}
+        try:
+            # Check current column type
+            cursor.execute("PRAGMA table_info(game_state_snapshot)")
+            columns = {row[1]: row[2] for row in cursor.fetchall()}
         
-        if 'seed' in columns and columns['seed'] == 'INTEGER':
-            print("[FTB State DB] Migrating seed column from INTEGER to TEXT...")
+            if 'seed' in columns and columns['seed'] == 'INTEGER':
+                print("[FTB State DB] Migrating seed column from INTEGER to TEXT...")
             
-            # Read existing data
-            cursor.execute("SELECT * FROM game_state_snapshot WHERE id = 1")
-            row = cursor.fetchone()
+                # Read existing data
+                cursor.execute("SELECT * FROM game_state_snapshot WHERE id = 1")
+                row = cursor.fetchone()
             
-            if row:
-                # Backup current data
-                game_data = {
-                    'tick': row[1],
-                    'phase': row[2],
-                    'season': row[3],
-                    'day_of_year': row[4],
-                    'time_mode': row[5],
-                    'control_mode': row[6],
-                    'active_tab': row[7],
-                    'seed': str(row[8]),  # Convert to string
-                    'last_updated_ts': row[9]
-                }
+                if row:
+                    # Backup current data
+                    game_data = {
+                        'tick': row[1],
+                        'phase': row[2],
+                        'season': row[3],
+                        'day_of_year': row[4],
+                        'time_mode': row[5],
+                        'control_mode': row[6],
+                        'active_tab': row[7],
+                        'seed': str(row[8]),  # Convert to string
+                        'last_updated_ts': row[9]
+                    }
                 
-                # Drop and recreate table with TEXT seed and races_completed_this_season
-                cursor.execute("DROP TABLE game_state_snapshot")
-                cursor.execute("""
-                    CREATE TABLE game_state_snapshot (
-                        id INTEGER PRIMARY KEY CHECK (id = 1),
-                        tick INTEGER NOT NULL,
-                        phase TEXT NOT NULL,
-                        season INTEGER NOT NULL,
-                        day_of_year INTEGER NOT NULL,
-                        time_mode TEXT NOT NULL,
-                        control_mode TEXT NOT NULL,
-                        active_tab TEXT,
-                        seed TEXT NOT NULL,
-                        races_completed_this_season INTEGER DEFAULT 0,
-                        last_updated_ts REAL NOT NULL
-                    )
-                """)
+                    # Drop and recreate table with TEXT seed and races_completed_this_season
+                    cursor.execute("DROP TABLE game_state_snapshot")
+                    cursor.execute("""
+                        CREATE TABLE game_state_snapshot (
+                            id INTEGER PRIMARY KEY CHECK (id = 1),
+                            tick INTEGER NOT NULL,
+                            phase TEXT NOT NULL,
+                            season INTEGER NOT NULL,
+                            day_of_year INTEGER NOT NULL,
+                            time_mode TEXT NOT NULL,
+                            control_mode TEXT NOT NULL,
+                            active_tab TEXT,
+                            seed TEXT NOT NULL,
+                            races_completed_this_season INTEGER DEFAULT 0,
+                            last_updated_ts REAL NOT NULL
+                        )
+                    """)
                 
-                # Restore data
-                cursor.execute("""
-                    INSERT INTO game_state_snapshot 
-                    (id, tick, phase, season, day_of_year, time_mode, control_mode, active_tab, seed, races_completed_this_season, last_updated_ts)
-                    VALUES (1, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    game_data['tick'],
-                    game_data['phase'],
-                    game_data['season'],
-                    game_data['day_of_year'],
-                    game_data['time_mode'],
-                    game_data['control_mode'],
-                    game_data['active_tab'],
-                    game_data['seed'],
-                    game_data.get('races_completed_this_season', 0),
-                    game_data['last_updated_ts']
-                ))
+                    # Restore data
+                    cursor.execute("""
+                        INSERT INTO game_state_snapshot 
+                        (id, tick, phase, season, day_of_year, time_mode, control_mode, active_tab, seed, races_completed_this_season, last_updated_ts)
+                        VALUES (1, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, (
+                        game_data['tick'],
+                        game_data['phase'],
+                        game_data['season'],
+                        game_data['day_of_year'],
+                        game_data['time_mode'],
+                        game_data['control_mode'],
+                        game_data['active_tab'],
+                        game_data['seed'],
+                        game_data.get('races_completed_this_season', 0),
+                        game_data['last_updated_ts']
+                    ))
                 
-                print("[FTB State DB] Seed column migration complete")
-            else:
-                # No data exists, just recreate table
-                cursor.execute("DROP TABLE game_state_snapshot")
-                cursor.execute("""
-                    CREATE TABLE game_state_snapshot (
-                        id INTEGER PRIMARY KEY CHECK (id = 1),
-                        tick INTEGER NOT NULL,
-                        phase TEXT NOT NULL,
-                        season INTEGER NOT NULL,
-                        day_of_year INTEGER NOT NULL,
-                        time_mode TEXT NOT NULL,
-                        control_mode TEXT NOT NULL,
-                        active_tab TEXT,
-                        seed TEXT NOT NULL,
-                        races_completed_this_season INTEGER DEFAULT 0,
-                        last_updated_ts REAL NOT NULL
-                    )
-                """)
-                print("[FTB State DB] Seed column migration complete (no existing data)")
+                    print("[FTB State DB] Seed column migration complete")
+                else:
+                    # No data exists, just recreate table
+                    cursor.execute("DROP TABLE game_state_snapshot")
+                    cursor.execute("""
+                        CREATE TABLE game_state_snapshot (
+                            id INTEGER PRIMARY KEY CHECK (id = 1),
+                            tick INTEGER NOT NULL,
+                            phase TEXT NOT NULL,
+                            season INTEGER NOT NULL,
+                            day_of_year INTEGER NOT NULL,
+                            time_mode TEXT NOT NULL,
+                            control_mode TEXT NOT NULL,
+                            active_tab TEXT,
+                            seed TEXT NOT NULL,
+                            races_completed_this_season INTEGER DEFAULT 0,
+                            last_updated_ts REAL NOT NULL
+                        )
+                    """)
+                    print("[FTB State DB] Seed column migration complete (no existing data)")
         
-        conn.commit()
-    except Exception as e:
-        print(f"[FTB State DB] Seed column migration error: {e}")
-    finally:
-        conn.close()
+            conn.commit()
+        except Exception as e:
+            print(f"[FTB State DB] Seed column migration error: {e}")
+            conn.rollback()
 
 
 def migrate_game_id_column(db_path: str) -> None:
@@ -1228,43 +1627,23 @@ def migrate_game_id_column(db_path: str) -> None:
     Args:
         db_path: Path to SQLite database file
     """
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    with get_connection(db_path) as conn:
+        cursor = conn.cursor()
     
-    try:
-        # Check if game_id column exists
-        cursor.execute("PRAGMA table_info(game_state_snapshot)")
-        columns = {row[1] for row in cursor.fetchall()}
+        try:
+            # Check if game_id column exists
+            cursor.execute("PRAGMA table_info(game_state_snapshot)")
+            columns = {row[1] for row in cursor.fetchall()}
         
-        if 'game_id' not in columns:
-            print("[FTB State DB] Adding game_id column...")
-            cursor.execute("ALTER TABLE game_state_snapshot ADD COLUMN game_id TEXT")
-            conn.commit()
-            print("[FTB State DB] game_id column added successfully")
+            if 'game_id' not in columns:
+                print("[FTB State DB] Adding game_id column...")
+                cursor.execute("ALTER TABLE game_state_snapshot ADD COLUMN game_id TEXT")
+                conn.commit()
+                print("[FTB State DB] game_id column added successfully")
         
-    except Exception as e:
-        print(f"[FTB State DB] game_id column migration error: {e}")
-    finally:
-        conn.close()
-
-
-@contextmanager
-def get_connection(db_path: str):
-    """Thread-safe database connection context manager."""
-    if not hasattr(_thread_local, 'connections'):
-        _thread_local.connections = {}
-    
-    if db_path not in _thread_local.connections:
-        _thread_local.connections[db_path] = sqlite3.connect(db_path, check_same_thread=False)
-        _thread_local.connections[db_path].row_factory = sqlite3.Row
-    
-    conn = _thread_local.connections[db_path]
-    try:
-        yield conn
-        conn.commit()
-    except Exception as e:
-        conn.rollback()
-        raise e
+        except Exception as e:
+            print(f"[FTB State DB] game_id column migration error: {e}")
+            conn.rollback()
 
 
 # ============================================================================
@@ -1544,6 +1923,9 @@ def write_game_snapshot(db_path: str, state: Any) -> None:
         
         # Penalties
         _write_penalties(cursor, state)
+    
+    # Tick-only change: lets the narrator know the world moved on
+    get_event_notifier(db_path).notify(state.tick)
 
 
 def _insert_entity(cursor, entity, entity_type: str, team_name: str, state: Any):
@@ -1595,6 +1977,18 @@ def write_event_batch(db_path: str, events: List[Any]) -> None:
                 json.dumps(event.data),
                 time.time()
             ))
+    
+    # Wake the narrator once the batch is committed
+    if events:
+        get_event_notifier(db_path).notify(
+            max(event.ts for event in events),
+            max_priority=max(event.priority for event in events),
+            urgent=any(
+                event.priority >= URGENT_EVENT_PRIORITY or event.severity in ("critical", "major")
+                for event in events
+            ),
+            event_count=len(events)
+        )
 
 
 def write_ui_context(db_path: str, active_tab: str, tick: int) -> None:
@@ -1802,7 +2196,7 @@ def query_player_state(db_path: str) -> Optional[Dict[str, Any]]:
     Returns:
         Dict with player team info, budget, standings, etc.
     """
-    with get_connection(db_path) as conn:
+    with read_connection(db_path) as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM player_state WHERE id = 1")
         row = cursor.fetchone()
@@ -1830,7 +2224,7 @@ def query_game_state(db_path: str) -> Optional[Dict[str, Any]]:
     Returns:
         Dict with tick, phase, season, day, modes, etc.
     """
-    with get_connection(db_path) as conn:
+    with read_connection(db_path) as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM game_state_snapshot WHERE id = 1")
         row = cursor.fetchone()
@@ -1867,7 +2261,7 @@ def query_entities_by_team(db_path: str, team_name: str) -> List[Dict[str, Any]]
     Returns:
         List of entity dicts
     """
-    with get_connection(db_path) as conn:
+    with read_connection(db_path) as conn:
         cursor = conn.cursor()
         cursor.execute("""
             SELECT entity_id, entity_type, name, age, overall_rating, stats_json, contract_end_day, salary
@@ -1901,7 +2295,7 @@ def query_sponsorships(db_path: str, team_name: Optional[str] = None) -> List[Di
     Returns:
         List of sponsorship dicts with full profile data
     """
-    with get_connection(db_path) as conn:
+    with read_connection(db_path) as conn:
         cursor = conn.cursor()
         
         if team_name:
@@ -1984,7 +2378,7 @@ def query_penalties(db_path: str, team_name: Optional[str] = None, limit: int =
     Returns:
         List of penalty dicts
     """
-    with get_connection(db_path) as conn:
+    with read_connection(db_path) as conn:
         cursor = conn.cursor()
         
         if team_name:
@@ -2033,7 +2427,7 @@ def query_team_penalty_history(db_path: str, team_name: str, days_back: int = 90
     Returns:
         Dict with penalty counts by type and warning accumulation
     """
-    with get_connection(db_path) as conn:
+    with read_connection(db_path) as conn:
         cursor = conn.cursor()
         
         # Get current game day
@@ -2141,7 +2535,7 @@ def query_tier_events(db_path: str, tier: int, limit: int = 50) -> List[Dict[str
         List of event dicts
     """
     fetch_limit = max(limit * 5, 100)
-    with get_connection(db_path) as conn:
+    with read_connection(db_path) as conn:
         cursor = conn.cursor()
         cursor.execute("""
             SELECT event_id, tick, event_type, category, priority, severity, team, data_json
@@ -2181,7 +2575,7 @@ def query_league_standings(db_path: str, tier: Optional[int] = None) -> List[Dic
     Returns:
         List of league standings dicts
     """
-    with get_connection(db_path) as conn:
+    with read_connection(db_path) as conn:
         cursor = conn.cursor()
         
         if tier:
@@ -2215,7 +2609,7 @@ def query_job_board(db_path: str, tier: Optional[int] = None, role: Optional[str
     Returns:
         List of job listing dicts
     """
-    with get_connection(db_path) as conn:
+    with read_connection(db_path) as conn:
         cursor = conn.cursor()
         
         query = "SELECT * FROM job_board WHERE 1=1"
@@ -2257,7 +2651,7 @@ def query_free_agents(db_path: str, role: Optional[str] = None, tier: Optional[i
     Returns:
         List of free agent dicts
     """
-    with get_connection(db_path) as conn:
+    with read_connection(db_path) as conn:
         cursor = conn.cursor()
         
         query = "SELECT * FROM free_agents WHERE exit_reason IS NULL"
@@ -2297,7 +2691,7 @@ def query_ui_context(db_path: str) -> Optional[Dict[str, Any]]:
     Returns:
         Dict with active_tab and last_tab_change_tick
     """
-    with get_connection(db_path) as conn:
+    with read_connection(db_path) as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM ui_context WHERE id = 1")
         row = cursor.fetchone()
@@ -2319,7 +2713,7 @@ def query_team_by_name(db_path: str, team_name: str) -> Optional[Dict[str, Any]]
     Returns:
         Dict with team info
     """
-    with get_connection(db_path) as conn:
+    with read_connection(db_path) as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM teams WHERE team_name = ?", (team_name,))
         row = cursor.fetchone()
@@ -2357,7 +2751,7 @@ def query_all_teams(db_path: str, league_id: Optional[str] = None) -> List[Dict[
     Returns:
         List of dicts with team info
     """
-    with get_connection(db_path) as conn:
+    with read_connection(db_path) as conn:
         cursor = conn.cursor()
         if league_id:
             cursor.execute("SELECT * FROM teams WHERE league_id = ?", (league_id,))
@@ -2453,7 +2847,7 @@ def load_narrator_context(db_path: str) -> Optional[Dict[str, Any]]:
     Returns:
         Dict with narrator context or None if not found
     """
-    with get_connection(db_path) as conn:
+    with read_connection(db_path) as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM narrator_context WHERE id = 1")
         row = cursor.fetchone()
@@ -2540,27 +2934,25 @@ def query_calendar_window(
         List of calendar entries as dicts
     """
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with read_connection(db_path) as conn:
+            cursor = conn.cursor()
         
-        end_day = start_day + window_days
+            end_day = start_day + window_days
         
-        query = """
-            SELECT * FROM calendar_entries
-            WHERE entry_day BETWEEN ? AND ?
-        """
+            query = """
+                SELECT * FROM calendar_entries
+                WHERE entry_day BETWEEN ? AND ?
+            """
         
-        params = [start_day, end_day]
+            params = [start_day, end_day]
         
-        if not include_player_authored:
-            query += " AND is_player_authored = 0"
+            if not include_player_authored:
+                query += " AND is_player_authored = 0"
         
-        query += " ORDER BY entry_day ASC, priority DESC"
+            query += " ORDER BY entry_day ASC, priority DESC"
         
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
         
         return [dict(row) for row in rows]
     except Exception as e:
@@ -2580,18 +2972,16 @@ def query_folded_teams(db_path: str, limit: int = 10) -> List[Dict[str, Any]]:
         List of folded team records as dicts
     """
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with read_connection(db_path) as conn:
+            cursor = conn.cursor()
         
-        cursor.execute("""
-            SELECT * FROM folded_teams
-            ORDER BY fold_tick DESC
-            LIMIT ?
-        """, (limit,))
+            cursor.execute("""
+                SELECT * FROM folded_teams
+                ORDER BY fold_tick DESC
+                LIMIT ?
+            """, (limit,))
         
-        rows = cursor.fetchall()
-        conn.close()
+            rows = cursor.fetchall()
         
         return [dict(row) for row in rows]
     except Exception as e:
@@ -2611,24 +3001,22 @@ def query_league_economic_state(db_path: str, season: Optional[int] = None) -> O
         Economic state dict or None if not found
     """
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with read_connection(db_path) as conn:
+            cursor = conn.cursor()
         
-        if season is not None:
-            cursor.execute("""
-                SELECT * FROM league_economic_state
-                WHERE season = ?
-            """, (season,))
-        else:
-            cursor.execute("""
-                SELECT * FROM league_economic_state
-                ORDER BY season DESC
-                LIMIT 1
-            """)
+            if season is not None:
+                cursor.execute("""
+                    SELECT * FROM league_economic_state
+                    WHERE season = ?
+                """, (season,))
+            else:
+                cursor.execute("""
+                    SELECT * FROM league_economic_state
+                    ORDER BY season DESC
+                    LIMIT 1
+                """)
         
-        row = cursor.fetchone()
-        conn.close()
+            row = cursor.fetchone()
         
         return dict(row) if row else None
     except Exception as e:
@@ -2657,7 +3045,7 @@ def query_calendar_window(
     Returns:
         List of calendar entry dicts
     """
-    with get_connection(db_path) as conn:
+    with read_connection(db_path) as conn:
         cursor = conn.cursor()
         
         # Build query dynamically based on filters
@@ -2712,7 +3100,7 @@ def query_decision_inbox(db_path: str) -> List[Dict[str, Any]]:
     Returns:
         List of entries with action_required=1, sorted by urgency
     """
-    with get_connection(db_path) as conn:
+    with read_connection(db_path) as conn:
         cursor = conn.cursor()
         cursor.execute("""
             SELECT * FROM calendar_entries
@@ -2799,7 +3187,7 @@ def query_decision_history(
     Returns:
         List of decision records, newest first
     """
-    with get_connection(db_path) as conn:
+    with read_connection(db_path) as conn:
         cursor = conn.cursor()
         
         query = "SELECT * FROM decision_history WHERE 1=1"
@@ -2866,7 +3254,7 @@ def query_race_results(
     Returns:
         List of race result records, newest first
     """
-    with get_connection(db_path) as conn:
+    with read_connection(db_path) as conn:
         cursor = conn.cursor()
         
         query = "SELECT * FROM race_results_archive WHERE 1=1"
@@ -3044,7 +3432,7 @@ def query_financial_transactions(
     Returns:
         List of transaction records, newest first
     """
-    with get_connection(db_path) as conn:
+    with read_connection(db_path) as conn:
         cursor = conn.cursor()
         
         query = "SELECT * FROM financial_transactions WHERE 1=1"
@@ -3105,7 +3493,7 @@ def query_season_summaries(
     Returns:
         List of season summary records, newest first
     """
-    with get_connection(db_path) as conn:
+    with read_connection(db_path) as conn:
         cursor = conn.cursor()
         
         query = "SELECT * FROM season_summaries WHERE 1=1"
@@ -3290,7 +3678,7 @@ def query_ai_decisions(
     Returns:
         List of AI decision records
     """
-    with get_connection(db_path) as conn:
+    with read_connection(db_path) as conn:
         cursor = conn.cursor()
         
         query = "SELECT * FROM ai_decisions WHERE 1=1"
@@ -3354,7 +3742,7 @@ def query_team_outcomes(
     Returns:
         List of team outcome records
     """
-    with get_connection(db_path) as conn:
+    with read_connection(db_path) as conn:
         cursor = conn.cursor()
         
         query = "SELECT * FROM team_outcomes WHERE 1=1"
@@ -14,6 +14,13 @@
 #     vision_model: "llava:latest"
 #     vision_endpoint: "http://localhost:11434"
 #     vision_api_key: "..."
+#     vision_batch_size: 4
+#     scene_threshold: 0.0
+#     scene_snap_sec: 2.0
+#
+# On PLAY, every file/URL item is prefetched: each video is decoded once by a
+# single ffmpeg pass that emits all requested timestamps, frames are interpreted
+# in multi-image batches, and results are cached by (video hash, timestamp).
 #
 
 import base64
@@ -43,6 +50,9 @@ DEFAULT_CONFIG = {
     "vision_model": "llava:latest",
     "vision_endpoint": "http://localhost:11434",
     "vision_api_key": "",
+    "vision_batch_size": 4,     # frames per multi-image vision request (providers that support it)
+    "scene_threshold": 0.0,     # >0: detect scene-change keyframes (ffmpeg scene score)...
+    "scene_snap_sec": 2.0,      # ...and use the nearest one within this many seconds for a timeline item
     "vision_prompt": (
         "Describe what is happening in this video frame as if you are a commentator watching a live feed. "
         "Focus on the action, the people, and the atmosphere. Keep it immediate and descriptive."
@@ -218,6 +228,34 @@ class VisionClient:
     def interpret(self, image_bytes: bytes, prompt: str) -> Optional[str]:
         raise NotImplementedError
 
+    def interpret_batch(self, images: List[bytes], prompt: str) -> List[Optional[str]]:
+        """One description per image. Default: one request per image."""
+        return [self.interpret(img, prompt) for img in images]
+
+
+def _batch_prompt(prompt: str, n: int) -> str:
+    return (
+        f"You are given {n} frames from the same video, in chronological order. {prompt}\n"
+        f"Describe each frame separately. Respond with only a JSON array of exactly {n} strings, "
+        f"one description per frame, in the same order."
+    )
+
+
+def _parse_batch_response(raw: Optional[str], n: int) -> Optional[List[Optional[str]]]:
+    """Pull the JSON array of n descriptions out of a multi-image reply."""
+    if not raw:
+        return None
+    start, end = raw.find("["), raw.rfind("]")
+    if start < 0 or end <= start:
+        return None
+    try:
+        arr = json.loads(raw[start:end + 1])
+    except Exception:
+        return None
+    if not isinstance(arr, list) or len(arr) != n:
+        return None
+    return [str(x).strip() or None for x in arr]
+
 class OllamaVisionClient(VisionClient):
     def __init__(self, endpoint: str, model: str):
         self.endpoint = endpoint.rstrip("/")
@@ -252,36 +290,55 @@ class APIVisionClient(VisionClient):
         self.model = model
         self.api_key = api_key
     
+    MULTI_IMAGE_PROVIDERS = ("openai", "anthropic", "google")
+
     def interpret(self, image_bytes: bytes, prompt: str) -> Optional[str]:
+        return self._dispatch([image_bytes], prompt)
+
+    def interpret_batch(self, images: List[bytes], prompt: str) -> List[Optional[str]]:
+        """
+        Multi-image prompt for providers that accept several images per
+        request; falls back to per-frame calls if the reply can't be split.
+        """
+        if len(images) <= 1 or self.provider not in self.MULTI_IMAGE_PROVIDERS:
+            return super().interpret_batch(images, prompt)
+        raw = self._dispatch(images, _batch_prompt(prompt, len(images)))
+        parsed = _parse_batch_response(raw, len(images))
+        if parsed is None:
+            print(f"[futuresight] Batch reply unparseable; falling back to {len(images)} single-frame calls")
+            return super().interpret_batch(images, prompt)
+        return parsed
+
+    def _dispatch(self, images: List[bytes], prompt: str) -> Optional[str]:
         try:
             if self.provider == "openai":
-                return self._interpret_openai(image_bytes, prompt)
+                return self._interpret_openai(images, prompt)
             elif self.provider == "anthropic":
-                return self._interpret_anthropic(image_bytes, prompt)
+                return self._interpret_anthropic(images, prompt)
             elif self.provider == "google":
-                return self._interpret_google(image_bytes, prompt)
+                return self._interpret_google(images, prompt)
             return None
         except Exception as e:
             print(f"[futuresight] API error: {e}")
             return None
     
-    def _interpret_openai(self, image_bytes: bytes, prompt: str) -> Optional[str]:
-        b64_image = base64.b64encode(image_bytes).decode("utf-8")
+    def _interpret_openai(self, images: List[bytes], prompt: str) -> Optional[str]:
+        content: List[Dict[str, Any]] = [{"type": "text", "text": prompt}]
+        for image_bytes in images:
+            b64_image = base64.b64encode(image_bytes).decode("utf-8")
+            content.append({
+                "type": "image_url",
+                "image_url": {"url": f"data:image/jpeg;base64,{b64_image}"}
+            })
         payload = {
             "model": self.model,
             "messages": [
                 {
                     "role": "user",
-                    "content": [
-                        {"type": "text", "text": prompt},
-                        {
-                            "type": "image_url", 
-                            "image_url": {"url": f"data:image/jpeg;base64,{b64_image}"}
-                        },
-                    ],
+                    "content": content,
                 }
             ],
-            "max_tokens": 300,
+            "max_tokens": 300 * len(images),
         }
         req = urllib.request.Request(
             "https://api.openai.com/v1/chat/completions",
@@ -298,30 +355,31 @@ class APIVisionClient(VisionClient):
                 return result["choices"][0]["message"]["content"].strip()
         return None
 
-    def _interpret_anthropic(self, image_bytes: bytes, prompt: str) -> Optional[str]:
+    def _interpret_anthropic(self, images: List[bytes], prompt: str) -> Optional[str]:
         # Minimal implementation without external SDK dependency if possible, 
         # but for robustness we mimic the visual_reader pattern which uses import.
         # If 'anthropic' is not installed, this will fail.
         try:
             import anthropic  # type: ignore
             client = anthropic.Anthropic(api_key=self.api_key)
-            b64_image = base64.b64encode(image_bytes).decode("utf-8")
+            content: List[Dict[str, Any]] = [
+                {
+                    "type": "image",
+                    "source": {
+                        "type": "base64",
+                        "media_type": "image/jpeg",
+                        "data": base64.b64encode(image_bytes).decode("utf-8"),
+                    },
+                }
+                for image_bytes in images
+            ]
+            content.append({"type": "text", "text": prompt})
             message = client.messages.create(
                 model=self.model,
-                max_tokens=300,
+                max_tokens=300 * len(images),
                 messages=[{
                     "role": "user",
-                    "content": [
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": "image/jpeg",
-                                "data": b64_image,
-                            },
-                        },
-                        {"type": "text", "text": prompt},
-                    ],
+                    "content": content,
                 }],
             )
             if message.content:
@@ -332,14 +390,14 @@ class APIVisionClient(VisionClient):
             print(f"[futuresight] Anthropic error: {e}")
         return None
 
-    def _interpret_google(self, image_bytes: bytes, prompt: str) -> Optional[str]:
+    def _interpret_google(self, images: List[bytes], prompt: str) -> Optional[str]:
         try:
             import google.generativeai as genai  # type: ignore
             from PIL import Image  # type: ignore
             genai.configure(api_key=self.api_key)
             model = genai.GenerativeModel(self.model)
-            img = Image.open(io.BytesIO(image_bytes))
-            response = model.generate_content([prompt, img])
+            imgs = [Image.open(io.BytesIO(image_bytes)) for image_bytes in images]
+            response = model.generate_content([prompt, *imgs])
             return response.text.strip()
         except ImportError:
             print("[futuresight] google-generativeai SDK not installed.")
@@ -464,6 +522,250 @@ def resolve_video_source(path: str) -> str:
         except Exception: pass
     return path
 
+_SHOWINFO_PTS_RE = re.compile(r"Parsed_showinfo.*?pts_time:\s*(-?[0-9.]+)")
+
+
+def _split_jpeg_stream(data: bytes) -> List[bytes]:
+    """Split an mjpeg image2pipe stream into individual JPEGs (SOI..EOI)."""
+    frames = []
+    pos = 0
+    while True:
+        start = data.find(b"\xff\xd8", pos)
+        if start < 0:
+            break
+        end = data.find(b"\xff\xd9", start + 2)
+        if end < 0:
+            break
+        frames.append(data[start:end + 2])
+        pos = end + 2
+    return frames
+
+
+def extract_frames(input_path: str, timestamps: List[float], scene_threshold: float = 0.0,
+                   max_width: int = 1024, timeout: Optional[float] = None) -> Dict[float, bytes]:
+    """
+    Decode the video once and return {timestamp: jpeg} for every requested
+    timestamp (first frame at or after it). With scene_threshold > 0, scene-change
+    keyframes are added too, keyed by their own timestamp.
+
+    One ffmpeg process: a select filter picks the wanted frames, showinfo
+    reports their pts so output JPEGs can be matched back to timestamps.
+    """
+    wanted = sorted({max(0.0, float(t)) for t in timestamps})
+    scene = float(scene_threshold or 0.0)
+    if not wanted and scene <= 0:
+        return {}
+
+    # Fast-seek to just before the first timestamp and stop after the last,
+    # unless scene detection needs the whole video
+    base = max(0.0, wanted[0] - 1.0) if wanted and scene <= 0 else 0.0
+    terms = [
+        f"gte(t,{t - base:.3f})*(isnan(prev_selected_t)+lt(prev_selected_t,{t - base:.3f}))"
+        for t in wanted
+    ]
+    if scene > 0:
+        terms.append(f"gt(scene,{scene:.3f})")
+    vf = f"select='{'+'.join(terms)}',scale='min({int(max_width)},iw)':-2,showinfo"
+
+    cmd = ["ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "info"]
+    if base > 0:
+        cmd += ["-ss", f"{base:.3f}"]
+    if wanted and scene <= 0:
+        cmd += ["-t", f"{wanted[-1] - base + 1.0:.3f}"]
+    cmd += [
+        "-i", input_path,
+        "-an", "-sn", "-dn",
+        "-vf", vf,
+        "-vsync", "vfr",
+        "-f", "image2pipe",
+        "-vcodec", "mjpeg",
+        "-q:v", "3",
+        "pipe:1",
+    ]
+    if timeout is None:
+        timeout = 3600.0 if scene > 0 else 30.0 + (wanted[-1] - base) * 0.5
+
+    try:
+        proc = subprocess.run(cmd, capture_output=True, timeout=timeout)
+    except Exception:
+        return {}
+
+    frames = _split_jpeg_stream(proc.stdout or b"")
+    pts = [float(m.group(1)) for m in _SHOWINFO_PTS_RE.finditer((proc.stderr or b"").decode("utf-8", errors="replace"))]
+    pairs = list(zip(pts, frames))
+
+    out: Dict[float, bytes] = {}
+    j = 0
+    for t in wanted:
+        rel = t - base
+        while j < len(pairs) and pairs[j][0] < rel - 1e-3:
+            j += 1
+        if j < len(pairs):
+            out[t] = pairs[j][1]
+    if scene > 0:
+        for p, jpg in pairs:
+            out.setdefault(round(p + base, 3), jpg)
+    return out
+
+
+def video_fingerprint(path: str) -> str:
+    """Stable id for a video source: size + head/tail sample for files, the URL otherwise."""
+    try:
+        if os.path.isfile(path):
+            size = os.path.getsize(path)
+            h = hashlib.sha1(str(size).encode())
+            with open(path, "rb") as f:
+                h.update(f.read(65536))
+                if size > 65536:
+                    f.seek(-65536, os.SEEK_END)
+                    h.update(f.read())
+            return h.hexdigest()
+    except OSError:
+        pass
+    return sha1(path)
+
+
+# Vision results keyed by (video hash, timestamp, model+prompt); lives in mem so
+# rescans across sessions are instant
+_MEM_KEY_VISION_CACHE = "_futuresight_vision_cache"
+VISION_CACHE_MAX = 500
+_INFLIGHT: Dict[str, threading.Event] = {}  # cache key -> set when prefetch settles it
+
+
+def _vision_cache_key(video_hash: str, ts: float, cfg: Dict[str, Any]) -> str:
+    prompt = cfg.get("vision_prompt") or DEFAULT_CONFIG["vision_prompt"]
+    model = f"{cfg.get('vision_provider', 'ollama')}:{cfg.get('vision_model', '')}"
+    return f"{video_hash}|{max(0.0, float(ts)):.3f}|{sha1(model + prompt)[:10]}"
+
+
+def _vision_cache_get(mem: Dict[str, Any], key: str) -> Optional[str]:
+    with _LOCK:
+        cache = mem.get(_MEM_KEY_VISION_CACHE)
+        return cache.get(key) if isinstance(cache, dict) else None
+
+
+def _vision_cache_put(mem: Dict[str, Any], key: str, text: str) -> None:
+    with _LOCK:
+        cache = mem.get(_MEM_KEY_VISION_CACHE)
+        if not isinstance(cache, dict):
+            cache = mem[_MEM_KEY_VISION_CACHE] = {}
+        cache.pop(key, None)
+        cache[key] = text
+        while len(cache) > VISION_CACHE_MAX:
+            cache.pop(next(iter(cache)))
+
+
+def _await_cached_description(mem: Dict[str, Any], key: str, timeout: float = 180.0) -> Optional[str]:
+    """Cached description, waiting for an in-flight prefetch of the same frame."""
+    hit = _vision_cache_get(mem, key)
+    if hit is not None:
+        return hit
+    ev = _INFLIGHT.get(key)
+    if ev is not None:
+        ev.wait(timeout)
+        return _vision_cache_get(mem, key)
+    return None
+
+
+def _snap_to_scene_frames(frames: Dict[float, bytes], slots: List[float],
+                          snap_sec: float) -> Dict[float, bytes]:
+    """
+    {slot: jpeg} where each timeline slot takes the scene-change keyframe
+    nearest to it within snap_sec (a clean shot instead of a mid-cut frame),
+    falling back to the frame extracted at the slot itself.
+    """
+    wanted = set(slots)
+    cuts = sorted(t for t in frames if t not in wanted)
+    out: Dict[float, bytes] = {}
+    for t in slots:
+        near = [c for c in cuts if abs(c - t) <= snap_sec]
+        best = min(near, key=lambda c: abs(c - t)) if near else None
+        if best is not None:
+            out[t] = frames[best]
+        elif t in frames:
+            out[t] = frames[t]
+    return out
+
+
+def _prefetch_timeline(items: List[TimelineItem], mem: Dict[str, Any], cfg: Dict[str, Any],
+                       log=None) -> Optional[threading.Thread]:
+    """
+    Warm the vision cache for every file/URL item on the timeline: one ffmpeg
+    pass per video for all its timestamps, then batched vision calls.
+
+    Frames are registered as in-flight before returning, so items that fire
+    while the prefetch runs wait for it instead of extracting on their own.
+    """
+    by_source: Dict[str, List[float]] = {}
+    for it in items:
+        if not it.enabled or it.kind != "video":
+            continue
+        pld = it.payload
+        if _safe_str(pld.get("source"), "file") in ("screen", "window"):
+            continue
+        raw_path = _safe_str(pld.get("path"), "")
+        if raw_path:
+            by_source.setdefault(raw_path, []).append(max(0.0, float(pld.get("seek") or 0.0)))
+
+    scene = float(cfg.get("scene_threshold", 0.0) or 0.0)
+    snap = max(0.0, float(cfg.get("scene_snap_sec", 2.0) or 0.0))
+    plan = []  # (raw_path, video_hash, {ts: cache key})
+    for raw_path, seeks in by_source.items():
+        video_hash = video_fingerprint(raw_path)
+        keys = {t: _vision_cache_key(video_hash, t, cfg) for t in sorted(set(seeks))}
+        keys = {t: k for t, k in keys.items() if _vision_cache_get(mem, k) is None and k not in _INFLIGHT}
+        if keys:
+            for k in keys.values():
+                _INFLIGHT[k] = threading.Event()
+            plan.append((raw_path, video_hash, keys))
+
+    if not plan:
+        return None
+
+    def run():
+        client = get_vision_client(cfg)
+        prompt = cfg.get("vision_prompt") or DEFAULT_CONFIG["vision_prompt"]
+        batch_size = max(1, int(cfg.get("vision_batch_size", 4) or 1))
+        have_ffmpeg = ffmpeg_available()
+
+        for raw_path, video_hash, keys in plan:
+            try:
+                if not have_ffmpeg:
+                    continue
+                path = resolve_video_source(raw_path)
+                t0 = time.time()
+                frames = extract_frames(path, list(keys), scene_threshold=scene)
+                if callable(log):
+                    log("futuresight", f"Extracted {len(frames)} frames from {raw_path} in one pass ({time.time() - t0:.1f}s)")
+                if scene > 0:
+                    frames = _snap_to_scene_frames(frames, list(keys), snap)
+
+                # Only timeline slots are interpreted; unmatched scene keyframes are dropped
+                pending = [(t, frames[t]) for t in sorted(keys)
+                           if t in frames and _vision_cache_get(mem, keys[t]) is None]
+                for i in range(0, len(pending), batch_size):
+                    chunk = pending[i:i + batch_size]
+                    descriptions = client.interpret_batch([jpg for _, jpg in chunk], prompt)
+                    for (t, _), desc in zip(chunk, descriptions):
+                        if desc:
+                            _vision_cache_put(mem, keys[t], desc)
+                        ev = _INFLIGHT.pop(keys[t], None)
+                        if ev is not None:
+                            ev.set()
+            except Exception as e:
+                with _LOCK: _get_state(mem)["last_error"] = str(e)
+            finally:
+                # Release anything not produced so waiting items fall back
+                for k in keys.values():
+                    ev = _INFLIGHT.pop(k, None)
+                    if ev is not None:
+                        ev.set()
+
+    t = threading.Thread(target=run, daemon=True)
+    t.start()
+    return t
+
+
 def extract_single_frame(input_path: str, ss: float) -> Optional[bytes]:
     """Capture a single frame at timestamp ss."""
     ss = max(0.0, float(ss))
@@ -496,6 +798,8 @@ def _ingest_visual_item(item: TimelineItem, mem: Dict[str, Any], cfg: Dict[str,
 
     jpg_bytes = None
     path_info = ""
+    description = None
+    cache_key = None
 
     # 1. Screen Capture
     if raw_source == "screen":
@@ -510,22 +814,30 @@ def _ingest_visual_item(item: TimelineItem, mem: Dict[str, Any], cfg: Dict[str,
     # 3. Video File / URL
     else:
         try:
-            path = resolve_video_source(raw_path)
-            if path and ffmpeg_available():
-                jpg_bytes = extract_single_frame(path, seek)
-                path_info = path
+            # Usually already interpreted by the PLAY-time prefetch
+            cache_key = _vision_cache_key(video_fingerprint(raw_path), seek, cfg)
+            description = _await_cached_description(mem, cache_key)
+            path_info = raw_path
+            if description is None:
+                path = resolve_video_source(raw_path)
+                if path and ffmpeg_available():
+                    jpg_bytes = extract_single_frame(path, seek)
+                    path_info = path
         except Exception as e:
             with _LOCK: _get_state(mem)["last_error"] = str(e)
             return
 
-    if not jpg_bytes:
-        if callable(log): log("futuresight", f"Failed to capture visual from {raw_source} ({path_info})")
-        return
+    if description is None:
+        if not jpg_bytes:
+            if callable(log): log("futuresight", f"Failed to capture visual from {raw_source} ({path_info})")
+            return
 
-    # Interpret
-    client = get_vision_client(cfg)
-    prompt = cfg.get("vision_prompt") or DEFAULT_CONFIG["vision_prompt"]
-    description = client.interpret(jpg_bytes, prompt)
+        # Interpret
+        client = get_vision_client(cfg)
+        prompt = cfg.get("vision_prompt") or DEFAULT_CONFIG["vision_prompt"]
+        description = client.interpret(jpg_bytes, prompt)
+        if description and cache_key:
+            _vision_cache_put(mem, cache_key, description)
 
     if not description:
         if callable(log): log("futuresight", "Vision client returned no description.")
@@ -600,6 +912,8 @@ def feed_worker(stop_event, mem, cfg, runtime=None):
     poll_sec = float(cfg.get("poll_sec", 0.25))
     mem.setdefault(_MEM_KEY_ITEMS, [])
     mem.setdefault(_MEM_KEY_TAPE, [])
+    log = runtime.get("log") if isinstance(runtime, dict) else None
+    prefetched_run = None  # started_ts of the run whose frames were prefetched
     
     while not stop_event.is_set():
         try:
@@ -607,10 +921,16 @@ def feed_worker(stop_event, mem, cfg, runtime=None):
                 st = _get_state(mem)
                 running = bool(st.get("running"))
                 paused = bool(st.get("paused"))
+                started_ts = st.get("started_ts")
             
             if not running or paused:
                 time.sleep(poll_sec)
                 continue
+
+            # New PLAY: extract + interpret every file/URL frame up front
+            if started_ts != prefetched_run:
+                prefetched_run = started_ts
+                _prefetch_timeline(_items_from_mem(mem), mem, cfg, log)
                 
             elapsed = _timeline_elapsed_sec(mem)
             items = _items_from_mem(mem)
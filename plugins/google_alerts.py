@@ -3,6 +3,9 @@ import feedparser
 import os, sqlite3, json, hashlib, random
 import html
 import re
+from urllib.parse import urlparse
+
+from fetch_engine import get_fetch_engine, wait_jittered
 
 
 # =====================================================
@@ -116,12 +119,21 @@ def feed_worker(stop_event, mem, *args):
 
     conn = db_connect()
 
+    engine = get_fetch_engine()
+    for host in {urlparse(u).hostname for u in urls if urlparse(u).hostname}:
+        engine.set_host_policy(host, min_interval=feed_delay)
+
     while not stop_event.is_set():
 
-        for url in urls:
+        responses = engine.fetch_many([{"url": u} for u in urls])
+
+        for url, resp in zip(urls, responses):
+
+            if resp.not_modified or not resp.ok:
+                continue
 
             try:
-                feed = feedparser.parse(url)
+                feed = feedparser.parse(resp.body, response_headers=resp.headers)
 
                 for e in feed.entries:
 
@@ -209,8 +221,5 @@ def feed_worker(stop_event, mem, *args):
 
             except Exception:
                 pass
-            
-            if feed_delay > 0:
-                time.sleep(feed_delay)
 
-        time.sleep(poll)
+        wait_jittered(stop_event, poll)
@@ -1,11 +1,18 @@
 import time
 import hashlib
 import random
+import json
 import math
-import requests
 from collections import deque
 from typing import Any, Dict, List, Optional, Tuple
 
+from fetch_engine import get_fetch_engine
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 PLUGIN_NAME = "markets"
 
 # =====================================================
@@ -75,7 +82,7 @@ def stock_price(symbol: str, timeout: int = 8) -> Optional[float]:
     """
     try:
         url = "https://query1.finance.yahoo.com/v7/finance/quote"
-        r = requests.get(
+        r = get_fetch_engine().fetch(
             url,
             params={"symbols": symbol},
             timeout=timeout,
@@ -101,7 +108,7 @@ def bn_price(symbol: str, timeout: int = 8) -> Optional[float]:
     Lightweight spot price endpoint.
     """
     try:
-        r = requests.get(
+        r = get_fetch_engine().fetch(
             "https://api.binance.com/api/v3/ticker/price",
             params={"symbol": symbol},
             timeout=timeout
@@ -112,31 +119,264 @@ def bn_price(symbol: str, timeout: int = 8) -> Optional[float]:
         return None
 
 
+def _price_provider(sym: str, providers: Dict[str, str]) -> Optional[str]:
+    # crypto heuristic (you can improve later)
+    if sym.endswith("USDT") or sym.endswith("USD"):
+        if providers.get("crypto", "binance") == "binance":
+            return "binance"
+
+    # otherwise treat as stock/ETF
+    if providers.get("stocks", "yahoo") == "yahoo":
+        return "yahoo"
+
+    return None
+
+
+def fetch_prices(symbols: List[str], providers: Dict[str, str], timeout: int = 8) -> Dict[str, float]:
+    """
+    Batched quotes: one Binance request for all crypto symbols and one Yahoo
+    request for all stocks, issued concurrently. Returns {symbol: price} for
+    the symbols that resolved.
+    """
+    binance_syms = [s for s in symbols if _price_provider(s, providers) == "binance"]
+    yahoo_syms = [s for s in symbols if _price_provider(s, providers) == "yahoo"]
+
+    requests_ = []
+    if binance_syms:
+        requests_.append({
+            "url": "https://api.binance.com/api/v3/ticker/price",
+            "params": {"symbols": json.dumps(binance_syms, separators=(",", ":"))},
+            "timeout": timeout,
+        })
+    if yahoo_syms:
+        requests_.append({
+            "url": "https://query1.finance.yahoo.com/v7/finance/quote",
+            "params": {"symbols": ",".join(yahoo_syms)},
+            "headers": {"User-Agent": "RadioOS/1.0"},
+            "timeout": timeout,
+        })
+
+    engine = get_fetch_engine()
+    responses = engine.fetch_many(requests_, timeout=timeout)
+    out: Dict[str, float] = {}
+
+    if binance_syms:
+        r = responses.pop(0)
+        try:
+            for row in r.json() if r.ok else []:
+                px = _as_float(row.get("price"))
+                if px is not None:
+                    out[row.get("symbol")] = px
+        except Exception:
+            pass
+
+        # Binance rejects the whole batch if any symbol is unknown; fall back
+        # to per-symbol requests (still concurrent) so one typo doesn't mute the rest
+        missing = [s for s in binance_syms if s not in out]
+        if missing and not r.ok:
+            singles = engine.fetch_many([
+                {"url": "https://api.binance.com/api/v3/ticker/price",
+                 "params": {"symbol": s}, "timeout": timeout}
+                for s in missing
+            ], timeout=timeout)
+            for s, rs in zip(missing, singles):
+                try:
+                    px = _as_float(rs.json().get("price")) if rs.ok else None
+                except Exception:
+                    px = None
+                if px is not None:
+                    out[s] = px
+
+    if yahoo_syms:
+        r = responses.pop(0)
+        try:
+            res = r.json().get("quoteResponse", {}).get("result", []) if r.ok else []
+            for q in res:
+                px = _as_float(q.get("regularMarketPrice"))
+                if px is not None and q.get("symbol") in yahoo_syms:
+                    out[q["symbol"]] = px
+        except Exception:
+            pass
+
+    return out
+
+
 # =====================================================
 # Signal Engine
 # =====================================================
 
+class RollingWindow:
+    """
+    Fixed-length ring buffer with O(1) rolling mean / population variance
+    (Welford add + remove) and amortised O(1) min / max (monotonic deques).
+    Indexable like the deque it replaces.
+    """
+    RESYNC_EVERY = 16  # full recompute every N windows to shed float drift
+
+    def __init__(self, maxlen: int, extrema: bool = False):
+        self.maxlen = max(int(maxlen), 1)
+        self.values: deque = deque(maxlen=self.maxlen)
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._seq = 0
+        self._pushes = 0
+        self._maxq: Optional[deque] = deque() if extrema else None  # (seq, value), decreasing
+        self._minq: Optional[deque] = deque() if extrema else None  # (seq, value), increasing
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, i: int) -> float:
+        return self.values[i]
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __bool__(self) -> bool:
+        return bool(self.values)
+
+    def append(self, x: float) -> None:
+        x = float(x)
+        if len(self.values) == self.maxlen:
+            self._remove(self.values[0])
+        self.values.append(x)
+
+        n = len(self.values)
+        d = x - self._mean
+        self._mean += d / n
+        self._m2 += d * (x - self._mean)
+
+        if self._maxq is not None:
+            while self._maxq and self._maxq[-1][1] <= x:
+                self._maxq.pop()
+            self._maxq.append((self._seq, x))
+            while self._minq and self._minq[-1][1] >= x:
+                self._minq.pop()
+            self._minq.append((self._seq, x))
+            oldest = self._seq - n + 1
+            while self._maxq[0][0] < oldest:
+                self._maxq.popleft()
+            while self._minq[0][0] < oldest:
+                self._minq.popleft()
+
+        self._seq += 1
+        self._pushes += 1
+        if self._pushes >= self.maxlen * self.RESYNC_EVERY:
+            self._resync()
+
+    def _remove(self, y: float) -> None:
+        n = len(self.values) - 1  # count after removal
+        if n <= 0:
+            self._mean = 0.0
+            self._m2 = 0.0
+            return
+        d = y - self._mean
+        self._mean -= d / n
+        self._m2 -= d * (y - self._mean)
+
+    def _resync(self) -> None:
+        xs = list(self.values)
+        self._mean = _mean(xs) if xs else 0.0
+        self._m2 = sum((x - self._mean) ** 2 for x in xs)
+        self._pushes = 0
+
+    def mean(self) -> float:
+        return self._mean if self.values else 0.0
+
+    def pstdev(self) -> float:
+        # population stdev (matches _stdev)
+        n = len(self.values)
+        if n < 2:
+            return 0.0
+        return math.sqrt(max(self._m2 / n, 0.0))
+
+    def max(self) -> float:
+        return self._maxq[0][1]
+
+    def min(self) -> float:
+        return self._minq[0][1]
+
+
 class SymbolState:
     def __init__(self, window_points: int, vol_points: int, ret_points: int):
-        self.prices = deque(maxlen=window_points)  # rolling prices
-        self.returns = deque(maxlen=ret_points)    # per-tick returns (fraction)
-        self.vol_hist = deque(maxlen=vol_points)   # rolling vol estimates
+        self.prices = RollingWindow(window_points, extrema=True)  # rolling prices
+        self.returns = RollingWindow(ret_points)                   # per-tick returns (fraction)
+        self.vol_hist = RollingWindow(vol_points)                  # rolling vol estimates
         self.last_emit_minute: Dict[str, int] = {} # event cooldown by type
         self.last_price: Optional[float] = None
+        # Window extrema *before* the latest point (what a range break breaks)
+        self.prev_hi: Optional[float] = None
+        self.prev_lo: Optional[float] = None
 
     def push(self, px: float) -> None:
         if self.last_price and self.last_price > 0:
             self.returns.append((px - self.last_price) / self.last_price)
         self.last_price = px
+        if self.prices:
+            self.prev_hi = self.prices.max()
+            self.prev_lo = self.prices.min()
         self.prices.append(px)
 
     def vol(self) -> float:
-        return _stdev(list(self.returns))
+        return self.returns.pstdev()
 
     def vol_baseline(self) -> float:
-        if not self.vol_hist:
-            return 0.0
-        return _mean(list(self.vol_hist))
+        return self.vol_hist.mean()
+
+
+def _signal_features(states: List[SymbolState], momentum_pct: float, reversal_pct: float,
+                     vol_spike_mult: float, range_break_pct: float) -> Dict[str, List[Any]]:
+    """
+    Window features and trigger masks for every ready symbol in one pass.
+    Columns are aligned with `states`. Uses numpy when available.
+    """
+    p0 = [st.prices[0] for st in states]
+    pN = [st.prices[-1] for st in states]
+    mid = [st.prices[len(st.prices) // 2] for st in states]
+    hi = [st.prev_hi if st.prev_hi is not None else st.prices.max() for st in states]
+    lo = [st.prev_lo if st.prev_lo is not None else st.prices.min() for st in states]
+    cur_vol = [st.vol() for st in states]
+    base_vol = [st.vol_baseline() for st in states]
+
+    if np is not None and states:
+        P0, PN, MID = np.asarray(p0), np.asarray(pN), np.asarray(mid)
+        HI, LO = np.asarray(hi), np.asarray(lo)
+        CV, BV = np.asarray(cur_vol), np.asarray(base_vol)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            win_ret = np.where(P0 != 0, (PN - P0) / P0 * 100.0, 0.0)
+            snap = np.where(MID != 0, (PN - MID) / MID * 100.0, 0.0)
+        beyond_hi = (PN - HI) / np.maximum(HI, 1e-9) * 100.0
+        beyond_lo = (LO - PN) / np.maximum(LO, 1e-9) * 100.0
+        cols = {
+            "win_ret": win_ret,
+            "snap": snap,
+            "beyond_hi": beyond_hi,
+            "beyond_lo": beyond_lo,
+            "momentum": np.abs(win_ret) >= momentum_pct,
+            "vol_spike": (BV > 0) & (CV >= BV * vol_spike_mult),
+            "reversal": np.abs(snap) >= reversal_pct,
+            "range_break": (beyond_hi >= range_break_pct) | (beyond_lo >= range_break_pct),
+        }
+        out = {k: v.tolist() for k, v in cols.items()}
+    else:
+        win_ret = [_pct(a, b) for a, b in zip(p0, pN)]
+        snap = [_pct(m, b) for m, b in zip(mid, pN)]
+        beyond_hi = [(b - h) / max(h, 1e-9) * 100.0 for b, h in zip(pN, hi)]
+        beyond_lo = [(l - b) / max(l, 1e-9) * 100.0 for b, l in zip(pN, lo)]
+        out = {
+            "win_ret": win_ret,
+            "snap": snap,
+            "beyond_hi": beyond_hi,
+            "beyond_lo": beyond_lo,
+            "momentum": [abs(x) >= momentum_pct for x in win_ret],
+            "vol_spike": [b > 0 and c >= b * vol_spike_mult for c, b in zip(cur_vol, base_vol)],
+            "reversal": [abs(x) >= reversal_pct for x in snap],
+            "range_break": [h >= range_break_pct or l >= range_break_pct
+                            for h, l in zip(beyond_hi, beyond_lo)],
+        }
+
+    out.update(p0=p0, pN=pN, hi=hi, lo=lo, cur_vol=cur_vol, base_vol=base_vol)
+    return out
 
 
 def _cooldown_ok(st: SymbolState, event_type: str, cooldown_min: int) -> bool:
@@ -158,6 +398,8 @@ def _cooldown_ok(st: SymbolState, event_type: str, cooldown_min: int) -> bool:
 def feed_worker(stop_event, mem, cfg, runtime=None):
     """
     Catch-all markets plugin (Binance spot price)
+    - Whole watchlist quoted in one batched round-trip per provider
+    - O(1) rolling window stats; signal features computed across all symbols at once
     - Multiple event types
     - Manifest-driven thresholds, enabled_events, emit_limit
     - Emits BOTH StationEvent (live) and feed_candidates via emit_candidate (producer pool)
@@ -281,75 +523,94 @@ def feed_worker(stop_event, mem, cfg, runtime=None):
     # track “tape” for widget
     mem.setdefault("_markets_tape", [])  # list of last N emitted events (compact)
 
+    min_history = max(6, int(window_points * 0.66))
+
     while not stop_event.is_set():
 
         emitted = 0
 
+        # ---------------------------
+        # One batched quote round-trip for the whole watchlist
+        # ---------------------------
+        try:
+            quotes = fetch_prices(symbols, providers)
+        except Exception:
+            quotes = {}
+
+        ready: List[Tuple[str, SymbolState, float]] = []
+
         for sym in symbols:
-            if emitted >= emit_limit:
-                break
+            px = quotes.get(sym)
+            if px is None or px <= 0:
+                continue
 
             st = state.get(sym)
             if st is None:
                 st = SymbolState(window_points=max(window_points, 6), vol_points=24, ret_points=max(window_points, 6))
                 state[sym] = st
 
-            try:
-                px = fetch_price(sym, providers)
-                if px is None or px <= 0:
-                    continue
-
-                st.push(px)
-
-                # ---------------------------
-                # Continuous HUD update
-                # ---------------------------
-                if ui_q is not None:
-                    try:
-                        ui_q.put((
-                            "widget_update",
-                            {
-                                "widget_key": "market_hud",
-                                "data": {
-                                    "symbol": sym,
-                                    "price": px,
-                                    "ts": now_ts(),
-                                    "window_points": len(st.prices),
-                                    "ret_window_pct": _pct(st.prices[0], st.prices[-1]) if len(st.prices) >= 2 else 0.0,
-                                    "vol": st.vol(),
-                                    "vol_base": st.vol_baseline(),
-                                    "prices": list(st.prices),   # 👈 ADD THIS LINE
-
-                                }
+            st.push(px)
+
+            # ---------------------------
+            # Continuous HUD update (new point only; the widget keeps the series)
+            # ---------------------------
+            if ui_q is not None:
+                try:
+                    ui_q.put((
+                        "widget_update",
+                        {
+                            "widget_key": "market_hud",
+                            "data": {
+                                "symbol": sym,
+                                "price": px,
+                                "ts": now_ts(),
+                                "window_points": len(st.prices),
+                                "window_max": st.prices.maxlen,
+                                "ret_window_pct": _pct(st.prices[0], st.prices[-1]) if len(st.prices) >= 2 else 0.0,
+                                "vol": st.vol(),
+                                "vol_base": st.vol_baseline(),
+                                "point": px,
                             }
-                        ))
-                    except Exception:
-                        pass
-
-                # need sufficient history for signals
-                if len(st.prices) < max(6, int(window_points * 0.66)):
-                    continue
-
-                # update vol baseline
-                cur_vol = st.vol()
-                if cur_vol > 0:
-                    st.vol_hist.append(cur_vol)
-                base_vol = st.vol_baseline()
-
-                # computed features
-                p0 = st.prices[0]
-                pN = st.prices[-1]
-                win_ret = _pct(p0, pN)
-
-                mid = st.prices[len(st.prices)//2]
-                snap = _pct(mid, pN)
+                        }
+                    ))
+                except Exception:
+                    pass
+
+            # need sufficient history for signals
+            if len(st.prices) < min_history:
+                continue
+
+            # update vol baseline
+            cur_vol = st.vol()
+            if cur_vol > 0:
+                st.vol_hist.append(cur_vol)
+
+            ready.append((sym, st, px))
+
+        # ---------------------------
+        # Features + trigger masks for all ready symbols at once
+        # ---------------------------
+        sig = _signal_features(
+            [st for _, st, _ in ready],
+            momentum_pct, reversal_pct, vol_spike_mult, range_break_pct,
+        )
 
-                hi = max(st.prices)
-                lo = min(st.prices)
+        for i, (sym, st, px) in enumerate(ready):
+            if emitted >= emit_limit:
+                break
 
-                # range break distance from extrema
-                break_up = _pct(hi, pN)  # will be <=0 if above hi
-                break_dn = _pct(lo, pN)  # will be >=0 if above lo
+            try:
+                cur_vol = sig["cur_vol"][i]
+                base_vol = sig["base_vol"][i]
+                pN = sig["pN"][i]
+                win_ret = sig["win_ret"][i]
+                snap = sig["snap"][i]
+
+                # extrema of the window before this tick
+                hi = sig["hi"][i]
+                lo = sig["lo"][i]
+                beyond_hi = sig["beyond_hi"][i]
+                beyond_lo = sig["beyond_lo"][i]
 
                 # ---------------------------
                 # Candidate builder (common)
@@ -434,7 +695,7 @@ def feed_worker(stop_event, mem, cfg, runtime=None):
                 # Event: momentum_burst
                 # ---------------------------
                 if emitted < emit_limit and is_enabled("momentum_burst"):
-                    if abs(win_ret) >= momentum_pct and _cooldown_ok(st, "momentum_burst", cd("momentum_burst", 1)):
+                    if sig["momentum"][i] and _cooldown_ok(st, "momentum_burst", cd("momentum_burst", 1)):
                         direction = "up" if win_ret > 0 else "down"
                         title = f"{sym} momentum {direction}"
                         body = f"{sym} moved {win_ret:.2f}% over the last {len(st.prices)} ticks (price={px:g})."
@@ -461,7 +722,7 @@ def feed_worker(stop_event, mem, cfg, runtime=None):
                 # Event: volatility_spike
                 # ---------------------------
                 if emitted < emit_limit and is_enabled("volatility_spike"):
-                    if base_vol > 0 and cur_vol >= base_vol * vol_spike_mult and _cooldown_ok(st, "volatility_spike", cd("volatility_spike", 2)):
+                    if sig["vol_spike"][i] and _cooldown_ok(st, "volatility_spike", cd("volatility_spike", 2)):
                         title = f"{sym} volatility spike"
                         body = f"{sym} volatility expanded (vol={cur_vol:.5f}, baseline={base_vol:.5f})."
                         emit_event(
@@ -487,7 +748,7 @@ def feed_worker(stop_event, mem, cfg, runtime=None):
                 # Event: trend_reversal (snap move in latter half)
                 # ---------------------------
                 if emitted < emit_limit and is_enabled("trend_reversal"):
-                    if abs(snap) >= reversal_pct and _cooldown_ok(st, "trend_reversal", cd("trend_reversal", 2)):
+                    if sig["reversal"][i] and _cooldown_ok(st, "trend_reversal", cd("trend_reversal", 2)):
                         direction = "up" if snap > 0 else "down"
                         title = f"{sym} trend snap {direction}"
                         body = f"{sym} snapped {snap:.2f}% in the latter half of the window (price={px:g})."
@@ -513,12 +774,8 @@ def feed_worker(stop_event, mem, cfg, runtime=None):
                 # Event: range_break (push beyond recent extrema)
                 # ---------------------------
                 if emitted < emit_limit and is_enabled("range_break"):
-                    # If pN is meaningfully beyond hi/lo, break_up will be negative large.
-                    # We trigger when abs(distance beyond extrema) exceeds threshold.
-                    beyond_hi = (pN - hi) / max(hi, 1e-9) * 100.0
-                    beyond_lo = (lo - pN) / max(lo, 1e-9) * 100.0
-
-                    if (beyond_hi >= range_break_pct or beyond_lo >= range_break_pct) and _cooldown_ok(st, "range_break", cd("range_break", 2)):
+                    # We trigger when the distance beyond the prior extrema exceeds threshold.
+                    if sig["range_break"][i] and _cooldown_ok(st, "range_break", cd("range_break", 2)):
                         if beyond_hi >= range_break_pct:
                             title = f"{sym} range break up"
                             body = f"{sym} pushed {beyond_hi:.2f}% above the recent high (price={px:g})."
@@ -594,26 +851,14 @@ def feed_worker(stop_event, mem, cfg, runtime=None):
 # =====================================================
 def fetch_price(sym: str, providers: Dict[str, str]) -> Optional[float]:
     """
-    Routes symbol to correct provider.
+    Routes symbol to correct provider (single-symbol form of fetch_prices).
     """
-
-    # crypto heuristic (you can improve later)
-    if sym.endswith("USDT") or sym.endswith("USD"):
-        prov = providers.get("crypto", "binance")
-        if prov == "binance":
-            return bn_price(sym)
-
-    # otherwise treat as stock/ETF
-    prov = providers.get("stocks", "yahoo")
-    if prov == "yahoo":
-        return stock_price(sym)
-
-    return None
+    return fetch_prices([sym], providers).get(sym)
 
 def yahoo_search(query: str, timeout: int = 8):
     try:
         url = "https://query2.finance.yahoo.com/v1/finance/search"
-        r = requests.get(
+        r = get_fetch_engine().fetch(
             url,
             params={"q": query, "quotesCount": 8, "newsCount": 0},
             timeout=timeout,
@@ -636,9 +881,11 @@ def yahoo_search(query: str, timeout: int = 8):
         return []
 def binance_search(query: str, timeout: int = 8):
     try:
-        r = requests.get(
+        # exchangeInfo is large and rarely changes: share it for an hour
+        r = get_fetch_engine().fetch(
             "https://api.binance.com/api/v3/exchangeInfo",
-            timeout=timeout
+            timeout=timeout,
+            max_age=3600
         )
         j = r.json()
 
@@ -843,7 +1090,8 @@ class MarketHUDWidget:
             "px": lbl_px,
             "ret": lbl_ret,
             "vol": lbl_vol,
-            "spark": spark
+            "spark": spark,
+            "series": deque(maxlen=64),
         }
 
 
@@ -864,10 +1112,23 @@ class MarketHUDWidget:
         ret = data.get("ret_window_pct")
         vol = data.get("vol")
         vb  = data.get("vol_base")
-        prices = data.get("prices")
 
+        # The feed sends only the newest point; the row keeps its own window
+        series = row["series"]
+        window_max = data.get("window_max")
+        if isinstance(window_max, int) and window_max > 0 and window_max != series.maxlen:
+            series = row["series"] = deque(series, maxlen=window_max)
+
+        prices = data.get("prices")
+        point = data.get("point")
         if isinstance(prices, list):
-            self.draw_sparkline(row["spark"], prices)
+            series.clear()
+            series.extend(prices)
+        elif isinstance(point, (int, float)):
+            series.append(float(point))
+
+        if len(series) >= 2:
+            self.draw_sparkline(row["spark"], list(series))
 
         try:
             if isinstance(px, (int, float)):
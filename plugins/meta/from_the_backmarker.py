@@ -25,6 +25,7 @@ from enum import Enum
 import time
 import json
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 
 # Import MetaPluginBase from bookmark
 try:
@@ -199,6 +200,18 @@ class ArcMemory:
             pass
 
 
+@dataclass
+class BeatRequest:
+    """A planned beat: prompts built, LLM call not yet made"""
+    priority: float
+    event: Any = None
+    intent: str = ""
+    facts_bundle: Dict[str, Any] = field(default_factory=dict)
+    system_prompt: str = ""
+    user_prompt: str = ""
+    ready_beat: Any = None  # Set for beats that need no LLM call (news)
+
+
 class BeatBuilder:
     """Compose narrative beats from classified events"""
     
@@ -209,8 +222,53 @@ class BeatBuilder:
     
     def build_beats(self, classified: Dict[str, List[Any]], state: Any,
                    arc_memory: ArcMemory, facts_bundle: Dict[str, Any]) -> List[Any]:
-        """Generate beats from classified events"""
-        beats = []
+        """Generate beats from classified events (blocking, priority order)"""
+        beats = list(self.iter_beats(classified, state, arc_memory, facts_bundle))
+        self.log('meta', f'build_beats complete: {len(beats)} total beats')
+        return beats
+    
+    def iter_beats(self, classified: Dict[str, List[Any]], state: Any,
+                   arc_memory: ArcMemory, facts_bundle: Dict[str, Any]):
+        """Yield beats in priority order as their LLM calls finish.
+        
+        All prompts are planned up front, then generated concurrently (capped
+        by cfg 'beat_concurrency'). A beat is yielded as soon as it and every
+        higher-priority beat are done, so the first one can be enqueued while
+        later ones are still generating.
+        """
+        requests = self.plan_beats(classified, state, arc_memory, facts_bundle)
+        if not requests:
+            return
+        
+        # Highest priority first; sort is stable so stage order breaks ties
+        requests.sort(key=lambda r: r.priority, reverse=True)
+        
+        max_workers = max(1, int(self.cfg.get('beat_concurrency', 3)))
+        pending = [r for r in requests if r.ready_beat is None]
+        self.log('meta', f'Dispatching {len(pending)} beat prompts (concurrency {max_workers})')
+        
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, max(1, len(pending))),
+                                      thread_name_prefix='ftb_beat')
+        try:
+            futures = {
+                id(r): executor.submit(self._run_beat_request, r)
+                for r in pending
+            }
+            for request in requests:
+                if request.ready_beat is not None:
+                    yield request.ready_beat
+                    continue
+                beat = futures[id(request)].result()
+                if beat:
+                    yield beat
+        finally:
+            # Abandoned iteration: drop queued prompts, let running ones finish
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def plan_beats(self, classified: Dict[str, List[Any]], state: Any,
+                   arc_memory: ArcMemory, facts_bundle: Dict[str, Any]) -> List[BeatRequest]:
+        """Run the collapse stages and return beat requests (no LLM calls)"""
+        requests: List[BeatRequest] = []
         
         # Debug: Log classified event counts
         for tier, events in classified.items():
@@ -222,46 +280,46 @@ class BeatBuilder:
         race_beats = self._collapse_race_weekend(
             classified.get("us_core", []), state, arc_memory, facts_bundle
         )
-        beats.extend(race_beats)
-        self.log('meta', f'Race beats generated: {len(race_beats)}')
+        requests.extend(race_beats)
+        self.log('meta', f'Race beats planned: {len(race_beats)}')
         
         self.log('meta', 'Starting personnel beats...')
         # 2. Personnel events (hirings, firings, contracts)
         personnel_beats = self._collapse_personnel_events(
             classified.get("us_interaction", []), state, arc_memory, facts_bundle
         )
-        beats.extend(personnel_beats)
-        self.log('meta', f'Personnel beats generated: {len(personnel_beats)}')
+        requests.extend(personnel_beats)
+        self.log('meta', f'Personnel beats planned: {len(personnel_beats)}')
         
         self.log('meta', 'Starting development beats...')
         # 3. Development/technical events
         dev_beats = self._collapse_development_events(
             classified.get("us_context", []), state, arc_memory, facts_bundle
         )
-        beats.extend(dev_beats)
-        self.log('meta', f'Development beats generated: {len(dev_beats)}')
+        requests.extend(dev_beats)
+        self.log('meta', f'Development beats planned: {len(dev_beats)}')
         
         self.log('meta', 'Starting context collapse...')
         # 4. Financial/context updates (medium priority)
         context_beats = self._collapse_context(
             classified.get("us_context", []), state, arc_memory, facts_bundle
         )
-        beats.extend(context_beats)
-        self.log('meta', f'Context beats generated: {len(context_beats)}')
+        requests.extend(context_beats)
+        self.log('meta', f'Context beats planned: {len(context_beats)}')
         
         self.log('meta', 'Checking Formula Z news...')
-        # 5. Formula Z news (periodic, independent)
+        # 5. Formula Z news (periodic, independent, no LLM call)
         formula_z_beat = self._check_formula_z_news(state, arc_memory)
         if formula_z_beat:
-            beats.append(formula_z_beat)
+            requests.append(BeatRequest(priority=formula_z_beat.priority,
+                                        ready_beat=formula_z_beat))
             self.log('meta', 'Formula Z beat added')
         
-        self.log('meta', f'build_beats complete: {len(beats)} total beats')
-        return beats
+        return requests
     
     def _collapse_race_weekend(self, events: List[Any], state: Any,
                                arc_memory: ArcMemory,
-                               facts_bundle: Dict[str, Any]) -> List[NarratorBeat]:
+                               facts_bundle: Dict[str, Any]) -> List[BeatRequest]:
         """Collapse qualifying + race events into 1-2 beats"""
         beats = []
         
@@ -278,7 +336,7 @@ class BeatBuilder:
         # DNF takes priority — suppress other race beats
         if dnf_events:
             dnf_event = dnf_events[0]
-            beat = self._generate_narrator_beat(
+            beat = self._plan_narrator_beat(
                 dnf_event,
                 intent="setback",
                 facts_bundle=facts_bundle,
@@ -291,7 +349,7 @@ class BeatBuilder:
         # Qualifying beat (brief)
         if qualifying_events:
             qual_event = qualifying_events[0]
-            beat = self._generate_narrator_beat(
+            beat = self._plan_narrator_beat(
                 qual_event,
                 intent="momentum",
                 facts_bundle=facts_bundle,
@@ -312,7 +370,7 @@ class BeatBuilder:
             else:
                 intent = "momentum"
             
-            beat = self._generate_narrator_beat(
+            beat = self._plan_narrator_beat(
                 race_event,
                 intent=intent,
                 facts_bundle=facts_bundle,
@@ -325,7 +383,7 @@ class BeatBuilder:
     
     def _collapse_personnel_events(self, events: List[Any], state: Any,
                                     arc_memory: ArcMemory,
-                                    facts_bundle: Dict[str, Any]) -> List[NarratorBeat]:
+                                    facts_bundle: Dict[str, Any]) -> List[BeatRequest]:
         """Generate beats for personnel changes (hiring, firing, contracts)"""
         beats = []
         
@@ -339,7 +397,7 @@ class BeatBuilder:
         # Firings are highest priority (dramatic)
         if firing_events:
             for event in firing_events[:2]:  # Limit to 2 firings per tick
-                beat = self._generate_narrator_beat(
+                beat = self._plan_narrator_beat(
                     event,
                     intent="setback",
                     facts_bundle=facts_bundle,
@@ -347,12 +405,12 @@ class BeatBuilder:
                 )
                 if beat:
                     beats.append(beat)
-                    self.log('meta', f"Generated firing beat from {event.category}")
+                    self.log('meta', f"Planned firing beat from {event.category}")
         
         # Contract warnings (medium priority)
         if contract_events:
             for event in contract_events[:1]:  # One contract warning per tick
-                beat = self._generate_narrator_beat(
+                beat = self._plan_narrator_beat(
                     event,
                     intent="warning",
                     facts_bundle=facts_bundle,
@@ -360,12 +418,12 @@ class BeatBuilder:
                 )
                 if beat:
                     beats.append(beat)
-                    self.log('meta', f"Generated contract expiry beat")
+                    self.log('meta', f"Planned contract expiry beat")
         
         # Hirings (positive news, lower priority)
         if hiring_events and not firing_events:  # Don't mix hiring with firing news
             for event in hiring_events[:1]:  # One hiring per tick
-                beat = self._generate_narrator_beat(
+                beat = self._plan_narrator_beat(
                     event,
                     intent="momentum",
                     facts_bundle=facts_bundle,
@@ -373,13 +431,13 @@ class BeatBuilder:
                 )
                 if beat:
                     beats.append(beat)
-                    self.log('meta', f"Generated hiring beat from {event.category}")
+                    self.log('meta', f"Planned hiring beat from {event.category}")
         
         return beats
     
     def _collapse_development_events(self, events: List[Any], state: Any,
                                       arc_memory: ArcMemory,
-                                      facts_bundle: Dict[str, Any]) -> List[NarratorBeat]:
+                                      facts_bundle: Dict[str, Any]) -> List[BeatRequest]:
         """Generate beats for development and technical progress"""
         beats = []
         
@@ -393,7 +451,7 @@ class BeatBuilder:
         # Regressions/failures (setback)
         if regression_events:
             for event in regression_events[:1]:
-                beat = self._generate_narrator_beat(
+                beat = self._plan_narrator_beat(
                     event,
                     intent="setback",
                     facts_bundle=facts_bundle,
@@ -401,12 +459,12 @@ class BeatBuilder:
                 )
                 if beat:
                     beats.append(beat)
-                    self.log('meta', f"Generated regression beat from {event.category}")
+                    self.log('meta', f"Planned regression beat from {event.category}")
         
         # Successful development completions (momentum)
         elif dev_complete_events:  # Only if no regressions
             for event in dev_complete_events[:1]:
-                beat = self._generate_narrator_beat(
+                beat = self._plan_narrator_beat(
                     event,
                     intent="momentum",
                     facts_bundle=facts_bundle,
@@ -414,12 +472,12 @@ class BeatBuilder:
                 )
                 if beat:
                     beats.append(beat)
-                    self.log('meta', f"Generated development complete beat")
+                    self.log('meta', f"Planned development complete beat")
         
         # Upgrades installed (relief/momentum)
         elif upgrade_events:
             for event in upgrade_events[:1]:
-                beat = self._generate_narrator_beat(
+                beat = self._plan_narrator_beat(
                     event,
                     intent="relief",
                     facts_bundle=facts_bundle,
@@ -427,13 +485,13 @@ class BeatBuilder:
                 )
                 if beat:
                     beats.append(beat)
-                    self.log('meta', f"Generated upgrade beat")
+                    self.log('meta', f"Planned upgrade beat")
         
         return beats
     
     def _collapse_context(self, events: List[Any], state: Any,
                          arc_memory: ArcMemory,
-                         facts_bundle: Dict[str, Any]) -> List[NarratorBeat]:
+                         facts_bundle: Dict[str, Any]) -> List[BeatRequest]:
         """Generate beats for financial/constraint changes"""
         beats = []
         
@@ -453,7 +511,7 @@ class BeatBuilder:
         # Emit one beat for most severe financial issue
         if warning_events:
             most_severe = max(warning_events, key=lambda e: e.priority)
-            beat = self._generate_narrator_beat(
+            beat = self._plan_narrator_beat(
                 most_severe,
                 intent="warning",
                 facts_bundle=facts_bundle,
@@ -461,13 +519,13 @@ class BeatBuilder:
             )
             if beat:
                 beats.append(beat)
-                self.log('meta', f"Generated warning beat from {most_severe.category}")
+                self.log('meta', f"Planned warning beat from {most_severe.category}")
         
         elif financial_events:
             for event in financial_events:
                 cash = event.data.get("budget", 0)
                 if cash < 50000:  # Critical threshold
-                    beat = self._generate_narrator_beat(
+                    beat = self._plan_narrator_beat(
                         event,
                         intent="warning",
                         facts_bundle=facts_bundle,
@@ -475,7 +533,7 @@ class BeatBuilder:
                     )
                     if beat:
                         beats.append(beat)
-                        self.log('meta', f"Generated financial beat from {event.category}")
+                        self.log('meta', f"Planned financial beat from {event.category}")
         
         return beats
     
@@ -535,21 +593,42 @@ class BeatBuilder:
                                 facts_bundle: Dict[str, Any],
                                 arc_memory: ArcMemory) -> Optional[NarratorBeat]:
         """Generate a single narrator beat via LLM with natural prompting"""
+        request = self._plan_narrator_beat(event, intent, facts_bundle, arc_memory)
+        return self._run_beat_request(request) if request else None
+    
+    def _plan_narrator_beat(self, event: Any, intent: str,
+                            facts_bundle: Dict[str, Any],
+                            arc_memory: ArcMemory) -> Optional[BeatRequest]:
+        """Build the prompts for a narrator beat without calling the LLM"""
         if not self.llm_generate:
             self.log("narrator", "llm_generate not available, skipping beat generation")
             return None
         
         try:
-            self.log("narrator", f"Generating beat for event {event.category} with intent {intent}")
-            system_prompt = self._narrator_system_prompt(facts_bundle, intent, arc_memory)
-            user_prompt = self._narrator_user_prompt(event, facts_bundle)
+            return BeatRequest(
+                priority=event.priority,
+                event=event,
+                intent=intent,
+                facts_bundle=facts_bundle,
+                system_prompt=self._narrator_system_prompt(facts_bundle, intent, arc_memory),
+                user_prompt=self._narrator_user_prompt(event, facts_bundle),
+            )
+        except Exception as e:
+            self.log("narrator", f"Beat prompt error: {e}")
+            return None
+    
+    def _run_beat_request(self, request: BeatRequest) -> Optional[NarratorBeat]:
+        """Make the LLM call for a planned beat (runs on a worker thread)"""
+        event = request.event
+        try:
+            self.log("narrator", f"Generating beat for event {event.category} with intent {request.intent}")
             
             model = self.cfg.get("models", {}).get("narrator", "llama3.1:8b")
             self.log("narrator", f"Calling LLM with model {model}")
             
             text = self.llm_generate(
-                prompt=user_prompt,
-                system=system_prompt,
+                prompt=request.user_prompt,
+                system=request.system_prompt,
                 model=model,
                 num_predict=150,
                 temperature=0.8,
@@ -565,8 +644,8 @@ class BeatBuilder:
             
             beat = NarratorBeat(
                 text=text,
-                intent=intent,
-                facts_bundle=facts_bundle,
+                intent=request.intent,
+                facts_bundle=request.facts_bundle,
                 priority=event.priority,
                 event_ids=[event.event_id]
             )
@@ -942,7 +1021,6 @@ Generate a concise Formula Z news headline (15 words max):"""
             
             # Import helpers
             from plugins.ftb_game import FTBNarrationHelpers
-            import bookmark
             
             # Get player team name
             player_team_name = FTBNarrationHelpers.get_player_team_name(state)
@@ -977,57 +1055,23 @@ Generate a concise Formula Z news headline (15 words max):"""
                 self.log('meta', f'Error initializing arc memory: {e}')
                 return
             
-            # 4. Build beats
+            # 4-5. Build beats and enqueue each one as soon as it is ready
+            # (priority order), so the first beat can air while later beats
+            # are still generating
             self.log('meta', 'Building beats...')
+            beats = []
             try:
                 beat_builder = BeatBuilder(self.llm_generate, self.cfg, self.log)
-                beats = beat_builder.build_beats(classified, state, arc_memory, facts_bundle)
+                for beat in beat_builder.iter_beats(classified, state, arc_memory, facts_bundle):
+                    beats.append(beat)
+                    self._emit_beat_segment(beat, conn)
             except Exception as e:
                 self.log('meta', f'Error building beats: {e}')
                 import traceback
                 self.log('meta', traceback.format_exc())
-                beats = []
             
             self.log('meta', f'Beat builder returned {len(beats)} beats')
             
-            # 5. Convert beats to segments and enqueue
-            for beat in beats:
-                try:
-                    # Get voice from config
-                    if isinstance(beat, NarratorBeat):
-                        voice_name = self.cfg.get('voices', {}).get('narrator', 'host')
-                    elif isinstance(beat, NewsBeat):
-                        voice_name = self.cfg.get('voices', {}).get('formula_z_news', 'host')
-                    else:
-                        voice_name = 'host'
-                    
-                    # Convert beat to packet
-                    packet = beat.to_packet(voice_name)
-                    
-                    # Create segment dict for DB
-                    segment = {
-                        "id": self._generate_segment_id(beat),
-                        "post_id": self._generate_post_id(beat),
-                        "source": "ftb",
-                        "event_type": packet["event_type"],
-                        "title": packet.get("host_intro", "From the Backmarker")[:200],
-                        "body": packet.get("summary", "")[:2000],
-                        "comments": [],
-                        "angle": beat.intent if isinstance(beat, NarratorBeat) else "formula_z_news",
-                        "why": "FTB narrative beat",
-                        "key_points": [],
-                        "priority": beat.priority,
-                        "host_hint": packet["event_type"]
-                    }
-                    
-                    # Enqueue segment
-                    bookmark.db_enqueue_segment(conn, segment)
-                    
-                    self.log('meta', f"Emitted {packet['event_type']} beat: {segment['title'][:40]}")
-                
-                except Exception as e:
-                    self.log('meta', f'Beat emission error: {e}')
-            
             # 6. Save arc memory
             try:
                 arc_memory.save()
@@ -1045,6 +1089,46 @@ Generate a concise Formula Z news headline (15 words max):"""
             import traceback
             self.log('meta', traceback.format_exc())
     
+    def _emit_beat_segment(self, beat: Any, conn) -> None:
+        """Convert a beat to a segment and enqueue it in the station DB"""
+        import bookmark
+        
+        try:
+            # Get voice from config
+            if isinstance(beat, NarratorBeat):
+                voice_name = self.cfg.get('voices', {}).get('narrator', 'host')
+            elif isinstance(beat, NewsBeat):
+                voice_name = self.cfg.get('voices', {}).get('formula_z_news', 'host')
+            else:
+                voice_name = 'host'
+            
+            # Convert beat to packet
+            packet = beat.to_packet(voice_name)
+            
+            # Create segment dict for DB
+            segment = {
+                "id": self._generate_segment_id(beat),
+                "post_id": self._generate_post_id(beat),
+                "source": "ftb",
+                "event_type": packet["event_type"],
+                "title": packet.get("host_intro", "From the Backmarker")[:200],
+                "body": packet.get("summary", "")[:2000],
+                "comments": [],
+                "angle": beat.intent if isinstance(beat, NarratorBeat) else "formula_z_news",
+                "why": "FTB narrative beat",
+                "key_points": [],
+                "priority": beat.priority,
+                "host_hint": packet["event_type"]
+            }
+            
+            # Enqueue segment
+            bookmark.db_enqueue_segment(conn, segment)
+            
+            self.log('meta', f"Emitted {packet['event_type']} beat: {segment['title'][:40]}")
+        
+        except Exception as e:
+            self.log('meta', f'Beat emission error: {e}')
+    
     def _generate_segment_id(self, beat: Any) -> str:
         """Generate unique segment ID for beat"""
         import hashlib
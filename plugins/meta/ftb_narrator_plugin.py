@@ -12,12 +12,12 @@ Architecture:
 - Completely decoupled from game simulation
 """
 
+import bisect
 import threading
 import time
 import random
 import os
 import re
-import sqlite3
 from typing import Any, Dict, List, Optional, Tuple
 from collections import deque
 from dataclasses import dataclass, field
@@ -318,6 +318,169 @@ class EventObservation:
         return len(self.high_priority_events) > 0 or len(self.player_team_events) > 0
 
 
+# ============================================================================
+# FACT INDEX - PRECOMPILED MATCHERS FOR VALIDATION PASSES
+# ============================================================================
+
+# Shared patterns (compiled once instead of per validation call)
+_CAPWORD_RE = re.compile(r'\b[A-Z][a-z]+(?:\'s)?\b')
+_PROPER_NAME_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+_ENTITY_WORD_RE = re.compile(r'\b[A-Z][a-z]+\b')
+_DOLLAR_K_RE = re.compile(r'\$(\d+)K', re.IGNORECASE)
+_DOLLAR_M_RE = re.compile(r'\$(\d+)M', re.IGNORECASE)
+_DOLLAR_COMMA_RE = re.compile(r'\$(\d{1,3}(?:,\d{3})+)')
+_PERCENT_VALUE_RE = re.compile(r'(\d+(?:\.\d+)?)%')
+_BUDGET_MENTION_RE = re.compile(r'\$\d+(?:,\d+)*(?:[KM])?')
+_PERCENT_MENTION_RE = re.compile(r'\d+(?:\.\d+)?%')
+_NAME_TOKEN_SPLIT_RE = re.compile(r'[^a-z0-9]+')
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over a fixed set of keywords.
+    
+    Finds every (possibly overlapping) keyword occurrence in a single pass,
+    so checking a text against hundreds of names or stakes phrases costs
+    O(len(text) + matches) instead of one substring scan per keyword.
+    Keywords are matched case-insensitively against lowercased text.
+    """
+    
+    def __init__(self, keywords):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[str]] = [[]]
+        self.keywords = set()
+        for keyword in keywords:
+            if keyword:
+                self._add(keyword.lower())
+        self._build_failure_links()
+    
+    def _add(self, keyword: str) -> None:
+        if keyword in self.keywords:
+            return
+        self.keywords.add(keyword)
+        node = 0
+        for ch in keyword:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append(keyword)
+    
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+    
+    def iter_matches(self, text_lower: str):
+        """Yield (start, end, keyword) for every occurrence in `text_lower`."""
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for i, ch in enumerate(text_lower):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for keyword in out[node]:
+                yield (i + 1 - len(keyword), i + 1, keyword)
+    
+    def find_all(self, text_lower: str) -> set:
+        """Set of keywords present anywhere in `text_lower`."""
+        return {keyword for _, _, keyword in self.iter_matches(text_lower)}
+    
+    def find_words(self, text: str) -> List[Tuple[int, int, str]]:
+        """Matches that start and end on word boundaries (whole names only)."""
+        text_lower = text.lower()
+        n = len(text_lower)
+        matches = []
+        for start, end, keyword in self.iter_matches(text_lower):
+            if start > 0 and text_lower[start - 1].isalnum():
+                continue
+            if end < n and text_lower[end].isalnum():
+                continue
+            matches.append((start, end, keyword))
+        return matches
+
+
+def _within_window(spans: List[Tuple[int, int]], starts: List[int], lo: int, hi: int) -> bool:
+    """True if any (start, end) span (sorted by start) lies fully inside [lo, hi)."""
+    i = bisect.bisect_left(starts, lo)
+    while i < len(spans) and spans[i][0] < hi:
+        if spans[i][1] <= hi:
+            return True
+        i += 1
+    return False
+
+
+class FactIndex:
+    """
+    Per-tick compiled view of the facts the narrator is allowed to state.
+    
+    - names: Aho-Corasick automaton over team/entity/sponsor names plus a
+      token set for name-part lookups
+    - dollar_facts / percent_facts: sorted numeric tables checked with
+      bisect-based tolerance lookups
+    
+    Built once per tick and reused by every validation/retry pass.
+    """
+    
+    # Same fuzzy tolerances as the original TruthValidator checks
+    DOLLAR_TOLERANCE = 0.5     # within 50% of a known amount
+    PERCENT_TOLERANCE = 20.0   # within 20 points of a known percentage
+    
+    def __init__(self, entity_names=(), dollar_facts=(), percent_facts=(),
+                 names_automaton: Optional[KeywordAutomaton] = None):
+        names = [n for n in entity_names if n]
+        self.entity_names = set(names)
+        self.names = names_automaton or KeywordAutomaton(names)
+        self.name_tokens = set()
+        for name in names:
+            self.name_tokens.update(t for t in _NAME_TOKEN_SPLIT_RE.split(name.lower()) if t)
+        self.dollar_facts = sorted(float(v) for v in dollar_facts if isinstance(v, (int, float)) and v > 0)
+        self.percent_facts = sorted(float(v) for v in percent_facts if isinstance(v, (int, float)))
+    
+    @classmethod
+    def from_game_state(cls, game_state: Dict[str, Any]) -> 'FactIndex':
+        """Build an index from a _gather_game_state()-style dict."""
+        names = set(game_state.get('known_teams', []))
+        names.update(game_state.get('entity_allowlist', set()))
+        dollars = [game_state.get('budget', 0)]
+        dollars.extend(game_state.get('team_budgets', {}).values())
+        return cls(names, dollars, [game_state.get('morale', 50.0)])
+    
+    def find_entities(self, text: str) -> List[Tuple[int, int, str]]:
+        """Whole-word occurrences of known names in `text`."""
+        return self.names.find_words(text)
+    
+    def is_known_name_part(self, part: str) -> bool:
+        """True if `part` is a word of any known name, or contains a known name."""
+        part_lower = part.lower()
+        if part_lower in self.name_tokens:
+            return True
+        return bool(self.names.find_all(part_lower))
+    
+    def verify_dollar_amount(self, amount: float) -> bool:
+        # |amount - v| <= 0.5 * v  <=>  amount / 1.5 <= v <= amount / 0.5
+        lo = amount / (1.0 + self.DOLLAR_TOLERANCE)
+        hi = amount / (1.0 - self.DOLLAR_TOLERANCE)
+        i = bisect.bisect_left(self.dollar_facts, lo)
+        return i < len(self.dollar_facts) and self.dollar_facts[i] <= hi
+    
+    def verify_percentage(self, pct: float) -> bool:
+        i = bisect.bisect_left(self.percent_facts, pct - self.PERCENT_TOLERANCE)
+        return i < len(self.percent_facts) and self.percent_facts[i] <= pct + self.PERCENT_TOLERANCE
+
+
 # ============================================================================
 # CLAIM TRACKER - "SAID-IT TAX" SYSTEM
 # ============================================================================
@@ -339,47 +502,73 @@ class ClaimTracker:
             'comparison', 'versus', 'than', 'compared to',
             'if', 'unless', 'when', 'until', 'before'
         }
+        self._escalation_automaton = KeywordAutomaton(self.escalation_words | {
+            'was', 'now', 'from', 'to', 'half of', 'twice', 'more than', 'less than',
+            'means', 'consequence', 'result', 'lead to', 'risk of',
+            'threshold', 'breaking point', 'where', 'is where'
+        })
+    
+    # Keyword groups behind each claim tag (substring semantics, scanned in one pass)
+    _CLAIM_KEYWORDS = {
+        'financial': ('budget', '$', 'money', 'spend'),
+        'tight': ('tight', 'strain', 'low', 'critical'),
+        'healthy': ('healthy', 'comfortable'),
+        'morale': ('morale',),
+        'morale_low': ('low', 'fragile', 'drop'),
+        'morale_high': ('high', 'strong'),
+        'performance': ('pace', 'speed', 'lap time', 'performance'),
+        'standings': ('position', 'standing', 'championship'),
+        'patience': ('early', 'patience', 'long term', 'season'),
+        'caution': ('careful', 'cautious', 'risk', 'avoid'),
+        'reliability': ('parts', 'reliability', 'dnf', 'crash'),
+    }
+    _CLAIM_AUTOMATON = KeywordAutomaton(
+        kw for group in _CLAIM_KEYWORDS.values() for kw in group
+    )
     
     def extract_claims(self, text: str) -> List[str]:
         """Extract semantic claim tags from generated text"""
         tags = []
-        text_lower = text.lower()
+        hits = self._CLAIM_AUTOMATON.find_all(text.lower())
+        
+        def has(group: str) -> bool:
+            return not hits.isdisjoint(self._CLAIM_KEYWORDS[group])
         
         # Financial claims
-        if 'budget' in text_lower or '$' in text or 'money' in text_lower or 'spend' in text_lower:
-            if 'tight' in text_lower or 'strain' in text_lower or 'low' in text_lower or 'critical' in text_lower:
+        if has('financial'):
+            if has('tight'):
                 tags.append('budget_tight')
-            elif 'healthy' in text_lower or 'comfortable' in text_lower:
+            elif has('healthy'):
                 tags.append('budget_healthy')
             else:
                 tags.append('budget_mentioned')
         
         # Morale claims
-        if 'morale' in text_lower:
-            if 'low' in text_lower or 'fragile' in text_lower or 'drop' in text_lower:
+        if has('morale'):
+            if has('morale_low'):
                 tags.append('morale_low')
-            elif 'high' in text_lower or 'strong' in text_lower:
+            elif has('morale_high'):
                 tags.append('morale_high')
             else:
                 tags.append('morale_mentioned')
         
         # Performance claims
-        if any(word in text_lower for word in ['pace', 'speed', 'lap time', 'performance']):
+        if has('performance'):
             tags.append('performance_check')
         
-        if any(word in text_lower for word in ['position', 'standing', 'championship']):
+        if has('standings'):
             tags.append('standings_check')
         
         # Temporal/patience claims
-        if any(word in text_lower for word in ['early', 'patience', 'long term', 'season']):
+        if has('patience'):
             tags.append('patience_early_season')
         
         # Risk/caution claims
-        if any(word in text_lower for word in ['careful', 'cautious', 'risk', 'avoid', 'careful']):
+        if has('caution'):
             tags.append('caution_advised')
         
         # Parts/reliability
-        if any(word in text_lower for word in ['parts', 'reliability', 'dnf', 'crash']):
+        if has('reliability'):
             tags.append('reliability_concern')
         
         return tags
@@ -390,23 +579,9 @@ class ClaimTracker:
     
     def escalates_or_resolves(self, tag: str, new_text: str) -> bool:
         """Check if new text escalates or resolves a prior claim"""
-        text_lower = new_text.lower()
-        
-        # Look for escalation keywords
-        has_escalation = any(word in text_lower for word in self.escalation_words)
-        
-        # Look for comparison language (numbers with context)
-        has_comparison = any(phrase in text_lower for phrase in [
-            'was', 'now', 'from', 'to', 'half of', 'twice', 'more than', 'less than'
-        ])
-        
-        # Look for consequence/threshold language
-        has_stakes = any(phrase in text_lower for phrase in [
-            'means', 'consequence', 'result', 'lead to', 'risk of', 
-            'threshold', 'breaking point', 'where', 'is where'
-        ])
-        
-        return has_escalation or has_comparison or has_stakes
+        # Escalation keywords, comparison language (numbers with context) and
+        # consequence/threshold language - any one of them is enough
+        return bool(self._escalation_automaton.find_all(new_text.lower()))
     
     def validate_repetition(self, text: str) -> Tuple[bool, List[str]]:
         """
@@ -680,6 +855,15 @@ class TruthValidator:
     Allows contextually reasonable content - only rejects clear fabrications.
     """
     
+    # Minimal generic racing terms only (no specific names)
+    COMMON_WORDS = frozenset([
+        'Day', 'Season', 'Formula', 'Morale', 'Budget', 'Championship', 'The',
+        'Racing', 'Performance', 'Team', 'Division', 'Grand', 'Prix',
+        'Motorsport', 'Driver', 'Engineer', 'Manager', 'Rival', 'Contender',
+        'Community', 'Motorsports', 'Local', 'City', 'Finding', 'Their',
+        'Will', 'As', 'With', 'How', 'Without', 'In', 'Patience'
+    ])
+    
     def __init__(self, context: NarratorContext, db_path: str):
         self.context = context
         self.db_path = db_path
@@ -701,107 +885,190 @@ class TruthValidator:
             if marker in text_lower:
                 violations.append(f"Speculative language: '{marker}'")
         
+        # Precompiled per-tick index (built here if the caller has none)
+        fact_index = game_state.get('fact_index') or FactIndex.from_game_state(game_state)
+        
         # Extract and verify team names (FUZZY - allow common words and database entities)
         mentioned_teams = self._extract_team_names(text)
-        known_teams = game_state.get('known_teams', [])
-        entity_allowlist = game_state.get('entity_allowlist', set())
-        
-        # Minimal generic racing terms only (no specific names)
-        common_words = [
-            'Day', 'Season', 'Formula', 'Morale', 'Budget', 'Championship', 'The',
-            'Racing', 'Performance', 'Team', 'Division', 'Grand', 'Prix',
-            'Motorsport', 'Driver', 'Engineer', 'Manager', 'Rival', 'Contender',
-            'Community', 'Motorsports', 'Local', 'City', 'Finding', 'Their',
-            'Will', 'As', 'With', 'How', 'Without', 'In', 'Patience'
-        ]
         
         for team in mentioned_teams:
-            if team != self.context.player_team and team not in known_teams:
+            if team != self.context.player_team and team not in fact_index.entity_names:
                 # Check both generic common words AND database entity allowlist
-                if team not in common_words and team not in entity_allowlist:
+                if team not in self.COMMON_WORDS:
                     violations.append(f"Unknown entity: {team}")
         
         # Verify dollar amounts (FUZZY - 50% tolerance)
         amounts = self._extract_dollar_amounts(text)
         for amount in amounts:
-            if not self._verify_dollar_amount(amount, game_state):
+            if not fact_index.verify_dollar_amount(amount):
                 violations.append(f"Unverified amount: ${amount:,}")
         
         # Verify percentages (FUZZY - 20 point tolerance)
         percentages = self._extract_percentages(text)
         for pct in percentages:
-            if not self._verify_percentage(pct, game_state):
+            if not fact_index.verify_percentage(pct):
                 violations.append(f"Unverified percentage: {pct}%")
         
         return (len(violations) == 0, violations)
     
     def _extract_team_names(self, text: str) -> List[str]:
         """Extract capitalized words that might be team names"""
-        import re
-        potential_teams = re.findall(r'\b[A-Z][a-z]+(?:\'s)?\b', text)
-        return list(set(potential_teams))
+        return list(set(_CAPWORD_RE.findall(text)))
     
     def _extract_dollar_amounts(self, text: str) -> List[int]:
         """Extract dollar amounts from text"""
-        import re
-        amounts = []
-        
-        # Match $XXK, $XXM, $XX,XXX
-        k_matches = re.findall(r'\$(\d+)K', text, re.IGNORECASE)
-        for match in k_matches:
-            amounts.append(int(match) * 1000)
-        
-        m_matches = re.findall(r'\$(\d+)M', text, re.IGNORECASE)
-        for match in m_matches:
-            amounts.append(int(match) * 1000000)
-        
-        comma_matches = re.findall(r'\$(\d{1,3}(?:,\d{3})+)', text)
-        for match in comma_matches:
-            amounts.append(int(match.replace(',', '')))
-        
+        amounts = [int(m) * 1000 for m in _DOLLAR_K_RE.findall(text)]
+        amounts.extend(int(m) * 1000000 for m in _DOLLAR_M_RE.findall(text))
+        amounts.extend(int(m.replace(',', '')) for m in _DOLLAR_COMMA_RE.findall(text))
         return amounts
     
     def _extract_percentages(self, text: str) -> List[float]:
         """Extract percentage values from text"""
-        import re
-        matches = re.findall(r'(\d+(?:\.\d+)?)%', text)
-        return [float(m) for m in matches]
+        return [float(m) for m in _PERCENT_VALUE_RE.findall(text)]
     
     def _verify_dollar_amount(self, amount: int, game_state: Dict[str, Any]) -> bool:
         """Fuzzy check - allow if within 50% of known values"""
-        player_budget = game_state.get('budget', 0)
-        
-        # Allow if within 50% of player budget (fuzzy match)
-        if player_budget > 0:
-            tolerance = player_budget * 0.5
-            if abs(amount - player_budget) <= tolerance:
-                return True
-        
-        # Check against known team budgets
-        team_budgets = game_state.get('team_budgets', {})
-        for team_budget in team_budgets.values():
-            if team_budget > 0:
-                tolerance = team_budget * 0.5
-                if abs(amount - team_budget) <= tolerance:
-                    return True
-        
-        return False
+        fact_index = game_state.get('fact_index') or FactIndex.from_game_state(game_state)
+        return fact_index.verify_dollar_amount(amount)
     
     def _verify_percentage(self, pct: float, game_state: Dict[str, Any]) -> bool:
         """Fuzzy check - allow if within 20 points of known values"""
-        morale = game_state.get('morale', 50.0)
-        
-        # Allow if within 20 points of player morale (fuzzy match)
-        if abs(pct - morale) <= 20.0:
-            return True
-        
-        return False
+        fact_index = game_state.get('fact_index') or FactIndex.from_game_state(game_state)
+        return fact_index.verify_percentage(pct)
 
 
 # ============================================================================
 # CONTINUOUS NARRATOR THREAD
 # ============================================================================
 
+# ============================================================================
+# GAME FACT CACHE - TICK-VERSIONED DB QUERY RESULTS
+# ============================================================================
+
+def _copy_fact(value: Any) -> Any:
+    """Copy plain query results (dicts/lists of rows) so callers can't edit the cached value."""
+    if isinstance(value, dict):
+        return {k: _copy_fact(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_fact(v) for v in value]
+    return value
+
+
+class GameFactCache:
+    """
+    Caches ftb_state_db query results for the current game tick.
+    
+    Every narrator stage (prompt building, news broadcasts, truth validation,
+    continuity retries) asks for the same facts many times within one tick.
+    Sections are loaded lazily on first use and dropped when the tick moves,
+    so each query runs at most once per tick. A max age bounds staleness
+    while the game is paused (player actions can change state mid-tick).
+    
+    Loaders run outside the lock; concurrent misses on the same key wait for
+    the one in-flight load instead of querying again. Dict/list results are
+    copied on the way out. Other values (FactIndex) are shared and must be
+    treated as read-only.
+    
+    Per-section timings are kept so slow queries can be spotted.
+    """
+    
+    def __init__(self, max_age_seconds: float = 30.0):
+        self.max_age_seconds = max_age_seconds
+        self.tick: Optional[int] = None
+        self._entries: Dict[Tuple[str, str], Tuple[Any, float]] = {}
+        self._inflight: Dict[Tuple[str, str], threading.Event] = {}
+        self._generation = 0  # bumped when entries are dropped; stale loads aren't stored
+        self._timings: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.RLock()
+    
+    def set_tick(self, tick: int) -> bool:
+        """Advance the cache to `tick`. Returns True if cached facts were dropped."""
+        with self._lock:
+            if tick == self.tick:
+                return False
+            self.tick = tick
+            self._entries.clear()
+            self._inflight.clear()
+            self._generation += 1
+            return True
+    
+    def get(self, section: str, loader, key: str = "") -> Any:
+        """Return the cached value for (section, key), loading it on a miss."""
+        entry_key = (section, key)
+        while True:
+            now = time.time()
+            with self._lock:
+                entry = self._entries.get(entry_key)
+                timing = self._timings.setdefault(section, {
+                    'hits': 0, 'misses': 0, 'total_ms': 0.0, 'last_ms': 0.0, 'max_ms': 0.0
+                })
+                if entry is not None and now - entry[1] < self.max_age_seconds:
+                    timing['hits'] += 1
+                    return _copy_fact(entry[0])
+                
+                pending = self._inflight.get(entry_key)
+                if pending is None:
+                    pending = self._inflight[entry_key] = threading.Event()
+                    generation = self._generation
+                    break
+            # Another thread is loading this key; use its result (or retry if it failed)
+            pending.wait()
+        
+        try:
+            start = time.perf_counter()
+            value = loader()
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+            
+            with self._lock:
+                timing['misses'] += 1
+                timing['total_ms'] += elapsed_ms
+                timing['last_ms'] = elapsed_ms
+                timing['max_ms'] = max(timing['max_ms'], elapsed_ms)
+                if generation == self._generation:
+                    self._entries[entry_key] = (value, now)
+        finally:
+            with self._lock:
+                if self._inflight.get(entry_key) is pending:
+                    del self._inflight[entry_key]
+            pending.set()
+        return _copy_fact(value)
+    
+    def prime(self, section: str, value: Any, key: str = "") -> None:
+        """Store a value that was fetched elsewhere (e.g. by the tick probe)."""
+        with self._lock:
+            self._entries[(section, key)] = (_copy_fact(value), time.time())
+    
+    def invalidate(self, section: Optional[str] = None) -> None:
+        """Drop one section (all keys) or everything."""
+        with self._lock:
+            self._generation += 1
+            if section is None:
+                self._entries.clear()
+                self._inflight.clear()
+                return
+            for entry_key in [k for k in self._entries if k[0] == section]:
+                del self._entries[entry_key]
+            for entry_key in [k for k in self._inflight if k[0] == section]:
+                del self._inflight[entry_key]
+    
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-section timing stats, slowest (by total query time) first."""
+        with self._lock:
+            stats = {}
+            for section, t in self._timings.items():
+                calls = t['hits'] + t['misses']
+                stats[section] = {
+                    'hits': t['hits'],
+                    'misses': t['misses'],
+                    'hit_rate': t['hits'] / calls if calls else 0.0,
+                    'avg_ms': t['total_ms'] / t['misses'] if t['misses'] else 0.0,
+                    'last_ms': t['last_ms'],
+                    'max_ms': t['max_ms'],
+                    'total_ms': t['total_ms'],
+                }
+            return dict(sorted(stats.items(), key=lambda kv: kv[1]['total_ms'], reverse=True))
+
+
 class ContinuousNarrator:
     """
     Independent thread that observes ftb_state_db and generates Jarvis-style commentary.
@@ -828,11 +1095,23 @@ class ContinuousNarrator:
         self.enabled = narrator_cfg.get("enabled", True)
         self.cadence_range = narrator_cfg.get("cadence_seconds", [10, 20])
         self.max_segments_per_hour = narrator_cfg.get("max_segments_per_hour", 180)  # Increased from 60 for omnipresent narrator
+        self.segment_cooldown = narrator_cfg.get("segment_cooldown_seconds", 90)  # Quiet time after each segment
+        self.urgent_min_gap = narrator_cfg.get("urgent_min_gap_seconds", 15)  # Urgent events may cut the cooldown to this
+        
+        # EVENT-DRIVEN LOOP: woken by ftb_state_db writes instead of polling
+        self.event_notifier = ftb_state_db.get_event_notifier(db_path) if ftb_state_db and db_path else None
+        self._live_race_active = False
+        self.loop_metrics = {
+            'started_ts': time.time(),
+            'wakeups': 0,
+            'idle_cycles': 0,  # Speak-eligible wakeups that produced no segment
+            'event_to_speech_ms': deque(maxlen=100),
+        }
         
         # State
         self.context = NarratorContext(player_team=player_team)
         self.running = False
-        self.suspended = False  # True during PBP mode – narrator sleeps
+        self._suspended = False  # True during PBP mode – narrator sleeps
         self.thread = None
         self.last_segment_time = 0
         self.last_news_broadcast_time = 0  # Track Formula Z news broadcasts separately
@@ -863,6 +1142,11 @@ class ContinuousNarrator:
         self._entity_allowlist = set()  # Set of all known entity names from DB
         self._allowlist_last_updated = 0  # Timestamp of last cache refresh
         self._allowlist_ttl = 300  # Cache TTL in seconds (5 minutes)
+        self._names_automaton = None  # KeywordAutomaton over the allowlist (rebuilt with it)
+        
+        # FACT CACHE: DB query results shared by all narrator stages within a tick
+        self.fact_cache = GameFactCache()
+        self._fact_stats_last_logged = time.time()
         
         # Voice configuration
         self.voice_path = cfg.get("voices", {}).get("narrator", 
@@ -910,18 +1194,34 @@ class ContinuousNarrator:
         # Initialize entity allowlist cache
         self._get_entity_allowlist()
     
+    @property
+    def suspended(self) -> bool:
+        return self._suspended
+    
+    @suspended.setter
+    def suspended(self, value: bool):
+        self._suspended = bool(value)
+        if self.event_notifier:
+            self.event_notifier.wake()
+    
     def start(self):
         """Start the narrator thread"""
         if not self.enabled:
             self.log("ftb_narrator", "Disabled in config, not starting")
             return
         
+        if not self.event_notifier:
+            self.log("ftb_narrator", "State DB unavailable, not starting")
+            return
+        
         if self.running:
             self.log("ftb_narrator", "Already running")
             return
         
         self.running = True
         self.thread = threading.Thread(target=self._run_loop, daemon=True, name="FTB-Narrator")
+        # Take one look at the world on startup, then wait for writes
+        self.event_notifier.notify(self.context.current_tick)
         self.thread.start()
         self.log("ftb_narrator", f"Started continuous narrator for {self.player_team}")
     
@@ -931,6 +1231,8 @@ class ContinuousNarrator:
             return
         
         self.running = False
+        if self.event_notifier:
+            self.event_notifier.wake()
         if self.thread:
             self.thread.join(timeout=5.0)
         self.log("ftb_narrator", "Stopped narrator thread")
@@ -984,13 +1286,12 @@ class ContinuousNarrator:
         
         # Ensure the state DB schema exists before cleanup.
         import os
-        import sqlite3
         if not os.path.exists(self.db_path):
             self.log("ftb_narrator", f"Database does not exist yet at {self.db_path}, initializing")
             ftb_state_db.init_db(self.db_path)
         else:
             try:
-                with sqlite3.connect(self.db_path) as conn:
+                with ftb_state_db.read_connection(self.db_path) as conn:
                     cursor = conn.cursor()
                     cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
                     existing_tables = {row[0] for row in cursor.fetchall()}
@@ -1066,18 +1367,6 @@ class ContinuousNarrator:
                 
                 conn.commit()
             
-            # Force close all database connections to ensure clean state
-            # This prevents cached connection from reading stale data
-            if hasattr(ftb_state_db, '_thread_local'):
-                if hasattr(ftb_state_db._thread_local, 'connections'):
-                    if self.db_path in ftb_state_db._thread_local.connections:
-                        try:
-                            ftb_state_db._thread_local.connections[self.db_path].close()
-                            del ftb_state_db._thread_local.connections[self.db_path]
-                            self.log("ftb_narrator", "Closed and cleared database connection cache")
-                        except:
-                            pass
-            
             # Clear queued audio segments from bookmark database
             segments_cleared = 0
             if self.db_connect:
@@ -1126,125 +1415,50 @@ class ContinuousNarrator:
             traceback.print_exc()
     
     def _run_loop(self):
-        """Main narrator observation loop"""
+        """Main narrator observation loop (event-driven)
+        
+        Sleeps on the state DB's EventNotifier instead of polling. Any write
+        (events or a new tick snapshot) makes the narrator eligible to speak
+        once the segment cooldown has passed; urgent events cut the cooldown
+        short. With nothing new the loop only wakes for timed duties (news
+        broadcasts, live race commentary, rate-limit reset).
+        """
         self.log("ftb_narrator", "Narrator loop started")
         
         while self.running:
             try:
                 # ---- PBP suspension gate ----
                 if self.suspended:
-                    time.sleep(1.0)
+                    # Woken by the suspended setter or stop(); the predicate runs under
+                    # the notifier lock so a resume just before the wait isn't missed
+                    self.event_notifier.wait(
+                        want_events=False,
+                        until=lambda: not self.suspended or not self.running
+                    )
                     continue
                 
-                # TICK ALIGNMENT: Sync narrator tick with game simulation tick
-                self._sync_current_tick()
+                now = time.time()
+                self.loop_metrics['wakeups'] += 1
                 
                 # Reset hourly counter
-                if time.time() - self.hour_start_time > 3600:
+                if now - self.hour_start_time > 3600:
                     self.segments_this_hour = 0
-                    self.hour_start_time = time.time()
+                    self.hour_start_time = now
                 
-                # Check rate limit (increased for omnipresent narrator)
-                if self.segments_this_hour >= self.max_segments_per_hour:
-                    time.sleep(30)  # Reduced from 60
-                    continue
+                pending = self.event_notifier.peek()
+                since_last = now - self.last_segment_time
+                rate_limited = self.segments_this_hour >= self.max_segments_per_hour
                 
-                # Check minimum interval with 90-second cooldown after regular segments
-                elapsed_since_last = time.time() - self.last_segment_time
-                if elapsed_since_last < 90:  # 90-second cooldown after each segment
-                    time.sleep(min(10, 90 - elapsed_since_last))  # Sleep in chunks to be responsive
-                    continue
+                ready_to_speak = (
+                    pending is not None and not rate_limited and (
+                        since_last >= self.segment_cooldown
+                        or (pending['urgent'] and since_last >= self.urgent_min_gap)
+                    )
+                )
                 
-                # Observe event pool
-                observations = self._observe_events()
-                
-                # Update context with current player state
-                self._update_player_context()
-                
-                # Initialize state snapshot on first run (prevents phantom heat spike)
-                if not self._snapshot_initialized:
-                    self.last_state_snapshot = {
-                        'budget': self.context.player_budget,
-                        'morale': self.context.player_morale,
-                        'position': self.context.player_championship_position,
-                        'points': self.context.player_points
-                    }
-                    self._snapshot_initialized = True
-                    self.log("ftb_narrator", f"Initialized heat snapshot: budget=${self.last_state_snapshot['budget']:,}, morale={self.last_state_snapshot['morale']:.1f}")
-                
-                # Decide if we should speak
-                should_speak, commentary_type = self._should_generate_commentary(observations)
-                
-                if should_speak:
-                    # ---- Re-check suspension BEFORE expensive LLM call ----
-                    if self.suspended:
-                        self.log("ftb_narrator", "Suspended before LLM call – skipping")
-                        continue
-
-                    # Generate commentary
-                    segment_text = self._generate_commentary(observations, commentary_type)
-                    
-                    # ---- Re-check suspension AFTER LLM call (may have taken 10-30s) ----
-                    if self.suspended:
-                        self.log("ftb_narrator", "Suspended after LLM call – discarding generated text")
-                        self.burst_sequence = []
-                        self.in_burst_mode = False
-                        continue
-
-                    if segment_text:
-                        # CONTINUITY-FIRST: Validate and enforce continuity
-                        validated_text = self._validate_and_enforce_continuity(segment_text, commentary_type, observations)
-                        
-                        # ---- Re-check suspension AFTER validation (more LLM calls) ----
-                        if self.suspended:
-                            self.log("ftb_narrator", "Suspended after validation – discarding")
-                            self.burst_sequence = []
-                            self.in_burst_mode = False
-                            continue
-
-                        if validated_text:
-                            # CONTINUITY-FIRST: Trigger burst mode (rapid multi-part delivery)
-                            self._trigger_burst_mode(validated_text, commentary_type, observations)
-                            
-                            # ---- Final suspension gate before enqueue ----
-                            if self.suspended:
-                                self.log("ftb_narrator", "Suspended before enqueue – discarding burst")
-                                self.burst_sequence = []
-                                self.in_burst_mode = False
-                                continue
-
-                            # Enqueue burst sequence or single segment
-                            if self.burst_sequence:
-                                self._enqueue_burst_sequence()
-                            else:
-                                self._enqueue_audio(validated_text, commentary_type)
-                            
-                            # Update show bible after successful generation
-                            try:
-                                # Get recent events and entities for show bible
-                                recent_events = observations.high_priority_events + observations.player_team_events
-                                state_snapshot = {
-                                    'budget': self.context.player_budget,
-                                    'morale': self.context.player_morale,
-                                    'position': self.context.player_championship_position
-                                }
-                                
-                                # Query entities from DB
-                                entities = []
-                                try:
-                                    if ftb_state_db and self.db_path:
-                                        entities = ftb_state_db.query_entities(self.db_path, team_name=self.player_team)
-                                except:
-                                    pass
-                                
-                                # CALENDAR INTEGRATION: Pass upcoming calendar to show bible manager
-                                upcoming = self._query_upcoming_calendar(days_ahead=14)
-                                self.show_bible_manager.finalize_segment_update(recent_events, state_snapshot, entities, upcoming)
-                            except Exception as e:
-                                self.log("ftb_narrator", f"Error updating show bible: {e}")
-                            
-                            self.last_segment_time = time.time()
-                            self.segments_this_hour += 1
+                spoke = False
+                if ready_to_speak:
+                    spoke = self._run_commentary_cycle()
                 
                 # Check for Formula Z news broadcast
                 if self._should_broadcast_news():
@@ -1261,12 +1475,25 @@ class ContinuousNarrator:
                             # Still update last broadcast time to avoid spam retries
                             self.last_news_broadcast_time = time.time()
                 
-                # Check for live race broadcast commentary
-                self._check_live_race_broadcast()
+                # Check for live race broadcast commentary (only when something
+                # was written or a race is already streaming)
+                if pending is not None or self._live_race_active:
+                    self._check_live_race_broadcast()
+                
+                if ready_to_speak and not spoke:
+                    self.loop_metrics['idle_cycles'] += 1
                 
-                # Random sleep for natural pacing (reduced for omnipresent narrator)
-                sleep_duration = random.uniform(2, 5)  # Changed from self.cadence_range (10-20)
-                time.sleep(sleep_duration)
+                # ---- Sleep until something changes or a timed duty is due ----
+                # Only writes that could change the decision end the wait early:
+                # any write when idle, urgent ones while a cooldown is running.
+                pending = self.event_notifier.peek()
+                rate_limited = self.segments_this_hour >= self.max_segments_per_hour
+                self.event_notifier.wait(
+                    timeout=self._next_wake_timeout(),
+                    want_events=not rate_limited and not (pending and pending['urgent']),
+                    urgent_only=pending is not None,
+                    until=lambda: self.suspended or not self.running
+                )
                 
             except Exception as e:
                 self.log("ftb_narrator", f"Error in narrator loop: {e}")
@@ -1274,6 +1501,169 @@ class ContinuousNarrator:
                 traceback.print_exc()
                 time.sleep(10)
     
+    def _next_wake_timeout(self) -> Optional[float]:
+        """Seconds until the loop has timed work to do (None = wait for events)."""
+        now = time.time()
+        deadlines = []
+        
+        # Pending writes become speakable when the cooldown (or urgent gap) ends
+        pending = self.event_notifier.peek()
+        if self.segments_this_hour >= self.max_segments_per_hour:
+            # Hourly rate limit window
+            deadlines.append(self.hour_start_time + 3600)
+        elif pending is not None:
+            cooldown = self.urgent_min_gap if pending['urgent'] else self.segment_cooldown
+            deadlines.append(self.last_segment_time + cooldown)
+        
+        # Formula Z news window opens 15 minutes after the last broadcast;
+        # once open, re-check it once a minute rather than spinning
+        if self.context.player_tier != 5:
+            deadlines.append(max(self.last_news_broadcast_time + 15 * 60, now + 60))
+        
+        # Keep lap commentary flowing while a live race streams
+        if self._live_race_active:
+            deadlines.append(now + random.uniform(2, 5))
+        
+        if not deadlines:
+            return None
+        return max(0.5, min(deadlines) - now)
+    
+    def _run_commentary_cycle(self) -> bool:
+        """Observe new events and generate one commentary segment.
+        
+        Returns:
+            True if a segment was enqueued
+        """
+        # Take the pending writes; anything written from here on wakes the next cycle
+        pending = self.event_notifier.consume()
+        
+        # TICK ALIGNMENT: Sync narrator tick with game simulation tick
+        self._sync_current_tick()
+        
+        # Observe event pool
+        observations = self._observe_events()
+        
+        # Update context with current player state
+        self._update_player_context()
+        
+        # Initialize state snapshot on first run (prevents phantom heat spike)
+        if not self._snapshot_initialized:
+            self.last_state_snapshot = {
+                'budget': self.context.player_budget,
+                'morale': self.context.player_morale,
+                'position': self.context.player_championship_position,
+                'points': self.context.player_points
+            }
+            self._snapshot_initialized = True
+            self.log("ftb_narrator", f"Initialized heat snapshot: budget=${self.last_state_snapshot['budget']:,}, morale={self.last_state_snapshot['morale']:.1f}")
+        
+        # Decide if we should speak
+        should_speak, commentary_type = self._should_generate_commentary(observations)
+        if not should_speak:
+            return False
+        
+        # ---- Re-check suspension BEFORE expensive LLM call ----
+        if self.suspended:
+            self.log("ftb_narrator", "Suspended before LLM call – skipping")
+            return False
+        
+        # Generate commentary
+        segment_text = self._generate_commentary(observations, commentary_type)
+        
+        # ---- Re-check suspension AFTER LLM call (may have taken 10-30s) ----
+        if self.suspended:
+            self.log("ftb_narrator", "Suspended after LLM call – discarding generated text")
+            self.burst_sequence = []
+            self.in_burst_mode = False
+            return False
+        
+        if not segment_text:
+            return False
+        
+        # CONTINUITY-FIRST: Validate and enforce continuity
+        validated_text = self._validate_and_enforce_continuity(segment_text, commentary_type, observations)
+        
+        # ---- Re-check suspension AFTER validation (more LLM calls) ----
+        if self.suspended:
+            self.log("ftb_narrator", "Suspended after validation – discarding")
+            self.burst_sequence = []
+            self.in_burst_mode = False
+            return False
+        
+        if not validated_text:
+            return False
+        
+        # CONTINUITY-FIRST: Trigger burst mode (rapid multi-part delivery)
+        self._trigger_burst_mode(validated_text, commentary_type, observations)
+        
+        # ---- Final suspension gate before enqueue ----
+        if self.suspended:
+            self.log("ftb_narrator", "Suspended before enqueue – discarding burst")
+            self.burst_sequence = []
+            self.in_burst_mode = False
+            return False
+        
+        # Enqueue burst sequence or single segment
+        if self.burst_sequence:
+            self._enqueue_burst_sequence()
+        else:
+            self._enqueue_audio(validated_text, commentary_type)
+        
+        # METRICS: time from the first triggering event write to enqueued speech
+        if pending and pending['event_count']:
+            latency_ms = (time.time() - pending['first_ts']) * 1000.0
+            self.loop_metrics['event_to_speech_ms'].append(latency_ms)
+        
+        # Update show bible after successful generation
+        try:
+            # Get recent events and entities for show bible
+            recent_events = observations.high_priority_events + observations.player_team_events
+            state_snapshot = {
+                'budget': self.context.player_budget,
+                'morale': self.context.player_morale,
+                'position': self.context.player_championship_position
+            }
+            
+            # Query entities from DB
+            entities = []
+            try:
+                if ftb_state_db and self.db_path:
+                    entities = self._cached_query('entities', ftb_state_db.query_entities, team_name=self.player_team)
+            except:
+                pass
+            
+            # CALENDAR INTEGRATION: Pass upcoming calendar to show bible manager
+            upcoming = self._query_upcoming_calendar(days_ahead=14)
+            self.show_bible_manager.finalize_segment_update(recent_events, state_snapshot, entities, upcoming)
+        except Exception as e:
+            self.log("ftb_narrator", f"Error updating show bible: {e}")
+        
+        self.last_segment_time = time.time()
+        self.segments_this_hour += 1
+        return True
+    
+    def get_loop_metrics(self) -> Dict[str, Any]:
+        """Event-to-speech latency and idle wakeup rate for diagnostics."""
+        latencies = sorted(self.loop_metrics['event_to_speech_ms'])
+        minutes = max(1e-6, (time.time() - self.loop_metrics['started_ts']) / 60.0)
+        metrics = {
+            'wakeups': self.loop_metrics['wakeups'],
+            'idle_cycles': self.loop_metrics['idle_cycles'],
+            'wakeups_per_min': self.loop_metrics['wakeups'] / minutes,
+            'idle_query_rate_per_min': self.loop_metrics['idle_cycles'] / minutes,
+            'event_to_speech_ms': {},
+        }
+        if latencies:
+            metrics['event_to_speech_ms'] = {
+                'count': len(latencies),
+                'last': self.loop_metrics['event_to_speech_ms'][-1],
+                'avg': sum(latencies) / len(latencies),
+                'p50': latencies[len(latencies) // 2],
+                'p95': latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+            }
+        return metrics
+    
+
     def _observe_events(self) -> EventObservation:
         """Read state DB and filter for relevant unseen events (with smart batch aggregation)"""
         if not ftb_state_db or not self.db_path:
@@ -1466,6 +1856,10 @@ class ContinuousNarrator:
             game_state = ftb_state_db.query_game_state(self.db_path)
             if game_state:
                 db_tick = game_state.get("tick", 0)
+                # FACT CACHE: new tick drops cached facts; reuse this probe result
+                if self.fact_cache.set_tick(db_tick):
+                    self._maybe_log_narrator_stats()
+                self.fact_cache.prime('game_state', game_state)
                 if db_tick != self.context.current_tick:
                     old_tick = self.context.current_tick
                     self.context.current_tick = db_tick
@@ -1477,13 +1871,57 @@ class ContinuousNarrator:
             # Fallback: increment manually on error
             self.context.current_tick += 1
     
+    def _cached_query(self, section: str, query_fn, *args, **kwargs) -> Any:
+        """Run an ftb_state_db query through the tick-versioned fact cache."""
+        key = repr((args, sorted(kwargs.items()))) if (args or kwargs) else ""
+        return self.fact_cache.get(
+            section,
+            lambda: query_fn(self.db_path, *args, **kwargs),
+            key
+        )
+    
+    def get_fact_cache_stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-section fact query timings (slowest first) for diagnostics."""
+        return self.fact_cache.get_stats()
+    
+    def _maybe_log_narrator_stats(self, interval_seconds: float = 600.0):
+        """Log the slowest fact sections, loop metrics and DB statements every few minutes."""
+        now = time.time()
+        if now - self._fact_stats_last_logged < interval_seconds:
+            return
+        self._fact_stats_last_logged = now
+        stats = self.fact_cache.get_stats()
+        if stats:
+            top = ", ".join(
+                f"{section}={t['avg_ms']:.1f}ms x{t['misses']:.0f} ({t['hit_rate']:.0%} hit)"
+                for section, t in list(stats.items())[:5]
+            )
+            self.log("ftb_narrator", f"Fact cache slowest sections: {top}")
+        
+        loop = self.get_loop_metrics()
+        latency = loop['event_to_speech_ms']
+        self.log(
+            "ftb_narrator",
+            f"Loop: {loop['wakeups_per_min']:.2f} wakeups/min, "
+            f"{loop['idle_query_rate_per_min']:.2f} idle cycles/min"
+            + (f", event→speech avg {latency['avg']:.0f}ms p95 {latency['p95']:.0f}ms" if latency else "")
+        )
+        
+        slow_queries = ftb_state_db.get_db_manager(self.db_path).get_query_stats(top=3)
+        if slow_queries:
+            top = "; ".join(
+                f"{q['sql'][:60]} avg {q['avg_ms']:.1f}ms x{q['count']}"
+                for q in slow_queries
+            )
+            self.log("ftb_narrator", f"DB slowest statements: {top}")
+    
     def _update_player_context(self):
         """Update narrator's understanding of current player state from DB"""
         if not ftb_state_db or not self.db_path:
             return
         
         try:
-            player_state = ftb_state_db.query_player_state(self.db_path)
+            player_state = self._cached_query('player_state', ftb_state_db.query_player_state)
             if player_state:
                 self.context.player_budget = int(player_state.get("budget", 0))
                 self.context.player_championship_position = player_state.get("championship_position", 0)
@@ -1493,7 +1931,7 @@ class ContinuousNarrator:
                 self.context.player_tier = player_state.get("tier", 1)
                 
                 # Query game state for tick/day info
-                game_state = ftb_state_db.query_game_state(self.db_path)
+                game_state = self._cached_query('game_state', ftb_state_db.query_game_state)
                 if game_state:
                     self.context.current_day = game_state.get("day", 0)
                     self.context.current_season = game_state.get("season", 1)
@@ -1553,7 +1991,7 @@ class ContinuousNarrator:
         
         try:
             # All team names
-            teams = ftb_state_db.query_all_teams(self.db_path)
+            teams = self._cached_query('teams', ftb_state_db.query_all_teams)
             if teams:
                 # Add team names
                 allowlist.update(t['name'] for t in teams if t['name'])
@@ -1564,13 +2002,20 @@ class ContinuousNarrator:
                 # Query rosters for each team to get all entity names
                 for team in teams:
                     try:
-                        roster = ftb_state_db.query_entities_by_team(self.db_path, team['name'])
+                        roster = self._cached_query('roster', ftb_state_db.query_entities_by_team, team['name'])
                         if roster:
                             allowlist.update(e['name'] for e in roster if e.get('name'))
                     except Exception as e:
                         self.log("ftb_narrator", f"Error querying roster for {team['name']}: {e}")
                         continue
             
+            # Sponsor names
+            try:
+                sponsors = self._cached_query('sponsors', ftb_state_db.query_sponsorships)
+                allowlist.update(sp['sponsor_name'] for sp in sponsors if sp.get('sponsor_name'))
+            except Exception as e:
+                self.log("ftb_narrator", f"Error querying sponsors for allowlist: {e}")
+            
             self.log("ftb_narrator", f"Built entity allowlist with {len(allowlist)} names")
             
         except Exception as e:
@@ -1584,8 +2029,36 @@ class ContinuousNarrator:
         if now - self._allowlist_last_updated > self._allowlist_ttl:
             self._entity_allowlist = self._build_entity_allowlist()
             self._allowlist_last_updated = now
+            self._names_automaton = None
         return self._entity_allowlist
     
+    def _get_fact_index(self) -> FactIndex:
+        """Per-tick FactIndex shared by all validation passes."""
+        return self.fact_cache.get('fact_index', self._build_fact_index)
+    
+    def _build_fact_index(self) -> FactIndex:
+        """Compile names and numeric facts for the current tick."""
+        allowlist = self._get_entity_allowlist()
+        # The name automaton only changes when the allowlist is rebuilt
+        if self._names_automaton is None:
+            self._names_automaton = KeywordAutomaton(allowlist)
+        
+        dollars = [self.context.player_budget]
+        percents = [self.context.player_morale]
+        if ftb_state_db and self.db_path:
+            try:
+                teams = self._cached_query('teams', ftb_state_db.query_all_teams)
+                dollars.extend(t.get('budget', 0) for t in teams)
+            except Exception as e:
+                self.log("ftb_narrator", f"Error gathering team budgets for fact index: {e}")
+            try:
+                sponsors = self._cached_query('sponsors', ftb_state_db.query_sponsorships)
+                dollars.extend(sp.get('base_payment_per_season', 0) for sp in sponsors)
+            except Exception as e:
+                self.log("ftb_narrator", f"Error gathering sponsor payments for fact index: {e}")
+        
+        return FactIndex(allowlist, dollars, percents, names_automaton=self._names_automaton)
+    
     def _choose_segment_type(self, observations: EventObservation) -> CommentaryType:
         """Choose segment type using cooldown-weighted selection with event-driven priority"""
         
@@ -2048,13 +2521,13 @@ Reply with ONLY the commentary text (2-3 sentences). Do not include labels, JSON
         
         try:
             # Query current roster
-            roster = ftb_state_db.query_entities_by_team(self.db_path, self.context.player_team)
+            roster = self._cached_query('roster', ftb_state_db.query_entities_by_team, self.context.player_team)
             
             # Query job board for visible opportunities
-            job_listings = ftb_state_db.query_job_board(self.db_path, tier=self.context.player_tier)
+            job_listings = self._cached_query('job_board', ftb_state_db.query_job_board, tier=self.context.player_tier)
             
             # Query top free agents in our tier
-            free_agents = ftb_state_db.query_free_agents(self.db_path, tier=self.context.player_tier, limit=5)
+            free_agents = self._cached_query('free_agents', ftb_state_db.query_free_agents, tier=self.context.player_tier, limit=5)
             
             context = "\nROSTER CONTEXT:\n"
             
@@ -2097,7 +2570,7 @@ Reply with ONLY the commentary text (2-3 sentences). Do not include labels, JSON
         
         # Check if there's Formula Z race activity
         try:
-            fz_leagues = ftb_state_db.query_league_standings(self.db_path, tier=5)
+            fz_leagues = self._cached_query('standings', ftb_state_db.query_league_standings, tier=5)
             if not fz_leagues:
                 return False
 
@@ -2124,7 +2597,7 @@ Reply with ONLY the commentary text (2-3 sentences). Do not include labels, JSON
         """
         try:
             # Query Formula Z standings ONLY (tier 5)
-            fz_leagues = ftb_state_db.query_league_standings(self.db_path, tier=5)
+            fz_leagues = self._cached_query('standings', ftb_state_db.query_league_standings, tier=5)
             if not fz_leagues:
                 return None
 
@@ -2142,8 +2615,9 @@ Reply with ONLY the commentary text (2-3 sentences). Do not include labels, JSON
             current_day = 0
             try:
                 # Get most recent Formula Z race to determine current season
-                recent_fz_race = ftb_state_db.query_race_results(
-                    self.db_path,
+                recent_fz_race = self._cached_query(
+                    'race_results',
+                    ftb_state_db.query_race_results,
                     league_ids=[league_id] if league_id else None,
                     limit=1
                 )
@@ -2159,7 +2633,7 @@ Reply with ONLY the commentary text (2-3 sentences). Do not include labels, JSON
             fz_teams = []
             budget_map = {}
             try:
-                teams = ftb_state_db.query_all_teams(self.db_path, league_id=league_id) if league_id else ftb_state_db.query_all_teams(self.db_path)
+                teams = self._cached_query('teams', ftb_state_db.query_all_teams, league_id=league_id) if league_id else self._cached_query('teams', ftb_state_db.query_all_teams)
                 # Filter to tier 5 teams only
                 fz_teams = [t for t in teams if t.get('tier') == 5]
                 budget_map = {t.get('name'): t.get('budget', 0) for t in fz_teams}
@@ -2171,7 +2645,7 @@ Reply with ONLY the commentary text (2-3 sentences). Do not include labels, JSON
             all_fz_drivers = []
             for team_name in [team.get('team') or team.get('name') for team in fz_standings[:12]]:
                 try:
-                    entities = ftb_state_db.query_entities_by_team(self.db_path, team_name)
+                    entities = self._cached_query('roster', ftb_state_db.query_entities_by_team, team_name)
                     drivers = [e for e in entities if e.get('type') == 'driver']
                     driver_roster_map[team_name] = drivers
                     all_fz_drivers.extend(drivers)
@@ -2182,8 +2656,9 @@ Reply with ONLY the commentary text (2-3 sentences). Do not include labels, JSON
             # 4. Query recent Formula Z race results (tier 5 ONLY, last 3 races)
             race_results = []
             try:
-                race_results = ftb_state_db.query_race_results(
-                    self.db_path,
+                race_results = self._cached_query(
+                    'race_results',
+                    ftb_state_db.query_race_results,
                     seasons=[current_season],
                     league_ids=[league_id] if league_id else None,
                     limit=3
@@ -2194,7 +2669,7 @@ Reply with ONLY the commentary text (2-3 sentences). Do not include labels, JSON
             # 5. Query recent Formula Z events for additional context (tier 5 ONLY)
             recent_events = []
             try:
-                recent_events = ftb_state_db.query_tier_events(self.db_path, tier=5, limit=10)
+                recent_events = self._cached_query('tier_events', ftb_state_db.query_tier_events, tier=5, limit=10)
             except Exception:
                 recent_events = []
             
@@ -2359,12 +2834,12 @@ Reply with ONLY the news update text."""
             if re.search(pattern, text_lower):
                 violations.append(f"News anchor must not refer to player/listener (found pattern: {pattern})")
         
-        # CHECK 2: Get entity allowlist (all known teams and drivers)
-        entity_allowlist = self._get_entity_allowlist()
+        # CHECK 2: Get fact index (all known teams, drivers and sponsors)
+        fact_index = self._get_fact_index()
         
         # Extract capitalized words that look like proper nouns (potential names)
         # More aggressive pattern to catch first+last names
-        potential_names = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', text)
+        potential_names = _PROPER_NAME_RE.findall(text)
         
         # Filter out common words and known acceptable terms
         common_racing_terms = {
@@ -2389,15 +2864,9 @@ Reply with ONLY the news update text."""
                 if part in common_racing_terms:
                     continue
                 
-                # Check if this name part exists in entity allowlist
-                # Case-insensitive partial match (accounts for team suffixes like "Racing")
-                found = False
-                for entity in entity_allowlist:
-                    if part.lower() in entity.lower() or entity.lower() in part.lower():
-                        found = True
-                        break
-                
-                if not found:
+                # Check if this name part is a word of a known name, or contains one
+                # (case-insensitive; accounts for team suffixes like "Racing")
+                if not fact_index.is_known_name_part(part):
                     # Potential hallucination - unknown name
                     violations.append(f"Unknown entity mentioned: '{name}' (part: '{part}')")
         
@@ -2453,13 +2922,14 @@ Reply with ONLY the news update text."""
             'season': self.context.current_season,
             'known_teams': [self.context.player_team],
             'team_budgets': {},
-            'entity_allowlist': self._get_entity_allowlist()  # Database-driven entity names
+            'entity_allowlist': self._get_entity_allowlist(),  # Database-driven entity names
+            'fact_index': self._get_fact_index()  # Precompiled matchers for this tick
         }
         
         # Try to get other teams for validation
         if ftb_state_db and self.db_path:
             try:
-                teams = ftb_state_db.query_all_teams(self.db_path)
+                teams = self._cached_query('teams', ftb_state_db.query_all_teams)
                 if teams:
                     game_state['known_teams'].extend([t['name'] for t in teams if t['name'] != self.context.player_team])
                     game_state['team_budgets'] = {t['name']: t['budget'] for t in teams}
@@ -2666,9 +3136,8 @@ OUTPUT ONLY THE REWRITTEN NARRATION—no explanations, no meta-commentary.
         has_linking = any(word in new_lower for word in linking_words)
         
         # Check for shared entity names (extract capitalized words)
-        import re
-        prior_entities = set(re.findall(r'\b[A-Z][a-z]+\b', prior_text))
-        new_entities = set(re.findall(r'\b[A-Z][a-z]+\b', new_text))
+        prior_entities = set(_ENTITY_WORD_RE.findall(prior_text))
+        new_entities = set(_ENTITY_WORD_RE.findall(new_text))
         has_shared_entity = len(prior_entities & new_entities) > 0
         
         # Check for motif/open loop reference
@@ -2689,12 +3158,12 @@ OUTPUT ONLY THE REWRITTEN NARRATION—no explanations, no meta-commentary.
         
         try:
             # Player state
-            player_state = ftb_state_db.query_player_state(self.db_path)
+            player_state = self._cached_query('player_state', ftb_state_db.query_player_state)
             facts['player'] = player_state or {}
             
             # Game state for season context
             try:
-                game_state = ftb_state_db.query_game_state(self.db_path)
+                game_state = self._cached_query('game_state', ftb_state_db.query_game_state)
                 if game_state:
                     facts['current_season'] = game_state.get('season', 1)
                     facts['current_day'] = game_state.get('day', 0)
@@ -2718,8 +3187,9 @@ OUTPUT ONLY THE REWRITTEN NARRATION—no explanations, no meta-commentary.
                     player_tier = player_state.get('tier')
 
                 if player_league_id:
-                    results = ftb_state_db.query_race_results(
-                        self.db_path,
+                    results = self._cached_query(
+                        'race_results',
+                        ftb_state_db.query_race_results,
                         seasons=[facts['current_season']],
                         league_ids=[player_league_id]
                     )
@@ -2743,7 +3213,7 @@ OUTPUT ONLY THE REWRITTEN NARRATION—no explanations, no meta-commentary.
             
             # Player roster
             try:
-                roster = ftb_state_db.query_entities_by_team(self.db_path, self.context.player_team)
+                roster = self._cached_query('roster', ftb_state_db.query_entities_by_team, self.context.player_team)
                 facts['roster'] = roster
                 facts['roster_summary'] = {
                     'drivers': [e for e in roster if e['type'] == 'Driver'],
@@ -2758,12 +3228,12 @@ OUTPUT ONLY THE REWRITTEN NARRATION—no explanations, no meta-commentary.
             # All teams (league-scoped for fair comparisons)
             try:
                 # First, get player's team to find their league_id
-                all_teams_global = ftb_state_db.query_all_teams(self.db_path)
+                all_teams_global = self._cached_query('teams', ftb_state_db.query_all_teams)
                 player_team_data = next((t for t in all_teams_global if t['name'] == self.context.player_team), None)
                 
                 if player_team_data and player_team_data.get('league_id'):
                     # Query teams in player's league only
-                    league_teams = ftb_state_db.query_all_teams(self.db_path, league_id=player_team_data['league_id'])
+                    league_teams = self._cached_query('teams', ftb_state_db.query_all_teams, league_id=player_team_data['league_id'])
                     facts['all_teams'] = league_teams
                     facts['rival_teams'] = [t for t in league_teams if t['name'] != self.context.player_team]
                 else:
@@ -2815,7 +3285,7 @@ OUTPUT ONLY THE REWRITTEN NARRATION—no explanations, no meta-commentary.
             
             # League standings
             try:
-                standings = ftb_state_db.query_league_standings(self.db_path)
+                standings = self._cached_query('standings', ftb_state_db.query_league_standings)
                 facts['standings'] = standings
             except Exception as e:
                 self.log("ftb_narrator", f"Error querying standings: {e}")
@@ -2824,7 +3294,7 @@ OUTPUT ONLY THE REWRITTEN NARRATION—no explanations, no meta-commentary.
             # Upcoming calendar
             try:
                 current_day = self.context.current_day
-                calendar = ftb_state_db.query_calendar_window(self.db_path, current_day, current_day + 7)
+                calendar = self._cached_query('calendar', ftb_state_db.query_calendar_window, current_day, current_day + 7)
                 facts['upcoming_calendar'] = calendar[:5]  # Top 5 soonest
             except Exception as e:
                 self.log("ftb_narrator", f"Error querying calendar: {e}")
@@ -2832,7 +3302,7 @@ OUTPUT ONLY THE REWRITTEN NARRATION—no explanations, no meta-commentary.
             
             # Job market
             try:
-                job_board = ftb_state_db.query_job_board(self.db_path, tier=self.context.player_tier)
+                job_board = self._cached_query('job_board', ftb_state_db.query_job_board, tier=self.context.player_tier)
                 facts['job_board'] = job_board[:10]  # Top 10 listings
             except Exception as e:
                 self.log("ftb_narrator", f"Error querying job board: {e}")
@@ -2840,7 +3310,7 @@ OUTPUT ONLY THE REWRITTEN NARRATION—no explanations, no meta-commentary.
             
             # Free agents
             try:
-                free_agents = ftb_state_db.query_free_agents(self.db_path, tier=self.context.player_tier, limit=10)
+                free_agents = self._cached_query('free_agents', ftb_state_db.query_free_agents, tier=self.context.player_tier, limit=10)
                 facts['free_agents'] = free_agents
             except Exception as e:
                 self.log("ftb_narrator", f"Error querying free agents: {e}")
@@ -2848,7 +3318,7 @@ OUTPUT ONLY THE REWRITTEN NARRATION—no explanations, no meta-commentary.
             
             # Sponsorships (with behavioral profiles)
             try:
-                sponsors = ftb_state_db.query_sponsorships(self.db_path, team_name=self.context.player_team)
+                sponsors = self._cached_query('sponsors', ftb_state_db.query_sponsorships, team_name=self.context.player_team)
                 facts['sponsors'] = sponsors
             except Exception as e:
                 self.log("ftb_narrator", f"Error querying sponsorships: {e}")
@@ -2856,7 +3326,7 @@ OUTPUT ONLY THE REWRITTEN NARRATION—no explanations, no meta-commentary.
             
             # Folded teams (paddock graveyard)
             try:
-                folded = ftb_state_db.query_folded_teams(self.db_path, limit=5)
+                folded = self._cached_query('folded_teams', ftb_state_db.query_folded_teams, limit=5)
                 facts['folded_teams'] = folded
             except Exception as e:
                 self.log("ftb_narrator", f"Error querying folded teams: {e}")
@@ -2864,7 +3334,7 @@ OUTPUT ONLY THE REWRITTEN NARRATION—no explanations, no meta-commentary.
             
             # Penalties (player team)
             try:
-                penalties = ftb_state_db.query_penalties(self.db_path, team_name=self.context.player_team, limit=5)
+                penalties = self._cached_query('penalties', ftb_state_db.query_penalties, team_name=self.context.player_team, limit=5)
                 facts['penalties'] = penalties
             except Exception as e:
                 self.log("ftb_narrator", f"Error querying penalties: {e}")
@@ -2872,7 +3342,7 @@ OUTPUT ONLY THE REWRITTEN NARRATION—no explanations, no meta-commentary.
             
             # League economic state (sponsor market health)
             try:
-                econ_state = ftb_state_db.query_league_economic_state(self.db_path)
+                econ_state = self._cached_query('economic_state', ftb_state_db.query_league_economic_state)
                 facts['economic_state'] = econ_state
             except Exception as e:
                 self.log("ftb_narrator", f"Error querying economic state: {e}")
@@ -2880,7 +3350,7 @@ OUTPUT ONLY THE REWRITTEN NARRATION—no explanations, no meta-commentary.
             
             # Action-required calendar items (decision inbox)
             try:
-                decision_items = ftb_state_db.query_decision_inbox(self.db_path)
+                decision_items = self._cached_query('decision_inbox', ftb_state_db.query_decision_inbox)
                 filtered = []
                 for item in decision_items:
                     if item.get('category') != 'personnel':
@@ -3006,8 +3476,9 @@ Recent event: {ctx['newest_event']}
         
         try:
             current_day = self.context.current_day
-            entries = ftb_state_db.query_calendar_window(
-                self.db_path,
+            entries = self._cached_query(
+                'calendar',
+                ftb_state_db.query_calendar_window,
                 current_day,
                 current_day + days_ahead
             )
@@ -3137,55 +3608,34 @@ Recent event: {ctx['newest_event']}
         
         return cleaned.strip()
     
+    # Stakes keywords that should be near numbers
+    _STAKES_AUTOMATON = KeywordAutomaton([
+        'half of', 'twice', 'double', 'triple',  # Comparison multipliers
+        'more than', 'less than', 'compared to', 'versus', 'than',  # Comparison
+        'if', 'unless', 'when', 'until', 'away from', 'from',  # Consequence
+        'below', 'above', 'under', 'over', 'threshold', 'breaking point',  # Threshold
+        'enough for', 'covers', 'means', 'buys', 'costs',  # Consequence
+        'was', 'now', 'up from', 'down from', 'changed',  # Temporal comparison
+    ])
+    
     def _detect_bare_numbers(self, text: str) -> List[str]:
         """
         Detect numbers mentioned without stakes context.
         A number is "bare" if it appears without nearby comparison/consequence/threshold language.
         """
-        import re
-        
         bare_numbers = []
         
-        # Stakes keywords that should be near numbers
-        stakes_keywords = [
-            'half of', 'twice', 'double', 'triple',  # Comparison multipliers
-            'more than', 'less than', 'compared to', 'versus', 'than',  # Comparison
-            'if', 'unless', 'when', 'until', 'away from', 'from',  # Consequence
-            'below', 'above', 'under', 'over', 'threshold', 'breaking point',  # Threshold
-            'enough for', 'covers', 'means', 'buys', 'costs',  # Consequence
-            'was', 'now', 'up from', 'down from', 'changed',  # Temporal comparison
-        ]
-        
-        # Find budget mentions: $XXX or $XX,XXX or $XXK or $XXM
-        budget_pattern = r'\$\d+(?:,\d+)*(?:[KM])?'
-        budget_matches = re.finditer(budget_pattern, text)
-        
-        for match in budget_matches:
-            num_str = match.group()
-            start = max(0, match.start() - 50)  # Look 50 chars before
-            end = min(len(text), match.end() + 50)  # Look 50 chars after
-            context_window = text[start:end].lower()
-            
-            # Check if stakes keywords are nearby
-            has_stakes = any(keyword in context_window for keyword in stakes_keywords)
-            
-            if not has_stakes:
-                bare_numbers.append(num_str)
+        # Locate every stakes keyword once; each number then checks its window with bisect
+        spans = sorted((start, end) for start, end, _ in self._STAKES_AUTOMATON.iter_matches(text.lower()))
+        starts = [span[0] for span in spans]
         
-        # Find percentage mentions: XX%
-        percent_pattern = r'\d+(?:\.\d+)?%'
-        percent_matches = re.finditer(percent_pattern, text)
-        
-        for match in percent_matches:
-            num_str = match.group()
-            start = max(0, match.start() - 50)
-            end = min(len(text), match.end() + 50)
-            context_window = text[start:end].lower()
-            
-            has_stakes = any(keyword in context_window for keyword in stakes_keywords)
-            
-            if not has_stakes:
-                bare_numbers.append(num_str)
+        # Budget mentions ($XXX, $XX,XXX, $XXK, $XXM) and percentages (XX%)
+        for pattern in (_BUDGET_MENTION_RE, _PERCENT_MENTION_RE):
+            for match in pattern.finditer(text):
+                lo = max(0, match.start() - 50)  # Look 50 chars before
+                hi = min(len(text), match.end() + 50)  # Look 50 chars after
+                if not _within_window(spans, starts, lo, hi):
+                    bare_numbers.append(match.group())
         
         return bare_numbers
     
@@ -3398,52 +3848,29 @@ Recent event: {ctx['newest_event']}
             return
         
         try:
-            # Get game state from DB
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Check if there's an active live race
-            cursor.execute("""
-                SELECT value FROM game_state_kv 
-                WHERE key = 'race_day_phase' AND game_id = ?
-            """, (self.game_id,))
-            phase_row = cursor.fetchone()
-            
-            if not phase_row:
-                conn.close()
-                return
-            
-            phase_str = phase_row[0]
+            # Get race day state from DB (one lookup for all keys)
+            with ftb_state_db.read_connection(self.db_path) as conn:
+                rows = conn.execute("""
+                    SELECT key, value FROM game_state_kv
+                    WHERE game_id = ? AND key IN (
+                        'race_day_phase', 'race_day_current_lap',
+                        'race_day_total_laps', 'player_league_tier'
+                    )
+                """, (self.game_id,)).fetchall()
+            race_kv = {row[0]: row[1] for row in rows}
             
-            # Check if we're in RACE_RUNNING phase
-            if 'RACE_RUNNING' not in phase_str:
-                conn.close()
+            # Check if there's an active live race in RACE_RUNNING phase
+            phase_str = race_kv.get('race_day_phase')
+            if not phase_str or 'RACE_RUNNING' not in phase_str:
+                self._live_race_active = False
                 return
             
-            # Get current lap and recent events
-            cursor.execute("""
-                SELECT value FROM game_state_kv 
-                WHERE key = 'race_day_current_lap' AND game_id = ?
-            """, (self.game_id,))
-            lap_row = cursor.fetchone()
-            current_lap = int(lap_row[0]) if lap_row else 0
-            
-            cursor.execute("""
-                SELECT value FROM game_state_kv 
-                WHERE key = 'race_day_total_laps' AND game_id = ?
-            """, (self.game_id,))
-            total_lap_row = cursor.fetchone()
-            total_laps = int(total_lap_row[0]) if total_lap_row else 0
-            
-            # Get league tier for audio params
-            cursor.execute("""
-                SELECT value FROM game_state_kv 
-                WHERE key = 'player_league_tier' AND game_id = ?
-            """, (self.game_id,))
-            tier_row = cursor.fetchone()
-            league_tier = int(tier_row[0]) if tier_row else 3
+            self._live_race_active = True
             
-            conn.close()
+            current_lap = int(race_kv.get('race_day_current_lap') or 0)
+            total_laps = int(race_kv.get('race_day_total_laps') or 0)
+            # League tier for audio params
+            league_tier = int(race_kv.get('player_league_tier') or 3)
             
             # Initialize broadcast generator if needed
             if not self.broadcast_generator or self.broadcast_generator_tier != league_tier:
@@ -3460,6 +3887,14 @@ Recent event: {ctx['newest_event']}
         except Exception as e:
             self.log("ftb_narrator", f"Error checking live race broadcast: {e}")
     
+    def _query_race_leader_row(self):
+        """Current race leader's standings row (JSON value) from game_state_kv."""
+        with ftb_state_db.read_connection(self.db_path) as conn:
+            return conn.execute("""
+                SELECT value FROM game_state_kv 
+                WHERE key = 'race_day_standings_p1' AND game_id = ?
+            """, (self.game_id,)).fetchone()
+    
     def _generate_broadcast_commentary_for_lap(self, current_lap: int, total_laps: int):
         """
         Generate broadcast commentary for the current lap.
@@ -3480,20 +3915,15 @@ Recent event: {ctx['newest_event']}
             self._last_broadcast_lap = current_lap
             
             # Get race events for this lap from DB
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT event_type, data FROM sim_events
-                WHERE category IN ('overtake', 'crash', 'mechanical_dnf', 'fastest_lap')
-                AND json_extract(data, '$.lap_number') = ?
-                AND game_id = ?
-                ORDER BY event_id DESC
-                LIMIT 10
-            """, (current_lap, self.game_id))
-            
-            events = cursor.fetchall()
-            conn.close()
+            with ftb_state_db.read_connection(self.db_path) as conn:
+                events = conn.execute("""
+                    SELECT event_type, data FROM sim_events
+                    WHERE category IN ('overtake', 'crash', 'mechanical_dnf', 'fastest_lap')
+                    AND json_extract(data, '$.lap_number') = ?
+                    AND game_id = ?
+                    ORDER BY event_id DESC
+                    LIMIT 10
+                """, (current_lap, self.game_id)).fetchall()
             
             # Generate commentary for each event
             commentary_lines = []
@@ -3540,14 +3970,7 @@ Recent event: {ctx['newest_event']}
             # Final lap commentary
             if current_lap == total_laps:
                 # Get leader from standings
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT value FROM game_state_kv 
-                    WHERE key = 'race_day_standings_p1' AND game_id = ?
-                """, (self.game_id,))
-                leader_row = cursor.fetchone()
-                conn.close()
+                leader_row = self._query_race_leader_row()
                 
                 if leader_row:
                     import json
@@ -3562,14 +3985,7 @@ Recent event: {ctx['newest_event']}
             # Periodic lap updates (every 5 laps)
             elif current_lap % 5 == 0:
                 # Get leader and gap
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT value FROM game_state_kv 
-                    WHERE key = 'race_day_standings_p1' AND game_id = ?
-                """, (self.game_id,))
-                leader_row = cursor.fetchone()
-                conn.close()
+                leader_row = self._query_race_leader_row()
                 
                 if leader_row:
                     import json
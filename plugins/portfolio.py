@@ -1,9 +1,10 @@
 import time
-import requests
 import hashlib
 import random
 from typing import Any, Dict, Optional, Tuple, List
 
+from fetch_engine import get_fetch_engine
+
 PLUGIN_NAME = "portfolio_event"
 
 # =====================================================
@@ -65,12 +66,14 @@ def _safe(x: Any, default: str = "") -> str:
 
 def hl_fetch_state(base_url: str, user: str, timeout: int = 12) -> Optional[Dict[str, Any]]:
     try:
-        r = requests.post(
+        r = get_fetch_engine().fetch(
             base_url.rstrip("/") + "/info",
-            json={"type": "clearinghouseState", "user": user},
+            method="POST",
+            json_body={"type": "clearinghouseState", "user": user},
             timeout=timeout,
         )
-        r.raise_for_status()
+        if not r.ok:
+            return None
         j = r.json()
         return j if isinstance(j, dict) else None
     except Exception:
@@ -1,9 +1,10 @@
 import time
 import hashlib
-import requests
 from datetime import datetime
 from typing import List, Dict, Any
 
+from fetch_engine import get_fetch_engine, wait_jittered
+
 
 PLUGIN_NAME = "reddit"
 
@@ -37,71 +38,82 @@ def fetch_reddit(subreddits, limit=10):
     # Use browser-like UA and old.reddit.com to avoid strict API limits
     ua = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 
-    for sub in subreddits:
-        for mode in modes:
-            try:
-                time.sleep(2.0)  # Rate limiting
-                r = requests.get(
-                    f"https://old.reddit.com/r/{sub}/{mode}.json",
-                    headers={"User-Agent": ua},
-                    params={"limit": mode_limit},
-                    timeout=5
-                )
-                
-                if r.status_code == 429:
-                    print(f"[Reddit] Rate limit hit (429) on r/{sub}/{mode}. Aborting fetch cycle.")
-                    return out
+    # Rate limiting: the fetch engine spaces requests to old.reddit.com 2s apart
+    # (and backs off on 429) instead of sleeping before each one here.
+    engine = get_fetch_engine()
+    engine.set_host_policy("old.reddit.com", max_connections=1, min_interval=2.0)
+
+    jobs = [(sub, mode) for sub in subreddits for mode in modes]
+    responses = engine.fetch_many([
+        {
+            "url": f"https://old.reddit.com/r/{sub}/{mode}.json",
+            "headers": {"User-Agent": ua},
+            "params": {"limit": mode_limit},
+            "timeout": 5,
+        }
+        for sub, mode in jobs
+    ], timeout=5)
+
+    for (sub, mode), r in zip(jobs, responses):
+        try:
+            if r.status == 429:
+                print(f"[Reddit] Rate limit hit (429) on r/{sub}/{mode}. Aborting fetch cycle.")
+                return out
+
+            # Listing unchanged since last poll: every post is already seen
+            if r.not_modified:
+                continue
+
+            if r.status != 200:
+                print(f"[Reddit] Error fetching r/{sub}/{mode}: {r.status or r.error}")
+                continue
+
+            j = r.json()
+            children = j.get("data", {}).get("children", [])
+            
+            # Debug logging (remove later if too noisy)
+            print(f"[Reddit] r/{sub}/{mode} found {len(children)} items")
 
-                if r.status_code != 200:
-                    print(f"[Reddit] Error fetching r/{sub}/{mode}: {r.status_code}")
-                    continue
+            for c in children:
+                d = c.get("data", {})
 
-                j = r.json()
-                children = j.get("data", {}).get("children", [])
+                # Tag the source internally so we know (optional)
+                # but for now just append
                 
-                # Debug logging (remove later if too noisy)
-                print(f"[Reddit] r/{sub}/{mode} found {len(children)} items")
-
-                for c in children:
-                    d = c.get("data", {})
-
-                    # Tag the source internally so we know (optional)
-                    # but for now just append
-                    
-                    # Dedupe happens in the worker loop logic via seen set
-                    
-                    # Format for radio: provide context about engagement, not raw JSON
-                    score = d.get("score", 0)
-                    comments = d.get("num_comments", 0)
-                    selftext = d.get("selftext", "")
-                    
-                    # Build radio-friendly body with context
-                    body_parts = []
-                    
-                    # Add engagement context naturally
-                    if score > 1000 or comments > 100:
-                        body_parts.append(f"This post from r/{sub} is getting significant traction with {score} upvotes and {comments} comments.")
-                    elif score > 100:
-                        body_parts.append(f"From r/{sub}, scoring {score} karma with {comments} discussion threads.")
-                    
-                    # Add the actual content
-                    if selftext:
-                        body_parts.append(selftext)
-                    
-                    out.append({
-                        "post_id": d.get("id"),
-                        "subreddit": d.get("subreddit", sub),
-                        "title": d.get("title", ""),
-                        "body": " ".join(body_parts) if body_parts else "",
-                        "author": d.get("author", ""),
-                        "score": score,
-                        "comments": comments,
-                        "created_utc": d.get("created_utc", float(now_ts())),
-                        "mode": mode
-                    })
-
-            except Exception:
-                continue
+                # Dedupe happens in the worker loop logic via seen set
+                
+                # Format for radio: provide context about engagement, not raw JSON
+                score = d.get("score", 0)
+                comments = d.get("num_comments", 0)
+                selftext = d.get("selftext", "")
+                
+                # Build radio-friendly body with context
+                body_parts = []
+                
+                # Add engagement context naturally
+                if score > 1000 or comments > 100:
+                    body_parts.append(f"This post from r/{sub} is getting significant traction with {score} upvotes and {comments} comments.")
+                elif score > 100:
+                    body_parts.append(f"From r/{sub}, scoring {score} karma with {comments} discussion threads.")
+                
+                # Add the actual content
+                if selftext:
+                    body_parts.append(selftext)
+                
+                out.append({
+                    "post_id": d.get("id"),
+                    "subreddit": d.get("subreddit", sub),
+                    "title": d.get("title", ""),
+                    "body": " ".join(body_parts) if body_parts else "",
+                    "author": d.get("author", ""),
+                    "score": score,
+                    "comments": comments,
+                    "created_utc": d.get("created_utc", float(now_ts())),
+                    "mode": mode
+                })
+
+        except Exception:
+            continue
 
     return out
 
@@ -362,4 +374,4 @@ def feed_worker(stop_event, mem, cfg, runtime):
             if burst:
                 time.sleep(burst)
 
-        time.sleep(poll)
+        wait_jittered(stop_event, poll)
@@ -3,13 +3,14 @@ import hashlib
 import feedparser
 import html
 import re
-import requests
 import calendar
 import webbrowser
 from datetime import datetime
 from typing import Any
 from urllib.parse import urlparse
 
+from fetch_engine import get_fetch_engine, wait_jittered
+
 
 PLUGIN_NAME = "rss"
 
@@ -52,12 +53,8 @@ def domain(url: str):
 
 def fetch_article_text(url, timeout, max_chars):
     try:
-        r = requests.get(
-            url,
-            timeout=timeout,
-            headers={"User-Agent": "RadioOS/1.0"}
-        )
-        if r.status_code != 200:
+        r = get_fetch_engine().fetch(url, timeout=timeout, conditional=False)
+        if r.status != 200:
             return ""
 
         text = clean_html(r.text)
@@ -85,6 +82,12 @@ def feed_worker(stop_event, mem, cfg, runtime):
     burst_delay = float(cfg.get("burst_delay", 0.5))
     feed_delay = float(cfg.get("feed_delay", 2.0))
 
+    # All feeds go through the shared fetch engine: feed_delay becomes the
+    # per-host spacing, and unchanged feeds come back as 304s.
+    engine = get_fetch_engine()
+    for host in {urlparse(u).hostname for u in urls if urlparse(u).hostname}:
+        engine.set_host_policy(host, min_interval=feed_delay)
+
     deep_cfg = cfg.get("deep_fetch", {}) or {}
     deep_enabled = bool(deep_cfg.get("enabled", False))
     deep_timeout = float(deep_cfg.get("timeout_sec", 5))
@@ -97,10 +100,16 @@ def feed_worker(stop_event, mem, cfg, runtime):
 
     while not stop_event.is_set():
 
-        for feed_url in urls:
+        responses = engine.fetch_many([{"url": u} for u in urls])
+
+        for feed_url, resp in zip(urls, responses):
+
+            # Unchanged since last poll (or failed) -> nothing to parse
+            if resp.not_modified or not resp.ok:
+                continue
 
             try:
-                feed = feedparser.parse(feed_url)
+                feed = feedparser.parse(resp.body, response_headers=resp.headers)
 
                 emit_limit = int(cfg.get("emit_limit", 2))
                 emitted = 0
@@ -237,10 +246,7 @@ def feed_worker(stop_event, mem, cfg, runtime):
             except Exception:
                 pass
 
-            if feed_delay > 0:
-                time.sleep(feed_delay)
-
-        time.sleep(poll_sec)
+        wait_jittered(stop_event, poll_sec)
 
 
 # =====================================================
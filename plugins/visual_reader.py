@@ -32,6 +32,7 @@ DEFAULT_CONFIG = {
     "source_path": "",  # For video files: full path
     "source_window": "",  # For window capture: window title
     "capture_interval": 5,  # seconds
+    "change_threshold": 0.05,  # fraction of frame blocks that must change to call the vision model
     "talk_over_video": False,  # AI speaks while video plays
     "reaction_frequency": 30,  # seconds (if talk_over_video is True)
     "max_interpretation_length": 500,  # chars
@@ -350,11 +351,15 @@ def create_vision_client(cfg: Dict[str, Any]) -> Optional[VisionClient]:
 # =====================================================
 
 class ScreenCapture:
-    """Cross-platform screenshot capture."""
-    
+    """Cross-platform screenshot capture.
+
+    grab_* return PIL images (or None) so the capture pipeline can downscale
+    and fingerprint before encoding; capture_* return encoded JPEG bytes.
+    """
+
     @staticmethod
-    def capture_screen() -> Optional[bytes]:
-        """Capture full screen."""
+    def grab_screen_image():
+        """Grab the primary monitor as a PIL image."""
         if HAS_MSS:
             try:
                 with mss.mss() as sct:
@@ -362,10 +367,8 @@ class ScreenCapture:
                     monitor = sct.monitors[1] if len(sct.monitors) > 1 else sct.monitors[0]
                     screenshot = sct.grab(monitor)
                     if HAS_PIL:
-                        img = Image.frombytes("RGB", screenshot.size, screenshot.rgb)
-                        buf = io.BytesIO()
-                        img.save(buf, format="JPEG", quality=85)
-                        return buf.getvalue()
+                        # Decode straight from BGRA (skips mss's .rgb conversion copy)
+                        return Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
                     else:
                          import your_runtime as rt
                          rt.log("visual", "MSS capture blocked: PIL not available to process image.")
@@ -376,10 +379,7 @@ class ScreenCapture:
         # Fallback: pyautogui
         if HAS_PYAUTOGUI:
             try:
-                img = pyautogui.screenshot()
-                buf = io.BytesIO()
-                img.save(buf, format="JPEG", quality=85)
-                return buf.getvalue()
+                return pyautogui.screenshot()
             except Exception as e:
                 import your_runtime as rt
                 rt.log("visual", f"PyAutoGUI capture failed: {e}")
@@ -389,10 +389,16 @@ class ScreenCapture:
                  rt.log("visual", "No screen capture libraries available (missing mss AND pyautogui). Please pip install mss pyautogui pillow.")
         
         return None
+
+    @staticmethod
+    def capture_screen() -> Optional[bytes]:
+        """Capture full screen."""
+        img = ScreenCapture.grab_screen_image()
+        return encode_jpeg(img) if img is not None else None
     
     @staticmethod
-    def capture_window(window_title: str) -> Optional[bytes]:
-        """Capture specific window (Windows)."""
+    def grab_window_image(window_title: str):
+        """Grab a specific window (Windows) as a PIL image."""
         if not IS_WINDOWS or not HAS_WINDOWS_API:
             return None
         
@@ -410,10 +416,7 @@ class ScreenCapture:
                     w = x2 - x
                     h = y2 - y
                     if w > 0 and h > 0 and HAS_PIL:
-                        img = pyautogui.screenshot(region=(x, y, w, h))
-                        buf = io.BytesIO()
-                        img.save(buf, format="JPEG", quality=85)
-                        return buf.getvalue()
+                        return pyautogui.screenshot(region=(x, y, w, h))
             else:
                  import your_runtime as rt
                  rt.log("visual", f"Window not found: '{window_title}'")
@@ -422,10 +425,16 @@ class ScreenCapture:
             rt.log("visual", f"Window capture failed: {e}")
         
         return None
-    
+
     @staticmethod
-    def capture_video_frame(video_path: str, frame_num: int = -1) -> Optional[bytes]:
-        """Capture frame from video file."""
+    def capture_window(window_title: str) -> Optional[bytes]:
+        """Capture specific window (Windows)."""
+        img = ScreenCapture.grab_window_image(window_title)
+        return encode_jpeg(img) if img is not None else None
+
+    @staticmethod
+    def _read_video_frame(video_path: str, frame_num: int = -1):
+        """Read one frame from a video file as an RGB array."""
         if not HAS_CV2:
             import your_runtime as rt
             rt.log("visual", "OpenCV (cv2) not installed/available for video capture.")
@@ -450,24 +459,233 @@ class ScreenCapture:
             cap.release()
             
             if ret and frame is not None:
-                # Resize if needed
-                h, w = frame.shape[:2]
-                max_w = 1024
-                if w > max_w:
-                    scale = max_w / w
-                    frame = cv2.resize(frame, (max_w, int(h * scale)))
-                
-                # Convert BGR to RGB and encode
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                ret, buf = cv2.imencode(".jpg", frame_rgb, [cv2.IMWRITE_JPEG_QUALITY, 85])
-                if ret:
-                    return buf.tobytes()
+                return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        except Exception:
+            pass
+        
+        return None
+
+    @staticmethod
+    def grab_video_frame_image(video_path: str, frame_num: int = -1):
+        """Grab a frame from a video file as a PIL image."""
+        if not HAS_PIL:
+            return None
+        frame_rgb = ScreenCapture._read_video_frame(video_path, frame_num)
+        return Image.fromarray(frame_rgb) if frame_rgb is not None else None
+    
+    @staticmethod
+    def capture_video_frame(video_path: str, frame_num: int = -1) -> Optional[bytes]:
+        """Capture frame from video file."""
+        frame_rgb = ScreenCapture._read_video_frame(video_path, frame_num)
+        if frame_rgb is None:
+            return None
+
+        try:
+            # Resize if needed
+            h, w = frame_rgb.shape[:2]
+            max_w = 1024
+            if w > max_w:
+                scale = max_w / w
+                frame_rgb = cv2.resize(frame_rgb, (max_w, int(h * scale)))
+
+            ret, buf = cv2.imencode(".jpg", cv2.cvtColor(frame_rgb, cv2.COLOR_RGB2BGR), [cv2.IMWRITE_JPEG_QUALITY, 85])
+            if ret:
+                return buf.tobytes()
         except Exception:
             pass
         
         return None
 
 
+# =====================================================
+# Capture pipeline: downscale -> fingerprint -> change gate -> encode
+# =====================================================
+
+SIGNATURE_GRID = 16   # Frame fingerprint is a 16x16 grid of mean luminance
+BLOCK_DELTA = 12      # Per-block luminance change (0-255) that counts as "changed"
+
+
+def downscale_image(img, max_size: int):
+    """Shrink so the longest side is <= max_size (cheap integer reduce first)."""
+    longest = max(img.size)
+    if max_size <= 0 or longest <= max_size:
+        return img
+    factor = longest // max_size
+    if factor >= 2:
+        img = img.reduce(factor)
+    if max(img.size) > max_size:
+        img = img.copy()
+        img.thumbnail((max_size, max_size))
+    return img
+
+
+def encode_jpeg(img, quality: int = 85) -> bytes:
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    buf = io.BytesIO()
+    img.save(buf, format="JPEG", quality=quality)
+    return buf.getvalue()
+
+
+def frame_signature(img) -> bytes:
+    """Cheap perceptual fingerprint: block-mean luminance on a small grid."""
+    return img.convert("L").resize((SIGNATURE_GRID, SIGNATURE_GRID), Image.BOX).tobytes()
+
+
+def frame_change(prev: Optional[bytes], cur: bytes, block_delta: int = BLOCK_DELTA) -> float:
+    """Fraction of fingerprint blocks that moved by more than block_delta."""
+    if not prev or len(prev) != len(cur):
+        return 1.0
+    changed = sum(1 for a, b in zip(prev, cur) if abs(a - b) > block_delta)
+    return changed / len(cur)
+
+
+class FrameGate:
+    """
+    Decides whether a frame is different enough to spend a vision call on.
+
+    Compares against the last frame that was *sent*, not the last one
+    captured, so slow drift still accumulates past the threshold.
+    """
+    def __init__(self, threshold: float = 0.05):
+        self.threshold = threshold
+        self.last_sent: Optional[bytes] = None
+        self.sent = 0
+        self.skipped = 0
+
+    def check(self, signature: bytes) -> Tuple[bool, float]:
+        change = frame_change(self.last_sent, signature)
+        if change < self.threshold:
+            self.skipped += 1
+            return False, change
+        self.last_sent = signature
+        self.sent += 1
+        return True, change
+
+    def reset(self) -> None:
+        self.last_sent = None
+
+
+@dataclass
+class CapturedFrame:
+    ts: float
+    jpeg: bytes
+    change: float  # Fraction of blocks changed vs last sent frame (1.0 = first/ungated)
+
+
+class CapturePipeline:
+    """
+    Capture/encode thread feeding the vision loop.
+
+    Grabs a frame every capture interval, downsamples it immediately,
+    fingerprints it, and JPEG-encodes only frames that pass the change gate.
+    The newest passing frame waits in a one-slot mailbox for next_frame(), so
+    slow inference never backs up captures and stale frames are dropped.
+
+    grab_fn returns a PIL image, already-encoded bytes (passed through
+    ungated), or None. signature_fn/encode_fn can be swapped for tests.
+    """
+    def __init__(self, grab_fn, interval_fn, threshold_fn,
+                 max_image_size: int = 1024, image_quality: int = 85,
+                 signature_fn=frame_signature, encode_fn=encode_jpeg,
+                 log_fn=None):
+        self.grab_fn = grab_fn
+        self.interval_fn = interval_fn
+        self.threshold_fn = threshold_fn
+        self.max_image_size = max_image_size
+        self.image_quality = image_quality
+        self.signature_fn = signature_fn
+        self.encode_fn = encode_fn
+        self.log_fn = log_fn
+        self.gate = FrameGate(threshold_fn())
+        self.capture_failures = 0
+        self._last_fail_log = 0.0
+        self._cond = threading.Condition()
+        self._latest: Optional[CapturedFrame] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _log(self, msg: str) -> None:
+        if callable(self.log_fn):
+            try:
+                self.log_fn(msg)
+            except Exception:
+                pass
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self.gate.reset()
+        with self._cond:
+            self._latest = None
+        self._thread = threading.Thread(target=self._run, name="visual_capture", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        with self._cond:
+            self._latest = None
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def next_frame(self, timeout: float = 1.0) -> Optional[CapturedFrame]:
+        """Take the newest gated frame, waiting up to timeout for one."""
+        with self._cond:
+            if self._latest is None:
+                self._cond.wait(timeout)
+            frame, self._latest = self._latest, None
+            return frame
+
+    def process(self, img, ts: float) -> Optional[CapturedFrame]:
+        """Downscale, gate and encode one captured image. None = skipped."""
+        if isinstance(img, (bytes, bytearray)):
+            return CapturedFrame(ts, bytes(img), 1.0)
+        img = downscale_image(img, self.max_image_size)
+        self.gate.threshold = float(self.threshold_fn())
+        send, change = self.gate.check(self.signature_fn(img))
+        if not send:
+            return None
+        return CapturedFrame(ts, self.encode_fn(img, self.image_quality), change)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            started = time.time()
+            try:
+                img = self.grab_fn()
+            except Exception as e:
+                self._log(f"visual_reader capture error: {e}")
+                img = None
+
+            if img is None:
+                self.capture_failures += 1
+                # Throttle capture-failure logs to avoid spam
+                if started - self._last_fail_log > 5:
+                    self._log("visual_reader capture failed "
+                              f"(source={_state.source_type}, window={_state.source_window or '-'}, path={_state.source_path or '-'})")
+                    self._last_fail_log = started
+                self._stop.wait(1.0)
+                continue
+
+            try:
+                frame = self.process(img, started)
+            except Exception as e:
+                self._log(f"visual_reader frame processing error: {e}")
+                frame = None
+
+            if frame is not None:
+                with self._cond:
+                    self._latest = frame
+                    self._cond.notify_all()
+            elif self.gate.skipped % 20 == 0:
+                self._log(f"visual_reader: {self.gate.skipped} unchanged frames skipped, {self.gate.sent} sent")
+
+            interval = max(0.2, float(self.interval_fn() or 0))
+            self._stop.wait(max(0.0, interval - (time.time() - started)))
+
+
 # =====================================================
 # Main feed worker
 # =====================================================
@@ -481,6 +699,7 @@ class VisualReaderState:
         self.source_path = ""
         self.source_window = ""
         self.capture_interval = 5
+        self.change_threshold = 0.05
         self.talk_over_video = False
         self.reaction_frequency = 30
         self.last_capture_time = 0
@@ -496,6 +715,28 @@ class VisualReaderState:
 _state = VisualReaderState()
 
 
+def _grab_active_source():
+    """Grab one frame from the configured source (advances video playback)."""
+    if _state.source_type == "screen":
+        return ScreenCapture.grab_screen_image()
+    if _state.source_type == "window":
+        return ScreenCapture.grab_window_image(_state.source_window)
+    if _state.source_type == "video_file":
+        grab = ScreenCapture.grab_video_frame_image if HAS_PIL else ScreenCapture.capture_video_frame
+        frame = grab(_state.source_path, _state.video_frame_index)
+        if frame is not None:
+            # Advance frame index (approx 30fps * seconds)
+            _state.video_frame_index += int(_state.capture_interval * 30)
+        elif _state.video_frame_index > 0:
+            # If capture failed, we might be at end of video. Loop back
+            import your_runtime as rt
+            rt.log("visual", "Video ended or read failed; looping back to start.")
+            _state.video_frame_index = 0
+            frame = grab(_state.source_path, 0)
+        return frame
+    return None
+
+
 def feed_worker(*args, **kwargs) -> None:
     """
     Main feed worker loop.
@@ -565,6 +806,7 @@ def feed_worker(*args, **kwargs) -> None:
     _state.source_path = config.get("source_path", "")
     _state.source_window = config.get("source_window", "")
     _state.capture_interval = config.get("capture_interval", 5)
+    _state.change_threshold = float(config.get("change_threshold", 0.05))
     _state.talk_over_video = config.get("talk_over_video", False)
     _state.reaction_frequency = config.get("reaction_frequency", 30)
     rt.log("visual", f"Visual reader feed_worker running (enabled={_state.enabled}, active={_state.active}): source={_state.source_type} interval={_state.capture_interval}s talk_over_video={_state.talk_over_video}")
@@ -585,6 +827,16 @@ def feed_worker(*args, **kwargs) -> None:
 
     last_enabled = _state.enabled
     last_active = _state.active
+
+    # Capture + encode run on their own thread; this loop only does inference
+    pipeline = CapturePipeline(
+        grab_fn=_grab_active_source,
+        interval_fn=lambda: _state.capture_interval,
+        threshold_fn=lambda: _state.change_threshold,
+        max_image_size=int(global_cfg.get("max_image_size") or 1024),
+        image_quality=int(global_cfg.get("image_quality") or 85),
+        log_fn=lambda msg: rt.log("visual", msg),
+    )
     while not _state.stop_requested and (stop_event is None or not stop_event.is_set()):
         # Debug: print config dict id and enabled/active value every loop
         # try:
@@ -666,9 +918,12 @@ def feed_worker(*args, **kwargs) -> None:
                     _state._last_reacted_ts = 0
                     _state.video_frame_index = 0  # Reset video position on activation
                 was_active = True
+                pipeline.start()
             else:
                 if was_active:
                     rt.log("visual", "visual_reader DEACTIVATED")
+                    pipeline.stop()
+                    rt.log("visual", f"visual_reader frames: {pipeline.gate.sent} sent, {pipeline.gate.skipped} skipped as unchanged")
                     try:
                         mem["_visual_reader_active"] = False
                     except Exception:
@@ -737,43 +992,18 @@ def feed_worker(*args, **kwargs) -> None:
                 time.sleep(1)
                 continue
 
-            now = time.time()
-            if now - _state.last_capture_time < _state.capture_interval:
-                time.sleep(0.5)
-                continue
-
-            # Capture screenshot
-            screenshot = None
-            if _state.source_type == "screen":
-                screenshot = ScreenCapture.capture_screen()
-            elif _state.source_type == "window":
-                screenshot = ScreenCapture.capture_window(_state.source_window)
-            elif _state.source_type == "video_file":
-                # Capture specific frame
-                screenshot = ScreenCapture.capture_video_frame(_state.source_path, _state.video_frame_index)
-                if screenshot:
-                    # Advance frame index (approx 30fps * seconds)
-                    _state.video_frame_index += int(_state.capture_interval * 30)
-                else:
-                    # If capture failed, we might be at end of video. Loop back?
-                    if _state.video_frame_index > 0:
-                        rt.log("visual", "Video ended or read failed; looping back to start.")
-                        _state.video_frame_index = 0
-                        screenshot = ScreenCapture.capture_video_frame(_state.source_path, 0)
-            
-            if not screenshot:
-                # Throttle capture-failure logs to avoid spam
-                now_fail = time.time()
-                if now_fail - _state._last_capture_fail_log > 5:
-                    rt.log("visual", f"visual_reader capture failed (source={_state.source_type}, window={_state.source_window or '-'}, path={_state.source_path or '-'})")
-                    _state._last_capture_fail_log = now_fail
-                time.sleep(1)
+            # Frames arrive already downscaled, gated against the last sent
+            # frame, and JPEG-encoded; unchanged frames never get here
+            frame = pipeline.next_frame(timeout=1.0)
+            if frame is None:
                 continue
 
+            screenshot = frame.jpeg
+            now = frame.ts
             _state.last_capture_time = now
 
             # Send to vision model
-            rt.log("visual", f"Sending capture ({len(screenshot)} bytes) to vision model...")
+            rt.log("visual", f"Sending capture ({len(screenshot)} bytes, {frame.change:.0%} changed) to vision model...")
             
             start_ts = time.time()
             interpretation = _state.vision_client.interpret(screenshot)
@@ -828,12 +1058,12 @@ def feed_worker(*args, **kwargs) -> None:
                     rt.log("visual", "visual_reader: no interpretation returned by vision model")
                     _state._last_capture_fail_log = now_no
 
-            time.sleep(0.5)
-
         except Exception as e:
             rt.log("visual", f"Error in feed loop: {e}")
             time.sleep(2)
 
+    pipeline.stop()
+
 
 # =====================================================
 # Widget registration
@@ -1264,6 +1494,7 @@ def update_config(new_config: Dict[str, Any]) -> None:
     _state.source_path = new_config.get("source_path", "")
     _state.source_window = new_config.get("source_window", "")
     _state.capture_interval = new_config.get("capture_interval", 5)
+    _state.change_threshold = float(new_config.get("change_threshold", 0.05))
     _state.talk_over_video = new_config.get("talk_over_video", False)
     try:
         import your_runtime as rt
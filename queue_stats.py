@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Segment Queue Stats
+
+In-memory (status, source) -> row counters for the segments table, so the
+status loop, producer, rebalancer and source limits can read queue depth
+without COUNT(*) scans.
+
+- The host's enqueue / claim / done / requeue helpers update counters
+  incrementally.
+- Bulk statements (reclaim, prune, flush, GC) call invalidate(); the next
+  read reconciles.
+- Connections handed to plugins are TrackedConnection instances, which
+  invalidate on any commit that changed rows.
+- Any read reconciles against SQLite once reconcile_sec has passed, which
+  also absorbs writers we can't see (other connections, other processes).
+- Writers hold writing() across "commit + counter update" and reconcile()
+  takes the same lock, so a reconcile can't count a committed row and then
+  have its counter update applied on top.
+
+Source keys are raw COALESCE(source, 'feed') values, like the old GROUP BY
+queries; callers normalise them as before.
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+ACTIVE_STATUSES = ("queued", "claimed")
+
+
+def _src(source: Optional[str]) -> str:
+    return "feed" if source is None else str(source)
+
+
+class QueueStats:
+    """Thread-safe segment counters with periodic reconciliation."""
+
+    def __init__(self, reconcile_sec: float = 10.0,
+                 log: Optional[Callable[[str, str], None]] = None):
+        self.reconcile_sec = float(reconcile_sec)
+        self.log = log
+        self._counts: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.RLock()
+        self._dirty = True
+        self._epoch = 0  # bumped by invalidate()
+        self._last_reconcile = 0.0
+        self.reconciles = 0
+        self.drift = 0  # rows corrected by the last reconcile
+
+    # ---------- reconcile ----------
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._dirty = True
+            self._epoch += 1
+
+    def writing(self) -> threading.RLock:
+        """Lock to hold across a tracked write's commit and its counter update."""
+        return self._write_lock
+
+    def reconcile(self, conn: sqlite3.Connection) -> int:
+        """Replace counters with a GROUP BY over segments. Returns the absolute drift."""
+        with self._write_lock:
+            epoch = self._epoch
+            rows = conn.execute(
+                "SELECT COALESCE(status,''), COALESCE(source,'feed'), COUNT(*) "
+                "FROM segments GROUP BY 1, 2;"
+            ).fetchall()
+            fresh = {(str(st), str(src)): int(n or 0) for st, src, n in rows}
+            with self._lock:
+                keys = set(fresh) | set(self._counts)
+                drift = sum(abs(fresh.get(k, 0) - self._counts.get(k, 0)) for k in keys)
+                was_dirty = self._dirty
+                self._counts = fresh
+                # An invalidate() during the query may not be reflected in it
+                self._dirty = epoch != self._epoch
+                self._last_reconcile = time.monotonic()
+                self.reconciles += 1
+                self.drift = drift
+        if drift and not was_dirty and self.log:
+            self.log("queue", f"queue stats drift corrected ({drift} rows)")
+        return drift
+
+    def ensure(self, conn: sqlite3.Connection) -> None:
+        if self._dirty or time.monotonic() - self._last_reconcile >= self.reconcile_sec:
+            self.reconcile(conn)
+
+    # ---------- incremental updates ----------
+
+    def _add(self, status: str, source: Optional[str], n: int) -> None:
+        key = (status, _src(source))
+        with self._lock:
+            v = self._counts.get(key, 0) + n
+            if v > 0:
+                self._counts[key] = v
+            else:
+                self._counts.pop(key, None)
+                if v < 0:
+                    self._dirty = True  # missed an update somewhere
+
+    def inserted(self, source: Optional[str], status: str = "queued", n: int = 1) -> None:
+        self._add(status, source, n)
+
+    def moved(self, source: Optional[str], old: str, new: str, n: int = 1) -> None:
+        if old == new:
+            return
+        self._add(old, source, -n)
+        self._add(new, source, n)
+
+    def removed(self, source: Optional[str], status: str, n: int = 1) -> None:
+        self._add(status, source, -n)
+
+    # ---------- reads ----------
+
+    def counts(self, conn: sqlite3.Connection, statuses: Iterable[str] = ACTIVE_STATUSES) -> Dict[str, int]:
+        """source -> rows in any of statuses."""
+        self.ensure(conn)
+        wanted = set(statuses)
+        out: Dict[str, int] = {}
+        with self._lock:
+            for (st, src), n in self._counts.items():
+                if st in wanted:
+                    out[src] = out.get(src, 0) + n
+        return out
+
+    def total(self, conn: sqlite3.Connection, statuses: Iterable[str] = ACTIVE_STATUSES) -> int:
+        return sum(self.counts(conn, statuses).values())
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Per-status totals plus reconcile bookkeeping (no DB access)."""
+        by_status: Dict[str, int] = {}
+        with self._lock:
+            for (st, _), n in self._counts.items():
+                by_status[st] = by_status.get(st, 0) + n
+            age = time.monotonic() - self._last_reconcile if self._last_reconcile else None
+        return {
+            "by_status": by_status,
+            "reconciles": self.reconciles,
+            "last_drift": self.drift,
+            "reconcile_age_sec": round(age, 1) if age is not None else None,
+        }
+
+
+class TrackedConnection(sqlite3.Connection):
+    """
+    sqlite3 connection that calls on_write() after a commit that changed rows.
+    Used for connections whose writes QueueStats can't see (plugins).
+    """
+
+    on_write: Optional[Callable[[], None]] = None
+    _seen_changes = 0
+
+    def _check_writes(self) -> None:
+        n = self.total_changes
+        if n != self._seen_changes:
+            self._seen_changes = n
+            if self.on_write is not None:
+                self.on_write()
+
+    def commit(self) -> None:
+        super().commit()
+        self._check_writes()
+
+    def __exit__(self, *exc):
+        result = super().__exit__(*exc)
+        self._check_writes()
+        return result
+
+    def close(self) -> None:
+        # isolation_level=None connections write without commit()
+        try:
+            self._check_writes()
+        finally:
+            super().close()
@@ -14,6 +14,7 @@ import time
 import yaml
 import shutil
 import subprocess
+from collections import deque
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 try:
@@ -25,6 +26,10 @@ except ImportError:
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 
+import plugin_index
+import status_channel
+import inference_host
+
 # --- Cross-platform Button Shim ---
 if sys.platform == "darwin":
     class StyledButton(tk.Label):
@@ -235,45 +240,37 @@ def discover_plugins() -> Dict[str, Dict[str, Any]]:
     if not os.path.exists(PLUGINS_DIR):
         return plugins
 
-    for fn in sorted(os.listdir(PLUGINS_DIR)):
-        if not fn.endswith(".py"):
-            continue
-
-        name = os.path.splitext(fn)[0]
-        path = os.path.join(PLUGINS_DIR, fn)
-
+    # Static index (cached by mtime) instead of importing every plugin
+    for name, meta in plugin_index.build_index(PLUGINS_DIR).items():
         info: Dict[str, Any] = {
             "name": name,
-            "display": name,
-            "desc": "",
-            "path": path,
-            "is_feed": True,      # default
-            "defaults": None,     # optional dict
+            "display": meta.get("plugin_name") or name,
+            "desc": meta.get("plugin_desc") or "",
+            "path": meta["path"],
+            "is_feed": bool(meta.get("is_feed", True)),
+            "defaults": meta.get("defaults"),  # optional dict
         }
 
-        try:
-            spec = importlib.util.spec_from_file_location(name, path)
-            mod = importlib.util.module_from_spec(spec)
-            assert spec and spec.loader
-            spec.loader.exec_module(mod)
-
-            info["display"] = getattr(mod, "PLUGIN_NAME", name)
-            info["desc"]    = getattr(mod, "PLUGIN_DESC", "")
-            info["is_feed"] = bool(getattr(mod, "IS_FEED", True))
-
-            # Plugin-provided defaults (any of these names are acceptable)
-            # Keep it flexible so plugin authors have options.
-            d = (
-                getattr(mod, "FEED_DEFAULTS", None)
-                or getattr(mod, "DEFAULT_FEED_CFG", None)
-                or getattr(mod, "DEFAULT_CONFIG", None)
-            )
-            if isinstance(d, dict):
-                info["defaults"] = d
+        if meta.get("defaults_dynamic"):
+            # Defaults are computed at import time; only these plugins get imported
+            try:
+                spec = importlib.util.spec_from_file_location(name, meta["path"])
+                mod = importlib.util.module_from_spec(spec)
+                assert spec and spec.loader
+                spec.loader.exec_module(mod)
+
+                # Plugin-provided defaults (any of these names are acceptable)
+                d = (
+                    getattr(mod, "FEED_DEFAULTS", None)
+                    or getattr(mod, "DEFAULT_FEED_CFG", None)
+                    or getattr(mod, "DEFAULT_CONFIG", None)
+                )
+                if isinstance(d, dict):
+                    info["defaults"] = d
 
-        except Exception:
-            # tolerate import failure; keep minimal info
-            pass
+            except Exception:
+                # tolerate import failure; keep minimal info
+                pass
 
         plugins[name] = info
 
@@ -440,12 +437,24 @@ def load_stations() -> List[StationInfo]:
 # -----------------------------
 # Runtime process management
 # -----------------------------
+LOG_TAIL_LINES = 200
+
+
 class StationProcess:
     def __init__(self):
         self.proc: Optional[subprocess.Popen] = None
         self.station: Optional[StationInfo] = None
         self._log_file = None  # keep handle alive on Windows
         self._log_thread = None  # background thread for log capture
+        # Pushed status + in-memory log tail (no status.json / runtime.log polling)
+        self.status: Optional[status_channel.StatusSubscriber] = None
+        self.log_tail: "deque[str]" = deque(maxlen=LOG_TAIL_LINES)
+        self.log_version = 0
+
+    def _push_log(self, text: str) -> None:
+        for line in text.splitlines():
+            self.log_tail.append(line)
+        self.log_version += 1
 
     def is_alive(self) -> bool:
         return self.proc is not None and self.proc.poll() is None
@@ -496,6 +505,18 @@ class StationProcess:
             env["VISUAL_MODEL_MAX_IMAGE_SIZE"] = str(visual_cfg.get("max_image_size", "1024"))
             env["VISUAL_MODEL_IMAGE_QUALITY"] = str(visual_cfg.get("image_quality", "85"))
 
+        # Supervisor mode: one shared LLM/TTS host for every station on the box
+        inf_cfg = global_cfg.get("inference_host", {}) or {}
+        if inf_cfg.get("enabled") and inference_host.ENV_ADDR not in env:
+            addr = inference_host.ensure_host(extra_args=[
+                "--tts-workers", str(int(inf_cfg.get("tts_workers", 1))),
+                "--llm-workers", str(int(inf_cfg.get("llm_workers", 2))),
+            ])
+            if addr:
+                env[inference_host.ENV_ADDR] = addr
+            else:
+                print("[Shell] Inference host did not start; station will run its own models")
+
         # Ensure unbuffered UTF-8 output so logs are captured correctly
         env["PYTHONIOENCODING"] = "utf-8"
         env["PYTHONUNBUFFERED"] = "1"
@@ -536,9 +557,12 @@ class StationProcess:
             print(f"DEBUG ERROR: Failed to spawn subprocess: {e}")
             raise
         self.station = station
+        self.log_tail.clear()
+        self.log_version += 1
+        self.status = status_channel.StatusSubscriber(station.path)
         
         # Start a thread to capture and log output
-        if self.proc and lf:
+        if self.proc:
             import threading
             
             def log_output():
@@ -549,6 +573,9 @@ class StationProcess:
                     while self.proc and self.proc.poll() is None:
                         line = self.proc.stdout.readline()
                         if line:
+                            self._push_log(line if isinstance(line, str) else line.decode('utf-8', errors='replace'))
+                            if not lf:
+                                continue
                             if is_windows:
                                 # Windows: Extra error handling for charmap codec issues
                                 try:
@@ -571,6 +598,8 @@ class StationProcess:
                     if self.proc and self.proc.stdout:
                         remaining = self.proc.stdout.read()
                         if remaining:
+                            self._push_log(remaining if isinstance(remaining, str) else remaining.decode('utf-8', errors='replace'))
+                        if remaining and lf:
                             if is_windows:
                                 try:
                                     if isinstance(remaining, bytes):
@@ -602,6 +631,9 @@ class StationProcess:
             except Exception:
                 pass
         
+        if self.status is not None:
+            self.status.close()
+        self.status = None
         self.proc = None
         self.station = None
         self._log_thread = None
@@ -2608,32 +2640,58 @@ class RadioShell:
             except Exception as e:
                 print(f"[Shell] Switch failed: {e}")
 
+    def _read_status_file(self, st: StationInfo) -> Optional[Dict[str, Any]]:
+        """Fallback when the status channel isn't connected; re-parses only when the file changes."""
+        sp = station_status_path(st.path)
+        try:
+            mtime = os.stat(sp).st_mtime_ns
+        except OSError:
+            return None
+        cached = getattr(self, "_status_file_cache", None)
+        if cached and cached[0] == sp and cached[1] == mtime:
+            return cached[2]
+        try:
+            with open(sp, "r", encoding="utf-8") as f:
+                status = json.load(f)
+        except Exception:
+            return None
+        self._status_file_cache = (sp, mtime, status)
+        return status
+
     def _update_status_panel(self):
         if self._view != "runtime":
             return
 
         st = self.proc.station
         alive = self.proc.is_alive()
+        returncode = self.proc.proc.poll() if self.proc.proc is not None else None
+
+        sub = self.proc.status
+        status = sub.get() if sub is not None and sub.connected else None
+        if status is None and st:
+            status = self._read_status_file(st)
+
+        hb = int(status.get("ts", 0) or 0) if status else 0
+        age = now_ts() - hb if hb else -1
+
+        # Pushes and log lines bump versions; skip re-rendering when nothing moved.
+        # The age is part of the key so it keeps counting when pushes stop.
+        key = (st.station_id if st else None, alive, returncode,
+               sub.version if sub is not None else None, self.proc.log_version, id(status), age)
+        if key == getattr(self, "_status_panel_key", None):
+            return
+        self._status_panel_key = key
+
         lines: List[str] = []
 
         if self.proc.proc is not None:
-            try:
-                lines.append(f"returncode: {self.proc.proc.poll()}")
-            except Exception:
-                pass
+            lines.append(f"returncode: {returncode}")
 
-        if st:
-            lp = os.path.join(st.path, "runtime.log")
-            if os.path.exists(lp):
-                try:
-                    with open(lp, "r", encoding="utf-8", errors="ignore") as f:
-                        tail = f.read()[-4000:]
-                    if tail.strip():
-                        lines.append("")
-                        lines.append("---- runtime.log tail ----")
-                        lines.extend(tail.strip().splitlines()[-25:])
-                except Exception:
-                    pass
+        tail = list(self.proc.log_tail)[-25:]
+        if tail:
+            lines.append("")
+            lines.append("---- runtime log tail ----")
+            lines.extend(tail)
 
         lines.append(f"proc_alive: {alive}")
 
@@ -2645,18 +2703,7 @@ class RadioShell:
         name = (st.manifest.get("station", {}) or {}).get("name", st.station_id)
         lines.append(f"station: {name} ({st.station_id})")
 
-        sp = station_status_path(st.path)
-        status = None
-        if os.path.exists(sp):
-            try:
-                with open(sp, "r", encoding="utf-8") as f:
-                    status = json.load(f)
-            except Exception:
-                status = None
-
         if status:
-            hb = int(status.get("ts", 0) or 0)
-            age = now_ts() - hb if hb else -1
             lines.append(f"heartbeat_age_sec: {age}")
             for k in ["db_queued", "db_claimed", "audio_q", "last_event", "last_title", "last_source"]:
                 if k in status:
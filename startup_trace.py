@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Startup Trace
+
+Opt-in wall-clock trace of station startup:
+- named phases (step() laps or phase() blocks)
+- per-plugin import time
+- first-import cost of every module, -X importtime style (self/cumulative),
+  aggregated by top-level package
+
+Enable with RADIO_OS_STARTUP_TRACE=1. The host calls finish() once the UI is
+up; the report lands in <station>/startup_trace.json and a summary is logged.
+A budget (RADIO_OS_STARTUP_BUDGET_MS, or startup.budget_ms in the manifest)
+marks the report over_budget, and
+
+    python startup_trace.py <station>/startup_trace.json [--budget-ms N]
+
+exits 1 when cold start exceeded it, for use in benchmark runs.
+"""
+from __future__ import annotations
+
+import builtins
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+ENV_FLAG = "RADIO_OS_STARTUP_TRACE"
+ENV_BUDGET = "RADIO_OS_STARTUP_BUDGET_MS"
+REPORT_NAME = "startup_trace.json"
+
+_TOP_N = 25
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000.0, 2)
+
+
+class StartupTrace:
+    """Phase/import timer. Every method is a cheap no-op when disabled."""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.t0 = time.perf_counter()
+        self.phases: List[Dict[str, Any]] = []
+        self.imports: Dict[str, List[float]] = {}  # module -> [self_s, cumulative_s]
+        self._step: Optional[Dict[str, Any]] = None
+        self._tls = threading.local()
+        self._orig_import: Optional[Callable] = None
+        self._hook: Optional[Callable] = None  # the bound method we installed
+        self._hooked = False
+        self._finished = False
+        if enabled:
+            self.install_import_hook()
+
+    # ---------- phases ----------
+
+    def _open(self, name: str, kind: str) -> Dict[str, Any]:
+        rec = {"name": name, "kind": kind, "start_ms": _ms(time.perf_counter() - self.t0), "ms": None}
+        self.phases.append(rec)
+        return rec
+
+    def _close(self, rec: Dict[str, Any]) -> None:
+        rec["ms"] = round(_ms(time.perf_counter() - self.t0) - rec["start_ms"], 2)
+
+    def step(self, name: Optional[str]) -> None:
+        """End the current top-level phase and start `name` (None just ends it)."""
+        if not self.enabled:
+            return
+        if self._step is not None:
+            self._close(self._step)
+            self._step = None
+        if name:
+            self._step = self._open(name, "phase")
+
+    @contextmanager
+    def phase(self, name: str, kind: str = "phase") -> Iterator[None]:
+        """Time a nested block (e.g. one plugin import) inside the current step."""
+        if not self.enabled or self._finished:
+            yield
+            return
+        rec = self._open(name, kind)
+        try:
+            yield
+        finally:
+            self._close(rec)
+
+    # ---------- imports ----------
+
+    def install_import_hook(self) -> None:
+        if self._hooked:
+            return
+        if self._hook is None:
+            # Kept for good: anything that wrapped the hook may still call it
+            self._orig_import = builtins.__import__
+            self._hook = self._timed_import
+        if builtins.__import__ is not self._hook:
+            builtins.__import__ = self._hook
+        self._hooked = True
+
+    def remove_import_hook(self) -> None:
+        if not self._hooked:
+            return
+        self._hooked = False
+        # If someone wrapped us since, leave builtins alone; the hook passes through
+        if builtins.__import__ is self._hook:
+            builtins.__import__ = self._orig_import
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        orig = self._orig_import
+        # Only first-time absolute imports cost anything worth recording
+        if not self._hooked or level or name in sys.modules:
+            return orig(name, globals, locals, fromlist, level)
+
+        stack = getattr(self._tls, "stack", None)
+        if stack is None:
+            stack = self._tls.stack = []
+        stack.append(0.0)
+        t = time.perf_counter()
+        try:
+            return orig(name, globals, locals, fromlist, level)
+        finally:
+            dt = time.perf_counter() - t
+            children = stack.pop()
+            if stack:
+                stack[-1] += dt
+            rec = self.imports.setdefault(name, [0.0, 0.0])
+            rec[0] += dt - children
+            rec[1] += dt
+
+    # ---------- report ----------
+
+    def report(self, budget_ms: Optional[float] = None) -> Dict[str, Any]:
+        total_ms = _ms(time.perf_counter() - self.t0)
+
+        by_package: Dict[str, float] = {}
+        for mod, (self_s, _) in self.imports.items():
+            root = mod.split(".", 1)[0]
+            by_package[root] = by_package.get(root, 0.0) + self_s
+
+        def _top(items, key):
+            return sorted(items, key=key, reverse=True)[:_TOP_N]
+
+        return {
+            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "total_ms": total_ms,
+            "budget_ms": budget_ms,
+            "over_budget": bool(budget_ms and total_ms > budget_ms),
+            "phases": [p for p in self.phases if p["kind"] == "phase"],
+            "plugins": sorted(
+                ({"name": p["name"], "ms": p["ms"]} for p in self.phases if p["kind"] == "plugin"),
+                key=lambda p: p["ms"] or 0.0, reverse=True,
+            ),
+            "imports": {
+                "modules": len(self.imports),
+                "total_self_ms": _ms(sum(v[0] for v in self.imports.values())),
+                "by_package": [
+                    {"package": k, "self_ms": _ms(v)}
+                    for k, v in _top(by_package.items(), key=lambda kv: kv[1])
+                ],
+                "top_self": [
+                    {"module": k, "self_ms": _ms(v[0]), "cumulative_ms": _ms(v[1])}
+                    for k, v in _top(self.imports.items(), key=lambda kv: kv[1][0])
+                ],
+                "top_cumulative": [
+                    {"module": k, "self_ms": _ms(v[0]), "cumulative_ms": _ms(v[1])}
+                    for k, v in _top(self.imports.items(), key=lambda kv: kv[1][1])
+                ],
+            },
+        }
+
+    def finish(self, station_dir: str, budget_ms: Optional[float] = None,
+               log: Optional[Callable[[str, str], None]] = None) -> Optional[str]:
+        """Close the open phase, unhook imports, write the report. Returns its path."""
+        if not self.enabled or self._finished:
+            return None
+        self._finished = True
+        self.step(None)
+        self.remove_import_hook()
+
+        if budget_ms is None:
+            budget_ms = budget_from_env()
+        try:
+            budget_ms = float(budget_ms) if budget_ms else None
+        except (TypeError, ValueError):
+            budget_ms = None
+        rep = self.report(budget_ms)
+
+        path = os.path.join(station_dir or ".", REPORT_NAME)
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(rep, f, indent=2)
+        except Exception as e:
+            path = None
+            if log:
+                log("startup", f"Could not write startup trace: {e}")
+
+        if log:
+            slow = ", ".join(f"{p['name']}={p['ms']:.0f}ms" for p in
+                             sorted(rep["phases"], key=lambda p: p["ms"] or 0.0, reverse=True)[:5])
+            log("startup", f"Cold start {rep['total_ms']:.0f} ms ({slow})")
+            if rep["over_budget"]:
+                log("startup", f"⚠️ Cold start over budget: {rep['total_ms']:.0f} ms > {budget_ms:.0f} ms")
+            if path:
+                log("startup", f"Startup trace written to {path}")
+        return path
+
+
+def budget_from_env() -> Optional[float]:
+    try:
+        v = os.environ.get(ENV_BUDGET, "").strip()
+        return float(v) if v else None
+    except ValueError:
+        return None
+
+
+_TRACE: Optional[StartupTrace] = None
+
+
+def get_trace() -> StartupTrace:
+    """Process-wide trace; enabled by RADIO_OS_STARTUP_TRACE (timing starts on first call)."""
+    global _TRACE
+    if _TRACE is None:
+        flag = os.environ.get(ENV_FLAG, "").strip().lower()
+        _TRACE = StartupTrace(enabled=flag in ("1", "true", "yes", "on"))
+    return _TRACE
+
+
+def check_report(path: str, budget_ms: Optional[float] = None) -> int:
+    """Benchmark gate: 0 if the report is within budget, 1 if over, 2 if unreadable."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            rep = json.load(f)
+    except Exception as e:
+        print(f"[startup_trace] cannot read {path}: {e}")
+        return 2
+
+    budget = budget_ms if budget_ms is not None else rep.get("budget_ms")
+    total = float(rep.get("total_ms", 0.0))
+    print(f"[startup_trace] cold start {total:.0f} ms" + (f" (budget {budget:.0f} ms)" if budget else ""))
+    for p in rep.get("phases", []):
+        print(f"  {p['name']:<24} {p['ms'] or 0.0:>9.1f} ms")
+    if budget and total > budget:
+        print("[startup_trace] FAIL: over budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Check a station startup trace against a time budget")
+    ap.add_argument("report", help="path to startup_trace.json")
+    ap.add_argument("--budget-ms", type=float, default=None)
+    args = ap.parse_args()
+    sys.exit(check_report(args.report, args.budget_ms))
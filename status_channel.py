@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Status Channel
+
+Local push channel for station status, replacing status.json polling.
+
+- StatusPublisher (runtime): listens on a Unix domain socket (TCP on
+  127.0.0.1 where AF_UNIX isn't available) and sends newline-delimited JSON
+  to every subscriber when the status changes, plus a heartbeat every
+  heartbeat_sec so "last seen" stays fresh. The listen address is written
+  to <station>/status.addr.
+- StatusSubscriber (shell): background thread that connects via status.addr,
+  reconnects when the runtime restarts and keeps the latest status in
+  memory. `version` increments on every message.
+
+status.json is still written by the runtime, at a lower rate, as a fallback
+for tools that read the file.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+ADDR_NAME = "status.addr"
+SOCK_NAME = "status.sock"
+
+# AF_UNIX paths are limited to ~104-108 bytes
+_MAX_UNIX_PATH = 100
+
+
+def _use_unix() -> bool:
+    return hasattr(socket, "AF_UNIX") and sys.platform != "win32"
+
+
+def _unix_path(station_dir: str) -> str:
+    path = os.path.join(station_dir, SOCK_NAME)
+    if len(path.encode("utf-8")) <= _MAX_UNIX_PATH:
+        return path
+    digest = hashlib.sha1(os.path.abspath(station_dir).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(tempfile.gettempdir(), f"radio_os_status_{digest}.sock")
+
+
+def addr_path(station_dir: str) -> str:
+    return os.path.join(station_dir, ADDR_NAME)
+
+
+def _encode(data: Dict[str, Any]) -> bytes:
+    return (json.dumps(data, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+class StatusPublisher:
+    """Runtime side. publish() is cheap when nothing changed."""
+
+    def __init__(self, station_dir: str, heartbeat_sec: float = 2.0, send_timeout: float = 0.25):
+        self.station_dir = station_dir
+        self.heartbeat_sec = float(heartbeat_sec)
+        self.send_timeout = float(send_timeout)
+        self.address: Optional[str] = None
+        self._sock: Optional[socket.socket] = None
+        self._unix_path: Optional[str] = None
+        self._clients: List[socket.socket] = []
+        self._lock = threading.Lock()
+        self._last_body: Optional[str] = None
+        self._last_msg: Optional[bytes] = None
+        self._last_send = 0.0
+        self._closed = False
+
+    def start(self) -> bool:
+        """Bind, write status.addr and start accepting. False if the channel is unavailable."""
+        try:
+            if _use_unix():
+                path = _unix_path(self.station_dir)
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                sock.bind(path)
+                self._unix_path = path
+                self.address = f"unix:{path}"
+            else:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.bind(("127.0.0.1", 0))
+                self.address = "tcp:127.0.0.1:{}".format(sock.getsockname()[1])
+            sock.listen(8)
+            self._sock = sock
+
+            tmp = addr_path(self.station_dir) + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(self.address)
+            os.replace(tmp, addr_path(self.station_dir))
+        except Exception:
+            self.close()
+            return False
+
+        threading.Thread(target=self._accept_loop, name="status_channel", daemon=True).start()
+        return True
+
+    def _accept_loop(self) -> None:
+        while not self._closed and self._sock is not None:
+            try:
+                client, _ = self._sock.accept()
+            except OSError:
+                if self._closed:
+                    return
+                time.sleep(0.2)
+                continue
+            client.settimeout(self.send_timeout)
+            with self._lock:
+                if self._last_msg is not None:
+                    try:
+                        client.sendall(self._last_msg)
+                    except OSError:
+                        client.close()
+                        continue
+                self._clients.append(client)
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._clients)
+
+    def publish(self, data: Dict[str, Any]) -> bool:
+        """Send data (plus ts) if it changed or a heartbeat is due. Returns True if sent."""
+        body = json.dumps({k: v for k, v in data.items() if k != "ts"},
+                          sort_keys=True, ensure_ascii=False, default=str)
+        now = time.time()
+        with self._lock:
+            if body == self._last_body and now - self._last_send < self.heartbeat_sec:
+                return False
+            msg = _encode(dict(data, ts=int(now)))
+            self._last_body = body
+            self._last_msg = msg
+            self._last_send = now
+            alive = []
+            for client in self._clients:
+                try:
+                    client.sendall(msg)
+                    alive.append(client)
+                except OSError:
+                    # Gone or too slow; it will reconnect and get the latest message
+                    try:
+                        client.close()
+                    except OSError:
+                        pass
+            self._clients = alive
+        return True
+
+    def close(self) -> None:
+        self._closed = True
+        with self._lock:
+            for client in self._clients:
+                try:
+                    client.close()
+                except OSError:
+                    pass
+            self._clients = []
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+        if self._unix_path:
+            try:
+                os.remove(self._unix_path)
+            except OSError:
+                pass
+        if self.address:
+            try:
+                with open(addr_path(self.station_dir), "r", encoding="utf-8") as f:
+                    mine = f.read().strip() == self.address
+                if mine:
+                    os.remove(addr_path(self.station_dir))
+            except OSError:
+                pass
+
+
+def _parse_addr(addr: str) -> Optional[Tuple[int, Any]]:
+    kind, _, rest = (addr or "").strip().partition(":")
+    if kind == "unix" and rest and hasattr(socket, "AF_UNIX"):
+        return socket.AF_UNIX, rest
+    if kind == "tcp" and rest:
+        host, _, port = rest.rpartition(":")
+        try:
+            return socket.AF_INET, (host, int(port))
+        except ValueError:
+            return None
+    return None
+
+
+class StatusSubscriber:
+    """Shell side. Reads pushes in a daemon thread; get() never touches disk."""
+
+    def __init__(self, station_dir: str, retry_sec: float = 1.0):
+        self.station_dir = station_dir
+        self.retry_sec = float(retry_sec)
+        self.latest: Optional[Dict[str, Any]] = None
+        self.version = 0
+        self.connected = False
+        self._stop = threading.Event()
+        self._sock: Optional[socket.socket] = None
+        self._thread = threading.Thread(target=self._run, name="status_subscriber", daemon=True)
+        self._thread.start()
+
+    def get(self) -> Optional[Dict[str, Any]]:
+        return self.latest
+
+    def _connect(self) -> Optional[socket.socket]:
+        try:
+            with open(addr_path(self.station_dir), "r", encoding="utf-8") as f:
+                parsed = _parse_addr(f.read())
+        except OSError:
+            return None
+        if not parsed:
+            return None
+        family, target = parsed
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(2.0)
+            sock.connect(target)
+            sock.settimeout(None)
+            return sock
+        except OSError:
+            sock.close()
+            return None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            sock = self._connect()
+            if sock is None:
+                self._stop.wait(self.retry_sec)
+                continue
+            self._sock = sock
+            self.connected = True
+            buf = b""
+            try:
+                while not self._stop.is_set():
+                    chunk = sock.recv(65536)
+                    if not chunk:
+                        break
+                    buf += chunk
+                    *lines, buf = buf.split(b"\n")
+                    for line in lines:
+                        if not line.strip():
+                            continue
+                        try:
+                            self.latest = json.loads(line.decode("utf-8"))
+                            self.version += 1
+                        except ValueError:
+                            continue
+            except OSError:
+                pass
+            finally:
+                self.connected = False
+                self._sock = None
+                try:
+                    sock.close()
+                except OSError:
+                    pass
+            self._stop.wait(self.retry_sec)
+
+    def close(self) -> None:
+        self._stop.set()
+        sock = self._sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            try:
+                sock.close()
+            except OSError:
+                pass
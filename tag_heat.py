@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Tag Heat Index
+
+Exponentially decaying "heat" per riff tag without rewriting every entry on
+each read. Heat is kept in log-space relative to a fixed reference time:
+
+    score = ln(heat_at_touch) + ln2 * (last_touched - t0) / half_life
+
+so the current heat is exp(score - ln2 * (now - t0) / half_life) and decay is
+implicit. For a given half-life the ordering of scores never changes with
+time, so top-k comes from a max-heap per half-life with lazy invalidation
+(stale entries are skipped when popped). Cold tags are evicted in batches
+when the map doubles in size or a sweep interval passes.
+
+The persisted form is the existing memory.json schema
+    {tag: {"heat", "half_life_hours", "last_touched"}}
+where "heat" is the value at last_touched; it is only written on bump.
+"""
+from __future__ import annotations
+
+import heapq
+import math
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+_LN2 = math.log(2.0)
+
+# Sweep when the map grows past max(2 * size after last sweep, this)
+_MIN_SWEEP_SIZE = 256
+
+
+class TagHeat:
+    """Heap-backed view over a tag_heat dict. Thread-safe."""
+
+    def __init__(self, store: Optional[Dict[str, dict]] = None, *,
+                 default_half_life_hours: float = 48.0,
+                 evict_below: float = 0.5,
+                 sweep_sec: float = 600.0,
+                 t0: Optional[float] = None):
+        self.store: Dict[str, dict] = store if store is not None else {}
+        self.default_half_life_hours = float(default_half_life_hours)
+        self.evict_below = float(evict_below)
+        self.sweep_sec = float(sweep_sec)
+        self.t0 = float(time.time() if t0 is None else t0)
+
+        self._live: Dict[str, Tuple[float, float, int]] = {}  # tag -> (score, half_life_sec, seq)
+        self._heaps: Dict[float, List[Tuple[float, int, str]]] = {}  # half_life_sec -> [(-score, seq, tag)]
+        self._seq = 0
+        self._sweep_at = _MIN_SWEEP_SIZE
+        self._last_sweep = 0.0
+        self._lock = threading.RLock()
+        self._load()
+
+    # ---------- log-space helpers ----------
+
+    def _hl_sec(self, half_life_hours) -> float:
+        try:
+            hl = float(half_life_hours)
+        except (TypeError, ValueError):
+            hl = self.default_half_life_hours
+        return max(hl, 0.01) * 3600.0
+
+    def _score(self, heat: float, ts: float, hl_sec: float) -> float:
+        return math.log(heat) + _LN2 * (ts - self.t0) / hl_sec
+
+    def _heat(self, score: float, hl_sec: float, now: float) -> float:
+        return math.exp(score - _LN2 * (now - self.t0) / hl_sec)
+
+    def _push(self, tag: str, score: float, hl_sec: float) -> None:
+        self._seq += 1
+        self._live[tag] = (score, hl_sec, self._seq)
+        heapq.heappush(self._heaps.setdefault(hl_sec, []), (-score, self._seq, tag))
+
+    def _load(self) -> None:
+        for tag, data in list(self.store.items()):
+            try:
+                heat = float(data.get("heat", 0.0))
+                ts = float(data.get("last_touched", self.t0))
+                hl_sec = self._hl_sec(data.get("half_life_hours", self.default_half_life_hours))
+            except Exception:
+                self.store.pop(tag, None)
+                continue
+            if heat <= 0:
+                self.store.pop(tag, None)
+                continue
+            self._push(tag, self._score(heat, ts, hl_sec), hl_sec)
+        self._sweep_at = max(2 * len(self._live), _MIN_SWEEP_SIZE)
+
+    # ---------- API ----------
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def __contains__(self, tag: str) -> bool:
+        return tag in self._live
+
+    def heat(self, tag: str, now: Optional[float] = None) -> float:
+        now = time.time() if now is None else now
+        with self._lock:
+            rec = self._live.get(tag)
+            return self._heat(rec[0], rec[1], now) if rec else 0.0
+
+    def bump(self, tags: Iterable[str], boost: float = 10.0, now: Optional[float] = None,
+             half_life_hours: Optional[float] = None) -> None:
+        """Add boost to each tag's current heat (new tags use half_life_hours or the default)."""
+        now = time.time() if now is None else now
+        with self._lock:
+            for tag in tags:
+                tag = (tag or "").lower().strip()
+                if not tag:
+                    continue
+                rec = self._live.get(tag)
+                if rec:
+                    hl_sec = rec[1]
+                    hl_hours = hl_sec / 3600.0
+                    cur = self._heat(rec[0], hl_sec, now)
+                else:
+                    hl_hours = float(half_life_hours or self.default_half_life_hours)
+                    hl_sec = self._hl_sec(hl_hours)
+                    cur = 0.0
+                heat = cur + float(boost)
+                if heat <= 0:
+                    continue
+                self._push(tag, self._score(heat, now, hl_sec), hl_sec)
+                self.store[tag] = {"heat": heat, "half_life_hours": hl_hours, "last_touched": int(now)}
+            self._maybe_sweep(now)
+
+    def top(self, k: int, now: Optional[float] = None, min_heat: float = 0.0,
+            skip: Optional[Callable[[str], bool]] = None) -> List[Tuple[str, float]]:
+        """Up to k (tag, heat) pairs with heat >= min_heat, hottest first, excluding skip(tag)."""
+        now = time.time() if now is None else now
+        out: List[Tuple[str, float]] = []
+        with self._lock:
+            self._maybe_sweep(now)
+            for hl_sec, heap in self._heaps.items():
+                keep: List[Tuple[float, int, str]] = []
+                found = 0
+                while heap and found < k:
+                    entry = heapq.heappop(heap)
+                    neg, seq, tag = entry
+                    rec = self._live.get(tag)
+                    if rec is None or rec[2] != seq:
+                        continue  # stale
+                    keep.append(entry)
+                    heat = self._heat(-neg, hl_sec, now)
+                    if heat < min_heat:
+                        break  # everything below is colder
+                    if skip is not None and skip(tag):
+                        continue
+                    out.append((tag, heat))
+                    found += 1
+                for entry in keep:
+                    heapq.heappush(heap, entry)
+        out.sort(key=lambda kv: kv[1], reverse=True)
+        return out[:k]
+
+    def max_heat(self, now: Optional[float] = None) -> float:
+        hottest = self.top(1, now)
+        return hottest[0][1] if hottest else 0.0
+
+    # ---------- eviction ----------
+
+    def _maybe_sweep(self, now: float) -> None:
+        if len(self._live) >= self._sweep_at or now - self._last_sweep >= self.sweep_sec:
+            self.evict(now)
+
+    def evict(self, now: Optional[float] = None) -> int:
+        """Drop tags colder than evict_below and compact the heaps. Returns how many were dropped."""
+        now = time.time() if now is None else now
+        with self._lock:
+            cold = [tag for tag, (score, hl_sec, _) in self._live.items()
+                    if self._heat(score, hl_sec, now) < self.evict_below]
+            for tag in cold:
+                del self._live[tag]
+                self.store.pop(tag, None)
+
+            heaps: Dict[float, List[Tuple[float, int, str]]] = {}
+            for tag, (score, hl_sec, seq) in self._live.items():
+                heaps.setdefault(hl_sec, []).append((-score, seq, tag))
+            for heap in heaps.values():
+                heapq.heapify(heap)
+            self._heaps = heaps
+
+            self._sweep_at = max(2 * len(self._live), _MIN_SWEEP_SIZE)
+            self._last_sweep = now
+            return len(cold)
@@ -23,13 +23,15 @@ sys.path.insert(0, str(PROJECT_ROOT))
 # Import FTB simulation engine
 from plugins.ftb_game import FTBSimulation, SimState, Team, League, AIPrincipal
 from plugins.ftb_state_db import init_db, query_ai_decisions, query_team_outcomes
+from plugins.ftb_ml_policy import export_training_arrays
 
 
 def generate_training_data(
     station_dir: str,
     num_seasons: int = 10,
     num_teams: int = 100,
-    output_dir: str = "data/ml_training"
+    output_dir: str = "data/ml_training",
+    write_json: bool = False
 ):
     """
     Run headless simulation to generate ML training data.
@@ -39,6 +41,7 @@ def generate_training_data(
         num_seasons: Number of seasons to simulate per run
         num_teams: Total number of teams to create across all tiers
         output_dir: Directory to save training data exports
+        write_json: Also write the full decisions list as JSON (legacy format)
     """
     print(f"[FTB ML DataGen] Starting training data generation")
     print(f"  Station: {station_dir}")
@@ -164,11 +167,11 @@ def generate_training_data(
     
     # Export training data
     print(f"[FTB ML DataGen] Exporting training data...")
-    export_training_data(db_path, output_dir, run_id)
+    export_training_data(db_path, output_dir, run_id, write_json=write_json)
     
     print(f"[FTB ML DataGen] Data generation complete!")
     print(f"  Database: {db_path}")
-    print(f"  Exports: {output_dir}/{run_id}_*.json")
+    print(f"  Exports: {output_dir}/{run_id}_*")
 
 
 def _generate_simple_schedule(tier: int, start_tick: int) -> list:
@@ -277,16 +280,22 @@ def _create_ml_training_team(tier: int, team_index: int, seed: str) -> Team:
     return team
 
 
-def export_training_data(db_path: str, output_dir: str, run_id: str):
-    """Export logged data to JSON files for ML training."""
+def export_training_data(db_path: str, output_dir: str, run_id: str, write_json: bool = False):
+    """Export logged data for ML training (decision arrays + outcome/summary JSON)."""
     
-    # Export AI decisions
+    # Stream AI decisions into memory-mappable training shards
     print("  Exporting AI decisions...")
-    decisions = query_ai_decisions(db_path, limit=100000)
-    decisions_path = os.path.join(output_dir, f"{run_id}_decisions.json")
-    with open(decisions_path, 'w') as f:
-        json.dump(decisions, f, indent=2)
-    print(f"    Exported {len(decisions)} decisions to {decisions_path}")
+    arrays_dir = os.path.join(output_dir, f"{run_id}_arrays")
+    manifest = export_training_arrays(db_path, arrays_dir)
+    print(f"    Exported {manifest['rows']} training rows "
+          f"(of {manifest['decisions_scanned']} decisions) to {arrays_dir}")
+    
+    if write_json:
+        decisions = query_ai_decisions(db_path, limit=100000)
+        decisions_path = os.path.join(output_dir, f"{run_id}_decisions.json")
+        with open(decisions_path, 'w') as f:
+            json.dump(decisions, f)
+        print(f"    Exported {len(decisions)} decisions to {decisions_path}")
     
     # Export team outcomes
     print("  Exporting team outcomes...")
@@ -313,7 +322,8 @@ def export_training_data(db_path: str, output_dir: str, run_id: str):
     print("  Generating summary statistics...")
     summary = {
         'run_id': run_id,
-        'total_decisions': len(decisions),
+        'total_decisions': manifest['decisions_scanned'],
+        'training_rows': manifest['rows'],
         'total_outcomes': len(outcomes),
         'successful_teams': len(successful),
         'survival_rate': len([o for o in outcomes if o['survival_flag']]) / max(len(outcomes), 1),
@@ -342,6 +352,8 @@ def main():
                        help='Total number of teams to create')
     parser.add_argument('--output_dir', type=str, default='data/ml_training',
                        help='Directory to save training data')
+    parser.add_argument('--json', action='store_true',
+                       help='Also export decisions as JSON (legacy format)')
     
     args = parser.parse_args()
     
@@ -349,7 +361,8 @@ def main():
         station_dir=args.station_dir,
         num_seasons=args.seasons,
         num_teams=args.teams,
-        output_dir=args.output_dir
+        output_dir=args.output_dir,
+        write_json=args.json
     )
 
 
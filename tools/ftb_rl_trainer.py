@@ -7,16 +7,22 @@ Wraps the FTB simulation as an OpenAI Gym environment for RL training.
 Requirements:
     pip install gym stable-baselines3
 
+Environments run headless (no state DB). A seeded world is built once,
+captured with SimState.snapshot() as a template and shipped to each
+SubprocVecEnv worker, which restores it once and resets episodes from it.
+
 Usage:
-    python tools/ftb_rl_trainer.py --checkpoint models/baseline_policy_v1.pth --output models/rl_policy_v1.pth
+    python tools/ftb_rl_trainer.py --baseline models/baseline_policy_v1.pth --output models/rl_policy_v1.pth --n_envs 8
+    python tools/ftb_rl_trainer.py --benchmark --n_envs 8   # env-steps/sec for 1..8 workers
 """
 
 import sys
 import os
 import argparse
+import time
 import numpy as np
 from pathlib import Path
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -26,7 +32,7 @@ try:
     import gym
     from gym import spaces
     from stable_baselines3 import PPO
-    from stable_baselines3.common.vec_env import DummyVecEnv
+    from stable_baselines3.common.vec_env import DummyVecEnv, SubprocVecEnv, VecEnv
     from stable_baselines3.common.callbacks import EvalCallback, CheckpointCallback
 except ImportError:
     print("[FTB RL] ERROR: stable-baselines3 not installed. Run: pip install gym stable-baselines3")
@@ -51,9 +57,14 @@ class FTBTeamEnv(gym.Env):
     
     metadata = {'render.modes': ['human']}
     
-    def __init__(self, initial_state: SimState, team_index: int = 0):
+    def __init__(self, initial_state: SimState, team_index: int = 0, seed: int = 0):
         super().__init__()
         
+        # Episodes restart from this snapshot instead of rebuilding the world
+        self._snapshot = initial_state.snapshot()
+        self.seed_base = int(seed)
+        self.episodes = 0
+        
         self.state = initial_state
         self.team_index = team_index
         self.team = initial_state.ai_teams[team_index]
@@ -74,8 +85,11 @@ class FTBTeamEnv(gym.Env):
     
     def reset(self) -> np.ndarray:
         """Reset environment to initial state."""
-        # Restore initial team state
-        self.team.budget.cash = self.initial_budget
+        # Restore the whole world, then give the episode its own sim seed
+        self.state = SimState.restore(self._snapshot)
+        self.state.seed = self.seed_base * 100003 + self.episodes
+        self.team = self.state.ai_teams[self.team_index]
+        self.episodes += 1
         self.episode_ticks = 0
         
         return self._get_observation()
@@ -189,74 +203,142 @@ class FTBTeamEnv(gym.Env):
               f"Position={self.team.standing_metrics.get('championship_position', 99)}")
 
 
-def make_ftb_env(num_teams: int = 10, tier: int = 3) -> DummyVecEnv:
+def build_rl_world(num_teams: int = 10, tier: int = 3, seed: int = 0) -> SimState:
+    """
+    Minimal single-league world for RL training.
+    
+    Headless: state_db_path stays None, so ticks never touch SQLite.
+    """
+    state = SimState()
+    state.state_db_path = None
+    
+    state.tick = 0
+    state.season_number = 1
+    state.sim_year = 2025
+    state.sim_day_of_year = 1
+    state.phase = "development"
+    state.seed = int(seed)  # tick_simulation adds the tick to this
+    
+    # Create league with teams
+    state.leagues = {}
+    state.ai_teams = []
+    
+    league = League(league_id=f"tier_{tier}_rl", name=f"Tier {tier} RL Training", tier=tier)
+    league.teams = []
+    league.championship_table = {}
+    league.schedule = []
+    
+    for i in range(num_teams):
+        team = Team(name=f"RL_Team_{i}")
+        team.team_id = f"rl_team_{i}"
+        team.tier = tier
+        team.budget.cash = 500000.0
+        team.principal = AIPrincipal(name=f"Principal_{team.name}")
+        team.principal_name = team.principal.name
+        team.standing_metrics = {'championship_position': i + 1, 'morale': 50.0, 'reputation': 50.0}
+        team.seasons_active = 1
+        
+        league.teams.append(team)
+        state.ai_teams.append(team)
+    
+    state.leagues[league.league_id] = league
+    
+    # Initialize other components
+    state.tracks = {}
+    state.free_agent_pool = []
+    state.parts_catalog = {}
+    state.sponsorships = {t.name: [] for t in state.ai_teams}
+    state.contracts = {}
+    state._rngs = {}
+    
+    return state
+
+
+def _worker_env_fn(template: bytes, team_index: int, seed: int):
+    """Env factory for one vec-env slot; the template is restored once, in the worker."""
+    def _init():
+        state = SimState.restore(template)
+        state.seed = seed
+        return FTBTeamEnv(state, team_index=team_index, seed=seed)
+    return _init
+
+
+def make_ftb_env(
+    num_teams: int = 10,
+    tier: int = 3,
+    n_envs: int = 1,
+    seed: int = 0,
+    start_method: Optional[str] = None
+) -> VecEnv:
     """
     Create vectorized FTB environment for RL training.
     
     Args:
         num_teams: Number of teams in league
         tier: Tier level (1-5)
+        n_envs: Parallel environments; >1 runs each in its own process
+        seed: Base seed (worker i uses seed + i)
+        start_method: multiprocessing start method for SubprocVecEnv
     
     Returns:
         Vectorized gym environment
     """
-    def _init():
-        # Create minimal simulation state
-        from plugins.ftb_state_db import init_db
-        import tempfile
-        
-        state = SimState()
-        state.state_db_path = tempfile.mktemp(suffix=".db")
-        init_db(state.state_db_path)
-        
-        state.tick = 0
-        state.season_number = 1
-        state.sim_year = 2025
-        state.sim_day_of_year = 1
-        state.phase = "development"
-        state.seed = f"rl_training_{np.random.randint(10000)}"
-        
-        # Create league with teams
-        state.leagues = {}
-        state.ai_teams = []
-        
-        league = League(league_id=f"tier_{tier}_rl", name=f"Tier {tier} RL Training", tier=tier)
-        league.teams = []
-        league.championship_table = {}
-        league.schedule = []
-        
-        for i in range(num_teams):
-            team = Team(name=f"RL_Team_{i}")
-            team.team_id = f"rl_team_{i}"
-            team.tier = tier
-            team.budget.cash = 500000.0
-            team.principal = AIPrincipal.FromArchetype("The Pragmatist", team.name)
-            team.standing_metrics = {'championship_position': i + 1, 'morale': 50.0, 'reputation': 50.0}
-            team.seasons_active = 1
-            
-            league.teams.append(team)
-            state.ai_teams.append(team)
-        
-        state.leagues[league.league_id] = league
-        
-        # Initialize other components
-        state.tracks = {}
-        state.free_agent_pool = []
-        state.parts_catalog = {}
-        state.sponsorships = {t.name: [] for t in state.ai_teams}
-        state.contracts = {}
-        state._rngs = {}
-        
-        return FTBTeamEnv(state, team_index=0)
+    template = build_rl_world(num_teams, tier, seed).snapshot()
+    env_fns = [_worker_env_fn(template, 0, seed + i) for i in range(max(1, n_envs))]
+    
+    if len(env_fns) == 1:
+        return DummyVecEnv(env_fns)
+    return SubprocVecEnv(env_fns, start_method=start_method)
+
+
+def benchmark_vec_env(
+    max_envs: Optional[int] = None,
+    steps: int = 2000,
+    num_teams: int = 10,
+    tier: int = 3
+) -> List[Dict[str, float]]:
+    """
+    Measure env-steps/second for 1, 2, 4 ... max_envs workers (random actions).
     
-    return DummyVecEnv([_init])
+    Returns:
+        One row per worker count: n_envs, steps_per_sec, speedup
+    """
+    max_envs = max(1, max_envs or os.cpu_count() or 1)
+    counts = []
+    n = 1
+    while n < max_envs:
+        counts.append(n)
+        n *= 2
+    counts.append(max_envs)
+    
+    print(f"[FTB RL] Benchmarking vec env ({steps} steps per worker count, {os.cpu_count()} CPUs)")
+    results = []
+    for n_envs in counts:
+        env = make_ftb_env(num_teams=num_teams, tier=tier, n_envs=n_envs)
+        try:
+            env.reset()
+            rng = np.random.default_rng(0)
+            start = time.perf_counter()
+            for _ in range(steps):
+                env.step(rng.integers(0, env.action_space.n, size=n_envs))
+            elapsed = time.perf_counter() - start
+        finally:
+            env.close()
+        
+        rate = steps * n_envs / max(elapsed, 1e-9)
+        speedup = rate / results[0]['steps_per_sec'] if results else 1.0
+        results.append({'n_envs': n_envs, 'steps_per_sec': rate, 'speedup': speedup})
+        print(f"  {n_envs:>3} env(s): {rate:>10.0f} env-steps/s  ({speedup:.2f}x)")
+    
+    return results
 
 
 def train_rl_policy(
     baseline_checkpoint: str,
     output_checkpoint: str,
     total_timesteps: int = 500000,
-    eval_freq: int = 10000
+    eval_freq: int = 10000,
+    n_envs: int = 1
 ):
     """
     Train RL policy via PPO, starting from IL baseline.
@@ -266,14 +348,16 @@ def train_rl_policy(
         output_checkpoint: Where to save RL-trained model
         total_timesteps: Total training timesteps
         eval_freq: Evaluation frequency
+        n_envs: Parallel training environments (one process each when >1)
     """
     print(f"[FTB RL] Starting reinforcement learning training...")
     print(f"  Baseline: {baseline_checkpoint}")
     print(f"  Output: {output_checkpoint}")
     print(f"  Timesteps: {total_timesteps}")
+    print(f"  Envs: {n_envs}")
     
     # Create environment
-    env = make_ftb_env(num_teams=10, tier=3)
+    env = make_ftb_env(num_teams=10, tier=3, n_envs=n_envs)
     
     # Create PPO agent
     model = PPO(
@@ -294,18 +378,18 @@ def train_rl_policy(
     # For now, train from scratch
     
     # Setup callbacks
-    eval_env = make_ftb_env(num_teams=10, tier=3)
+    eval_env = make_ftb_env(num_teams=10, tier=3, seed=10000)
     eval_callback = EvalCallback(
         eval_env,
         best_model_save_path=str(Path(output_checkpoint).parent),
         log_path="./logs/ftb_rl_eval/",
-        eval_freq=eval_freq,
+        eval_freq=max(eval_freq // max(n_envs, 1), 1),  # counted in vec steps
         deterministic=True,
         render=False
     )
     
     checkpoint_callback = CheckpointCallback(
-        save_freq=50000,
+        save_freq=max(50000 // max(n_envs, 1), 1),
         save_path=str(Path(output_checkpoint).parent / "rl_checkpoints"),
         name_prefix="ftb_rl"
     )
@@ -324,7 +408,7 @@ def train_rl_policy(
 
 def main():
     parser = argparse.ArgumentParser(description='RL fine-tuning for FTB team principals')
-    parser.add_argument('--baseline', type=str, required=True,
+    parser.add_argument('--baseline', type=str, default=None,
                        help='Path to imitation learning baseline checkpoint')
     parser.add_argument('--output', type=str, default='models/rl_policy_v1.pth',
                        help='Output path for RL-trained model')
@@ -332,14 +416,27 @@ def main():
                        help='Total training timesteps')
     parser.add_argument('--eval_freq', type=int, default=10000,
                        help='Evaluation frequency')
+    parser.add_argument('--n_envs', type=int, default=None,
+                       help='Parallel environments (subprocess workers); default 1, or all CPUs with --benchmark')
+    parser.add_argument('--benchmark', action='store_true',
+                       help='Report env-steps/sec from 1 to --n_envs workers and exit')
+    parser.add_argument('--benchmark_steps', type=int, default=2000,
+                       help='Vec-env steps per worker count when benchmarking')
     
     args = parser.parse_args()
     
+    if args.benchmark:
+        benchmark_vec_env(max_envs=args.n_envs, steps=args.benchmark_steps)
+        return
+    if not args.baseline:
+        parser.error("--baseline is required for training")
+    
     train_rl_policy(
         baseline_checkpoint=args.baseline,
         output_checkpoint=args.output,
         total_timesteps=args.timesteps,
-        eval_freq=args.eval_freq
+        eval_freq=args.eval_freq,
+        n_envs=args.n_envs or 1
     )
 
 
@@ -1,6 +1,6 @@
 """Train baseline ML model with collected decisions (using default success scores)."""
-from plugins.ftb_state_db import query_ai_decisions
-import json
+from plugins.ftb_state_db import read_connection
+from plugins.ftb_ml_policy import calculate_team_success_scores, export_training_arrays
 import glob
 import os
 
@@ -10,14 +10,14 @@ latest_db = max(db_files, key=os.path.getmtime)
 
 print(f"Training from: {latest_db}")
 
-# Export decisions
-decisions = query_ai_decisions(latest_db, limit=100000)
-print(f"Loaded {len(decisions)} decisions")
+# Teams that made decisions
+with read_connection(latest_db) as conn:
+    teams = conn.execute("SELECT DISTINCT team_id, team_name FROM ai_decisions").fetchall()
+print(f"Found {len(teams)} teams with logged decisions")
 
 # Create fake outcomes for training (assign moderate success to all teams)
 outcomes = []
-team_ids = set(d['team_id'] for d in decisions)
-for team_id in team_ids:
+for team_id, team_name in teams:
     # Assign a random success score (0-100) for each team
     import random
     starting_budget = 100000
@@ -26,7 +26,7 @@ for team_id in team_ids:
     
     outcomes.append({
         'team_id': team_id,
-        'team_name': next(d['team_name'] for d in decisions if d['team_id'] == team_id),
+        'team_name': team_name,
         'season': 1,
         'championship_position': random.randint(1, 20),
         'total_points': random.uniform(0, 100),
@@ -41,23 +41,21 @@ for team_id in team_ids:
 
 print(f"Created {len(outcomes)} fake outcomes for training")
 
-# Export to JSON
-with open("training_decisions.json", "w") as f:
-    json.dump(decisions, f)
+# Stream decisions into training arrays scored with the fake outcomes
+arrays_dir = os.path.join("data", "ml_training", "baseline_arrays")
+manifest = export_training_arrays(
+    latest_db, arrays_dir, team_scores=calculate_team_success_scores(outcomes)
+)
 
-with open("training_outcomes.json", "w") as f:
-    json.dump(outcomes, f)
-
-print(f"\nExported to training_decisions.json and training_outcomes.json")
+print(f"\nExported {manifest['rows']} training rows to {arrays_dir}")
 print(f"\nNow training model with:")
-print(f"  python -m plugins.ftb_ml_policy training_decisions.json training_outcomes.json models/ftb_baseline_v1.pth")
+print(f"  python -m plugins.ftb_ml_policy {arrays_dir} models/ftb_baseline_v1.pth")
 
 # Auto-run training
 import subprocess
 result = subprocess.run([
     "python", "-m", "plugins.ftb_ml_policy",
-    "training_decisions.json",
-    "training_outcomes.json",
+    arrays_dir,
     "models/ftb_baseline_v1.pth"
 ], capture_output=True, text=True)
 
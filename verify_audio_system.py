@@ -72,7 +72,7 @@ try:
     print(f"✓ ftb_audio_engine plugin: Loaded")
     print(f"  - Plugin name: {ftb_audio_engine.PLUGIN_NAME}")
     print(f"  - Description: {ftb_audio_engine.PLUGIN_DESC}")
-    print(f"  - Has pygame: {ftb_audio_engine.HAS_PYGAME}")
+    print(f"  - Has mixer: {ftb_audio_engine.HAS_MIXER}")
 except Exception as e:
     print(f"✗ ftb_audio_engine: {e}")
     errors.append("ftb_audio_engine")